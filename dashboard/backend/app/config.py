@@ -57,6 +57,10 @@ class Settings(BaseSettings):
         default=10,
         description="Maximum requests per second per client",
     )
+    rate_limit_max_clients: int = Field(
+        default=10_000,
+        description="Clients tracked by the rate limiter before the least recent are evicted",
+    )
 
     # Conductor settings
     conductor_root: Path = Field(
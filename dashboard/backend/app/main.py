@@ -91,6 +91,7 @@ def create_app() -> FastAPI:
         rate_limit_config = RateLimitConfig(
             requests_per_minute=settings.rate_limit_per_minute,
             requests_per_second=settings.rate_limit_per_second,
+            max_clients=settings.rate_limit_max_clients,
             enabled=True,
         )
         app.add_middleware(RateLimitMiddleware, config=rate_limit_config)
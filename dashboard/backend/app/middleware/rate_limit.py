@@ -1,7 +1,15 @@
-"""Rate limiting middleware using sliding window algorithm."""
+"""Rate limiting middleware using the generic cell rate algorithm (GCRA).
 
+Each client's state is one theoretical arrival time (TAT) per limit, so a
+check is O(1) regardless of the request rate. Clients are kept in
+lock-sharded LRU maps: a request only locks the shard its client hashes
+to, idle clients (whose TATs have passed) are dropped as they reach the
+LRU head, and each shard is capped so the total stays near ``max_clients``.
+"""
+
+import math
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from threading import Lock
@@ -12,6 +20,12 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+# Number of independently locked client maps
+CLIENT_SHARDS = 16
+
+# Idle clients examined at the LRU head per new client
+IDLE_SWEEP = 2
+
 
 @dataclass
 class RateLimitConfig:
@@ -24,30 +38,54 @@ class RateLimitConfig:
     path_overrides: dict[str, tuple[int, int]] = field(default_factory=dict)
     # Paths to skip rate limiting
     skip_paths: set[str] = field(default_factory=set)
+    # Clients tracked before the least recently seen are evicted
+    max_clients: int = 10_000
 
 
 @dataclass
 class ClientState:
-    """Tracks request timestamps for a client."""
+    """GCRA state for a client.
+
+    A limit of ``n`` requests per ``period`` admits a request if the
+    client's theoretical arrival time, advanced by ``period / n``, stays
+    within ``period`` of now. This allows a burst of ``n`` requests, then
+    one every ``period / n``.
+    """
+
+    second_tat: float = 0.0
+    minute_tat: float = 0.0
+
+    def is_idle(self, now: float) -> bool:
+        """Whether the client has no outstanding usage against any limit."""
+        return self.second_tat <= now and self.minute_tat <= now
+
+
+def _gcra(tat: float, now: float, limit: int, period: float) -> tuple[float, float]:
+    """Advance a theoretical arrival time by one request.
+
+    Returns:
+        Tuple of (new_tat, wait_seconds); the request is allowed if wait <= 0
+    """
+    if limit <= 0:
+        return tat, period
+    new_tat = max(tat, now) + period / limit
+    return new_tat, new_tat - period - now
+
 
-    timestamps: list[float] = field(default_factory=list)
-    lock: Lock = field(default_factory=Lock)
+class _ClientShard:
+    """LRU map of client states guarded by its own lock."""
 
-    def cleanup(self, window_seconds: float) -> None:
-        """Remove timestamps outside the window."""
-        cutoff = time.time() - window_seconds
-        self.timestamps = [ts for ts in self.timestamps if ts > cutoff]
+    __slots__ = ("lock", "clients")
 
-    def count_in_window(self, window_seconds: float) -> int:
-        """Count requests in the specified time window."""
-        cutoff = time.time() - window_seconds
-        return sum(1 for ts in self.timestamps if ts > cutoff)
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.clients: OrderedDict[str, ClientState] = OrderedDict()
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Sliding window rate limiting middleware.
+    """GCRA rate limiting middleware.
 
-    Limits requests per client IP using a sliding window algorithm.
+    Limits requests per client IP with constant-size state per client.
     Supports both per-second and per-minute limits.
     """
 
@@ -64,8 +102,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         """
         super().__init__(app)
         self.config = config or RateLimitConfig()
-        self._clients: dict[str, ClientState] = defaultdict(ClientState)
-        self._global_lock = Lock()
+        self._shards = [_ClientShard() for _ in range(CLIENT_SHARDS)]
+        self._shard_capacity = max(1, math.ceil(self.config.max_clients / CLIENT_SHARDS))
 
         # Default skip paths
         self.config.skip_paths.update({"/health", "/", "/docs", "/redoc", "/openapi.json"})
@@ -77,6 +115,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 "/api/chat/command": (10, 2),
             }
 
+    @property
+    def client_count(self) -> int:
+        """Number of clients currently tracked."""
+        return sum(len(shard.clients) for shard in self._shards)
+
     async def dispatch(
         self,
         request: Request,
@@ -116,10 +159,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
 
         # Add rate limit headers
-        remaining_minute = max(0, per_minute - self._get_count(client_id, 60))
+        remaining_minute, reset_after = self._get_remaining(client_id, per_minute)
         response.headers["X-RateLimit-Limit"] = str(per_minute)
         response.headers["X-RateLimit-Remaining"] = str(remaining_minute)
-        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + 60)
+        response.headers["X-RateLimit-Reset"] = str(math.ceil(time.time() + reset_after))
 
         return response
 
@@ -150,6 +193,28 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Return default limits
         return (self.config.requests_per_minute, self.config.requests_per_second)
 
+    def _shard(self, client_id: str) -> _ClientShard:
+        """Get the shard a client is stored in."""
+        return self._shards[hash(client_id) % CLIENT_SHARDS]
+
+    def _evict(self, shard: _ClientShard, now: float) -> None:
+        """Make room for a new client in a shard.
+
+        Must be called with the shard lock held.
+        """
+        clients = shard.clients
+        while len(clients) >= self._shard_capacity:
+            clients.popitem(last=False)
+
+        # Idle clients carry no usage, so dropping them does not change limits
+        for _ in range(IDLE_SWEEP):
+            if not clients:
+                break
+            oldest = next(iter(clients.values()))
+            if not oldest.is_idle(now):
+                break
+            clients.popitem(last=False)
+
     def _check_rate_limit(
         self,
         client_id: str,
@@ -161,48 +226,49 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Returns:
             Tuple of (allowed, retry_after_seconds)
         """
-        now = time.time()
-
-        with self._global_lock:
-            state = self._clients[client_id]
-
-        with state.lock:
-            # Cleanup old timestamps
-            state.cleanup(60)
-
-            # Check per-second limit
-            count_second = state.count_in_window(1)
-            if count_second >= per_second:
-                return (False, 1)
-
-            # Check per-minute limit
-            count_minute = len(state.timestamps)
-            if count_minute >= per_minute:
-                # Find when oldest request will expire
-                if state.timestamps:
-                    oldest = min(state.timestamps)
-                    retry_after = int(60 - (now - oldest)) + 1
-                    return (False, max(1, retry_after))
-                return (False, 60)
+        now = time.monotonic()
+        shard = self._shard(client_id)
+
+        with shard.lock:
+            state = shard.clients.get(client_id)
+            if state is None:
+                self._evict(shard, now)
+                state = shard.clients[client_id] = ClientState()
+            else:
+                shard.clients.move_to_end(client_id)
+
+            second_tat, second_wait = _gcra(state.second_tat, now, per_second, 1.0)
+            minute_tat, minute_wait = _gcra(state.minute_tat, now, per_minute, 60.0)
+            wait = max(second_wait, minute_wait)
+            if wait > 0:
+                return (False, max(1, math.ceil(wait)))
 
             # Record this request
-            state.timestamps.append(now)
+            state.second_tat = second_tat
+            state.minute_tat = minute_tat
 
         return (True, 0)
 
-    def _get_count(self, client_id: str, window_seconds: float) -> int:
-        """Get request count for a client in the specified window."""
-        with self._global_lock:
-            state = self._clients.get(client_id)
+    def _get_remaining(self, client_id: str, per_minute: int) -> tuple[int, float]:
+        """Get the remaining per-minute budget for a client.
+
+        Returns:
+            Tuple of (remaining_requests, seconds_until_budget_is_full)
+        """
+        now = time.monotonic()
+        shard = self._shard(client_id)
 
-        if not state:
-            return 0
+        with shard.lock:
+            state = shard.clients.get(client_id)
+            backlog = max(0.0, state.minute_tat - now) if state else 0.0
 
-        with state.lock:
-            return state.count_in_window(window_seconds)
+        if per_minute <= 0:
+            return (0, backlog)
+        remaining = int((60.0 - backlog) * per_minute / 60.0)
+        return (max(0, min(per_minute, remaining)), backlog)
 
     def reset_client(self, client_id: str) -> None:
         """Reset rate limit state for a client (for testing)."""
-        with self._global_lock:
-            if client_id in self._clients:
-                del self._clients[client_id]
+        shard = self._shard(client_id)
+        with shard.lock:
+            shard.clients.pop(client_id, None)
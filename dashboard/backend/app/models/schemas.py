@@ -230,6 +230,7 @@ class TaskListResponse(BaseModel):
     in_progress: int = 0
     pending: int = 0
     failed: int = 0
+    next_cursor: Optional[str] = None
 
 
 # Agent models
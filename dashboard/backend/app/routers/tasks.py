@@ -3,7 +3,7 @@
 # Import orchestrator modules
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
@@ -13,7 +13,13 @@ from ..models import AuditEntry, ErrorResponse, TaskInfo, TaskListResponse, Task
 
 settings = get_settings()
 sys.path.insert(0, str(settings.conductor_root))
-from orchestrator.db.repositories.tasks import Task, get_task_repository
+from orchestrator.db.repositories.tasks import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    TASK_LIST_FIELDS,
+    Task,
+    get_task_repository,
+)
 from orchestrator.storage.audit_adapter import AuditStorageAdapter
 
 router = APIRouter(prefix="/projects/{project_name}/tasks", tags=["tasks"])
@@ -31,6 +37,28 @@ def _priority_to_int(priority: str) -> int:
     return {"low": 0, "medium": 1, "high": 2, "critical": 3}.get(priority.lower(), 1)
 
 
+def _split(values: Optional[list[str]]) -> Optional[list[str]]:
+    """Flatten repeated and comma-separated query values."""
+    if not values:
+        return None
+    return [v.strip() for value in values for v in value.split(",") if v.strip()] or None
+
+
+def _priority_filter(values: Optional[list[str]]) -> Optional[list[str]]:
+    """Normalize priority filters to the stored priority strings.
+
+    Args:
+        values: Priority names or API priority numbers (0-3), comma-separated
+            values allowed
+
+    Returns:
+        Stored priority strings, or None for no filter
+    """
+    names = {"0": "low", "1": "medium", "2": "high", "3": "critical"}
+    priorities = [names.get(p, p.lower()) for p in _split(values) or []]
+    return priorities or None
+
+
 def _complexity_to_score(complexity: str) -> Optional[float]:
     """Convert complexity string to numeric score.
 
@@ -81,37 +109,48 @@ def _task_to_task_info(task: Task) -> TaskInfo:
     "",
     response_model=TaskListResponse,
     summary="List tasks",
-    description="Get all tasks for a project.",
+    description=(
+        "Get a page of tasks for a project, ordered by task ID. Filters combine; "
+        "pass next_cursor as cursor for the next page."
+    ),
     responses={404: {"model": ErrorResponse}},
 )
 async def list_tasks(
     project_name: str,
     project_dir: Path = Depends(get_project_dir),
-    status: Optional[str] = Query(default=None, description="Filter by status"),
+    status: Optional[list[str]] = Query(default=None, description="Filter by status"),
+    milestone: Optional[str] = Query(default=None, description="Filter by milestone ID"),
+    priority: Optional[list[str]] = Query(default=None, description="Filter by priority"),
+    cursor: Optional[str] = Query(default=None, description="Task ID to continue after"),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: Literal["list", "detail"] = Query(
+        default="list", description="list fetches board fields only; detail fetches all"
+    ),
 ) -> TaskListResponse:
-    """List all tasks from SurrealDB."""
+    """List tasks from SurrealDB with filters and keyset pagination."""
     repo = get_task_repository(project_name)
 
     try:
-        # Fetch tasks from database
-        if status:
-            db_tasks = await repo.get_by_status(status)
-        else:
-            db_tasks = await repo.find_all(limit=1000)
-
-        # Convert to TaskInfo
-        tasks = [_task_to_task_info(t) for t in db_tasks]
+        page = await repo.list_tasks(
+            statuses=_split(status),
+            milestone_id=milestone,
+            priorities=_priority_filter(priority),
+            after=cursor,
+            limit=limit,
+            fields=TASK_LIST_FIELDS if view == "list" else None,
+        )
 
-        # Get progress summary from database
-        progress = await repo.get_progress()
+        # Project-wide counts, shared across requests until a task changes
+        progress = await repo.get_cached_progress()
 
         return TaskListResponse(
-            tasks=tasks,
-            total=progress.get("total", len(tasks)),
+            tasks=[_task_to_task_info(t) for t in page.tasks],
+            total=progress.get("total", len(page.tasks)),
             completed=progress.get("completed", 0),
             in_progress=progress.get("in_progress", 0),
             pending=progress.get("pending", 0),
             failed=progress.get("failed", 0),
+            next_cursor=page.next_cursor,
         )
     except Exception as e:
         # Log error but return empty response rather than failing
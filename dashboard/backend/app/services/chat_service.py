@@ -14,6 +14,14 @@ from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Add orchestrator to path
+import sys
+
+settings = get_settings()
+sys.path.insert(0, str(settings.conductor_root))
+
+from orchestrator.utils.segmented_log import get_segmented_log
+
 
 class ChatService:
     """Service for Claude chat integration.
@@ -181,7 +189,13 @@ class ChatService:
 
 
 class ChatHistory:
-    """Manages chat history for a project."""
+    """Manages chat history for a project.
+
+    History is a segmented JSONL log: new messages go to chat_history.jsonl,
+    which is sealed into ``.workflow/chat_history/`` once it reaches the
+    segment size, keeping only the newest segments. Reads seek from the end
+    instead of parsing the whole history.
+    """
 
     def __init__(self, project_dir: Path):
         """Initialize chat history.
@@ -191,6 +205,7 @@ class ChatHistory:
         """
         self.project_dir = project_dir
         self.history_file = project_dir / ".workflow" / "chat_history.jsonl"
+        self._log = get_segmented_log(self.history_file)
 
     def add_message(
         self,
@@ -205,8 +220,6 @@ class ChatHistory:
             content: Message content
             metadata: Optional metadata
         """
-        self.history_file.parent.mkdir(parents=True, exist_ok=True)
-
         entry = {
             "role": role,
             "content": content,
@@ -214,8 +227,7 @@ class ChatHistory:
             "metadata": metadata or {},
         }
 
-        with open(self.history_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        self._log.append(entry)
 
     def get_history(self, limit: int = 50) -> list[dict]:
         """Get chat history.
@@ -224,23 +236,27 @@ class ChatHistory:
             limit: Maximum messages to return
 
         Returns:
-            List of message dictionaries
+            List of the newest message dictionaries, oldest first
         """
-        if not self.history_file.exists():
-            return []
+        return self._log.tail(limit)
 
-        messages = []
-        with open(self.history_file) as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        messages.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+    def get_page(self, limit: int = 50, before: Optional[str] = None) -> dict[str, Any]:
+        """Get a page of older chat history.
+
+        Args:
+            limit: Maximum messages to return
+            before: Cursor from a previous page (newest messages if None)
 
-        return messages[-limit:] if len(messages) > limit else messages
+        Returns:
+            Dictionary with messages (oldest first) and the cursor for the
+            next older page (None at the start of history)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        page = self._log.page(limit=limit, before=before)
+        return {"messages": page.entries, "cursor": page.cursor}
 
     def clear(self) -> None:
-        """Clear chat history."""
-        if self.history_file.exists():
-            self.history_file.unlink()
+        """Clear chat history, including sealed segments."""
+        self._log.clear()
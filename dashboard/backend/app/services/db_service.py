@@ -163,6 +163,9 @@ class DatabaseService:
     ) -> dict[str, Any]:
         """Get audit statistics from database.
 
+        Served from the audit repository's rollups plus the un-rolled tail
+        instead of aggregating every entry.
+
         Args:
             project_name: Project name
             since: Optional time filter
@@ -170,52 +173,23 @@ class DatabaseService:
         Returns:
             Statistics dictionary
         """
-        time_filter = ""
-        params = {"project": project_name}
-
-        if since:
-            time_filter = "AND timestamp >= $since"
-            params["since"] = since.isoformat()
-
-        result = await self.query(
-            f"""
-            SELECT
-                count() as total,
-                count() FILTER WHERE status = 'success' as success_count,
-                count() FILTER WHERE status = 'failed' as failed_count,
-                count() FILTER WHERE status = 'timeout' as timeout_count,
-                math::sum(cost_usd) as total_cost_usd,
-                math::sum(duration_seconds) as total_duration_seconds,
-                math::mean(duration_seconds) as avg_duration_seconds
-            FROM audit_entries
-            WHERE project = $project {time_filter}
-            """,
-            params,
-        )
+        if not self.is_enabled:
+            raise RuntimeError("SurrealDB is not enabled")
 
-        if result:
-            stats = result[0]
-            total = stats.get("total", 0)
-            return {
-                "total": total,
-                "success_count": stats.get("success_count", 0),
-                "failed_count": stats.get("failed_count", 0),
-                "timeout_count": stats.get("timeout_count", 0),
-                "success_rate": stats.get("success_count", 0) / total if total > 0 else 0,
-                "total_cost_usd": stats.get("total_cost_usd", 0) or 0,
-                "total_duration_seconds": stats.get("total_duration_seconds", 0) or 0,
-                "avg_duration_seconds": stats.get("avg_duration_seconds", 0) or 0,
-            }
+        from orchestrator.db.repositories.audit import get_audit_repository
 
+        stats = await get_audit_repository(project_name).get_statistics(since=since)
         return {
-            "total": 0,
-            "success_count": 0,
-            "failed_count": 0,
-            "timeout_count": 0,
-            "success_rate": 0,
-            "total_cost_usd": 0,
-            "total_duration_seconds": 0,
-            "avg_duration_seconds": 0,
+            "total": stats.total,
+            "success_count": stats.success_count,
+            "failed_count": stats.failed_count,
+            "timeout_count": stats.timeout_count,
+            "success_rate": stats.success_rate,
+            "total_cost_usd": stats.total_cost_usd,
+            "total_duration_seconds": stats.total_duration_seconds,
+            "avg_duration_seconds": stats.avg_duration_seconds,
+            "by_agent": stats.by_agent,
+            "by_status": stats.by_status,
         }
 
     async def subscribe_to_changes(
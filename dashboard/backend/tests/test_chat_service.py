@@ -166,3 +166,52 @@ class TestChatHistory:
 
         # Should not raise
         history.clear()
+
+    def test_add_message_round_trip(self, temp_project_dir: Path):
+        """Test added messages are returned oldest first."""
+        history = ChatHistory(temp_project_dir)
+
+        history.add_message("user", "Hello")
+        history.add_message("assistant", "Hi there!", metadata={"model": "sonnet"})
+
+        result = history.get_history()
+
+        assert [m["content"] for m in result] == ["Hello", "Hi there!"]
+        assert result[1]["metadata"] == {"model": "sonnet"}
+
+    def test_get_page_walks_back(self, temp_project_dir: Path):
+        """Test get_page returns older messages through the cursor."""
+        history = ChatHistory(temp_project_dir)
+        for i in range(10):
+            history.add_message("user", f"Message {i}")
+
+        first = history.get_page(limit=4)
+        second = history.get_page(limit=4, before=first["cursor"])
+        last = history.get_page(limit=4, before=second["cursor"])
+
+        assert [m["content"] for m in first["messages"]] == [f"Message {i}" for i in range(6, 10)]
+        assert [m["content"] for m in second["messages"]] == [f"Message {i}" for i in range(2, 6)]
+        assert [m["content"] for m in last["messages"]] == ["Message 0", "Message 1"]
+        assert last["cursor"] is None
+
+    def test_get_page_invalid_cursor(self, temp_project_dir: Path):
+        """Test get_page rejects malformed cursors."""
+        history = ChatHistory(temp_project_dir)
+
+        with pytest.raises(ValueError):
+            history.get_page(before="not-a-cursor")
+
+    def test_clear_removes_segments(self, temp_project_dir: Path):
+        """Test clear removes sealed history segments."""
+        history = ChatHistory(temp_project_dir)
+        history._log.segment_bytes = 200
+        for i in range(20):
+            history.add_message("user", f"Message {i}")
+
+        segments_dir = temp_project_dir / ".workflow" / "chat_history"
+        assert any(segments_dir.glob("segment-*.jsonl"))
+
+        history.clear()
+
+        assert not segments_dir.exists()
+        assert history.get_history() == []
@@ -1,38 +1,41 @@
 """Tests for rate limiting middleware."""
 
-import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from app.middleware.rate_limit import ClientState, RateLimitConfig, RateLimitMiddleware
+from app.middleware.rate_limit import ClientState, RateLimitConfig, RateLimitMiddleware, _gcra
 
 
 class TestClientState:
-    """Tests for ClientState tracking."""
+    """Tests for GCRA client state."""
 
-    def test_cleanup_removes_old_timestamps(self):
-        """Cleanup should remove timestamps outside the window."""
-        state = ClientState()
-        now = time.time()
-
-        # Add some old and new timestamps
-        state.timestamps = [now - 120, now - 90, now - 30, now - 10, now]
+    def test_burst_then_steady_rate(self):
+        """A limit admits a full burst, then one request per interval."""
+        tat, now = 0.0, 100.0
+        for _ in range(5):
+            tat, wait = _gcra(tat, now, limit=5, period=60.0)
+            assert wait <= 0
 
-        state.cleanup(60)  # 60 second window
+        _, wait = _gcra(tat, now, limit=5, period=60.0)
+        assert wait == pytest.approx(12.0)
 
-        # Should only keep timestamps within the last 60 seconds
-        assert len(state.timestamps) == 3
+        _, wait = _gcra(tat, now + 12.0, limit=5, period=60.0)
+        assert wait <= 0
 
-    def test_count_in_window(self):
-        """Should count requests within the specified window."""
+    def test_usage_expires(self):
+        """A client is idle once its arrival times have passed."""
         state = ClientState()
-        now = time.time()
+        state.minute_tat, _ = _gcra(0.0, 100.0, limit=60, period=60.0)
 
-        state.timestamps = [now - 5, now - 3, now - 1, now]
+        assert not state.is_idle(100.0)
+        assert state.is_idle(101.0)
 
-        assert state.count_in_window(2) == 2  # Last 2 seconds
-        assert state.count_in_window(10) == 4  # Last 10 seconds
+    def test_zero_limit_denies(self):
+        """A zero limit never admits requests."""
+        _, wait = _gcra(0.0, 100.0, limit=0, period=1.0)
+
+        assert wait > 0
 
 
 class TestRateLimitConfig:
@@ -44,6 +47,7 @@ class TestRateLimitConfig:
         assert config.requests_per_minute == 60
         assert config.requests_per_second == 10
         assert config.enabled is True
+        assert config.max_clients == 10_000
 
     def test_path_overrides(self):
         """Should support path-specific overrides."""
@@ -127,6 +131,51 @@ class TestRateLimitMiddleware:
         allowed, _ = middleware._check_rate_limit(client_id, per_minute=5, per_second=2)
         assert allowed is True
 
+    def test_remaining_budget(self, middleware):
+        """Remaining budget reflects requests made in the last minute."""
+        assert middleware._get_remaining("test-client-remaining", per_minute=5) == (5, 0.0)
+
+        middleware._check_rate_limit("test-client-remaining", per_minute=5, per_second=10)
+        remaining, reset_after = middleware._get_remaining("test-client-remaining", per_minute=5)
+
+        assert remaining == 4
+        assert 0 < reset_after <= 12
+
+    def test_client_count_is_bounded(self):
+        """Least recently seen clients are evicted beyond max_clients."""
+        middleware = RateLimitMiddleware(MagicMock(), config=RateLimitConfig(max_clients=64))
+
+        for i in range(5000):
+            middleware._check_rate_limit(f"10.0.{i // 256}.{i % 256}", per_minute=5, per_second=2)
+
+        assert middleware.client_count <= 64
+
+    def test_recent_client_survives_eviction(self):
+        """A client seen again is moved to the back of the LRU."""
+        middleware = RateLimitMiddleware(MagicMock(), config=RateLimitConfig(max_clients=64))
+
+        for i in range(200):
+            middleware._check_rate_limit("busy", per_minute=1000, per_second=1000)
+            middleware._check_rate_limit(f"client-{i}", per_minute=5, per_second=2)
+
+        assert "busy" in middleware._shard("busy").clients
+
+    def test_idle_clients_dropped(self, middleware, monkeypatch):
+        """Clients whose usage has expired are dropped as new clients arrive."""
+        clock = [1000.0]
+        monkeypatch.setattr("app.middleware.rate_limit.time.monotonic", lambda: clock[0])
+        for i in range(100):
+            middleware._check_rate_limit(f"old-{i}", per_minute=5, per_second=2)
+
+        clock[0] += 120
+        for i in range(100):
+            middleware._check_rate_limit(f"new-{i}", per_minute=5, per_second=2)
+
+        remaining_old = sum(
+            client.startswith("old-") for shard in middleware._shards for client in shard.clients
+        )
+        assert remaining_old < 100
+
     def test_get_client_id_from_direct_client(self, middleware):
         """Should get client ID from direct connection."""
         request = MagicMock()
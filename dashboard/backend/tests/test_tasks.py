@@ -1,6 +1,6 @@
 """Tests for tasks API router."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi.testclient import TestClient
 
@@ -91,3 +91,71 @@ class TestGetTaskHistory:
         assert len(data) == 1
         assert data[0]["id"] == "entry1"
         assert data[0]["agent"] == "claude"
+
+
+class TestListTasksPagination:
+    """Tests for filtered, paginated task listing."""
+
+    def _repo(self) -> MagicMock:
+        from orchestrator.db.repositories.tasks import Task, TaskPage
+
+        repo = MagicMock()
+        repo.list_tasks = AsyncMock(
+            return_value=TaskPage(
+                tasks=[Task(id="T1", title="Task 1"), Task(id="T2", title="Task 2")],
+                next_cursor="T2",
+            )
+        )
+        repo.get_cached_progress = AsyncMock(
+            return_value={"total": 10, "completed": 4, "in_progress": 1, "pending": 5, "failed": 0}
+        )
+        return repo
+
+    def test_filters_and_cursor_passed_to_repository(self, client_with_mocks: TestClient):
+        """Test that filters, cursor and limit are pushed into the repository query."""
+        repo = self._repo()
+        with patch("app.routers.tasks.get_task_repository", return_value=repo):
+            response = client_with_mocks.get(
+                "/api/projects/test-project/tasks"
+                "?status=pending,failed&milestone=M1&priority=2&cursor=T0&limit=2"
+            )
+
+        assert response.status_code == 200
+        kwargs = repo.list_tasks.await_args.kwargs
+        assert kwargs["statuses"] == ["pending", "failed"]
+        assert kwargs["milestone_id"] == "M1"
+        assert kwargs["priorities"] == ["high"]
+        assert kwargs["after"] == "T0"
+        assert kwargs["limit"] == 2
+
+    def test_page_with_cached_progress(self, client_with_mocks: TestClient):
+        """Test that counts come from cached progress and the next cursor is returned."""
+        repo = self._repo()
+        with patch("app.routers.tasks.get_task_repository", return_value=repo):
+            response = client_with_mocks.get("/api/projects/test-project/tasks?limit=2")
+
+        data = response.json()
+        assert [t["id"] for t in data["tasks"]] == ["T1", "T2"]
+        assert data["next_cursor"] == "T2"
+        assert data["total"] == 10
+        assert data["completed"] == 4
+        repo.get_cached_progress.assert_awaited_once()
+
+    def test_detail_view_fetches_all_fields(self, client_with_mocks: TestClient):
+        """Test that the detail view does not project fields."""
+        from orchestrator.db.repositories.tasks import TASK_LIST_FIELDS
+
+        repo = self._repo()
+        with patch("app.routers.tasks.get_task_repository", return_value=repo):
+            client_with_mocks.get("/api/projects/test-project/tasks")
+            client_with_mocks.get("/api/projects/test-project/tasks?view=detail")
+
+        calls = repo.list_tasks.await_args_list
+        assert calls[0].kwargs["fields"] == TASK_LIST_FIELDS
+        assert calls[1].kwargs["fields"] is None
+
+    def test_invalid_view_rejected(self, client_with_mocks: TestClient):
+        """Test that unknown views are rejected."""
+        response = client_with_mocks.get("/api/projects/test-project/tasks?view=full")
+
+        assert response.status_code == 422
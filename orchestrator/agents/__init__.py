@@ -7,6 +7,7 @@ This module provides wrappers for various CLI agents used in the orchestrator:
 
 Enhanced features available across agents:
 - Session continuity for iterative refinement
+- Warm worker processes that skip CLI cold starts
 - Audit trail for debugging and compliance
 - Error context preservation for intelligent retries
 - Budget control for cost management
@@ -34,6 +35,7 @@ from .budget import (
     BudgetExceeded,
     BudgetManager,
     SpendRecord,
+    estimate_prompt_cost,
     get_model_pricing,
 )
 from .claude_agent import ClaudeAgent
@@ -46,6 +48,14 @@ from .security_specialist import (
     get_security_specialist,
 )
 from .session_manager import SessionInfo, SessionManager
+from .worker_pool import (
+    AgentWorker,
+    AgentWorkerPool,
+    WorkerError,
+    WorkerReply,
+    WorkerTimeout,
+    get_worker_pool,
+)
 
 __all__ = [
     # Base classes
@@ -61,6 +71,13 @@ __all__ = [
     # Session management
     "SessionManager",
     "SessionInfo",
+    # Warm worker processes
+    "AgentWorker",
+    "AgentWorkerPool",
+    "WorkerReply",
+    "WorkerError",
+    "WorkerTimeout",
+    "get_worker_pool",
     # Error handling
     "ErrorContextManager",
     "ErrorContext",
@@ -73,6 +90,7 @@ __all__ = [
     "SpendRecord",
     "AGENT_PRICING",
     "get_model_pricing",
+    "estimate_prompt_cost",
     # Adapter layer
     "AgentType",
     "AgentAdapter",
@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from .worker_pool import WorkerError, WorkerTimeout, get_worker_pool
+
 logger = logging.getLogger(__name__)
 
 # Default timeouts by phase (in seconds)
@@ -85,6 +87,9 @@ class BaseAgent(ABC):
 
     name: str = "base"
 
+    # Whether the CLI accepts stream-json input, so calls can use warm workers
+    supports_warm_workers: bool = False
+
     def __init__(
         self,
         project_dir: str | Path,
@@ -286,15 +291,20 @@ class BaseAgent(ABC):
         """Execute the actual subprocess command."""
         start_time = time.time()
 
+        pool = get_worker_pool() if self.supports_warm_workers else None
+
         try:
-            result = subprocess.run(
-                command,
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                env={**os.environ, "TERM": "dumb"},
-            )
+            if pool is not None:
+                result = pool.run(command, cwd=self.project_dir, timeout=timeout)
+            else:
+                result = subprocess.run(
+                    command,
+                    cwd=self.project_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    env={**os.environ, "TERM": "dumb"},
+                )
 
             duration = time.time() - start_time
             output = result.stdout
@@ -351,7 +361,7 @@ class BaseAgent(ABC):
                 model=model,
             )
 
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, WorkerTimeout):
             duration = time.time() - start_time
             return AgentResult(
                 success=False,
@@ -391,6 +401,15 @@ class BaseAgent(ABC):
                 duration_seconds=duration,
             )
 
+        except WorkerError as e:
+            duration = time.time() - start_time
+            return AgentResult(
+                success=False,
+                error=f"Agent worker failed: {e}",
+                exit_code=-1,
+                duration_seconds=duration,
+            )
+
         except Exception as e:
             # Log unexpected exceptions for debugging
             cli_cmd = self.get_cli_command()
@@ -870,6 +870,31 @@ def estimate_cost(
     return input_cost + output_cost
 
 
+def estimate_prompt_cost(
+    model: str,
+    prompt: str,
+    max_output_tokens: int,
+    agent: str = "claude",
+) -> float:
+    """Estimate the cost of sending a prompt, for budget pre-checks.
+
+    Counts prompt tokens with the shared token counter rather than a
+    character-based guess, so reservations track the real prompt size.
+
+    Args:
+        model: Model name
+        prompt: Prompt text to be sent
+        max_output_tokens: Expected (or maximum) completion tokens
+        agent: Agent type (claude, cursor, gemini)
+
+    Returns:
+        Estimated cost in USD
+    """
+    from ..utils.token_counter import count_tokens
+
+    return estimate_cost(model, count_tokens(prompt), max_output_tokens, agent)
+
+
 # Agent pricing lookup table for quick access
 AGENT_PRICING = {
     "claude": {
@@ -6,6 +6,7 @@ Supports advanced CLI features:
 - JSON Schema Validation: --json-schema for structured output
 - Budget Control: --max-budget-usd for cost management
 - Fallback Model: --fallback-model for resilience
+- Warm Workers: long-lived stream-json processes when enabled (see worker_pool)
 
 Reference: https://docs.anthropic.com/claude-code/cli
 """
@@ -17,6 +18,7 @@ from typing import TYPE_CHECKING, Any, Optional
 from ..config.models import DEFAULT_CLAUDE_MODEL
 from .base import AgentResult, BaseAgent
 from .prompts import format_prompt, load_prompt
+from .worker_pool import get_worker_pool
 
 if TYPE_CHECKING:
     from ..storage import SessionStorageAdapter
@@ -42,6 +44,7 @@ class ClaudeAgent(BaseAgent):
     """
 
     name = "claude"
+    supports_warm_workers = True
 
     def __init__(
         self,
@@ -611,6 +614,11 @@ When complete, output a JSON object:
             True if session was closed
         """
         if self._session_manager:
+            pool = get_worker_pool()
+            if pool is not None:
+                session = self._session_manager.get_active_session(task_id)
+                if session is not None:
+                    pool.release_session(session.id)
             return self._session_manager.close_session(task_id)
         return False
 
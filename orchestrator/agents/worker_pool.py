@@ -0,0 +1,610 @@
+"""Pool of long-lived Claude CLI processes in streaming-input mode.
+
+Every ``claude -p`` call pays CLI startup, auth and MCP server boot before
+the model sees the prompt. For short evaluator and review calls that is a
+large share of the total latency. The pool removes it from the critical path:
+
+- Workers run ``claude -p --input-format stream-json --output-format
+  stream-json`` (the stream-json formats only work in print mode) and
+  receive prompts as JSON lines on stdin, so one process can answer
+  several messages.
+- Stateless calls (no ``--session-id``/``--resume``) get a pre-warmed spare
+  process and use it once, so each call still starts with a fresh context.
+  A replacement spare is booted in the background.
+- Session calls lease a worker bound to the session id. The process keeps
+  the conversation between calls and is recycled after ``max_uses``
+  messages or on any error; its replacement resumes the session with
+  ``--resume``.
+
+Pooling is opt-in. Set ``ORCHESTRATOR_WARM_WORKERS`` to the number of spare
+processes to keep per command shape (0 disables it), and optionally
+``ORCHESTRATOR_WORKER_CLI`` to the command that replaces ``claude``
+(e.g. a fake CLI for local testing).
+
+Usage:
+    pool = get_worker_pool()
+    if pool is not None:
+        reply = pool.run(command, cwd=project_dir, timeout=300)
+        output = reply.stdout
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import queue
+import shlex
+import subprocess
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Optional
+
+logger = logging.getLogger(__name__)
+
+WARM_WORKERS_ENV = "ORCHESTRATOR_WARM_WORKERS"
+WORKER_CLI_ENV = "ORCHESTRATOR_WORKER_CLI"
+WORKER_MAX_USES_ENV = "ORCHESTRATOR_WORKER_MAX_USES"
+
+DEFAULT_SPARES = 1
+DEFAULT_MAX_USES = 20
+
+# Spare processes are kept for at most this many distinct command shapes
+MAX_SPARE_SPECS = 8
+
+# Seconds to wait for a worker to exit after closing stdin / terminating
+SHUTDOWN_GRACE_SECONDS = 5.0
+
+STDERR_TAIL_LINES = 20
+
+# Options consumed by the pool rather than passed to the worker process
+_SESSION_OPTIONS = ("--session-id", "--resume")
+
+
+class WorkerError(Exception):
+    """A worker process failed, exited or produced an unusable reply."""
+
+
+class WorkerTimeout(WorkerError):
+    """A worker did not produce a result in time."""
+
+
+@dataclass
+class WorkerRequest:
+    """A one-shot CLI command split into worker arguments and a message.
+
+    Attributes:
+        prompt: Prompt sent as a stream-json user message
+        output_format: Output format the caller asked for (json or text)
+        args: Remaining CLI options, which define the worker's shape
+        session_args: ``--session-id``/``--resume`` options, if any
+    """
+
+    prompt: str
+    output_format: str = "text"
+    args: tuple[str, ...] = ()
+    session_args: tuple[str, ...] = ()
+
+    @property
+    def session_id(self) -> Optional[str]:
+        return self.session_args[1] if self.session_args else None
+
+    @classmethod
+    def from_command(cls, command: list[str]) -> "WorkerRequest":
+        """Parse a ``claude -p <prompt> ...`` command.
+
+        Raises:
+            ValueError: If the command has no ``-p`` prompt
+        """
+        prompt: Optional[str] = None
+        output_format = "text"
+        args: list[str] = []
+        session_args: list[str] = []
+        tokens = iter(command[1:])
+        for token in tokens:
+            if token in ("-p", "--print"):
+                prompt = next(tokens, "")
+            elif token == "--output-format":
+                output_format = next(tokens, output_format)
+            elif token in _SESSION_OPTIONS:
+                session_args = [token, next(tokens, "")]
+            else:
+                args.append(token)
+        if prompt is None:
+            raise ValueError("Command has no -p prompt")
+        return cls(prompt, output_format, tuple(args), tuple(session_args))
+
+
+@dataclass
+class WorkerReply:
+    """Result of one message, shaped like a completed one-shot process.
+
+    Attributes:
+        result: The ``result`` event emitted by the CLI
+        output_format: Output format the caller asked for
+        session_id: Session the message ran in
+        duration_seconds: Time from sending the prompt to the result
+    """
+
+    result: dict
+    output_format: str = "text"
+    session_id: Optional[str] = None
+    duration_seconds: float = 0.0
+
+    @property
+    def text(self) -> str:
+        return str(self.result.get("result") or "")
+
+    @property
+    def is_error(self) -> bool:
+        return bool(self.result.get("is_error"))
+
+    @property
+    def returncode(self) -> int:
+        return 1 if self.is_error else 0
+
+    @property
+    def stdout(self) -> str:
+        """Output as the one-shot CLI would have printed it."""
+        if self.output_format == "json":
+            return json.dumps(self.result)
+        return self.text
+
+    @property
+    def stderr(self) -> str:
+        return self.text if self.is_error else ""
+
+
+class AgentWorker:
+    """One long-lived CLI process answering stream-json messages.
+
+    Thread-safe: concurrent ``send`` calls are serialized.
+    """
+
+    def __init__(self, command: list[str], cwd: Path | str):
+        """Start the worker process.
+
+        Args:
+            command: Full command line, including the stream-json options
+            cwd: Working directory for the process
+
+        Raises:
+            FileNotFoundError: If the CLI is not installed
+        """
+        self.command = command
+        self.cwd = str(cwd)
+        self.uses = 0
+        self.session_id: Optional[str] = None
+        self._lock = threading.Lock()
+        self._events: queue.Queue[Optional[str]] = queue.Queue()
+        self._stderr: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+        self.process = subprocess.Popen(
+            command,
+            cwd=self.cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env={**os.environ, "TERM": "dumb"},
+        )
+        assert self.process.stdin is not None
+        assert self.process.stdout is not None
+        assert self.process.stderr is not None
+        self._stdin: IO[str] = self.process.stdin
+        self._stdout: IO[str] = self.process.stdout
+        self._stderr_stream: IO[str] = self.process.stderr
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def _read_stdout(self) -> None:
+        try:
+            for line in self._stdout:
+                self._events.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._events.put(None)
+
+    def _read_stderr(self) -> None:
+        try:
+            for line in self._stderr_stream:
+                self._stderr.append(line.rstrip())
+        except (OSError, ValueError):
+            pass
+
+    def _exit_error(self) -> WorkerError:
+        try:
+            code = self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            code = None
+        detail = "\n".join(self._stderr)
+        return WorkerError(f"Worker exited with code {code}" + (f": {detail}" if detail else ""))
+
+    def send(self, prompt: str, timeout: float, output_format: str = "text") -> WorkerReply:
+        """Send a prompt and wait for its result event.
+
+        Args:
+            prompt: User message text
+            timeout: Seconds to wait for the result
+            output_format: Output format recorded on the reply
+
+        Returns:
+            WorkerReply for the message
+
+        Raises:
+            WorkerTimeout: If no result arrives in time (the worker is closed)
+            WorkerError: If the process exits or cannot be written to
+        """
+        message = {
+            "type": "user",
+            "message": {"role": "user", "content": [{"type": "text", "text": prompt}]},
+        }
+        with self._lock:
+            start = time.monotonic()
+            deadline = start + timeout
+            try:
+                self._stdin.write(json.dumps(message) + "\n")
+                self._stdin.flush()
+            except (BrokenPipeError, OSError, ValueError) as e:
+                raise self._exit_error() from e
+            self.uses += 1
+
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    line = self._events.get(timeout=max(remaining, 0))
+                except queue.Empty:
+                    self.close()
+                    raise WorkerTimeout(f"Worker timed out after {timeout} seconds") from None
+                if line is None:
+                    raise self._exit_error()
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(event, dict):
+                    continue
+                if event.get("session_id"):
+                    self.session_id = event["session_id"]
+                if event.get("type") == "result":
+                    return WorkerReply(
+                        result=event,
+                        output_format=output_format,
+                        session_id=self.session_id,
+                        duration_seconds=time.monotonic() - start,
+                    )
+
+    def terminate(self) -> None:
+        """Signal the process to stop without waiting for it to exit."""
+        if self.process.poll() is None:
+            self.process.terminate()
+
+    def close(self) -> None:
+        """Stop the process: close stdin, then terminate, then kill."""
+        if self.process.poll() is None:
+            try:
+                self._stdin.close()
+            except OSError:
+                pass
+            try:
+                self.process.wait(timeout=0.2)
+            except subprocess.TimeoutExpired:
+                self.process.terminate()
+                try:
+                    self.process.wait(timeout=SHUTDOWN_GRACE_SECONDS)
+                except subprocess.TimeoutExpired:
+                    logger.warning(f"Worker {self.pid} didn't terminate, sending SIGKILL")
+                    self.process.kill()
+                    self.process.wait()
+        for stream in (self._stdin, self._stdout, self._stderr_stream):
+            try:
+                stream.close()
+            except (OSError, ValueError):
+                pass
+
+
+# Spare workers are interchangeable when they share a working directory and
+# the CLI options they were started with
+_Spec = tuple[str, tuple[str, ...]]
+
+
+@dataclass
+class _Lease:
+    worker: AgentWorker
+    spec: _Spec
+    session_id: Optional[str] = None
+
+
+@dataclass
+class PoolStats:
+    """Counters describing pool behaviour."""
+
+    warm_starts: int = 0
+    cold_starts: int = 0
+    session_reuses: int = 0
+    recycled: int = 0
+    spawned: int = 0
+
+
+class AgentWorkerPool:
+    """Leases warm CLI workers to agent calls.
+
+    Thread-safe. See the module docstring for the leasing rules.
+    """
+
+    def __init__(
+        self,
+        spares: int = DEFAULT_SPARES,
+        max_uses: int = DEFAULT_MAX_USES,
+        cli: Optional[list[str]] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            spares: Pre-warmed processes to keep per command shape
+            max_uses: Messages a session worker answers before it is recycled
+            cli: Command replacing the ``claude`` executable
+        """
+        self.spares = spares
+        self.max_uses = max_uses
+        self.cli = list(cli) if cli else ["claude"]
+        self.stats = PoolStats()
+        self._lock = threading.Lock()
+        self._idle: OrderedDict[_Spec, list[AgentWorker]] = OrderedDict()
+        self._booting: dict[_Spec, int] = {}
+        self._sessions: dict[str, AgentWorker] = {}
+        self._busy_sessions: set[str] = set()
+        self._started_sessions: set[str] = set()
+        self._closed = False
+
+    def _worker_command(self, args: tuple[str, ...], session_args: tuple[str, ...]) -> list[str]:
+        return [
+            *self.cli,
+            "-p",
+            "--input-format",
+            "stream-json",
+            "--output-format",
+            "stream-json",
+            "--verbose",
+            *args,
+            *session_args,
+        ]
+
+    def _spawn(self, spec: _Spec, session_args: tuple[str, ...] = ()) -> AgentWorker:
+        worker = AgentWorker(self._worker_command(spec[1], session_args), spec[0])
+        with self._lock:
+            self.stats.spawned += 1
+        return worker
+
+    def _acquire(self, request: WorkerRequest, cwd: Path | str) -> _Lease:
+        spec: _Spec = (str(cwd), request.args)
+        session_id = request.session_id
+
+        if session_id:
+            with self._lock:
+                if session_id in self._busy_sessions:
+                    raise WorkerError(f"Session {session_id} is already in use")
+                self._busy_sessions.add(session_id)
+                worker = self._sessions.pop(session_id, None)
+                started = session_id in self._started_sessions
+            if worker is not None and worker.alive:
+                with self._lock:
+                    self.stats.session_reuses += 1
+                return _Lease(worker, spec, session_id)
+            if worker is not None:
+                worker.close()
+            # A session that already ran in a worker must be resumed, not recreated
+            session_args = ("--resume", session_id) if started else request.session_args
+            try:
+                worker = self._spawn(spec, session_args)
+            except BaseException:
+                with self._lock:
+                    self._busy_sessions.discard(session_id)
+                raise
+            with self._lock:
+                self.stats.cold_starts += 1
+            return _Lease(worker, spec, session_id)
+
+        worker = None
+        with self._lock:
+            idle = self._idle.get(spec)
+            while idle and worker is None:
+                candidate = idle.pop()
+                if candidate.alive:
+                    worker = candidate
+            if idle is not None:
+                self._idle.move_to_end(spec)
+            if worker is not None:
+                self.stats.warm_starts += 1
+        if worker is None:
+            worker = self._spawn(spec)
+            with self._lock:
+                self.stats.cold_starts += 1
+        self._replenish(spec)
+        return _Lease(worker, spec)
+
+    def _release(self, lease: _Lease, failed: bool) -> None:
+        worker = lease.worker
+        if lease.session_id is None:
+            # Stateless workers are single-use so no context leaks between calls
+            worker.close()
+            return
+
+        with self._lock:
+            self._busy_sessions.discard(lease.session_id)
+            if worker.uses:
+                self._started_sessions.add(lease.session_id)
+            recycle = failed or self._closed or worker.uses >= self.max_uses or not worker.alive
+            if recycle:
+                self.stats.recycled += 1
+            else:
+                self._sessions[lease.session_id] = worker
+        if recycle:
+            worker.close()
+
+    def _replenish(self, spec: _Spec) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            idle = self._idle.setdefault(spec, [])
+            self._idle.move_to_end(spec)
+            missing = self.spares - len(idle) - self._booting.get(spec, 0)
+            if missing <= 0:
+                return
+            self._booting[spec] = self._booting.get(spec, 0) + missing
+            evicted = []
+            while len(self._idle) > MAX_SPARE_SPECS:
+                _, workers = self._idle.popitem(last=False)
+                evicted.extend(workers)
+        for worker in evicted:
+            worker.close()
+        for _ in range(missing):
+            threading.Thread(target=self._boot_spare, args=(spec,), daemon=True).start()
+
+    def _boot_spare(self, spec: _Spec) -> None:
+        try:
+            worker = self._spawn(spec)
+        except Exception as e:
+            logger.warning(f"Failed to start spare worker: {e}")
+            worker = None
+        with self._lock:
+            self._booting[spec] -= 1
+            if worker is not None and not self._closed and spec in self._idle:
+                self._idle[spec].append(worker)
+                worker = None
+        if worker is not None:
+            worker.close()
+
+    def run(self, command: list[str], cwd: Path | str, timeout: float) -> WorkerReply:
+        """Run a one-shot ``claude -p`` command on a warm worker.
+
+        Args:
+            command: Command as built for ``subprocess.run``
+            cwd: Working directory
+            timeout: Seconds to wait for the result
+
+        Returns:
+            WorkerReply
+
+        Raises:
+            WorkerTimeout: If the worker did not answer in time
+            WorkerError: If the worker failed
+            FileNotFoundError: If the CLI is not installed
+        """
+        request = WorkerRequest.from_command(command)
+        lease = self._acquire(request, cwd)
+        return self._send(lease, request, timeout)
+
+    async def arun(self, command: list[str], cwd: Path | str, timeout: float) -> WorkerReply:
+        """Async ``run``; cancelling the call stops the leased worker."""
+        request = WorkerRequest.from_command(command)
+        # Acquiring only starts processes; it never waits for them to boot
+        lease = self._acquire(request, cwd)
+        try:
+            return await asyncio.to_thread(self._send, lease, request, timeout)
+        except asyncio.CancelledError:
+            # Don't block the event loop: the send thread sees EOF, releases
+            # the lease as failed and reaps the process
+            lease.worker.terminate()
+            raise
+
+    def _send(self, lease: _Lease, request: WorkerRequest, timeout: float) -> WorkerReply:
+        failed = True
+        try:
+            reply = lease.worker.send(request.prompt, timeout, request.output_format)
+            failed = reply.is_error
+            if lease.session_id and reply.session_id and reply.session_id != lease.session_id:
+                logger.debug(f"Session {lease.session_id} continued as {reply.session_id}")
+            return reply
+        finally:
+            self._release(lease, failed)
+
+    def release_session(self, session_id: str) -> bool:
+        """Stop the worker bound to a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if a worker was stopped
+        """
+        with self._lock:
+            worker = self._sessions.pop(session_id, None)
+            self._started_sessions.discard(session_id)
+        if worker is None:
+            return False
+        worker.close()
+        return True
+
+    def shutdown(self) -> None:
+        """Stop all idle and session workers."""
+        with self._lock:
+            self._closed = True
+            workers = [w for idle in self._idle.values() for w in idle]
+            workers.extend(self._sessions.values())
+            self._idle.clear()
+            self._sessions.clear()
+        for worker in workers:
+            worker.close()
+
+    def idle_count(self) -> int:
+        """Number of spare workers ready to be leased."""
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+
+_default_pool: Optional[AgentWorkerPool] = None
+_default_lock = threading.Lock()
+
+
+def get_worker_pool() -> Optional[AgentWorkerPool]:
+    """Get the shared worker pool, or None if warm workers are disabled."""
+    global _default_pool
+    if _default_pool is not None:
+        return _default_pool
+    try:
+        spares = int(os.environ.get(WARM_WORKERS_ENV, "0"))
+    except ValueError:
+        logger.warning(f"Invalid {WARM_WORKERS_ENV}, warm workers disabled")
+        return None
+    if spares <= 0:
+        return None
+    with _default_lock:
+        if _default_pool is None:
+            cli = os.environ.get(WORKER_CLI_ENV)
+            _default_pool = AgentWorkerPool(
+                spares=spares,
+                max_uses=int(os.environ.get(WORKER_MAX_USES_ENV, DEFAULT_MAX_USES)),
+                cli=shlex.split(cli) if cli else None,
+            )
+    return _default_pool
+
+
+def set_worker_pool(pool: Optional[AgentWorkerPool]) -> None:
+    """Replace the shared pool (None re-reads the environment on next use)."""
+    global _default_pool
+    with _default_lock:
+        previous, _default_pool = _default_pool, pool
+    if previous is not None and previous is not pool:
+        previous.shutdown()
+
+
+def shutdown_worker_pool() -> None:
+    """Stop the shared pool's workers."""
+    if _default_pool is not None:
+        _default_pool.shutdown()
+
+
+atexit.register(shutdown_worker_pool)
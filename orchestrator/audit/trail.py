@@ -8,7 +8,8 @@ Records every CLI invocation with:
 - Parsed output (if available)
 - Cost information (if available)
 
-Storage: Append-only JSONL format for efficient querying.
+Storage: Append-only JSONL format for efficient querying. Entries are
+written by the shared background LogWriter in batches; queries flush it first.
 
 Usage:
     trail = AuditTrail(project_dir)
@@ -40,6 +41,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+from orchestrator.utils.log_writer import LogWriter, get_log_writer
+
 logger = logging.getLogger(__name__)
 
 # Default storage location
@@ -214,15 +217,18 @@ class AuditTrail:
         self,
         project_dir: Path | str,
         config: Optional[AuditConfig] = None,
+        writer: Optional[LogWriter] = None,
     ):
         """Initialize audit trail.
 
         Args:
             project_dir: Project directory
             config: Audit configuration
+            writer: Background writer (shared process writer if None)
         """
         self.project_dir = Path(project_dir)
         self.config = config or AuditConfig()
+        self._writer = writer or get_log_writer()
 
         self.audit_dir = self.project_dir / self.config.audit_dir
         self.log_file = self.audit_dir / self.config.log_file
@@ -320,12 +326,15 @@ class AuditTrail:
             # Check for log rotation
             self._maybe_rotate()
 
-            # Append to log file
-            with open(self.log_file, "a") as f:
-                f.write(json.dumps(entry.to_dict()) + "\n")
+            # Queue append; the writer batches lines per file
+            self._writer.append(self.log_file, json.dumps(entry.to_dict()) + "\n")
 
         logger.debug(f"Audit entry committed: {entry.id} ({entry.agent}/{entry.task_id})")
 
+    def flush(self) -> None:
+        """Wait until committed entries are on disk."""
+        self._writer.flush()
+
     @contextmanager
     def record(
         self,
@@ -383,7 +392,8 @@ class AuditTrail:
         if size_mb < self.config.max_log_size_mb:
             return
 
-        # Rotate: rename current file with timestamp
+        # Rotate: land queued entries first, then rename current file with timestamp
+        self._writer.flush()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         rotated_name = f"invocations_{timestamp}.jsonl"
         rotated_path = self.audit_dir / rotated_name
@@ -429,6 +439,7 @@ class AuditTrail:
         Returns:
             List of matching AuditEntry objects
         """
+        self.flush()
         if not self.log_file.exists():
             return []
 
@@ -458,6 +469,7 @@ class AuditTrail:
 
     def _iter_entries(self) -> Iterator[AuditEntry]:
         """Iterate over all entries in the log file."""
+        self.flush()
         if not self.log_file.exists():
             return
 
@@ -4,6 +4,11 @@ Provides configurable thresholds, feature flags, and project-type
 specific defaults. Includes JSON schema validation for configuration files.
 """
 
+from .context_cache import (
+    ProjectContextCache,
+    get_active_context_cache,
+    use_context_cache,
+)
 from .thresholds import (
     DEFAULT_CONFIGS,
     ConfigValidationError,
@@ -30,4 +35,7 @@ __all__ = [
     "load_project_config",
     "validate_config",
     "ConfigValidationError",
+    "ProjectContextCache",
+    "get_active_context_cache",
+    "use_context_cache",
 ]
@@ -0,0 +1,193 @@
+"""Run-scoped cache for project configuration and documentation context.
+
+Nodes call ``load_project_config`` and ``load_documentation_context`` on
+nearly every superstep. While a ``WorkflowRunner`` is active it installs a
+``ProjectContextCache`` in a context variable, and both loaders consult it:
+
+- Entries are keyed by kind and project directory.
+- Each entry remembers a stat fingerprint (mtime, size, inode) of the files
+  and directory trees it was built from; a lookup re-stats them and reloads
+  only when something changed.
+- ``reload()`` drops entries explicitly.
+- Callers receive a deep copy, so mutating a result never affects the cache.
+
+Outside a runner (scripts, tests) no cache is active and loaders read from
+disk as before.
+
+Usage:
+    cache = ProjectContextCache()
+    with use_context_cache(cache):
+        config = load_project_config(project_dir)  # Loaded
+        config = load_project_config(project_dir)  # Served from cache
+"""
+
+import copy
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import Any, Optional, TypeVar, cast
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Directory trees are fingerprinted to this depth
+MAX_TREE_DEPTH = 6
+
+Fingerprint = tuple[tuple[Any, ...], ...]
+
+
+def stat_fingerprint(
+    files: Iterable[Path],
+    trees: Iterable[Path] = (),
+    max_depth: int = MAX_TREE_DEPTH,
+) -> Fingerprint:
+    """Build a fingerprint from file and directory tree metadata.
+
+    Missing paths are part of the fingerprint, so creating a file changes it.
+
+    Args:
+        files: Individual files to stat
+        trees: Directories whose entries are stat'ed recursively
+        max_depth: Maximum recursion depth for trees
+
+    Returns:
+        Hashable fingerprint tuple
+    """
+    parts: list[tuple[Any, ...]] = []
+    for path in files:
+        parts.append(_stat_entry(str(path)))
+    for tree in trees:
+        _walk_tree(str(tree), 0, max_depth, parts)
+    return tuple(parts)
+
+
+def _stat_entry(path: str) -> tuple[Any, ...]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (path, None)
+    return (path, st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _walk_tree(path: str, depth: int, max_depth: int, parts: list[tuple[Any, ...]]) -> None:
+    # Directory mtimes change when entries are added, removed or renamed
+    parts.append(_stat_entry(path))
+    if depth > max_depth:
+        return
+    try:
+        with os.scandir(path) as entries:
+            children = sorted(entries, key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in children:
+        if entry.name.startswith("."):
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                _walk_tree(entry.path, depth + 1, max_depth, parts)
+            else:
+                st = entry.stat(follow_symlinks=False)
+                parts.append((entry.path, st.st_mtime_ns, st.st_size, st.st_ino))
+        except OSError:
+            parts.append((entry.path, None))
+
+
+class ProjectContextCache:
+    """Memoizes project-derived values, invalidated by stat fingerprints.
+
+    Thread-safe. Loaders run outside the lock, so concurrent misses for the
+    same key may both load; the last result wins.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple[str, str], tuple[Fingerprint, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        kind: str,
+        project_dir: Path,
+        loader: Callable[[], T],
+        files: Iterable[Path] = (),
+        trees: Iterable[Path] = (),
+    ) -> T:
+        """Return a cached value, reloading it if its inputs changed.
+
+        Args:
+            kind: Value kind (e.g. "project_config")
+            project_dir: Project directory the value belongs to
+            loader: Callable producing the value from disk
+            files: Files the value is derived from
+            trees: Directory trees the value is derived from
+
+        Returns:
+            A private deep copy of the cached value
+        """
+        key = (kind, str(Path(project_dir).resolve()))
+        fingerprint = stat_fingerprint(files, trees)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self.hits += 1
+                return cast(T, copy.deepcopy(entry[1]))
+            self.misses += 1
+
+        value = loader()
+        with self._lock:
+            self._entries[key] = (fingerprint, value)
+        return copy.deepcopy(value)
+
+    def reload(self, project_dir: Optional[Path] = None, kind: Optional[str] = None) -> None:
+        """Drop cached entries so the next lookup reads from disk.
+
+        Args:
+            project_dir: Only drop entries for this project (all if None)
+            kind: Only drop entries of this kind (all if None)
+        """
+        resolved = str(Path(project_dir).resolve()) if project_dir is not None else None
+        with self._lock:
+            for key in list(self._entries):
+                if (kind is None or key[0] == kind) and (resolved is None or key[1] == resolved):
+                    del self._entries[key]
+
+
+_active_cache: ContextVar[Optional[ProjectContextCache]] = ContextVar(
+    "project_context_cache", default=None
+)
+
+
+def get_active_context_cache() -> Optional[ProjectContextCache]:
+    """Get the cache installed for the current run, if any."""
+    return _active_cache.get()
+
+
+def activate_context_cache(cache: Optional[ProjectContextCache]) -> Token:
+    """Install a cache for the current context (and tasks spawned from it)."""
+    return _active_cache.set(cache)
+
+
+def deactivate_context_cache(token: Token) -> None:
+    """Restore the cache that was active before ``activate_context_cache``."""
+    try:
+        _active_cache.reset(token)
+    except ValueError:
+        # Token created in a different context; clear instead
+        _active_cache.set(None)
+
+
+@contextmanager
+def use_context_cache(cache: Optional[ProjectContextCache]) -> Iterator[None]:
+    """Install a cache for the duration of a block."""
+    token = activate_context_cache(cache)
+    try:
+        yield
+    finally:
+        deactivate_context_cache(token)
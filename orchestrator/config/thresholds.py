@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Optional
 
 from ..validators.security_scanner import Severity
+from .context_cache import get_active_context_cache
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 _SCHEMA_PATH = Path(__file__).parent / "project-config.schema.json"
 _SCHEMA_CACHE: Optional[dict] = None
 
+# Files load_project_config derives its result from
+PROJECT_CONFIG_FILES = (".project-config.json", "template.json", "package.json")
+
 
 class ConfigValidationError(Exception):
     """Raised when configuration fails schema validation."""
@@ -305,6 +309,13 @@ class ReviewConfig:
     # Whether to log reviewer timeouts for monitoring
     log_timeouts: bool = True
 
+    # How reviewer verdicts combine: "all", "quorum" or "any_blocking_rejects"
+    # (see orchestrator.review.ReviewPolicy)
+    policy: str = "all"
+
+    # Approvals required under the "quorum" policy (majority if None)
+    quorum: Optional[int] = None
+
 
 @dataclass
 class QualityGateConfig:
@@ -349,6 +360,8 @@ class DependencyConfig:
     generate_dependabot: bool = True
     # Generate renovate.json if missing (alternative to dependabot)
     generate_renovate: bool = False
+    # Reuse findings for unchanged manifests for this long (0 disables)
+    cache_ttl_seconds: int = 21600
 
 
 @dataclass
@@ -461,6 +474,7 @@ class ProjectConfig:
                 "blocking_severities": self.dependency.blocking_severities,
                 "generate_dependabot": self.dependency.generate_dependabot,
                 "generate_renovate": self.dependency.generate_renovate,
+                "cache_ttl_seconds": self.dependency.cache_ttl_seconds,
             },
             "review": {
                 "reviewer_timeout_seconds": self.review.reviewer_timeout_seconds,
@@ -470,6 +484,8 @@ class ProjectConfig:
                 "max_reviewer_retries": self.review.max_reviewer_retries,
                 "single_agent_preference": self.review.single_agent_preference,
                 "log_timeouts": self.review.log_timeouts,
+                "policy": self.review.policy,
+                "quorum": self.review.quorum,
             },
             "retry": self.retry.to_dict(),
         }
@@ -570,6 +586,8 @@ def load_project_config(project_dir: str | Path) -> ProjectConfig:
     """Load project configuration from .project-config.json.
 
     Falls back to detecting project type from files if no config exists.
+    Inside a workflow run the result is served from the run's context cache
+    until one of the source files changes.
 
     Args:
         project_dir: Path to the project directory
@@ -578,6 +596,19 @@ def load_project_config(project_dir: str | Path) -> ProjectConfig:
         ProjectConfig with merged settings
     """
     project_dir = Path(project_dir)
+    cache = get_active_context_cache()
+    if cache is None:
+        return _read_project_config(project_dir)
+    return cache.get(
+        "project_config",
+        project_dir,
+        lambda: _read_project_config(project_dir),
+        files=[project_dir / name for name in PROJECT_CONFIG_FILES],
+    )
+
+
+def _read_project_config(project_dir: Path) -> ProjectConfig:
+    """Read and merge project configuration from disk."""
     config_file = project_dir / ".project-config.json"
 
     # Start with base config
@@ -776,6 +807,8 @@ def _merge_config(base: ProjectConfig, custom: dict) -> ProjectConfig:
             base.dependency.generate_dependabot = bool(d["generate_dependabot"])
         if "generate_renovate" in d:
             base.dependency.generate_renovate = bool(d["generate_renovate"])
+        if "cache_ttl_seconds" in d:
+            base.dependency.cache_ttl_seconds = int(d["cache_ttl_seconds"])
 
     # Handle workflow features for new flags
     if "workflow" in custom and "features" in custom["workflow"]:
@@ -806,6 +839,10 @@ def _merge_config(base: ProjectConfig, custom: dict) -> ProjectConfig:
             base.review.single_agent_preference = str(r["single_agent_preference"])
         if "log_timeouts" in r:
             base.review.log_timeouts = bool(r["log_timeouts"])
+        if "policy" in r:
+            base.review.policy = str(r["policy"])
+        if "quorum" in r:
+            base.review.quorum = int(r["quorum"]) if r["quorum"] is not None else None
 
     return base
 
@@ -0,0 +1,32 @@
+"""Migration 0007: Queryable Checkpoint Metadata.
+
+Adds a ``meta`` object to graph_checkpoints holding the checkpoint's scalar
+metadata (source, step, ...) and workflow phase, so checkpoint listings and
+compaction can filter in the query instead of unpickling every blob.
+Checkpoints written before this migration have no ``meta`` and are filtered
+after deserialization.
+"""
+
+from ..base import BaseMigration, MigrationContext
+
+
+class MigrationCheckpointMetadata(BaseMigration):
+    """Add queryable metadata to LangGraph checkpoints."""
+
+    version = "0007"
+    name = "checkpoint_metadata"
+    dependencies = ["0006"]
+
+    SCHEMA = """
+    DEFINE FIELD IF NOT EXISTS meta ON TABLE graph_checkpoints FLEXIBLE TYPE option<object>;
+    DEFINE INDEX IF NOT EXISTS idx_graph_cp_source ON TABLE graph_checkpoints COLUMNS thread_id, checkpoint_ns, meta.source;
+    """
+
+    async def up(self, ctx: MigrationContext) -> None:
+        """Apply the migration."""
+        await ctx.execute(self.SCHEMA)
+
+    async def down(self, ctx: MigrationContext) -> None:
+        """Rollback by removing the metadata field and its index."""
+        await ctx.execute("REMOVE INDEX IF EXISTS idx_graph_cp_source ON TABLE graph_checkpoints")
+        await ctx.execute("REMOVE FIELD IF EXISTS meta ON TABLE graph_checkpoints")
@@ -0,0 +1,31 @@
+"""Migration 0008: Task Listing Indexes.
+
+Adds indexes for the dashboard's filtered, keyset-paginated task listing
+(milestone filter, and status/priority filters walked in task ID order).
+"""
+
+from ..base import BaseMigration, MigrationContext
+
+
+class MigrationTaskListingIndexes(BaseMigration):
+    """Index task filters used by paginated listings."""
+
+    version = "0008"
+    name = "task_listing_indexes"
+    dependencies = ["0007"]
+
+    SCHEMA = """
+    DEFINE INDEX IF NOT EXISTS idx_tasks_milestone ON TABLE tasks COLUMNS milestone_id, task_id;
+    DEFINE INDEX IF NOT EXISTS idx_tasks_status_id ON TABLE tasks COLUMNS status, task_id;
+    DEFINE INDEX IF NOT EXISTS idx_tasks_priority_id ON TABLE tasks COLUMNS priority, task_id;
+    """
+
+    async def up(self, ctx: MigrationContext) -> None:
+        """Apply the migration."""
+        await ctx.execute(self.SCHEMA)
+
+    async def down(self, ctx: MigrationContext) -> None:
+        """Rollback by removing the listing indexes."""
+        await ctx.execute("REMOVE INDEX IF EXISTS idx_tasks_milestone ON TABLE tasks")
+        await ctx.execute("REMOVE INDEX IF EXISTS idx_tasks_status_id ON TABLE tasks")
+        await ctx.execute("REMOVE INDEX IF EXISTS idx_tasks_priority_id ON TABLE tasks")
@@ -0,0 +1,50 @@
+"""Migration 0009: Audit Statistics Rollups.
+
+Adds hourly and daily audit_rollups per agent/status/model, the watermark
+up to which audit entries have been rolled up, and composite indexes for
+the audit listing filters (filter column plus timestamp ordering).
+"""
+
+from ..base import BaseMigration, MigrationContext
+
+
+class MigrationAuditRollups(BaseMigration):
+    """Add audit statistics rollups and composite audit indexes."""
+
+    version = "0009"
+    name = "audit_rollups"
+    dependencies = ["0008"]
+
+    SCHEMA = """
+    DEFINE TABLE IF NOT EXISTS audit_rollups SCHEMAFULL;
+    DEFINE FIELD IF NOT EXISTS granularity ON TABLE audit_rollups TYPE string ASSERT $value IN ["hour", "day"];
+    DEFINE FIELD IF NOT EXISTS bucket ON TABLE audit_rollups TYPE datetime VALUE <datetime>$value;
+    DEFINE FIELD IF NOT EXISTS agent ON TABLE audit_rollups TYPE string;
+    DEFINE FIELD IF NOT EXISTS status ON TABLE audit_rollups TYPE string;
+    DEFINE FIELD IF NOT EXISTS model ON TABLE audit_rollups TYPE string DEFAULT "";
+    DEFINE FIELD IF NOT EXISTS count ON TABLE audit_rollups TYPE int DEFAULT 0;
+    DEFINE FIELD IF NOT EXISTS cost_usd ON TABLE audit_rollups TYPE float DEFAULT 0.0;
+    DEFINE FIELD IF NOT EXISTS duration_seconds ON TABLE audit_rollups TYPE float DEFAULT 0.0;
+
+    DEFINE INDEX IF NOT EXISTS idx_audit_rollup_key ON TABLE audit_rollups COLUMNS granularity, bucket, agent, status, model UNIQUE;
+
+    DEFINE TABLE IF NOT EXISTS audit_rollup_state SCHEMAFULL;
+    DEFINE FIELD IF NOT EXISTS rolled_until ON TABLE audit_rollup_state TYPE datetime VALUE <datetime>$value;
+    DEFINE FIELD IF NOT EXISTS updated_at ON TABLE audit_rollup_state TYPE datetime VALUE time::now();
+
+    DEFINE INDEX IF NOT EXISTS idx_audit_agent_time ON TABLE audit_entries COLUMNS agent, timestamp;
+    DEFINE INDEX IF NOT EXISTS idx_audit_status_time ON TABLE audit_entries COLUMNS status, timestamp;
+    DEFINE INDEX IF NOT EXISTS idx_audit_task_time ON TABLE audit_entries COLUMNS task_id, timestamp;
+    """
+
+    async def up(self, ctx: MigrationContext) -> None:
+        """Apply the migration."""
+        await ctx.execute(self.SCHEMA)
+
+    async def down(self, ctx: MigrationContext) -> None:
+        """Rollback by removing rollup tables and composite indexes."""
+        await ctx.execute("REMOVE INDEX IF EXISTS idx_audit_task_time ON TABLE audit_entries")
+        await ctx.execute("REMOVE INDEX IF EXISTS idx_audit_status_time ON TABLE audit_entries")
+        await ctx.execute("REMOVE INDEX IF EXISTS idx_audit_agent_time ON TABLE audit_entries")
+        await ctx.execute("REMOVE TABLE IF EXISTS audit_rollup_state")
+        await ctx.execute("REMOVE TABLE IF EXISTS audit_rollups")
@@ -20,7 +20,7 @@ from .prompts import (
     get_prompt_version_repository,
 )
 from .sessions import SessionRepository, get_session_repository
-from .tasks import TaskRepository, get_task_repository
+from .tasks import TaskPage, TaskRepository, get_task_repository
 from .workflow import WorkflowRepository, get_workflow_repository
 
 __all__ = [
@@ -29,6 +29,7 @@ __all__ = [
     "WorkflowRepository",
     "get_workflow_repository",
     "TaskRepository",
+    "TaskPage",
     "get_task_repository",
     "CheckpointRepository",
     "get_checkpoint_repository",
@@ -1,6 +1,11 @@
 """Audit trail repository.
 
 Provides queryable audit logging that replaces JSONL-based trail.
+
+Statistics are served from hourly and daily rollups (audit_rollups) for
+entries older than the rollup watermark, plus a scan of only the entries
+after it. ``roll_up`` advances the watermark once entries have settled
+(stopped changing status); ``get_statistics`` runs it when it is due.
 """
 
 import hashlib
@@ -14,6 +19,96 @@ from .base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+
+# Entries younger than this may still change status and are not rolled up
+ROLLUP_SETTLE_SECONDS = 3600
+# Bound on the history one roll-up pass aggregates (first pass on old projects)
+ROLLUP_MAX_HOURS_PER_PASS = 24 * 7
+
+
+def _floor(value: datetime, step: timedelta) -> datetime:
+    value = value.replace(minute=0, second=0, microsecond=0)
+    return value.replace(hour=0) if step == DAY else value
+
+
+def _ceil(value: datetime, step: timedelta) -> datetime:
+    floored = _floor(value, step)
+    return floored if floored == value else floored + step
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    """Parse a stored timestamp into a naive datetime (as entries are written)."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    return None
+
+
+def _stat_segments(
+    since: Optional[datetime],
+    until: Optional[datetime],
+    rolled_until: Optional[datetime],
+) -> list[tuple[str, Optional[datetime], Optional[datetime]]]:
+    """Split [since, until) into pieces served by raw entries or rollups.
+
+    Whole days before the watermark come from daily rollups, whole hours
+    from hourly rollups, and partial hours plus everything after the
+    watermark from audit_entries.
+
+    Returns:
+        (source, start, end) tuples with source "raw", "hour" or "day";
+        None bounds are open
+    """
+    if rolled_until is None:
+        return [("raw", since, until)]
+
+    segments: list[tuple[str, Optional[datetime], Optional[datetime]]] = []
+    tail_start = rolled_until if since is None else max(since, rolled_until)
+    if until is None or tail_start < until:
+        segments.append(("raw", tail_start, until))
+
+    end = rolled_until if until is None else min(until, rolled_until)
+    if since is not None and since >= end:
+        return segments
+
+    hour_start = None if since is None else _ceil(since, HOUR)
+    hour_end = _floor(end, HOUR)
+    if hour_start is not None and hour_start >= hour_end:
+        segments.append(("raw", since, end))
+        return segments
+    if since is not None and hour_start is not None and since < hour_start:
+        segments.append(("raw", since, hour_start))
+    if hour_end < end:
+        segments.append(("raw", hour_end, end))
+
+    day_start = None if hour_start is None else _ceil(hour_start, DAY)
+    day_end = _floor(hour_end, DAY)
+    if hour_start is not None and day_start is not None and day_start >= day_end:
+        segments.append(("hour", hour_start, hour_end))
+        return segments
+    if hour_start is not None and day_start is not None and hour_start < day_start:
+        segments.append(("hour", hour_start, day_start))
+    segments.append(("day", day_start, day_end))
+    if day_end < hour_end:
+        segments.append(("hour", day_end, hour_end))
+    return segments
+
+
+def _time_range(field_name: str, start: Optional[datetime], end: Optional[datetime]) -> tuple:
+    """WHERE conditions and params for start <= field < end."""
+    conditions = []
+    params: dict[str, Any] = {}
+    if start is not None:
+        conditions.append(f"{field_name} >= <datetime>$since")
+        params["since"] = start.isoformat()
+    if end is not None:
+        conditions.append(f"{field_name} < <datetime>$until")
+        params["until"] = end.isoformat()
+    return conditions, params
+
 
 @dataclass
 class AuditEntry:
@@ -115,6 +210,15 @@ class AuditRepository(BaseRepository[AuditEntry]):
 
     table_name = "audit_entries"
 
+    def __init__(self, project_name: str):
+        """Initialize repository.
+
+        Args:
+            project_name: Project name for database selection
+        """
+        super().__init__(project_name)
+        self._rolling_up = False
+
     def _to_record(self, data: dict[str, Any]) -> AuditEntry:
         return AuditEntry.from_dict(data)
 
@@ -421,6 +525,9 @@ class AuditRepository(BaseRepository[AuditEntry]):
     ) -> AuditStatistics:
         """Get audit statistics.
 
+        Merges rollups with the entries after the rollup watermark, so the
+        cost doesn't grow with the project's history.
+
         Args:
             since: Start time (default all time)
             until: End time (default now)
@@ -428,71 +535,194 @@ class AuditRepository(BaseRepository[AuditEntry]):
         Returns:
             AuditStatistics summary
         """
-        time_filter = ""
-        params: dict[str, Any] = {}
+        # Concurrent readers don't wait for (or repeat) a pass in progress
+        if not self._rolling_up:
+            self._rolling_up = True
+            try:
+                await self.roll_up()
+            except Exception as e:
+                logger.warning(f"Audit roll-up failed, statistics use the previous rollups: {e}")
+            finally:
+                self._rolling_up = False
+
+        stats = AuditStatistics()
+        async with get_connection(self.project_name) as conn:
+            rolled_until = await self._rolled_until(conn)
+            for source, start, end in _stat_segments(since, until, rolled_until):
+                if source == "raw":
+                    conditions, params = _time_range("timestamp", start, end)
+                    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+                    rows = await conn.query(
+                        f"""
+                        SELECT
+                            agent,
+                            status,
+                            count() as total,
+                            math::sum(duration_seconds) as total_duration,
+                            math::sum(cost_usd) as total_cost
+                        FROM audit_entries
+                        {where}
+                        GROUP BY agent, status
+                        """,
+                        params,
+                    )
+                else:
+                    conditions, params = _time_range("bucket", start, end)
+                    params["granularity"] = source
+                    rows = await conn.query(
+                        f"""
+                        SELECT
+                            agent,
+                            status,
+                            math::sum(count) as total,
+                            math::sum(duration_seconds) as total_duration,
+                            math::sum(cost_usd) as total_cost
+                        FROM audit_rollups
+                        WHERE {' AND '.join(["granularity = $granularity", *conditions])}
+                        GROUP BY agent, status
+                        """,
+                        params,
+                    )
+                for row in rows:
+                    self._add_to_statistics(stats, row)
+
+        stats.success_count = stats.by_status.get("success", 0)
+        stats.failed_count = stats.by_status.get("failed", 0)
+        stats.timeout_count = stats.by_status.get("timeout", 0)
+        if stats.total > 0:
+            stats.success_rate = stats.success_count / stats.total
+            stats.avg_duration_seconds = stats.total_duration_seconds / stats.total
+
+        return stats
 
-        if since:
-            time_filter += (
-                " AND timestamp >= $since" if time_filter else "WHERE timestamp >= $since"
-            )
-            params["since"] = since.isoformat()
-        if until:
-            time_filter += " AND timestamp < $until" if time_filter else "WHERE timestamp < $until"
-            params["until"] = until.isoformat()
+    @staticmethod
+    def _add_to_statistics(stats: AuditStatistics, row: dict[str, Any]) -> None:
+        agent = row.get("agent", "unknown")
+        status = row.get("status", "unknown")
+        count = row.get("total", 0) or 0
+
+        stats.total += count
+        stats.total_duration_seconds += row.get("total_duration", 0) or 0
+        stats.total_cost_usd += row.get("total_cost", 0) or 0
+        stats.by_status[status] = stats.by_status.get(status, 0) + count
+        stats.by_agent[agent] = stats.by_agent.get(agent, 0) + count
+
+    async def _rolled_until(self, conn: Any) -> Optional[datetime]:
+        """Watermark before which all entries are in the rollups."""
+        rows = await conn.query("SELECT rolled_until FROM audit_rollup_state:current")
+        return _parse_time(rows[0].get("rolled_until")) if rows else None
+
+    async def roll_up(self, now: Optional[datetime] = None) -> int:
+        """Roll settled audit entries up into hourly and daily rollups.
+
+        Aggregates whole hours between the watermark and ROLLUP_SETTLE_SECONDS
+        ago (at most ROLLUP_MAX_HOURS_PER_PASS per call). Rewriting a range
+        replaces its rollups, so an interrupted pass is safe to repeat.
+
+        Args:
+            now: Current time (default datetime.now())
+
+        Returns:
+            Number of hours rolled up
+        """
+        now = now or datetime.now()
+        cutoff = _floor(now - timedelta(seconds=ROLLUP_SETTLE_SECONDS), HOUR)
 
         async with get_connection(self.project_name) as conn:
-            # Get counts by status
-            base_query = f"""
+            start = await self._rolled_until(conn)
+            if start is None:
+                first = await conn.query(
+                    "SELECT timestamp FROM audit_entries ORDER BY timestamp ASC LIMIT 1"
+                )
+                first_time = _parse_time(first[0].get("timestamp")) if first else None
+                if first_time is None:
+                    return 0
+                start = _floor(first_time, HOUR)
+            end = min(cutoff, start + ROLLUP_MAX_HOURS_PER_PASS * HOUR)
+            if end <= start:
+                return 0
+
+            params = {"since": start.isoformat(), "until": end.isoformat()}
+            hourly = await conn.query(
+                """
                 SELECT
-                    count() as total,
+                    time::floor(timestamp, 1h) as bucket,
+                    agent,
                     status,
-                    math::sum(duration_seconds) as total_duration,
-                    math::sum(cost_usd) as total_cost
-                FROM audit_entries
-                {time_filter}
-                GROUP BY status
-            """
-            results = await conn.query(base_query, params)
-
-            stats = AuditStatistics()
-
-            for row in results:
-                status = row.get("status", "unknown")
-                count = row.get("total", 0)
-                duration = row.get("total_duration", 0) or 0
-                cost = row.get("total_cost", 0) or 0
-
-                stats.total += count
-                stats.total_duration_seconds += duration
-                stats.total_cost_usd += cost
-                stats.by_status[status] = count
-
-                if status == "success":
-                    stats.success_count = count
-                elif status == "failed":
-                    stats.failed_count = count
-                elif status == "timeout":
-                    stats.timeout_count = count
-
-            if stats.total > 0:
-                stats.success_rate = stats.success_count / stats.total
-                stats.avg_duration_seconds = stats.total_duration_seconds / stats.total
-
-            # Get counts by agent
-            agent_query = f"""
-                SELECT agent, count() as total
+                    model,
+                    count() as count,
+                    math::sum(cost_usd) as cost_usd,
+                    math::sum(duration_seconds) as duration_seconds
                 FROM audit_entries
-                {time_filter}
-                GROUP BY agent
-            """
-            agent_results = await conn.query(agent_query, params)
+                WHERE timestamp >= <datetime>$since AND timestamp < <datetime>$until
+                GROUP BY bucket, agent, status, model
+                """,
+                params,
+            )
+            await self._replace_rollups(conn, "hour", hourly, params)
+
+            # Daily rollups of the touched days, summed from their hourly rollups
+            day_params = {
+                "since": _floor(start, DAY).isoformat(),
+                "until": _ceil(end, DAY).isoformat(),
+            }
+            daily = await conn.query(
+                """
+                SELECT
+                    time::floor(bucket, 1d) as day,
+                    agent,
+                    status,
+                    model,
+                    math::sum(count) as count,
+                    math::sum(cost_usd) as cost_usd,
+                    math::sum(duration_seconds) as duration_seconds
+                FROM audit_rollups
+                WHERE granularity = "hour"
+                    AND bucket >= <datetime>$since AND bucket < <datetime>$until
+                GROUP BY day, agent, status, model
+                """,
+                day_params,
+            )
+            await self._replace_rollups(
+                conn, "day", [{**row, "bucket": row.get("day")} for row in daily], day_params
+            )
+
+            await conn.create("audit_rollup_state", {"rolled_until": end.isoformat()}, "current")
 
-            for row in agent_results:
-                agent = row.get("agent", "unknown")
-                count = row.get("total", 0)
-                stats.by_agent[agent] = count
+        hours = int((end - start) / HOUR)
+        logger.debug(f"Rolled up {hours}h of audit entries for {self.project_name}")
+        return hours
 
-            return stats
+    async def _replace_rollups(
+        self,
+        conn: Any,
+        granularity: str,
+        groups: list[dict[str, Any]],
+        params: dict[str, Any],
+    ) -> None:
+        await conn.query(
+            """
+            DELETE audit_rollups
+            WHERE granularity = $granularity
+                AND bucket >= <datetime>$since AND bucket < <datetime>$until
+            """,
+            {**params, "granularity": granularity},
+        )
+        rows = [
+            {
+                "granularity": granularity,
+                "bucket": group["bucket"],
+                "agent": group.get("agent") or "unknown",
+                "status": group.get("status") or "unknown",
+                "model": group.get("model") or "",
+                "count": group.get("count", 0) or 0,
+                "cost_usd": float(group.get("cost_usd", 0) or 0),
+                "duration_seconds": float(group.get("duration_seconds", 0) or 0),
+            }
+            for group in groups
+        ]
+        if rows:
+            await conn.query("INSERT INTO audit_rollups $rows", {"rows": rows})
 
     async def get_cost_by_task(self) -> dict[str, float]:
         """Get total cost per task.
@@ -3,17 +3,44 @@
 Provides task management with dependency tracking and status queries.
 """
 
+import asyncio
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
 from ..connection import get_connection
+from ..live import LiveEvent, LiveQueryManager
 from .base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Fields fetched for task lists (board cards); details fetch the full record
+TASK_LIST_FIELDS = (
+    "task_id",
+    "title",
+    "user_story",
+    "status",
+    "priority",
+    "milestone_id",
+    "estimated_complexity",
+    "dependencies",
+    "files_to_modify",
+    "error",
+    "created_at",
+)
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Cached progress is refetched after this long even without invalidations
+# (live query notifications can be lost across reconnects)
+PROGRESS_WATCHED_TTL_SECONDS = 60.0
+# Without a live query, cached progress is only shared between close requests
+PROGRESS_UNWATCHED_TTL_SECONDS = 2.0
+
 
 @dataclass
 class Task:
@@ -103,6 +130,107 @@ class Task:
         )
 
 
+@dataclass
+class TaskPage:
+    """One page of a keyset-paginated task listing.
+
+    Attributes:
+        tasks: Tasks on this page, ordered by task ID
+        next_cursor: Cursor for the next page (None on the last page)
+    """
+
+    tasks: list[Task]
+    next_cursor: Optional[str] = None
+
+
+class TaskProgressCache:
+    """Task progress counts shared by all readers of a project.
+
+    Counts are computed once and reused until a live query on the tasks
+    table reports a change. If the live query can't be started, counts
+    expire after a short TTL instead.
+    """
+
+    def __init__(self, repository: "TaskRepository"):
+        """Initialize the cache.
+
+        Args:
+            repository: Repository that computes progress
+        """
+        self._repository = repository
+        self._progress: Optional[dict[str, Any]] = None
+        self._fetched_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+        self._manager: Optional[LiveQueryManager] = None
+        self._watching = False
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def is_watching(self) -> bool:
+        """Whether a live query invalidates the cache."""
+        return self._watching
+
+    def _fresh(self) -> bool:
+        if self._progress is None:
+            return False
+        ttl = PROGRESS_WATCHED_TTL_SECONDS if self._watching else PROGRESS_UNWATCHED_TTL_SECONDS
+        return time.monotonic() - self._fetched_at < ttl
+
+    async def get(self) -> dict[str, Any]:
+        """Get progress, computing it only when the cache is stale.
+
+        Returns:
+            Progress dictionary (see TaskRepository.get_progress)
+        """
+        if self._fresh():
+            self.hits += 1
+            return dict(self._progress)  # type: ignore[arg-type]
+
+        async with self._lock:
+            # Another request may have refreshed it while we waited
+            if self._fresh():
+                self.hits += 1
+                return dict(self._progress)  # type: ignore[arg-type]
+            self.misses += 1
+            await self._watch()
+            generation = self._generation
+            progress = await self._repository.get_progress()
+            # Don't cache counts that a change made stale mid-query
+            if generation == self._generation:
+                self._progress = progress
+                self._fetched_at = time.monotonic()
+            return dict(progress)
+
+    def invalidate(self, event: Optional[LiveEvent] = None) -> None:
+        """Drop cached progress (also the live query callback).
+
+        Args:
+            event: Task change that caused the invalidation
+        """
+        self._generation += 1
+        self._progress = None
+
+    async def _watch(self) -> None:
+        if self._watching:
+            return
+        try:
+            if self._manager is None:
+                self._manager = LiveQueryManager(self._repository.project_name)
+            await self._manager.subscribe("tasks", self.invalidate, "tasks_progress")
+            self._watching = True
+        except Exception as e:
+            logger.debug(f"Task progress live query unavailable, using TTL: {e}")
+
+    async def close(self) -> None:
+        """Stop the live query."""
+        if self._manager is not None:
+            await self._manager.close()
+        self._watching = False
+        self.invalidate()
+
+
 class TaskRepository(BaseRepository[Task]):
     """Repository for tasks.
 
@@ -111,6 +239,15 @@ class TaskRepository(BaseRepository[Task]):
 
     table_name = "tasks"
 
+    def __init__(self, project_name: str):
+        """Initialize repository.
+
+        Args:
+            project_name: Project name for database selection
+        """
+        super().__init__(project_name)
+        self.progress_cache = TaskProgressCache(self)
+
     def _to_record(self, data: dict[str, Any]) -> Task:
         return Task.from_dict(data)
 
@@ -173,6 +310,7 @@ class TaskRepository(BaseRepository[Task]):
 
         # Use task_id as record ID (database is already project-scoped)
         await self.create(task.to_dict(), task_id)
+        self.progress_cache.invalidate()
 
         logger.debug(f"Created task {task_id} in project {self.project_name}")
         return task
@@ -224,6 +362,8 @@ class TaskRepository(BaseRepository[Task]):
                     "updates": updates,
                 },
             )
+            if "status" in updates:
+                self.progress_cache.invalidate()
             if result:
                 return self._to_record(result[0])
             return None
@@ -350,6 +490,71 @@ class TaskRepository(BaseRepository[Task]):
 
             return available
 
+    async def list_tasks(
+        self,
+        statuses: Optional[Sequence[str]] = None,
+        milestone_id: Optional[str] = None,
+        priorities: Optional[Sequence[str]] = None,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = TASK_LIST_FIELDS,
+    ) -> TaskPage:
+        """List tasks one page at a time, filtered in the query.
+
+        Pages are ordered by task ID; pass the previous page's
+        ``next_cursor`` as ``after`` to get the next one.
+
+        Args:
+            statuses: Only tasks with one of these statuses
+            milestone_id: Only tasks in this milestone
+            priorities: Only tasks with one of these priorities
+            after: Cursor (task ID) to continue after
+            limit: Maximum tasks per page
+            fields: Task fields to fetch (None for all)
+
+        Returns:
+            TaskPage with the tasks and the next cursor
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        conditions = []
+        params: dict[str, Any] = {"limit": limit + 1}
+        if statuses:
+            conditions.append("status IN $statuses")
+            params["statuses"] = list(statuses)
+        if milestone_id is not None:
+            conditions.append("milestone_id = $milestone_id")
+            params["milestone_id"] = milestone_id
+        if priorities:
+            conditions.append("priority IN $priorities")
+            params["priorities"] = list(priorities)
+        if after is not None:
+            conditions.append("task_id > $after")
+            params["after"] = after
+
+        if fields is None:
+            projection = "*"
+        else:
+            unknown = set(fields) - set(Task("").to_dict())
+            if unknown:
+                raise ValueError(f"Unknown task fields: {sorted(unknown)}")
+            projection = ", ".join(dict.fromkeys(("task_id", *fields)))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        async with get_connection(self.project_name) as conn:
+            results = await conn.query(
+                f"""
+                SELECT {projection} FROM tasks
+                {where}
+                ORDER BY task_id ASC
+                LIMIT $limit
+                """,
+                params,
+            )
+
+        tasks = [self._to_record(r) for r in results[:limit]]
+        next_cursor = tasks[-1].id if len(results) > limit else None
+        return TaskPage(tasks=tasks, next_cursor=next_cursor)
+
     async def get_by_milestone(self, milestone_id: str) -> list[Task]:
         """Get all tasks for a milestone.
 
@@ -407,6 +612,14 @@ class TaskRepository(BaseRepository[Task]):
 
             return progress
 
+    async def get_cached_progress(self) -> dict[str, Any]:
+        """Get task progress from the shared progress cache.
+
+        Returns:
+            Progress dictionary
+        """
+        return await self.progress_cache.get()
+
     async def bulk_create(self, tasks: list[dict[str, Any]]) -> list[Task]:
         """Create multiple tasks at once.
 
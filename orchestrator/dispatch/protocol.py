@@ -420,6 +420,11 @@ class AgentDispatcher:
                     process.communicate(),
                     timeout=timeout,
                 )
+            except asyncio.CancelledError:
+                # Caller no longer needs the result (e.g. review already decided)
+                process.kill()
+                await process.wait()
+                raise
             except asyncio.TimeoutError:
                 process.kill()
                 await process.wait()  # Ensure process is properly reaped
@@ -13,6 +13,7 @@ import subprocess
 from dataclasses import dataclass
 from typing import Optional
 
+from ..agents.worker_pool import WorkerTimeout, get_worker_pool
 from .metrics import EVALUATION_CRITERIA, EvaluationMetric, compute_weighted_score
 
 logger = logging.getLogger(__name__)
@@ -273,16 +274,22 @@ class GEvalEvaluator:
                 # Haiku is faster and cheaper for evaluation
                 cmd.extend(["--model", self.evaluator_model])
 
-            # Run subprocess in thread to avoid blocking the event loop
-            result = await asyncio.to_thread(
-                subprocess.run,
-                cmd,
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                env={**os.environ, "TERM": "dumb"},
-            )
+            # Evaluator calls are short, so CLI startup dominates; use a
+            # pre-warmed worker when available
+            pool = get_worker_pool()
+            if pool is not None:
+                result = await pool.arun(cmd, cwd=self.project_dir, timeout=self.timeout)
+            else:
+                # Run subprocess in thread to avoid blocking the event loop
+                result = await asyncio.to_thread(
+                    subprocess.run,
+                    cmd,
+                    cwd=self.project_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=self.timeout,
+                    env={**os.environ, "TERM": "dumb"},
+                )
 
             if result.returncode != 0:
                 logger.warning(f"Evaluator returned non-zero: {result.stderr}")
@@ -290,7 +297,7 @@ class GEvalEvaluator:
 
             return result.stdout.strip()
 
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, WorkerTimeout):
             logger.warning(f"Evaluator timed out after {self.timeout}s")
             return "{}"
         except FileNotFoundError:
@@ -0,0 +1,472 @@
+"""Retention and garbage collection for LangGraph checkpoints in SurrealDB.
+
+Every superstep of every run adds a full-state row to ``graph_checkpoints``
+(plus its pending writes to ``graph_writes``). ``CheckpointCompactor``
+prunes them per thread and checkpoint namespace according to a
+``RetentionPolicy``:
+
+- The newest ``keep_last`` checkpoints are kept.
+- Phase-boundary checkpoints (the last checkpoint of a phase and the first
+  of the next) are kept, so rollback targets survive.
+- Pending writes of superseded checkpoints (any but the newest) and writes
+  whose checkpoint no longer exists are dropped.
+
+Deletes run in batches of ``batch_size`` IDs, at most ``max_batches`` per
+pass, and the pass reports the rows and bytes reclaimed. Phases are read
+from the checkpoint's queryable ``meta``; rows written before it existed
+have their blobs decoded once and ``meta`` backfilled, at most
+``max_backfill`` rows per pass. Scanning, backfilling and deleting all stop
+once ``time_budget_seconds`` have elapsed; a thread whose scan or backfill
+was cut off keeps all its checkpoints. An incomplete pass is picked up by
+the next one.
+
+``schedule_compaction`` starts a pass after workflow runs, at most once per
+``min_interval_seconds`` per project (sooner if the last pass was cut off by
+its budget). The workflow awaits the pass before ``run``/``resume`` return,
+since callers such as ``asyncio.run`` cancel leftover tasks on exit. Configure
+it with ``ORCHESTRATOR_CHECKPOINT_KEEP`` (0 disables compaction),
+``ORCHESTRATOR_CHECKPOINT_COMPACT_INTERVAL`` and
+``ORCHESTRATOR_CHECKPOINT_COMPACT_BUDGET`` (seconds).
+
+Usage:
+    compactor = CheckpointCompactor(project_name, RetentionPolicy(keep_last=50))
+    report = await compactor.compact()
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from itertools import pairwise
+from typing import Any, Optional
+
+from orchestrator.db.connection import get_connection
+
+from .surrealdb_saver import SurrealDBSaver, _checkpoint_meta
+
+logger = logging.getLogger(__name__)
+
+KEEP_ENV = "ORCHESTRATOR_CHECKPOINT_KEEP"
+INTERVAL_ENV = "ORCHESTRATOR_CHECKPOINT_COMPACT_INTERVAL"
+BUDGET_ENV = "ORCHESTRATOR_CHECKPOINT_COMPACT_BUDGET"
+
+DEFAULT_KEEP_LAST = 100
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_MIN_INTERVAL_SECONDS = 600.0
+DEFAULT_TIME_BUDGET_SECONDS = 5.0
+DEFAULT_MAX_BACKFILL = 500
+
+
+@dataclass
+class RetentionPolicy:
+    """What checkpoint compaction keeps."""
+
+    keep_last: int = DEFAULT_KEEP_LAST
+    keep_phase_boundaries: bool = True
+    drop_superseded_writes: bool = True
+    batch_size: int = DEFAULT_BATCH_SIZE
+    max_batches: Optional[int] = None
+    min_interval_seconds: float = DEFAULT_MIN_INTERVAL_SECONDS
+    time_budget_seconds: Optional[float] = DEFAULT_TIME_BUDGET_SECONDS
+    max_backfill: Optional[int] = DEFAULT_MAX_BACKFILL
+
+    @property
+    def enabled(self) -> bool:
+        return self.keep_last > 0
+
+    @classmethod
+    def from_env(cls) -> "RetentionPolicy":
+        """Policy with overrides from environment variables."""
+        policy = cls()
+        try:
+            policy.keep_last = int(os.environ.get(KEEP_ENV, policy.keep_last))
+            policy.min_interval_seconds = float(
+                os.environ.get(INTERVAL_ENV, policy.min_interval_seconds)
+            )
+            budget = os.environ.get(BUDGET_ENV)
+            if budget is not None:
+                policy.time_budget_seconds = float(budget)
+        except ValueError as e:
+            logger.warning(f"Ignoring invalid checkpoint retention setting: {e}")
+        return policy
+
+
+@dataclass
+class CompactionReport:
+    """Outcome of a compaction pass."""
+
+    threads: int = 0
+    checkpoints_scanned: int = 0
+    phases_backfilled: int = 0
+    checkpoints_deleted: int = 0
+    writes_deleted: int = 0
+    bytes_reclaimed: int = 0
+    batches: int = 0
+    complete: bool = True
+    duration_seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def rows_deleted(self) -> int:
+        return self.checkpoints_deleted + self.writes_deleted
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "threads": self.threads,
+            "checkpoints_scanned": self.checkpoints_scanned,
+            "phases_backfilled": self.phases_backfilled,
+            "checkpoints_deleted": self.checkpoints_deleted,
+            "writes_deleted": self.writes_deleted,
+            "rows_deleted": self.rows_deleted,
+            "bytes_reclaimed": self.bytes_reclaimed,
+            "batches": self.batches,
+            "complete": self.complete,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class _Row:
+    checkpoint_id: str
+    phase: Optional[int]
+    size: int
+    legacy: bool = False
+
+
+class CheckpointCompactor:
+    """Prunes graph_checkpoints and graph_writes for one project."""
+
+    def __init__(self, project_name: str, policy: Optional[RetentionPolicy] = None):
+        """Initialize the compactor.
+
+        Args:
+            project_name: Project name (database scope)
+            policy: Retention policy (defaults to ``RetentionPolicy.from_env()``)
+        """
+        self.project_name = project_name
+        self.policy = policy or RetentionPolicy.from_env()
+        self._saver = SurrealDBSaver(project_name)
+        self._deadline: Optional[float] = None
+
+    async def compact(self, thread_id: Optional[str] = None) -> CompactionReport:
+        """Run one compaction pass.
+
+        Args:
+            thread_id: Only compact this thread (all threads if None)
+
+        Returns:
+            CompactionReport with reclaimed rows and bytes
+        """
+        report = CompactionReport()
+        if not self.policy.enabled:
+            return report
+        started = time.monotonic()
+        if self.policy.time_budget_seconds is not None:
+            self._deadline = started + self.policy.time_budget_seconds
+
+        async with get_connection(self.project_name) as conn:
+            for thread, namespace in await self._threads(conn, thread_id):
+                report.threads += 1
+                try:
+                    await self._compact_thread(conn, thread, namespace, report)
+                except Exception as e:
+                    logger.warning(f"Checkpoint compaction failed for {thread}/{namespace}: {e}")
+                    report.errors.append(f"{thread}/{namespace}: {e}")
+                if not report.complete:
+                    break
+
+        report.duration_seconds = time.monotonic() - started
+        if report.rows_deleted:
+            logger.info(
+                f"Compacted checkpoints for {self.project_name}: "
+                f"{report.checkpoints_deleted} checkpoints, {report.writes_deleted} writes, "
+                f"{report.bytes_reclaimed} bytes reclaimed"
+            )
+        return report
+
+    async def _threads(self, conn: Any, thread_id: Optional[str]) -> list[tuple[str, str]]:
+        query = "SELECT thread_id, checkpoint_ns FROM graph_checkpoints"
+        params: dict[str, Any] = {}
+        if thread_id is not None:
+            query += " WHERE thread_id = $thread_id"
+            params["thread_id"] = thread_id
+        query += " GROUP BY thread_id, checkpoint_ns"
+        rows = await conn.query(query, params)
+        return [(row["thread_id"], row.get("checkpoint_ns", "")) for row in rows]
+
+    async def _scan(
+        self, conn: Any, thread_id: str, namespace: str, report: CompactionReport
+    ) -> Optional[list[_Row]]:
+        """List a thread's checkpoints newest first, without their blobs.
+
+        Returns:
+            The rows, or None if the time budget ran out first
+        """
+        rows: list[_Row] = []
+        params: dict[str, Any] = {
+            "thread_id": thread_id,
+            "checkpoint_ns": namespace,
+            "limit": self.policy.batch_size,
+        }
+        cursor_condition = ""
+        while True:
+            if self._out_of_time(report):
+                return None
+            page = await conn.query(
+                f"""
+                SELECT checkpoint_id, meta,
+                    string::len(checkpoint) + string::len(metadata) AS size
+                FROM graph_checkpoints
+                WHERE thread_id = $thread_id AND checkpoint_ns = $checkpoint_ns{cursor_condition}
+                ORDER BY checkpoint_id DESC LIMIT $limit
+                """,
+                params,
+            )
+            for row in page:
+                meta = row.get("meta")
+                rows.append(
+                    _Row(
+                        row["checkpoint_id"],
+                        (meta or {}).get("phase"),
+                        row.get("size") or 0,
+                        legacy=meta is None,
+                    )
+                )
+            if len(page) < self.policy.batch_size:
+                return rows
+            cursor_condition = " AND checkpoint_id < $before"
+            params["before"] = page[-1]["checkpoint_id"]
+
+    async def _fill_phases(
+        self,
+        conn: Any,
+        thread_id: str,
+        namespace: str,
+        rows: list[_Row],
+        report: CompactionReport,
+    ) -> bool:
+        """Decode phases of checkpoints written before ``meta`` existed.
+
+        The decoded ``meta`` is stored back so later passes (and filtered
+        listings) don't decode these rows again.
+
+        Returns:
+            False if the time budget or ``max_backfill`` cut the backfill off
+        """
+        missing = [row for row in rows if row.legacy]
+        params = {"thread_id": thread_id, "checkpoint_ns": namespace}
+        for i in range(0, len(missing), self.policy.batch_size):
+            if not self._take_backfill(report):
+                return False
+            batch = {row.checkpoint_id: row for row in missing[i : i + self.policy.batch_size]}
+            blobs = await conn.query(
+                """
+                SELECT checkpoint_id, checkpoint, metadata FROM graph_checkpoints
+                WHERE thread_id = $thread_id AND checkpoint_ns = $checkpoint_ns
+                AND checkpoint_id IN $ids
+                """,
+                {**params, "ids": list(batch)},
+            )
+            for blob in blobs:
+                if not self._take_backfill(report):
+                    return False
+                batch[blob["checkpoint_id"]].legacy = False
+                report.phases_backfilled += 1
+                try:
+                    checkpoint = self._saver._deserialize_blob(blob["checkpoint"], "checkpoint")
+                    metadata = self._saver._deserialize_blob(blob["metadata"], "metadata")
+                except ValueError:
+                    continue
+                meta = _checkpoint_meta(checkpoint, metadata)
+                batch[blob["checkpoint_id"]].phase = meta.get("phase")
+                await conn.query(
+                    """
+                    UPDATE graph_checkpoints SET meta = $meta
+                    WHERE thread_id = $thread_id AND checkpoint_ns = $checkpoint_ns
+                    AND checkpoint_id = $checkpoint_id
+                    RETURN NONE
+                    """,
+                    {**params, "checkpoint_id": blob["checkpoint_id"], "meta": meta},
+                )
+            await asyncio.sleep(0)
+        return True
+
+    def _retained(self, rows: list[_Row]) -> set[str]:
+        """IDs the policy keeps (rows are newest first)."""
+        keep = {row.checkpoint_id for row in rows[: max(self.policy.keep_last, 1)]}
+        if self.policy.keep_phase_boundaries:
+            for newer, older in pairwise(rows):
+                if newer.phase != older.phase:
+                    keep.add(newer.checkpoint_id)
+                    keep.add(older.checkpoint_id)
+        return keep
+
+    async def _write_stats(self, conn: Any, thread_id: str, namespace: str) -> dict[str, tuple]:
+        rows = await conn.query(
+            """
+            SELECT checkpoint_id, count() AS rows, math::sum(string::len(value)) AS size
+            FROM graph_writes
+            WHERE thread_id = $thread_id AND checkpoint_ns = $checkpoint_ns
+            GROUP BY checkpoint_id
+            """,
+            {"thread_id": thread_id, "checkpoint_ns": namespace},
+        )
+        return {row["checkpoint_id"]: (row.get("rows") or 0, row.get("size") or 0) for row in rows}
+
+    async def _compact_thread(
+        self, conn: Any, thread_id: str, namespace: str, report: CompactionReport
+    ) -> None:
+        rows = await self._scan(conn, thread_id, namespace, report)
+        if not rows:
+            return
+        report.checkpoints_scanned += len(rows)
+
+        # Retention needs every row and phase, so a cut-off thread keeps everything
+        if self.policy.keep_phase_boundaries and not await self._fill_phases(
+            conn, thread_id, namespace, rows, report
+        ):
+            return
+        keep = self._retained(rows)
+        doomed = [row for row in rows if row.checkpoint_id not in keep]
+        existing = {row.checkpoint_id for row in rows}
+        newest = rows[0].checkpoint_id
+
+        write_stats = await self._write_stats(conn, thread_id, namespace)
+        doomed_ids = {row.checkpoint_id for row in doomed}
+        stale_writes = [
+            checkpoint_id
+            for checkpoint_id in write_stats
+            # Checkpoints newer than the scan may have been written since
+            if checkpoint_id < newest
+            and (
+                checkpoint_id in doomed_ids
+                or checkpoint_id not in existing
+                or self.policy.drop_superseded_writes
+            )
+        ]
+
+        params = {"thread_id": thread_id, "checkpoint_ns": namespace}
+        for ids in self._batches(stale_writes):
+            if not self._take_batch(report):
+                return
+            await conn.query(
+                """
+                DELETE FROM graph_writes
+                WHERE thread_id = $thread_id AND checkpoint_ns = $checkpoint_ns
+                AND checkpoint_id IN $ids
+                RETURN NONE
+                """,
+                {**params, "ids": ids},
+            )
+            for checkpoint_id in ids:
+                count, size = write_stats[checkpoint_id]
+                report.writes_deleted += count
+                report.bytes_reclaimed += size
+            await asyncio.sleep(0)
+
+        sizes = {row.checkpoint_id: row.size for row in doomed}
+        for ids in self._batches(list(sizes)):
+            if not self._take_batch(report):
+                return
+            await conn.query(
+                """
+                DELETE FROM graph_checkpoints
+                WHERE thread_id = $thread_id AND checkpoint_ns = $checkpoint_ns
+                AND checkpoint_id IN $ids
+                RETURN NONE
+                """,
+                {**params, "ids": ids},
+            )
+            report.checkpoints_deleted += len(ids)
+            report.bytes_reclaimed += sum(sizes[checkpoint_id] for checkpoint_id in ids)
+            await asyncio.sleep(0)
+
+    def _batches(self, ids: list[str]) -> list[list[str]]:
+        size = self.policy.batch_size
+        return [ids[i : i + size] for i in range(0, len(ids), size)]
+
+    def _take_batch(self, report: CompactionReport) -> bool:
+        """Count a delete batch, or mark the pass incomplete at the limit."""
+        if self.policy.max_batches is not None and report.batches >= self.policy.max_batches:
+            report.complete = False
+            return False
+        if self._out_of_time(report):
+            return False
+        report.batches += 1
+        return True
+
+    def _take_backfill(self, report: CompactionReport) -> bool:
+        """Check another row may be backfilled, or mark the pass incomplete."""
+        if (
+            self.policy.max_backfill is not None
+            and report.phases_backfilled >= self.policy.max_backfill
+        ):
+            report.complete = False
+            return False
+        return not self._out_of_time(report)
+
+    def _out_of_time(self, report: CompactionReport) -> bool:
+        """Mark the pass incomplete once the time budget is spent."""
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            report.complete = False
+            return True
+        return False
+
+
+# Background passes per project, and when each last started
+_compactions: dict[str, asyncio.Task] = {}
+_last_started: dict[str, float] = {}
+
+
+def schedule_compaction(
+    project_name: str,
+    thread_id: Optional[str] = None,
+    policy: Optional[RetentionPolicy] = None,
+) -> Optional[asyncio.Task]:
+    """Start a compaction pass if one is due.
+
+    Must be called from a running event loop. The pass is bounded by the
+    policy's batch and time budgets; callers whose loop may close soon (e.g.
+    under ``asyncio.run``) should await the returned task.
+
+    Args:
+        project_name: Project name (database scope)
+        thread_id: Only compact this thread (all threads if None)
+        policy: Retention policy (defaults to ``RetentionPolicy.from_env()``)
+
+    Returns:
+        The compaction task, or None if disabled, running or not yet due
+    """
+    policy = policy or RetentionPolicy.from_env()
+    if not policy.enabled:
+        return None
+    running = _compactions.get(project_name)
+    if running is not None and not running.done():
+        return None
+    now = time.monotonic()
+    last = _last_started.get(project_name)
+    if last is not None and now - last < policy.min_interval_seconds:
+        return None
+    _last_started[project_name] = now
+
+    async def _run() -> Optional[CompactionReport]:
+        try:
+            report = await CheckpointCompactor(project_name, policy).compact(thread_id)
+        except asyncio.CancelledError:
+            logger.warning(f"Checkpoint compaction for {project_name} was cancelled")
+            _last_started.pop(project_name, None)
+            raise
+        except Exception as e:
+            logger.warning(f"Checkpoint compaction failed: {e}")
+            return None
+        if not report.complete:
+            # Let the next run continue where the budget cut this pass off
+            _last_started.pop(project_name, None)
+        return report
+
+    task = asyncio.get_running_loop().create_task(_run())
+    _compactions[project_name] = task
+    return task
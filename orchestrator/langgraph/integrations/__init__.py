@@ -11,10 +11,15 @@ from .hooks import HookManager, HookResult, create_hook_manager
 from .linear import (
     LinearAdapter,
     LinearConfig,
+    LinearUpdateQueue,
     create_linear_adapter,
+    flush_linear_updates,
+    get_linear_adapter,
     load_issue_mapping,
     load_linear_config,
+    load_unresolved_tasks,
     save_issue_mapping,
+    save_unresolved_tasks,
 )
 from .markdown_tracker import (
     MarkdownTracker,
@@ -69,10 +74,15 @@ __all__ = [
     # Linear integration
     "LinearAdapter",
     "LinearConfig",
+    "LinearUpdateQueue",
     "create_linear_adapter",
+    "get_linear_adapter",
+    "flush_linear_updates",
     "load_linear_config",
     "save_issue_mapping",
     "load_issue_mapping",
+    "save_unresolved_tasks",
+    "load_unresolved_tasks",
     # Markdown task tracker
     "MarkdownTracker",
     "MarkdownTrackerConfig",
@@ -10,23 +10,95 @@ The board structure is:
 - .board/done.md
 - .board/blocked.md
 - .board/archive/YYYY-MM-DD.md
+
+Syncs are incremental: each task's card is cached with a fingerprint of the
+fields it renders, and a column file is only rebuilt when its membership or
+one of its cards changed. Files are written atomically and left untouched
+when their content is unchanged. ``sync_board`` additionally debounces, so
+bursts of node transitions coalesce into a single write.
 """
 
+import atexit
+import json
 import logging
+import os
+import threading
+import time
 from pathlib import Path
+from typing import Optional
 
 from ..state import Task, TaskStatus, WorkflowState
 
 logger = logging.getLogger(__name__)
 
+# Seconds during which repeated sync_board calls are coalesced
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+
+# Column file name -> title
+COLUMNS = {
+    "backlog.md": "Backlog",
+    "in-progress.md": "In Progress",
+    "review.md": "Review / Verification",
+    "done.md": "Done",
+    "blocked.md": "Blocked / Failed",
+}
+
+# Priority map: critical=0, high=1, medium=2, low=3
+PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+# Task fields that appear on a rendered card
+CARD_FIELDS = (
+    "id",
+    "title",
+    "priority",
+    "estimated_complexity",
+    "dependencies",
+    "user_story",
+    "acceptance_criteria",
+)
+
+
+def _column_for(task: Task) -> str:
+    """Get the board file a task belongs in."""
+    status = task.get("status", TaskStatus.PENDING)
+    # Normalize status to lowercase string
+    status_str = status.value if hasattr(status, "value") else str(status).lower()
+
+    if status_str == "in_progress":
+        return "in-progress.md"
+    if status_str == "review" or status_str == "verification":  # Handle variations
+        return "review.md"
+    if status_str == "completed":
+        return "done.md"
+    if status_str == "blocked" or status_str == "failed":
+        return "blocked.md"
+    # Pending and unknown statuses go to the backlog
+    return "backlog.md"
+
+
+def _card_fingerprint(task: Task) -> str:
+    """Fingerprint the fields a task's card is rendered from."""
+    return json.dumps([task.get(field) for field in CARD_FIELDS], default=str)
+
 
 class BoardSyncer:
     """Synchronizes WorkflowState tasks to .board/ markdown files."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS):
         self.project_dir = project_dir
         self.board_dir = project_dir / ".board"
         self.archive_dir = self.board_dir / "archive"
+        self.debounce_seconds = debounce_seconds
+
+        self._lock = threading.RLock()
+        # task_id -> (fingerprint, rendered card)
+        self._cards: dict[str, tuple[str, str]] = {}
+        # file name -> ((task_id, fingerprint), ...) last written
+        self._columns: dict[str, tuple[tuple[str, str], ...]] = {}
+        self._pending: Optional[list[Task]] = None
+        self._timer: Optional[threading.Timer] = None
+        self._last_sync = 0.0
+        self.files_written = 0
 
     def sync(self, state: WorkflowState) -> None:
         """Sync the current state to the board files.
@@ -37,68 +109,129 @@ class BoardSyncer:
         tasks = state.get("tasks", [])
         if not tasks:
             return
+        with self._lock:
+            self._sync_tasks(tasks)
+
+    def request_sync(self, state: WorkflowState) -> None:
+        """Sync now, or coalesce with other requests in the debounce window.
+
+        The first request after a quiet period is written immediately;
+        requests arriving within ``debounce_seconds`` of a sync replace each
+        other and the latest is written when the window closes.
+        """
+        tasks = state.get("tasks", [])
+        if not tasks:
+            return
+        with self._lock:
+            wait = self._last_sync + self.debounce_seconds - time.monotonic()
+            if wait <= 0 and self._timer is None:
+                self._sync_tasks(tasks)
+                return
+            self._pending = list(tasks)
+            if self._timer is None:
+                self._timer = threading.Timer(max(wait, 0.0), self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write any pending debounced sync now."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            tasks, self._pending = self._pending, None
+            if tasks:
+                try:
+                    self._sync_tasks(tasks)
+                except Exception as e:
+                    logger.warning(f"Failed to sync board: {e}")
 
+    def _sync_tasks(self, tasks: list[Task]) -> None:
+        """Re-render the columns whose membership or cards changed."""
         # Ensure directories exist
         self.board_dir.mkdir(parents=True, exist_ok=True)
         self.archive_dir.mkdir(parents=True, exist_ok=True)
+        self._last_sync = time.monotonic()
 
         # Categorize tasks
-        backlog = []
-        in_progress = []
-        review = []
-        done = []
-        blocked = []
-
+        columns: dict[str, list[Task]] = {name: [] for name in COLUMNS}
+        fingerprints: dict[str, str] = {}
         for task in tasks:
-            status = task.get("status", TaskStatus.PENDING)
-            # Normalize status to lowercase string
-            status_str = status.value if hasattr(status, "value") else str(status).lower()
-
-            if status_str == "pending":
-                backlog.append(task)
-            elif status_str == "in_progress":
-                in_progress.append(task)
-            elif status_str == "review" or status_str == "verification":  # Handle variations
-                review.append(task)
-            elif status_str == "completed":
-                done.append(task)
-            elif status_str == "blocked" or status_str == "failed":
-                blocked.append(task)
-            else:
-                # Default to backlog if unknown
-                backlog.append(task)
-
-        # Write files
-        self._write_list(self.board_dir / "backlog.md", "Backlog", backlog)
-        self._write_list(self.board_dir / "in-progress.md", "In Progress", in_progress)
-        self._write_list(self.board_dir / "review.md", "Review / Verification", review)
-        self._write_list(self.board_dir / "done.md", "Done", done)
-        self._write_list(self.board_dir / "blocked.md", "Blocked / Failed", blocked)
-
-        logger.info(f"Synced board: {len(tasks)} tasks updated across .board/ files")
-
-    def _write_list(self, file_path: Path, title: str, tasks: list[Task]) -> None:
-        """Write a list of tasks to a markdown file."""
+            columns[_column_for(task)].append(task)
+            fingerprints[task.get("id", "")] = _card_fingerprint(task)
+
+        written = 0
+        for name, title in COLUMNS.items():
+            column_tasks = sorted(columns[name], key=self._sort_key)
+            key = tuple((t.get("id", ""), fingerprints[t.get("id", "")]) for t in column_tasks)
+            file_path = self.board_dir / name
+            if self._columns.get(name) == key and file_path.exists():
+                continue
+            if self._write_list(file_path, title, column_tasks, fingerprints):
+                written += 1
+            self._columns[name] = key
+
+        # Forget cards for tasks that are no longer on the board
+        for task_id in self._cards.keys() - fingerprints.keys():
+            del self._cards[task_id]
+
+        self.files_written += written
+        if written:
+            logger.info(f"Synced board: {len(tasks)} tasks, {written} .board/ files updated")
+        else:
+            logger.debug(f"Board unchanged for {len(tasks)} tasks")
+
+    @staticmethod
+    def _sort_key(task: Task) -> tuple[int, str]:
+        """Sort by priority, then id."""
+        p = (task.get("priority") or "medium").lower()
+        return (PRIORITY_ORDER.get(p, 2), task.get("id", ""))
+
+    def _write_list(
+        self,
+        file_path: Path,
+        title: str,
+        tasks: list[Task],
+        fingerprints: dict[str, str],
+    ) -> bool:
+        """Write a sorted list of tasks to a markdown file.
+
+        Returns:
+            True if the file content changed
+        """
         lines = [f"# {title}", "", f"Count: {len(tasks)}", ""]
 
         if not tasks:
             lines.append("_No tasks_")
         else:
-            # Sort by priority/id
-            # Priority map: critical=0, high=1, medium=2, low=3
-            priority_map = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-
-            def sort_key(t):
-                p = t.get("priority", "medium").lower()
-                return (priority_map.get(p, 2), t.get("id", ""))
+            for task in tasks:
+                lines.append(self._card(task, fingerprints[task.get("id", "")]))
+                lines.append("---")
 
-            sorted_tasks = sorted(tasks, key=sort_key)
+        content = "\n".join(lines)
+        try:
+            if file_path.read_text() == content:
+                return False
+        except (OSError, UnicodeDecodeError):
+            pass
 
-            for task in sorted_tasks:
-                lines.append(self._format_task_card(task))
-                lines.append("---")
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+        try:
+            tmp_path.write_text(content)
+            os.replace(tmp_path, file_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return True
 
-        file_path.write_text("\n".join(lines))
+    def _card(self, task: Task, fingerprint: str) -> str:
+        """Get a task's card, re-rendering it only if its fields changed."""
+        task_id = task.get("id", "")
+        cached = self._cards.get(task_id)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        card = self._format_task_card(task)
+        self._cards[task_id] = (fingerprint, card)
+        return card
 
     def _format_task_card(self, task: Task) -> str:
         """Format a single task as a markdown card."""
@@ -143,11 +276,40 @@ class BoardSyncer:
         return "\n".join(lines)
 
 
+# Syncers shared per project so card caches and debouncing span node calls
+_syncers: dict[str, BoardSyncer] = {}
+_syncers_lock = threading.Lock()
+
+
+def get_board_syncer(project_dir: Path) -> BoardSyncer:
+    """Get the shared board syncer for a project."""
+    key = str(Path(project_dir).resolve())
+    with _syncers_lock:
+        syncer = _syncers.get(key)
+        if syncer is None:
+            syncer = _syncers[key] = BoardSyncer(Path(project_dir))
+        return syncer
+
+
 def sync_board(state: WorkflowState) -> None:
-    """Helper function to sync board from state."""
+    """Helper function to sync board from state.
+
+    Calls within the debounce window are coalesced; the latest state is
+    written when the window closes (or at interpreter exit).
+    """
     try:
         project_dir = Path(state["project_dir"])
-        syncer = BoardSyncer(project_dir)
-        syncer.sync(state)
+        get_board_syncer(project_dir).request_sync(state)
     except Exception as e:
         logger.warning(f"Failed to sync board: {e}")
+
+
+def flush_board_syncs() -> None:
+    """Write pending debounced syncs for all projects."""
+    with _syncers_lock:
+        syncers = list(_syncers.values())
+    for syncer in syncers:
+        syncer.flush()
+
+
+atexit.register(flush_board_syncs)
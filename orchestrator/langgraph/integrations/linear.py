@@ -7,12 +7,38 @@ Provides optional integration with Linear issue tracking:
 
 Uses the official Linear MCP (https://mcp.linear.app/mcp) with graceful degradation.
 MCP calls are made via subprocess to the Claude CLI.
+
+Each CLI call is a multi-turn agent run, so calls are amortized:
+- Issues are created in batches (several per call) on a bounded worker pool
+- Status updates and comments are queued, coalesced per issue, and sent
+  together in one call per flush
+
+A batched call that times out or returns a partial reply may still have
+created some issues, so unreported tasks are looked up by their ``[task_id]``
+title prefix before being created again. Tasks whose lookup also fails are
+left unresolved (never created blindly); they are saved next to the issue
+mapping and looked up before anything else on the next run.
+
+Batched updates report a result per operation. Status changes that were not
+confirmed are retried with the next flush, since repeating them is harmless.
+Comments are only retried after an explicit error: a comment without a
+result may already have been posted. Each update is sent at most
+``LinearUpdateQueue.MAX_ATTEMPTS`` times.
+
+The CLI command is configurable so tests can substitute a local fake.
 """
 
+import atexit
 import json
 import logging
 import os
+import re
+import shlex
 import subprocess
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -32,12 +58,20 @@ class LinearConfig:
         create_project: Whether to create a Linear project for the feature
         status_mapping: Map TaskStatus to Linear workflow states
         project_id: Optional existing project ID to use
+        batch_size: Issues created per CLI call (1 disables batching)
+        max_workers: Maximum concurrent CLI calls
+        update_delay: Seconds queued status updates wait to coalesce
+        cli_command: CLI used for MCP calls (e.g. a fake CLI in tests)
     """
 
     enabled: bool = False
     team_id: Optional[str] = None
     create_project: bool = True
     project_id: Optional[str] = None
+    batch_size: int = 10
+    max_workers: int = 4
+    update_delay: float = 2.0
+    cli_command: str = "claude"
     status_mapping: dict[str, str] = field(
         default_factory=lambda: {
             "pending": "Backlog",
@@ -49,6 +83,14 @@ class LinearConfig:
     )
 
 
+# Environment variable overriding the CLI used for MCP calls
+LINEAR_CLI_ENV = "LINEAR_MCP_CLI"
+
+# Response markers for batched calls
+_ISSUE_ID_PATTERN = re.compile(r"ISSUE_ID\[([^\]]+)\]:\s*(\S+)")
+_RESULT_PATTERN = re.compile(r"RESULT\[([^\]]+)\]:\s*(SUCCESS|ERROR)(.*)", re.IGNORECASE)
+_LOOKUP_DONE = "LOOKUP_DONE"
+
 # Default status mapping used when not specified in config
 DEFAULT_STATUS_MAPPING = {
     "pending": "Backlog",
@@ -83,6 +125,10 @@ def load_linear_config(project_dir: Path) -> LinearConfig:
             create_project=linear.get("create_project", True),
             project_id=linear.get("project_id"),
             status_mapping=linear.get("status_mapping", DEFAULT_STATUS_MAPPING),
+            batch_size=int(linear.get("batch_size", 10)),
+            max_workers=int(linear.get("max_workers", 4)),
+            update_delay=float(linear.get("update_delay", 2.0)),
+            cli_command=os.environ.get(LINEAR_CLI_ENV) or linear.get("cli_command", "claude"),
         )
 
     except (json.JSONDecodeError, KeyError) as e:
@@ -90,6 +136,167 @@ def load_linear_config(project_dir: Path) -> LinearConfig:
         return LinearConfig()
 
 
+@dataclass
+class _UpdateOutcome:
+    """Outcome of applying a batch of queued updates.
+
+    Attributes:
+        failed_statuses: Issue IDs whose status change was not confirmed
+        failed_comments: Comments that reported an error (not posted)
+        unknown_comments: Comments without a result (may have been posted)
+    """
+
+    failed_statuses: set[str] = field(default_factory=set)
+    failed_comments: dict[str, list[str]] = field(default_factory=dict)
+    unknown_comments: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every update was confirmed."""
+        return not (self.failed_statuses or self.failed_comments or self.unknown_comments)
+
+    def merge(self, other: "_UpdateOutcome") -> "_UpdateOutcome":
+        """Combine with the outcome of another batch."""
+        self.failed_statuses |= other.failed_statuses
+        self.failed_comments.update(other.failed_comments)
+        self.unknown_comments.update(other.unknown_comments)
+        return self
+
+
+class LinearUpdateQueue:
+    """Coalesces Linear status updates and comments into batched calls.
+
+    Updates wait ``delay`` seconds on a timer thread before being sent; a
+    newer status for the same issue replaces an older queued one, while
+    comments are kept in order. ``flush()`` sends everything immediately.
+    Failed updates are queued again for the next flush, up to MAX_ATTEMPTS
+    sends each; comments whose outcome is unknown are not resent.
+    """
+
+    # Sends per status change or comment before it is dropped
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, adapter: "LinearAdapter", delay: float = 2.0):
+        """Initialize the queue.
+
+        Args:
+            adapter: Adapter used to apply updates
+            delay: Seconds to wait for more updates before sending
+        """
+        self._adapter = adapter
+        self.delay = delay
+        self._lock = threading.Lock()
+        # Serializes flushes so an older batch never lands after a newer one
+        self._flush_lock = threading.Lock()
+        self._statuses: dict[str, str] = {}
+        self._comments: dict[str, list[str]] = {}
+        # Failed sends per (issue_id, status or comment body)
+        self._failures: dict[tuple[str, str], int] = {}
+        self._timer: Optional[threading.Timer] = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._statuses) + sum(len(c) for c in self._comments.values())
+
+    def put_status(self, issue_id: str, status: str) -> None:
+        """Queue a status change, replacing any queued status for the issue."""
+        with self._lock:
+            self._statuses[issue_id] = status
+            self._schedule()
+
+    def put_comment(self, issue_id: str, body: str) -> None:
+        """Queue a comment."""
+        with self._lock:
+            self._comments.setdefault(issue_id, []).append(body)
+            self._schedule()
+
+    def _schedule(self) -> None:
+        # Caller holds self._lock
+        if self._timer is None:
+            self._timer = threading.Timer(self.delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """Send all queued updates now.
+
+        Returns:
+            True if every update was applied (or nothing was queued)
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                statuses, self._statuses = self._statuses, {}
+                comments, self._comments = self._comments, {}
+            if not statuses and not comments:
+                return True
+            try:
+                outcome = self._adapter._apply_updates(statuses, comments)
+            except Exception as e:
+                logger.warning(f"Failed to flush Linear updates: {e}")
+                outcome = _UpdateOutcome(failed_statuses=set(statuses), unknown_comments=comments)
+            for issue_id, bodies in outcome.unknown_comments.items():
+                logger.warning(
+                    f"{len(bodies)} comment(s) on Linear issue {issue_id} may not have been "
+                    "posted; not retrying to avoid duplicates"
+                )
+            self._requeue(
+                {i: statuses[i] for i in outcome.failed_statuses if i in statuses},
+                outcome.failed_comments,
+                sent=[
+                    *statuses.items(),
+                    *((i, body) for i, bodies in comments.items() for body in bodies),
+                ],
+            )
+            return outcome.ok
+
+    def _requeue(
+        self,
+        statuses: dict[str, str],
+        comments: dict[str, list[str]],
+        sent: list[tuple[str, str]],
+    ) -> None:
+        """Put failed updates back in front of anything queued since.
+
+        Args:
+            statuses: Status changes to retry
+            comments: Comments to retry
+            sent: Every (issue_id, status or body) in the flush, to reset the
+                failure count of those that went through
+        """
+        failed = {
+            *statuses.items(),
+            *((i, body) for i, bodies in comments.items() for body in bodies),
+        }
+        with self._lock:
+            for key in sent:
+                if key not in failed:
+                    self._failures.pop(key, None)
+            for issue_id, status in statuses.items():
+                if self._give_up((issue_id, status)):
+                    continue
+                # A status queued during the flush is newer
+                if self._statuses.setdefault(issue_id, status) != status:
+                    self._failures.pop((issue_id, status), None)
+            for issue_id, bodies in comments.items():
+                kept = [body for body in bodies if not self._give_up((issue_id, body))]
+                if kept:
+                    self._comments[issue_id] = kept + self._comments.get(issue_id, [])
+
+    def _give_up(self, key: tuple[str, str]) -> bool:
+        """Count a failed send; True once the update has used all its attempts."""
+        # Caller holds self._lock
+        failures = self._failures.get(key, 0) + 1
+        if failures < self.MAX_ATTEMPTS:
+            self._failures[key] = failures
+            return False
+        self._failures.pop(key, None)
+        logger.warning(f"Dropping Linear update for issue {key[0]} after {failures} attempts")
+        return True
+
+
 class LinearAdapter:
     """Adapter for Linear MCP integration.
 
@@ -111,15 +318,24 @@ class LinearAdapter:
         """
         self.config = config
         self._mcp_available: Optional[bool] = None
-        self._issue_cache: dict[
-            str, tuple[str, float]
-        ] = {}  # task_id -> (linear_issue_id, timestamp)
+        # task_id -> (linear_issue_id, timestamp)
+        self._issue_cache: dict[str, tuple[str, float]] = {}
+        self.updates = LinearUpdateQueue(self, delay=config.update_delay)
+        self._lock = threading.Lock()
+        # Tasks whose batched create may or may not have produced an issue
+        self._unresolved: set[str] = set()
 
     @property
     def enabled(self) -> bool:
         """Check if Linear integration is enabled and configured."""
         return self.config.enabled and self.config.team_id is not None
 
+    @property
+    def unresolved_tasks(self) -> set[str]:
+        """Task IDs whose issue could not be confirmed or ruled out."""
+        with self._lock:
+            return set(self._unresolved)
+
     def create_issues_from_tasks(
         self,
         tasks: list[Task],
@@ -142,35 +358,59 @@ class LinearAdapter:
             logger.warning("Linear MCP not available, skipping issue creation")
             return {}
 
-        results = {}
-        import time
+        batches = [
+            tasks[i : i + max(1, self.config.batch_size)]
+            for i in range(0, len(tasks), max(1, self.config.batch_size))
+        ]
+        results: dict[str, str] = {}
+        workers = max(1, min(self.config.max_workers, len(batches)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="linear") as pool:
+            for mapping in pool.map(lambda batch: self._create_batch(batch, project_name), batches):
+                results.update(mapping)
 
         now = time.time()
-
-        for task in tasks:
-            try:
-                issue_id = self._create_issue(task, project_name)
-                if issue_id:
-                    results[task["id"]] = issue_id
-                    self._issue_cache[task["id"]] = (issue_id, now)
-            except Exception as e:
-                logger.warning(f"Failed to create Linear issue for {task.get('id')}: {e}")
+        for task_id, issue_id in results.items():
+            self._issue_cache[task_id] = (issue_id, now)
 
         return results
 
+    def load_issue_mapping(self, mapping: dict[str, str]) -> None:
+        """Seed the issue cache from a persisted task_id -> issue_id mapping.
+
+        Args:
+            mapping: Mapping as returned by load_issue_mapping()
+        """
+        now = time.time()
+        for task_id, issue_id in mapping.items():
+            self._issue_cache[task_id] = (issue_id, now)
+
+    def load_unresolved_tasks(self, task_ids: Iterable[str]) -> None:
+        """Mark tasks from an earlier run as unresolved.
+
+        Their issues are looked up before they can be created again.
+
+        Args:
+            task_ids: Task IDs as returned by load_unresolved_tasks()
+        """
+        with self._lock:
+            self._unresolved.update(task_ids)
+
     def update_issue_status(
         self,
         task_id: str,
         status: TaskStatus,
+        defer: bool = False,
     ) -> bool:
         """Update Linear issue status when task status changes.
 
         Args:
             task_id: Task ID
             status: New task status
+            defer: Queue the update; repeated updates for the same issue
+                coalesce and are sent in one batched call
 
         Returns:
-            True if update successful, False otherwise
+            True if update successful (or queued), False otherwise
         """
         if not self.enabled:
             return True  # Not a failure if disabled
@@ -184,6 +424,10 @@ class LinearAdapter:
             status.value if isinstance(status, TaskStatus) else status, "Backlog"
         )
 
+        if defer:
+            self.updates.put_status(issue_id, linear_status)
+            return True
+
         try:
             return self._update_issue(issue_id, {"status": linear_status})
         except Exception as e:
@@ -194,15 +438,17 @@ class LinearAdapter:
         self,
         task_id: str,
         blocker: str,
+        defer: bool = False,
     ) -> bool:
         """Add a blocker comment to Linear issue.
 
         Args:
             task_id: Task ID
             blocker: Blocker description
+            defer: Queue the comment for the next batched flush
 
         Returns:
-            True if comment added, False otherwise
+            True if comment added (or queued), False otherwise
         """
         if not self.enabled:
             return True
@@ -212,8 +458,13 @@ class LinearAdapter:
             logger.debug(f"No Linear issue found for task {task_id}")
             return True
 
+        body = f"🚫 **Blocked**: {blocker}"
+        if defer:
+            self.updates.put_comment(issue_id, body)
+            return True
+
         try:
-            return self._add_comment(issue_id, f"🚫 **Blocked**: {blocker}")
+            return self._add_comment(issue_id, body)
         except Exception as e:
             logger.warning(f"Failed to add comment to Linear issue {issue_id}: {e}")
             return False
@@ -222,15 +473,17 @@ class LinearAdapter:
         self,
         task_id: str,
         notes: str,
+        defer: bool = False,
     ) -> bool:
         """Add a completion comment to Linear issue.
 
         Args:
             task_id: Task ID
             notes: Completion notes
+            defer: Queue the comment for the next batched flush
 
         Returns:
-            True if comment added, False otherwise
+            True if comment added (or queued), False otherwise
         """
         if not self.enabled:
             return True
@@ -239,12 +492,25 @@ class LinearAdapter:
         if not issue_id:
             return True
 
+        body = f"✅ **Completed**: {notes}"
+        if defer:
+            self.updates.put_comment(issue_id, body)
+            return True
+
         try:
-            return self._add_comment(issue_id, f"✅ **Completed**: {notes}")
+            return self._add_comment(issue_id, body)
         except Exception as e:
             logger.warning(f"Failed to add completion comment: {e}")
             return False
 
+    def flush_updates(self) -> bool:
+        """Send queued status updates and comments now.
+
+        Returns:
+            True if every queued update was applied
+        """
+        return self.updates.flush()
+
     def _get_cached_issue_id(self, task_id: str) -> Optional[str]:
         """Get issue ID from cache with TTL checking.
 
@@ -254,8 +520,6 @@ class LinearAdapter:
         Returns:
             Issue ID if found and not expired, None otherwise
         """
-        import time
-
         cached = self._issue_cache.get(task_id)
         if cached is None:
             return None
@@ -289,8 +553,6 @@ class LinearAdapter:
         Returns:
             Number of entries removed
         """
-        import time
-
         now = time.time()
         expired = [
             task_id
@@ -350,30 +612,8 @@ class LinearAdapter:
         """
         task_id = task.get("id", "")
         title = task.get("title", "")
-        user_story = task.get("user_story", "")
-        acceptance_criteria = task.get("acceptance_criteria", [])
-        priority_map = {
-            "critical": 1,
-            "high": 2,
-            "medium": 3,
-            "low": 4,
-        }
-        priority = priority_map.get(task.get("priority", "medium"), 3)
-
-        # Build description
-        description_parts = [
-            f"**Project:** {project_name}",
-            f"**Task ID:** {task_id}",
-            "",
-            "## User Story",
-            user_story or "_No user story defined_",
-            "",
-            "## Acceptance Criteria",
-        ]
-        for criterion in acceptance_criteria:
-            description_parts.append(f"- [ ] {criterion}")
-
-        description = "\n".join(description_parts)
+        priority = self._issue_priority(task)
+        description = self._issue_description(task, project_name)
 
         prompt = f"""Create a Linear issue using mcp__linear__createIssue with:
 - teamId: "{self.config.team_id}"
@@ -410,6 +650,291 @@ Return ONLY the issue ID from the response in format: ISSUE_ID: <id>"""
 
         return None
 
+    def _issue_priority(self, task: Task) -> int:
+        """Map task priority to Linear priority (1 = urgent, 4 = low)."""
+        priority_map = {
+            "critical": 1,
+            "high": 2,
+            "medium": 3,
+            "low": 4,
+        }
+        return priority_map.get(task.get("priority", "medium"), 3)
+
+    def _issue_description(self, task: Task, project_name: str) -> str:
+        """Build the markdown description for a task's issue."""
+        description_parts = [
+            f"**Project:** {project_name}",
+            f"**Task ID:** {task.get('id', '')}",
+            "",
+            "## User Story",
+            task.get("user_story", "") or "_No user story defined_",
+            "",
+            "## Acceptance Criteria",
+        ]
+        for criterion in task.get("acceptance_criteria", []):
+            description_parts.append(f"- [ ] {criterion}")
+
+        return "\n".join(description_parts)
+
+    def _create_batch(self, tasks: list[Task], project_name: str) -> dict[str, str]:
+        """Create issues for a batch of tasks (runs on a worker thread).
+
+        Tasks left unresolved earlier are looked up before anything is
+        created. Tasks the batched call did not report may still have been
+        created, so they are looked up too; only tasks confirmed to have no
+        issue are retried one at a time. Tasks whose lookup fails stay
+        unresolved and are not created.
+
+        Returns:
+            Dict mapping task_id to linear_issue_id
+        """
+        results: dict[str, str] = {}
+        with self._lock:
+            unresolved = set(self._unresolved)
+        pending = [task for task in tasks if task.get("id", "") not in unresolved]
+        suspect = [task for task in tasks if task.get("id", "") in unresolved]
+        if suspect:
+            found, missing = self._resolve_existing(suspect)
+            results.update(found)
+            pending.extend(missing)
+
+        if len(pending) > 1:
+            try:
+                results.update(self._create_issues_batch(pending, project_name))
+            except Exception as e:
+                logger.warning(f"Batched Linear issue creation failed: {e}")
+            unreported = [task for task in pending if task.get("id", "") not in results]
+            pending = []
+            if unreported:
+                found, pending = self._resolve_existing(unreported)
+                results.update(found)
+
+        for task in pending:
+            task_id = task.get("id", "")
+            try:
+                issue_id = self._create_issue(task, project_name)
+                if issue_id:
+                    results[task_id] = issue_id
+            except Exception as e:
+                logger.warning(f"Failed to create Linear issue for {task_id}: {e}")
+
+        return results
+
+    def _resolve_existing(self, tasks: list[Task]) -> tuple[dict[str, str], list[Task]]:
+        """Look up tasks that may already have issues and track the unresolved ones.
+
+        Returns:
+            Issues found (task_id -> linear_issue_id) and the tasks confirmed
+            to have none; both are empty if the lookup failed
+        """
+        task_ids = {task.get("id", "") for task in tasks}
+        existing = self._find_existing_issues(tasks)
+        with self._lock:
+            if existing is None:
+                self._unresolved.update(task_ids)
+            else:
+                self._unresolved.difference_update(task_ids)
+        if existing is None:
+            logger.warning(
+                f"Could not check Linear for existing issues for {sorted(task_ids)}; "
+                "leaving them unresolved"
+            )
+            return {}, []
+        return existing, [task for task in tasks if task.get("id", "") not in existing]
+
+    def _create_issues_batch(self, tasks: list[Task], project_name: str) -> dict[str, str]:
+        """Create several Linear issues with a single CLI call.
+
+        Args:
+            tasks: Tasks to create issues for
+            project_name: Project name
+
+        Returns:
+            Dict mapping task_id to linear_issue_id for issues reported created
+        """
+        issue_specs = []
+        for task in tasks:
+            task_id = task.get("id", "")
+            issue_specs.append(f"""Issue [{task_id}]:
+- title: "[{task_id}] {task.get('title', '')}"
+- description: {json.dumps(self._issue_description(task, project_name))}
+- priority: {self._issue_priority(task)}""")
+
+        prompt = f"""Create the following {len(tasks)} Linear issues using mcp__linear__createIssue, one call per issue, all with teamId: "{self.config.team_id}".
+
+{chr(10).join(issue_specs)}
+
+Return ONLY one line per created issue in format: ISSUE_ID[<task id>]: <id>"""
+
+        result = self._run_mcp_command(
+            prompt,
+            timeout=30 + 15 * len(tasks),
+            max_turns=3 + len(tasks),
+        )
+        if not result:
+            return {}
+
+        wanted = {task.get("id", "") for task in tasks}
+        created = {
+            task_id.strip(): issue_id
+            for task_id, issue_id in _ISSUE_ID_PATTERN.findall(result)
+            if task_id.strip() in wanted
+        }
+        for task_id, issue_id in created.items():
+            logger.info(f"Created Linear issue {issue_id} for task {task_id}")
+        return created
+
+    def _find_existing_issues(self, tasks: list[Task]) -> Optional[dict[str, str]]:
+        """Look up issues already created for tasks by their ``[task_id]`` title prefix.
+
+        Args:
+            tasks: Tasks to look up
+
+        Returns:
+            Dict mapping task_id to linear_issue_id for issues found, or None if
+            the lookup failed and the tasks may or may not have issues
+        """
+        prefixes = "\n".join(f'- "[{task.get("id", "")}]"' for task in tasks)
+        prompt = f"""Search Linear issues in team "{self.config.team_id}" using mcp__linear__listIssues for issues whose title starts with any of these prefixes:
+{prefixes}
+
+Return ONLY one line per issue found in format: ISSUE_ID[<task id>]: <id>
+Then end with the line: {_LOOKUP_DONE}"""
+
+        try:
+            result = self._run_mcp_command(
+                prompt,
+                timeout=30 + 5 * len(tasks),
+                max_turns=3 + len(tasks),
+            )
+        except Exception as e:
+            logger.warning(f"Linear issue lookup failed: {e}")
+            return None
+
+        # Without the end marker a missing line could just be a truncated reply
+        if not result or _LOOKUP_DONE not in result:
+            return None
+
+        wanted = {task.get("id", "") for task in tasks}
+        found = {
+            task_id.strip(): issue_id
+            for task_id, issue_id in _ISSUE_ID_PATTERN.findall(result)
+            if task_id.strip() in wanted
+        }
+        for task_id, issue_id in found.items():
+            logger.info(f"Found existing Linear issue {issue_id} for task {task_id}")
+        return found
+
+    def _apply_updates(
+        self, statuses: dict[str, str], comments: dict[str, list[str]]
+    ) -> _UpdateOutcome:
+        """Apply queued status changes and comments in batched CLI calls.
+
+        Args:
+            statuses: issue_id -> Linear status name (latest wins)
+            comments: issue_id -> comment bodies in order
+
+        Returns:
+            Updates that were not confirmed
+        """
+        issue_ids = list(dict.fromkeys([*statuses, *comments]))
+        if not issue_ids:
+            return _UpdateOutcome()
+
+        size = max(1, self.config.batch_size)
+        batches = [issue_ids[i : i + size] for i in range(0, len(issue_ids), size)]
+
+        def apply(batch: list[str]) -> _UpdateOutcome:
+            if len(batch) == 1 and batch[0] in statuses and batch[0] not in comments:
+                issue_id = batch[0]
+                if self._update_issue(issue_id, {"status": statuses[issue_id]}):
+                    return _UpdateOutcome()
+                return _UpdateOutcome(failed_statuses={issue_id})
+            return self._update_issues_batch(
+                {issue_id: statuses[issue_id] for issue_id in batch if issue_id in statuses},
+                {issue_id: comments[issue_id] for issue_id in batch if issue_id in comments},
+            )
+
+        workers = max(1, min(self.config.max_workers, len(batches)))
+        outcome = _UpdateOutcome()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="linear") as pool:
+            for batch_outcome in pool.map(apply, batches):
+                outcome.merge(batch_outcome)
+        return outcome
+
+    def _update_issues_batch(
+        self, statuses: dict[str, str], comments: dict[str, list[str]]
+    ) -> _UpdateOutcome:
+        """Update statuses and add comments on several issues in one CLI call.
+
+        Every operation gets its own ``<issue id>/<operation>`` result, so a
+        partial reply only leaves the unreported operations unconfirmed.
+
+        Returns:
+            Updates without a SUCCESS result; comments without any result
+            are reported as unknown rather than failed
+        """
+        issue_ids = list(dict.fromkeys([*statuses, *comments]))
+        sections = []
+        for issue_id in issue_ids:
+            lines = [f"Issue {issue_id}:"]
+            if issue_id in statuses:
+                lines.append(
+                    f"- [{issue_id}/status] update with mcp__linear__updateIssue: "
+                    f'stateId for status "{statuses[issue_id]}"'
+                )
+            for index, body in enumerate(comments.get(issue_id, []), 1):
+                lines.append(
+                    f"- [{issue_id}/comment-{index}] add comment with "
+                    f"mcp__linear__createComment: body {json.dumps(body)}"
+                )
+            sections.append("\n".join(lines))
+
+        prompt = f"""Apply the following updates to Linear issues.
+
+{chr(10).join(sections)}
+
+If any status changes are listed, get the team's workflow states once to find the stateIds, then apply all updates.
+Return ONLY one line per operation, using the id in brackets, in format: RESULT[<operation id>]: SUCCESS, or RESULT[<operation id>]: ERROR <reason>"""
+
+        operations = len(statuses) + sum(len(bodies) for bodies in comments.values())
+        try:
+            result = self._run_mcp_command(
+                prompt,
+                timeout=30 + 10 * operations,
+                max_turns=3 + operations,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to apply batched Linear updates: {e}")
+            result = None
+
+        outcomes: dict[str, bool] = {}
+        if result:
+            for operation, outcome, reason in _RESULT_PATTERN.findall(result):
+                succeeded = outcome.upper() == "SUCCESS"
+                outcomes[operation.strip()] = succeeded
+                if not succeeded:
+                    logger.warning(f"Failed Linear update {operation.strip()}:{reason}")
+        else:
+            logger.warning(f"Failed to apply batched Linear updates for {len(issue_ids)} issue(s)")
+
+        # A missing result line (e.g. a truncated reply) is not a success
+        failed = _UpdateOutcome(
+            failed_statuses={
+                issue_id for issue_id in statuses if not outcomes.get(f"{issue_id}/status")
+            }
+        )
+        for issue_id, bodies in comments.items():
+            for index, body in enumerate(bodies, 1):
+                outcome = outcomes.get(f"{issue_id}/comment-{index}")
+                if outcome is False:
+                    failed.failed_comments.setdefault(issue_id, []).append(body)
+                elif outcome is None:
+                    failed.unknown_comments.setdefault(issue_id, []).append(body)
+        if failed.ok:
+            logger.debug(f"Applied batched updates to {len(issue_ids)} Linear issue(s)")
+        return failed
+
     def _update_issue(self, issue_id: str, updates: dict) -> bool:
         """Update a Linear issue.
 
@@ -489,18 +1014,19 @@ Return SUCCESS if added, or ERROR with reason."""
             logger.warning(f"Failed to add comment to Linear issue {issue_id}: {e}")
             return False
 
-    def _run_mcp_command(self, prompt: str, timeout: int = 30) -> Optional[str]:
+    def _run_mcp_command(self, prompt: str, timeout: int = 30, max_turns: int = 3) -> Optional[str]:
         """Run a Claude CLI command with MCP tools.
 
         Args:
             prompt: Prompt for Claude
             timeout: Command timeout in seconds
+            max_turns: Maximum agent turns (batched calls need more)
 
         Returns:
             Command output or None on failure
         """
         cmd = [
-            "claude",
+            *shlex.split(self.config.cli_command),
             "-p",
             prompt,
             "--output-format",
@@ -508,7 +1034,7 @@ Return SUCCESS if added, or ERROR with reason."""
             "--allowedTools",
             "mcp__linear__*",
             "--max-turns",
-            "3",
+            str(max_turns),
         ]
 
         try:
@@ -550,6 +1076,47 @@ def create_linear_adapter(project_dir: Path) -> LinearAdapter:
     return LinearAdapter(config)
 
 
+# Adapters shared per project so queued updates and the issue cache
+# survive across node invocations
+_adapters: dict[str, LinearAdapter] = {}
+_adapters_lock = threading.Lock()
+
+
+def get_linear_adapter(project_dir: Path) -> LinearAdapter:
+    """Get the shared Linear adapter for a project.
+
+    The adapter is reused while the project's Linear config is unchanged,
+    so deferred updates from different nodes coalesce in one queue.
+
+    Args:
+        project_dir: Project directory path
+
+    Returns:
+        Shared LinearAdapter instance
+    """
+    config = load_linear_config(project_dir)
+    key = str(Path(project_dir).resolve())
+    with _adapters_lock:
+        adapter = _adapters.get(key)
+        if adapter is not None and adapter.config == config:
+            return adapter
+        _adapters[key] = new_adapter = LinearAdapter(config)
+    if adapter is not None:
+        adapter.flush_updates()
+    return new_adapter
+
+
+def flush_linear_updates() -> None:
+    """Flush queued updates on all shared adapters."""
+    with _adapters_lock:
+        adapters = list(_adapters.values())
+    for adapter in adapters:
+        adapter.flush_updates()
+
+
+atexit.register(flush_linear_updates)
+
+
 def save_issue_mapping(
     project_dir: Path,
     mapping: dict[str, str],
@@ -598,3 +1165,42 @@ def load_issue_mapping(project_dir: Path) -> dict[str, str]:
         return json.loads(mapping_file.read_text())
     except json.JSONDecodeError:
         return {}
+
+
+def save_unresolved_tasks(project_dir: Path, task_ids: Iterable[str]) -> None:
+    """Save the tasks whose Linear issue could not be confirmed or ruled out.
+
+    Stored next to the issue mapping and replaced on every save; an empty
+    set removes the file.
+
+    Args:
+        project_dir: Project directory
+        task_ids: Unresolved task IDs
+    """
+    unresolved_file = project_dir / ".workflow" / "linear_unresolved.json"
+    task_ids = sorted(task_ids)
+    if not task_ids:
+        unresolved_file.unlink(missing_ok=True)
+        return
+
+    unresolved_file.parent.mkdir(parents=True, exist_ok=True)
+    unresolved_file.write_text(json.dumps(task_ids, indent=2))
+
+
+def load_unresolved_tasks(project_dir: Path) -> set[str]:
+    """Load the unresolved task IDs saved by save_unresolved_tasks().
+
+    Args:
+        project_dir: Project directory
+
+    Returns:
+        Set of task IDs
+    """
+    unresolved_file = project_dir / ".workflow" / "linear_unresolved.json"
+    if not unresolved_file.exists():
+        return set()
+
+    try:
+        return set(json.loads(unresolved_file.read_text()))
+    except (json.JSONDecodeError, TypeError):
+        return set()
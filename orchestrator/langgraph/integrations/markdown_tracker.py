@@ -3,13 +3,12 @@
 Provides local task tracking using markdown files with YAML frontmatter:
 - Task files stored in .workflow/tasks/
 - Read-only file permissions (chmod 444)
-- SHA256 checksum validation
+- SHA256 checksum validation (stat-first, via the shared fingerprinter)
 - Status updates with history logging
 
 Works identically whether Linear integration is enabled or not.
 """
 
-import hashlib
 import json
 import logging
 import os
@@ -19,6 +18,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from ...utils.fingerprint import get_fingerprinter
 from ..state import Task, TaskStatus
 
 logger = logging.getLogger(__name__)
@@ -97,6 +97,8 @@ class MarkdownTracker:
         self._tasks_dir = project_dir / ".workflow" / config.tasks_dir
         self._checksums_file = self._tasks_dir / ".task-checksums.json"
         self._checksums: dict[str, str] = {}
+        self._checksums_stat: Optional[tuple[int, int, int]] = None
+        self._fingerprinter = get_fingerprinter(project_dir)
 
     @property
     def enabled(self) -> bool:
@@ -210,6 +212,7 @@ class MarkdownTracker:
 
             # Update checksum
             self._update_checksum(task_id, new_content)
+            self._save_checksums()
 
             # Restore read-only
             if self.config.make_readonly:
@@ -267,8 +270,15 @@ class MarkdownTracker:
             return False
 
         try:
-            content = file_path.read_text()
-            return self._validate_checksum(task_id, content)
+            self._load_checksums()
+            stored = self._checksums.get(task_id)
+            if not stored:
+                return True  # No checksum stored, consider valid
+
+            # Only re-reads the file if its stat changed since it was last hashed
+            digest = self._fingerprinter.digest(file_path)
+            self._fingerprinter.save()
+            return digest == stored
         except Exception:
             return False
 
@@ -537,22 +547,33 @@ class MarkdownTracker:
             return body.rstrip() + f"\n\n{history_marker}\n{entry}\n"
 
     def _calculate_checksum(self, content: str) -> str:
-        """Calculate SHA256 checksum of content.
+        """Calculate checksum of content.
 
         Args:
             content: File content
 
         Returns:
-            Hex digest of SHA256 hash
+            Hex digest (SHA256 unless the fingerprint hash is overridden)
         """
-        return hashlib.sha256(content.encode()).hexdigest()
+        return self._fingerprinter.hash_bytes(content.encode())
+
+    def _checksums_file_stat(self) -> Optional[tuple[int, int, int]]:
+        try:
+            st = self._checksums_file.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
 
     def _load_checksums(self) -> None:
-        """Load checksums from file."""
-        if self._checksums_file.exists():
+        """Load checksums from file, unless it is unchanged since the last load."""
+        current = self._checksums_file_stat()
+        if current is not None and current == self._checksums_stat:
+            return
+        self._checksums_stat = current
+        if current is not None:
             try:
                 self._checksums = json.loads(self._checksums_file.read_text())
-            except json.JSONDecodeError:
+            except (OSError, json.JSONDecodeError):
                 self._checksums = {}
         else:
             self._checksums = {}
@@ -560,15 +581,22 @@ class MarkdownTracker:
     def _save_checksums(self) -> None:
         """Save checksums to file."""
         self._checksums_file.write_text(json.dumps(self._checksums, indent=2))
+        self._checksums_stat = self._checksums_file_stat()
+        self._fingerprinter.save()
 
     def _update_checksum(self, task_id: str, content: str) -> None:
         """Update checksum for a task.
 
+        The task file has just been written with ``content``, so its digest
+        is recorded with the fingerprinter too.
+
         Args:
             task_id: Task ID
             content: File content
         """
-        self._checksums[task_id] = self._calculate_checksum(content)
+        checksum = self._calculate_checksum(content)
+        self._checksums[task_id] = checksum
+        self._fingerprinter.record(self._tasks_dir / f"{task_id}.md", checksum)
 
     def _validate_checksum(self, task_id: str, content: str) -> bool:
         """Validate content against stored checksum.
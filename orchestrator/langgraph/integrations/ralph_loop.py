@@ -31,6 +31,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
+from ...agents.worker_pool import get_worker_pool
+from ...validation.test_impact import TestImpactAnalyzer
+
 logger = logging.getLogger(__name__)
 
 # Completion promise pattern
@@ -181,6 +184,8 @@ class RalphLoopConfig:
         track_tokens: Whether to track token usage
         context_warning_threshold: Context utilization threshold for warnings
         max_cost_usd: Optional cost limit
+        test_impact_analysis: Whether to run only tests affected by changes
+        full_test_run_interval: Partial test runs allowed between full runs
     """
 
     max_iterations: int = 10
@@ -222,6 +227,10 @@ class RalphLoopConfig:
     model: Optional[str] = None  # Override model (e.g., 'haiku' for budget constraints)
     budget_per_iteration: float = 0.50  # Budget per iteration in USD
 
+    # Test impact analysis: only rerun tests affected by each iteration's edits
+    test_impact_analysis: bool = True
+    full_test_run_interval: int = 5  # Force a full run after this many partial runs
+
 
 @dataclass
 class RalphLoopResult:
@@ -358,6 +367,13 @@ async def run_ralph_loop(
         TokenUsageTracker(max_cost_usd=config.max_cost_usd) if config.track_tokens else None
     )
 
+    # Initialize test impact analysis
+    impact_analyzer = (
+        TestImpactAnalyzer(project_dir, full_run_interval=config.full_test_run_interval)
+        if config.test_impact_analysis and test_files
+        else None
+    )
+
     logger.info(
         f"Starting Ralph Wiggum loop for task {task_id} (mode: {config.execution_mode.value})"
     )
@@ -459,12 +475,19 @@ async def run_ralph_loop(
                 )
 
             # Check if tests pass
-            test_result = await _run_tests(project_dir, test_files, config)
+            test_result = await _run_impacted_tests(
+                project_dir,
+                test_files,
+                config,
+                impact_analyzer,
+                changed_files=result.get("files_changed", []),
+            )
             test_results.append(
                 {
                     "iteration": iteration,
                     "passed": test_result["all_passed"],
                     "summary": test_result.get("summary", ""),
+                    "tests_run": test_result.get("tests_run", len(test_files)),
                 }
             )
 
@@ -593,8 +616,9 @@ async def _run_single_iteration(
 ) -> dict[str, Any]:
     """Run a single Ralph loop iteration.
 
-    Spawns fresh Claude process with the prompt. Ensures proper cleanup
-    on timeout or error to prevent zombie processes.
+    Runs the prompt in a fresh Claude process, pre-warmed when warm workers
+    are enabled. Ensures proper cleanup on timeout or error to prevent
+    zombie processes.
 
     Args:
         project_dir: Project directory
@@ -628,6 +652,13 @@ async def _run_single_iteration(
     if config.budget_per_iteration > 0:
         cmd.extend(["--max-budget-usd", str(config.budget_per_iteration)])
 
+    # Warm workers are single-use for calls without a session, so each
+    # iteration still starts with fresh context
+    pool = get_worker_pool()
+    if pool is not None:
+        reply = await pool.arun(cmd, cwd=project_dir, timeout=config.iteration_timeout)
+        return _iteration_result(config, iteration, reply.stdout, reply.returncode)
+
     process = None
     try:
         process = await asyncio.create_subprocess_exec(
@@ -640,26 +671,7 @@ async def _run_single_iteration(
 
         stdout, stderr = await process.communicate()
         output_text = stdout.decode() if stdout else ""
-
-        # Check for completion promise in output
-        completion_detected = config.completion_pattern in output_text
-
-        # Parse any JSON output
-        parsed_output = _parse_iteration_output(output_text)
-
-        # Extract list of changed files from output (if any)
-        files_changed = parsed_output.get("files_modified", []) + parsed_output.get(
-            "files_created", []
-        )
-
-        return {
-            "iteration": iteration,
-            "completion_detected": completion_detected,
-            "output": parsed_output,
-            "files_changed": files_changed,
-            "raw_output": output_text,
-            "return_code": process.returncode,
-        }
+        return _iteration_result(config, iteration, output_text, process.returncode)
 
     except asyncio.CancelledError:
         # Task was cancelled (likely due to timeout)
@@ -674,6 +686,34 @@ async def _run_single_iteration(
         raise
 
 
+def _iteration_result(
+    config: RalphLoopConfig,
+    iteration: int,
+    output_text: str,
+    return_code: Optional[int],
+) -> dict[str, Any]:
+    """Build the result dict for one iteration from the agent's output."""
+    # Check for completion promise in output
+    completion_detected = config.completion_pattern in output_text
+
+    # Parse any JSON output
+    parsed_output = _parse_iteration_output(output_text)
+
+    # Extract list of changed files from output (if any)
+    files_changed = parsed_output.get("files_modified", []) + parsed_output.get(
+        "files_created", []
+    )
+
+    return {
+        "iteration": iteration,
+        "completion_detected": completion_detected,
+        "output": parsed_output,
+        "files_changed": files_changed,
+        "raw_output": output_text,
+        "return_code": return_code,
+    }
+
+
 async def _terminate_process(process: asyncio.subprocess.Process) -> None:
     """Safely terminate a subprocess.
 
@@ -783,6 +823,55 @@ async def _run_tests(
         }
 
 
+async def _run_impacted_tests(
+    project_dir: Path,
+    test_files: list[str],
+    config: RalphLoopConfig,
+    impact_analyzer: Optional[TestImpactAnalyzer],
+    changed_files: Optional[list[str]] = None,
+) -> dict[str, Any]:
+    """Run only the tests affected by the latest changes.
+
+    A passing partial run is confirmed with a full run before it is
+    reported as passing, so test impact analysis never causes a false
+    completion.
+
+    Args:
+        project_dir: Project directory
+        test_files: All test files that must pass
+        config: Loop configuration
+        impact_analyzer: Analyzer selecting affected tests (None runs everything)
+        changed_files: Files the iteration reported as changed
+
+    Returns:
+        Dict with test results
+    """
+    if impact_analyzer is None:
+        return await _run_tests(project_dir, test_files, config)
+
+    selection = impact_analyzer.select_tests(test_files, changed_files)
+    test_result = await _run_tests(project_dir, selection.tests, config)
+    impact_analyzer.record_result(
+        selection,
+        test_result["all_passed"],
+        TestImpactAnalyzer.failed_test_files(test_result.get("output", "")),
+    )
+
+    if test_result["all_passed"] and not selection.full_run:
+        logger.info("Affected tests pass, confirming with a full run")
+        selection = impact_analyzer.full_selection(test_files, "confirm partial pass")
+        test_result = await _run_tests(project_dir, test_files, config)
+        impact_analyzer.record_result(
+            selection,
+            test_result["all_passed"],
+            TestImpactAnalyzer.failed_test_files(test_result.get("output", "")),
+        )
+
+    test_result["tests_run"] = len(selection.tests)
+    test_result["full_run"] = selection.full_run
+    return test_result
+
+
 def _extract_test_summary(output: str) -> str:
     """Extract test summary from pytest output."""
     # Look for pytest summary line like "5 passed, 2 failed"
@@ -24,6 +24,7 @@ import json
 import logging
 import re
 import shutil
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -33,6 +34,9 @@ from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cancelled or timed-out command gets to exit after SIGTERM
+TERMINATE_GRACE_SECONDS = 2.0
+
 
 class VerificationType(str, Enum):
     """Types of verification strategies."""
@@ -155,6 +159,7 @@ class VerificationStrategy(ABC):
         timeout = timeout or self.timeout
         cwd = cwd or self.project_dir
 
+        process = None
         try:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
@@ -174,7 +179,14 @@ class VerificationStrategy(ABC):
                 stderr.decode() if stderr else "",
             )
 
+        except asyncio.CancelledError:
+            # Composite verification no longer needs the result
+            if process is not None:
+                await _terminate_process(process)
+            raise
         except asyncio.TimeoutError:
+            if process is not None:
+                await _terminate_process(process)
             return (-1, "", f"Command timed out after {timeout} seconds")
         except FileNotFoundError as e:
             return (-1, "", f"Command not found: {e}")
@@ -182,6 +194,24 @@ class VerificationStrategy(ABC):
             return (-1, "", f"Error running command: {e}")
 
 
+async def _terminate_process(
+    process: asyncio.subprocess.Process,
+    grace_period: float = TERMINATE_GRACE_SECONDS,
+) -> None:
+    """Stop a subprocess: SIGTERM, then SIGKILL if it outlives the grace period."""
+    if process.returncode is not None:
+        return
+    try:
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=grace_period)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+    except ProcessLookupError:
+        pass
+
+
 class TestVerification(VerificationStrategy):
     """Run tests to verify implementation.
 
@@ -574,6 +604,11 @@ class CompositeVerification(VerificationStrategy):
 
     Can be configured to require all strategies to pass,
     or just a subset.
+
+    Strategies are independent, so they run concurrently (up to
+    ``max_parallel`` at a time). With ``require_all`` the first failure
+    decides the outcome and the strategies still running are cancelled,
+    terminating their subprocesses.
     """
 
     def __init__(
@@ -582,6 +617,7 @@ class CompositeVerification(VerificationStrategy):
         strategies: Optional[list[VerificationStrategy]] = None,
         require_all: bool = True,
         timeout: int = 180,
+        max_parallel: Optional[int] = None,
     ):
         """Initialize composite verification.
 
@@ -590,10 +626,12 @@ class CompositeVerification(VerificationStrategy):
             strategies: List of strategies to run
             require_all: Whether all strategies must pass
             timeout: Total timeout for all strategies
+            max_parallel: Maximum strategies running at once (None for no limit)
         """
         super().__init__(project_dir, timeout)
         self.strategies = strategies or []
         self.require_all = require_all
+        self.max_parallel = max_parallel
 
     @property
     def verification_type(self) -> VerificationType:
@@ -604,7 +642,7 @@ class CompositeVerification(VerificationStrategy):
         self.strategies.append(strategy)
 
     async def verify(self, context: VerificationContext) -> VerificationResult:
-        """Run all strategies and aggregate results."""
+        """Run all strategies concurrently and aggregate results."""
         start_time = datetime.now()
 
         if not self.strategies:
@@ -615,15 +653,38 @@ class CompositeVerification(VerificationStrategy):
                 duration_seconds=0.0,
             )
 
-        # Run all strategies
-        results: list[VerificationResult] = []
-        for strategy in self.strategies:
-            result = await strategy.verify(context)
-            results.append(result)
+        limit = self.max_parallel or len(self.strategies)
+        semaphore = asyncio.Semaphore(max(1, limit))
+        tasks = [
+            asyncio.ensure_future(self._run_strategy(index, strategy, context, semaphore))
+            for index, strategy in enumerate(self.strategies)
+        ]
+
+        completed: dict[int, tuple[VerificationResult, float]] = {}
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result, elapsed = await next_done
+                completed[index] = (result, elapsed)
+                if self.require_all and not result.passed:
+                    # Outcome is decided; stop the rest
+                    break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                # Let cancelled strategies terminate their subprocesses
+                await asyncio.gather(*pending, return_exceptions=True)
 
         duration = (datetime.now() - start_time).total_seconds()
 
-        # Aggregate results
+        # Aggregate results in strategy order
+        results = [completed[index][0] for index in sorted(completed)]
+        cancelled = [
+            strategy.verification_type.value
+            for index, strategy in enumerate(self.strategies)
+            if index not in completed
+        ]
         all_failures = []
         all_warnings = []
         summaries = []
@@ -632,9 +693,11 @@ class CompositeVerification(VerificationStrategy):
             all_failures.extend(result.failures)
             all_warnings.extend(result.warnings)
             summaries.append(f"{result.verification_type.value}: {result.summary}")
+        for name in cancelled:
+            summaries.append(f"{name}: cancelled")
 
         if self.require_all:
-            passed = all(r.passed for r in results)
+            passed = not cancelled and all(r.passed for r in results)
         else:
             passed = any(r.passed for r in results)
 
@@ -648,10 +711,44 @@ class CompositeVerification(VerificationStrategy):
                 "strategies": [s.verification_type.value for s in self.strategies],
                 "individual_results": [r.to_dict() for r in results],
                 "require_all": self.require_all,
+                "max_parallel": limit,
+                "cancelled": cancelled,
+                "timings": {
+                    self.strategies[index].verification_type.value: round(elapsed, 3)
+                    for index, (_, elapsed) in sorted(completed.items())
+                },
             },
             duration_seconds=duration,
         )
 
+    async def _run_strategy(
+        self,
+        index: int,
+        strategy: VerificationStrategy,
+        context: VerificationContext,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[int, VerificationResult, float]:
+        """Run one strategy under the parallelism cap, timing it.
+
+        Returns:
+            Tuple of (strategy index, result, elapsed seconds)
+        """
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                result = await strategy.verify(context)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"{strategy.verification_type.value} verification raised: {e}")
+                result = VerificationResult(
+                    passed=False,
+                    verification_type=strategy.verification_type,
+                    summary=f"Verification error: {e}",
+                    failures=[str(e)],
+                )
+            return index, result, time.monotonic() - started
+
 
 class NoVerification(VerificationStrategy):
     """No-op verification that always passes.
@@ -724,6 +821,7 @@ def create_composite_verifier(
     include_lint: bool = True,
     include_security: bool = False,
     require_all: bool = True,
+    max_parallel: Optional[int] = None,
 ) -> CompositeVerification:
     """Create a composite verifier with configurable strategies.
 
@@ -734,6 +832,7 @@ def create_composite_verifier(
         include_lint: Include lint verification
         include_security: Include security verification
         require_all: Require all strategies to pass
+        max_parallel: Maximum strategies running at once (None for no limit)
 
     Returns:
         Configured CompositeVerification
@@ -752,4 +851,5 @@ def create_composite_verifier(
         strategies=strategies,
         require_all=require_all,
         timeout=timeout,
+        max_parallel=max_parallel,
     )
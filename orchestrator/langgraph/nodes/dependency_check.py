@@ -9,6 +9,7 @@ Analyzes project dependencies for:
 This node runs after security_scan and before completion.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -66,8 +67,9 @@ async def dependency_check_node(state: WorkflowState) -> dict[str, Any]:
         check_docker=config.dependency.check_docker,
         check_frameworks=config.dependency.check_frameworks,
         blocking_severities=blocking_severities,
+        cache_ttl_seconds=config.dependency.cache_ttl_seconds,
     )
-    result = checker.check()
+    result = await asyncio.to_thread(checker.check)
 
     # Build output for storage
     dependency_check_result = {
@@ -10,15 +10,19 @@ Based on GSD pattern for informed planning.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 
 from ...agents.prompts import format_prompt, load_prompt
+from ...agents.worker_pool import get_worker_pool
+from ...config.context_cache import get_active_context_cache
 from ..state import WorkflowState
 
 logger = logging.getLogger(__name__)
@@ -27,6 +31,44 @@ logger = logging.getLogger(__name__)
 RESEARCH_TIMEOUT = 120  # 2 minutes per agent
 MAX_RESEARCH_AGENTS = 2  # Number of parallel research agents
 
+# Dependency manifests and lockfiles that define the tech stack
+MANIFEST_FILES = (
+    "package.json",
+    "package-lock.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "pyproject.toml",
+    "poetry.lock",
+    "uv.lock",
+    "Pipfile.lock",
+    "requirements.txt",
+    "requirements-dev.txt",
+    "go.mod",
+    "go.sum",
+    "Cargo.toml",
+    "Cargo.lock",
+)
+
+# Inputs each research area depends on; findings are reused while they are
+# unchanged (see _research_fingerprints)
+RESEARCH_INPUTS = {
+    "tech_stack": ("manifests",),
+    "existing_patterns": ("manifests", "layout"),
+    "web_research": ("manifests", "docs"),
+}
+
+# Directory depth and names considered for the codebase layout fingerprint
+LAYOUT_DEPTH = 3
+LAYOUT_IGNORED_DIRS = frozenset(
+    {"node_modules", "__pycache__", "venv", "dist", "build", "target", "coverage"}
+)
+
+# Directories whose presence indicates the architecture
+PATTERN_DIRS = ("services", "repositories", "controllers", "api", "domain", "models", "utils")
+
+# Aggregated research records searched for reusable findings
+RESEARCH_HISTORY_LIMIT = 20
+
 
 @dataclass
 class ResearchAgent:
@@ -124,6 +166,8 @@ class ResearchFindings:
     web_research: Optional[dict] = None
     errors: list[dict] = field(default_factory=list)
     completed_at: Optional[str] = None
+    # Input fingerprint per agent id the findings were produced from
+    fingerprints: dict[str, str] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
         return {
@@ -132,6 +176,7 @@ class ResearchFindings:
             "web_research": self.web_research,
             "errors": self.errors,
             "completed_at": self.completed_at,
+            "fingerprints": self.fingerprints,
         }
 
 
@@ -156,15 +201,39 @@ async def research_phase_node(state: WorkflowState) -> dict[str, Any]:
 
     logger.info("Starting research phase with parallel agents")
 
-    # Check if research already exists and is recent (from DB)
-    existing_findings = _load_existing_research_from_db(project_name)
-    if existing_findings and _is_research_fresh_from_db(project_name):
-        logger.info("Using existing research findings (less than 1 hour old)")
+    # Reuse findings for areas whose manifests, docs or layout are unchanged
+    fingerprints = _research_fingerprints(project_dir)
+    history = _load_research_history_from_db(project_name)
+    cached = _match_cached_research(history, fingerprints)
+
+    if not cached:
+        legacy = _legacy_findings(history)
+        if legacy is not None:
+            logger.info("Using existing research findings (less than 1 hour old)")
+            return {
+                "research_complete": True,
+                "research_findings": legacy.to_dict(),
+                "updated_at": datetime.now().isoformat(),
+            }
+
+    findings = ResearchFindings(fingerprints=fingerprints)
+    for agent_id, result in cached.items():
+        setattr(findings, agent_id, result)
+
+    pending_agents = [agent for agent in RESEARCH_AGENTS if agent.id not in cached]
+    if not pending_agents:
+        logger.info("Using cached research findings (project inputs unchanged)")
+        findings.completed_at = datetime.now().isoformat()
         return {
             "research_complete": True,
-            "research_findings": existing_findings.to_dict(),
+            "research_findings": findings.to_dict(),
             "updated_at": datetime.now().isoformat(),
         }
+    if cached:
+        logger.info(
+            f"Reusing cached research for {sorted(cached)}; "
+            f"re-running {[agent.id for agent in pending_agents]}"
+        )
 
     # Load research configuration
     from ...config.thresholds import load_project_config
@@ -172,20 +241,17 @@ async def research_phase_node(state: WorkflowState) -> dict[str, Any]:
     project_config = load_project_config(project_dir)
     research_config = project_config.research
 
-    # Run research agents in parallel
-    findings = ResearchFindings()
-
     try:
         # Spawn agents concurrently
         tasks = [
             _run_research_agent(project_dir, agent, project_name, research_config)
-            for agent in RESEARCH_AGENTS
+            for agent in pending_agents
         ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results
-        for agent, result in zip(RESEARCH_AGENTS, results, strict=False):
+        for agent, result in zip(pending_agents, results, strict=False):
             if isinstance(result, Exception):
                 logger.warning(f"Research agent {agent.id} failed: {result}")
                 findings.errors.append(
@@ -211,7 +277,8 @@ async def research_phase_node(state: WorkflowState) -> dict[str, Any]:
 
         logger.info(
             f"Research phase complete. "
-            f"Agents completed: {len([r for r in results if not isinstance(r, Exception)])}/{len(RESEARCH_AGENTS)}"
+            f"Agents completed: {len([r for r in results if not isinstance(r, Exception)])}/{len(pending_agents)}"
+            f" (cached: {len(cached)})"
         )
 
         return {
@@ -292,7 +359,7 @@ async def _run_research_agent(
     try:
         # Run Claude with research prompt
         result = await asyncio.wait_for(
-            _spawn_claude_agent(project_dir, prompt, allowed_tools),
+            _spawn_claude_agent(project_dir, prompt, allowed_tools, timeout),
             timeout=timeout,
         )
 
@@ -321,6 +388,7 @@ async def _spawn_claude_agent(
     project_dir: Path,
     prompt: str,
     allowed_tools: str = "Read,Glob,Grep",
+    timeout: float = RESEARCH_TIMEOUT,
 ) -> str:
     """Spawn a Claude agent for research.
 
@@ -330,6 +398,7 @@ async def _spawn_claude_agent(
         project_dir: Project directory
         prompt: Research prompt
         allowed_tools: Comma-separated list of allowed tools (default: codebase-only)
+        timeout: Seconds a warm worker may take to answer
 
     Returns:
         Raw agent output
@@ -346,6 +415,14 @@ async def _spawn_claude_agent(
         "10",  # Limit turns for research
     ]
 
+    pool = get_worker_pool()
+    if pool is not None:
+        # The caller's wait_for cancels the call, which stops the worker
+        reply = await pool.arun(cmd, cwd=project_dir, timeout=timeout)
+        if reply.returncode != 0:
+            raise Exception(f"Claude agent failed: {reply.stderr or 'Unknown error'}")
+        return reply.stdout
+
     process = await asyncio.create_subprocess_exec(
         *cmd,
         cwd=project_dir,
@@ -497,77 +574,173 @@ IMPORTANT:
 """
 
 
-def _load_existing_research_from_db(project_name: str) -> Optional[ResearchFindings]:
-    """Load existing research findings from database if available.
+def _research_fingerprints(project_dir: Path) -> dict[str, str]:
+    """Fingerprint the inputs each research area depends on.
+
+    Manifests, lockfiles and docs are hashed by content; the codebase layout
+    by its directory names, so ordinary code edits do not invalidate pattern
+    research. Each agent's prompt is included so prompt changes re-research.
 
     Args:
-        project_name: Project name for DB lookup
+        project_dir: Project directory
 
     Returns:
-        ResearchFindings or None
+        Mapping of agent id to fingerprint
     """
-    from ...db.repositories.logs import get_logs_repository
-    from ...storage.async_utils import run_async
+    inputs = {
+        "manifests": _hash_files(project_dir, [project_dir / name for name in MANIFEST_FILES]),
+        "docs": _hash_files(project_dir, _doc_files(project_dir)),
+        "layout": _layout_signature(project_dir),
+    }
 
-    try:
-        repo = get_logs_repository(project_name)
-        logs = run_async(repo.get_by_type("research_aggregated"))
+    fingerprints = {}
+    for agent in RESEARCH_AGENTS:
+        digest = hashlib.sha256(agent.prompt.encode())
+        for name in RESEARCH_INPUTS.get(agent.id, ("manifests",)):
+            digest.update(f"\0{name}={inputs[name]}".encode())
+        fingerprints[agent.id] = digest.hexdigest()
+    return fingerprints
 
-        if not logs:
-            return None
 
-        # Get most recent research
-        latest = logs[0]  # Sorted by created_at desc
-        data = latest.get("content", {})
+def _hash_files(project_dir: Path, paths: list[Path]) -> str:
+    """Hash file names and contents; missing files hash as absent."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path.relative_to(project_dir)).encode() + b"\0")
+        try:
+            with open(path, "rb") as f:
+                while block := f.read(1 << 16):
+                    digest.update(block)
+        except OSError:
+            digest.update(b"<missing>")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _doc_files(project_dir: Path) -> list[Path]:
+    """List documentation files in sorted order."""
+    from ...validators.documentation_discovery import DocumentationScanner
+
+    files: list[Path] = []
+    for name in DocumentationScanner.DISCOVERY_PATHS:
+        docs_dir = project_dir / name
+        if docs_dir.is_dir():
+            files.extend(p for p in docs_dir.rglob("*") if p.is_file())
+    return sorted(set(files))
+
+
+def _layout_signature(project_dir: Path, max_depth: int = LAYOUT_DEPTH) -> str:
+    """Hash the names of the project's directories down to max_depth."""
+    dirs = []
+
+    def walk(path: Path, depth: int) -> None:
+        try:
+            entries = sorted(os.scandir(path), key=lambda e: e.name)
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name in LAYOUT_IGNORED_DIRS:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(os.path.relpath(entry.path, project_dir))
+                if depth < max_depth:
+                    walk(Path(entry.path), depth + 1)
+
+    walk(project_dir, 1)
+    return hashlib.sha256("\n".join(dirs).encode()).hexdigest()
 
-        return ResearchFindings(
-            tech_stack=data.get("tech_stack"),
-            existing_patterns=data.get("existing_patterns"),
-            web_research=data.get("web_research"),
-            errors=data.get("errors", []),
-            completed_at=data.get("completed_at"),
-        )
-    except Exception:
-        return None
 
+def _log_field(entry: Any, name: str) -> Any:
+    """Read a field from a log record or plain dict."""
+    if isinstance(entry, dict):
+        return entry.get(name)
+    return getattr(entry, name, None)
 
-def _is_research_fresh_from_db(project_name: str, max_age_hours: int = 1) -> bool:
-    """Check if research is recent enough to reuse.
+
+def _load_research_history_from_db(project_name: str) -> list[Any]:
+    """Load recent aggregated research records, most recent first.
 
     Args:
         project_name: Project name for DB lookup
-        max_age_hours: Maximum age in hours
 
     Returns:
-        True if research is fresh
+        List of log records (empty if unavailable)
     """
     from ...db.repositories.logs import get_logs_repository
     from ...storage.async_utils import run_async
 
     try:
         repo = get_logs_repository(project_name)
-        logs = run_async(repo.get_by_type("research_aggregated"))
+        return list(
+            run_async(repo.get_by_type("research_aggregated", limit=RESEARCH_HISTORY_LIMIT))
+        )
+    except Exception as e:
+        logger.debug(f"Could not load research history: {e}")
+        return []
+
+
+def _match_cached_research(history: list[Any], fingerprints: dict[str, str]) -> dict[str, dict]:
+    """Find reusable findings per agent by fingerprint.
+
+    Args:
+        history: Aggregated research records, most recent first
+        fingerprints: Current fingerprint per agent id
 
-        if not logs:
-            return False
+    Returns:
+        Mapping of agent id to cached findings for areas whose inputs are
+        unchanged
+    """
+    matched: dict[str, dict] = {}
+    for entry in history:
+        content = _log_field(entry, "content") or {}
+        stored = content.get("fingerprints") or {}
+        failed = {error.get("agent") for error in content.get("errors") or []}
+        for agent_id, fingerprint in fingerprints.items():
+            if agent_id in matched or agent_id in failed or stored.get(agent_id) != fingerprint:
+                continue
+            result = content.get(agent_id)
+            if isinstance(result, dict) and result and not result.get("skipped"):
+                matched[agent_id] = result
+    return matched
+
+
+def _legacy_findings(history: list[Any], max_age_hours: int = 1) -> Optional[ResearchFindings]:
+    """Reuse the latest pre-fingerprint research if it is recent enough.
 
-        # Get most recent research
-        latest = logs[0]
-        created_at = latest.get("created_at")
+    Args:
+        history: Aggregated research records, most recent first
+        max_age_hours: Maximum age in hours
 
-        if not created_at:
-            return False
+    Returns:
+        ResearchFindings or None
+    """
+    if not history:
+        return None
+    latest = history[0]
+    data = _log_field(latest, "content") or {}
+    created_at = _log_field(latest, "created_at")
+    if data.get("fingerprints") or not created_at:
+        return None
 
+    try:
         # Parse ISO timestamp
         if isinstance(created_at, str):
             created_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
         else:
             created_dt = created_at
-
         age_hours = (datetime.now(created_dt.tzinfo) - created_dt).total_seconds() / 3600
-        return age_hours < max_age_hours
-    except Exception:
-        return False
+    except (TypeError, ValueError):
+        return None
+    if age_hours >= max_age_hours:
+        return None
+
+    return ResearchFindings(
+        tech_stack=data.get("tech_stack"),
+        existing_patterns=data.get("existing_patterns"),
+        web_research=data.get("web_research"),
+        errors=data.get("errors", []),
+        completed_at=data.get("completed_at"),
+    )
 
 
 def _save_aggregated_findings(findings: ResearchFindings, project_name: str) -> None:
@@ -612,12 +785,26 @@ async def quick_research(project_dir: Path) -> ResearchFindings:
 def _quick_tech_stack_analysis(project_dir: Path) -> dict:
     """Quick analysis of tech stack from config files.
 
+    Memoized in the run's context cache until a manifest changes.
+
     Args:
         project_dir: Project directory
 
     Returns:
         Tech stack info
     """
+    cache = get_active_context_cache()
+    if cache is None:
+        return _read_tech_stack(project_dir)
+    return cache.get(
+        "research_tech_stack",
+        project_dir,
+        lambda: _read_tech_stack(project_dir),
+        files=[project_dir / name for name in MANIFEST_FILES],
+    )
+
+
+def _read_tech_stack(project_dir: Path) -> dict:
     result = {
         "languages": [],
         "frameworks": [],
@@ -706,12 +893,29 @@ def _quick_tech_stack_analysis(project_dir: Path) -> dict:
 def _quick_pattern_analysis(project_dir: Path) -> dict:
     """Quick analysis of code patterns.
 
+    Memoized in the run's context cache until the inspected directories
+    change.
+
     Args:
         project_dir: Project directory
 
     Returns:
         Pattern info
     """
+    cache = get_active_context_cache()
+    if cache is None:
+        return _read_patterns(project_dir)
+    src_dir = project_dir / "src"
+    watched = [project_dir, src_dir, project_dir / "tests", project_dir / "test"]
+    return cache.get(
+        "research_patterns",
+        project_dir,
+        lambda: _read_patterns(project_dir),
+        files=watched + [src_dir / name for name in PATTERN_DIRS],
+    )
+
+
+def _read_patterns(project_dir: Path) -> dict:
     result = {
         "architecture": "unknown",
         "folder_structure": "unknown",
@@ -725,8 +929,7 @@ def _quick_pattern_analysis(project_dir: Path) -> dict:
         src_dir = project_dir
 
     # Detect folder structure
-    common_dirs = ["services", "repositories", "controllers", "api", "domain", "models", "utils"]
-    found_dirs = [d for d in common_dirs if (src_dir / d).exists()]
+    found_dirs = [d for d in PATTERN_DIRS if (src_dir / d).exists()]
 
     if found_dirs:
         if "domain" in found_dirs or "repositories" in found_dirs:
@@ -754,7 +957,8 @@ def _quick_pattern_analysis(project_dir: Path) -> dict:
 
     # Check for naming patterns from a sample file
     for pattern in ["**/*.py", "**/*.ts", "**/*.js"]:
-        files = list(src_dir.glob(pattern))[:5]
+        # Stop walking once a sample is found
+        files = list(islice(src_dir.glob(pattern), 5))
         if files:
             # Check file naming
             names = [f.stem for f in files]
@@ -20,9 +20,10 @@ from typing import Any, Optional
 from langgraph.types import interrupt
 
 from orchestrator.cleanup import CleanupManager
+from orchestrator.config import load_project_config
 from orchestrator.dispatch import AgentDispatcher, Task
 from orchestrator.recovery import ErrorCategory, ErrorContext, RecoveryHandler
-from orchestrator.review import ReviewCycle, ReviewCycleResult
+from orchestrator.review import ReviewCycle, ReviewCycleResult, ReviewPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -73,8 +74,14 @@ async def review_cycle_node(state: dict[str, Any]) -> dict[str, Any]:
         test_files=current_task.get("test_files", []),
     )
 
-    # Run review cycle
-    cycle = ReviewCycle(dispatcher, project_dir)
+    # Run review cycle with the project's review policy
+    review_config = load_project_config(project_dir).review
+    try:
+        policy = ReviewPolicy(review_config.policy)
+    except ValueError:
+        logger.warning(f"Unknown review policy {review_config.policy!r}, using 'all'")
+        policy = ReviewPolicy.ALL
+    cycle = ReviewCycle(dispatcher, project_dir, policy=policy, quorum=review_config.quorum)
 
     try:
         result = await cycle.run(
@@ -8,7 +8,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-from ...integrations import create_linear_adapter, create_markdown_tracker, load_issue_mapping
+from ...integrations import create_markdown_tracker, get_linear_adapter, load_issue_mapping
 from ...state import Task, TaskStatus
 
 logger = logging.getLogger(__name__)
@@ -141,11 +141,11 @@ def update_task_trackers(
 
     try:
         # Update Linear (if configured and issue exists)
-        linear_adapter = create_linear_adapter(project_dir)
+        linear_adapter = get_linear_adapter(project_dir)
         if linear_adapter.enabled:
             # Load issue mapping to populate cache
             issue_mapping = load_issue_mapping(project_dir)
-            linear_adapter._issue_cache.update(issue_mapping)
-            linear_adapter.update_issue_status(task_id, status)
+            linear_adapter.load_issue_mapping(issue_mapping)
+            linear_adapter.update_issue_status(task_id, status, defer=True)
     except Exception as e:
         logger.warning(f"Failed to update Linear for task {task_id}: {e}")
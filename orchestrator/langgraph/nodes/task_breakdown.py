@@ -29,7 +29,13 @@ from ...utils.task_config import (
     TaskValidationResult,
     validate_task_complexity,
 )
-from ..integrations import create_linear_adapter, create_markdown_tracker, save_issue_mapping
+from ..integrations import (
+    create_markdown_tracker,
+    get_linear_adapter,
+    load_unresolved_tasks,
+    save_issue_mapping,
+    save_unresolved_tasks,
+)
 from ..integrations.board_sync import sync_board
 from ..state import Milestone, Task, TaskStatus, WorkflowState, create_task
 
@@ -164,11 +170,14 @@ async def task_breakdown_node(state: WorkflowState) -> dict[str, Any]:
     run_async(repo.save_output(phase=1, output_type="task_breakdown", content=tasks_output))
 
     # Create Linear issues (if configured)
-    linear_adapter = create_linear_adapter(project_dir)
+    linear_adapter = get_linear_adapter(project_dir)
+    linear_adapter.load_unresolved_tasks(load_unresolved_tasks(project_dir))
     linear_mapping = linear_adapter.create_issues_from_tasks(tasks, state["project_name"])
     if linear_mapping:
         save_issue_mapping(project_dir, linear_mapping)
         logger.info(f"Created {len(linear_mapping)} Linear issues")
+    if linear_adapter.enabled:
+        save_unresolved_tasks(project_dir, linear_adapter.unresolved_tasks)
 
     # Create markdown task files (always, if tracking enabled)
     markdown_tracker = create_markdown_tracker(project_dir)
@@ -13,7 +13,7 @@ from typing import Any, Optional
 
 from orchestrator.utils.uat_generator import create_uat_generator
 
-from ..integrations import create_linear_adapter, create_markdown_tracker, load_issue_mapping
+from ..integrations import create_markdown_tracker, get_linear_adapter, load_issue_mapping
 from ..integrations.board_sync import sync_board
 from ..state import Task, TaskStatus, WorkflowState, get_task_by_id
 
@@ -639,20 +639,20 @@ def _update_task_trackers_on_completion(
 
     try:
         # Update Linear (if configured and issue exists)
-        linear_adapter = create_linear_adapter(project_dir)
+        linear_adapter = get_linear_adapter(project_dir)
         if linear_adapter.enabled:
             # Load issue mapping to populate cache
             issue_mapping = load_issue_mapping(project_dir)
-            linear_adapter._issue_cache.update(issue_mapping)
+            linear_adapter.load_issue_mapping(issue_mapping)
 
             # Update status
-            linear_adapter.update_issue_status(task_id, status)
+            linear_adapter.update_issue_status(task_id, status, defer=True)
 
             # Add completion comment
             if status == TaskStatus.COMPLETED and notes:
-                linear_adapter.add_completion_comment(task_id, notes)
+                linear_adapter.add_completion_comment(task_id, notes, defer=True)
             elif status == TaskStatus.FAILED and notes:
-                linear_adapter.add_blocker_comment(task_id, notes)
+                linear_adapter.add_blocker_comment(task_id, notes, defer=True)
 
     except Exception as e:
         logger.warning(f"Failed to update Linear for task {task_id}: {e}")
@@ -1,14 +1,24 @@
 """SurrealDB Checkpoint Saver for LangGraph.
 
 Provides persistence for LangGraph state using SurrealDB.
+
+Checkpoint listing pages through rows with a ``checkpoint_id`` keyset
+cursor (checkpoint IDs are time-ordered), so ``before`` and ``limit`` are
+applied by the database. Scalar metadata (source, step, ...) is also stored
+as a queryable ``meta`` object so ``filter`` is applied in the query too.
+``alist_summaries`` lists checkpoints without reading or unpickling the
+checkpoint blobs; load a full checkpoint on demand with ``aget_tuple``.
 """
 
 import base64
 import json
 import logging
+import re
 from collections.abc import AsyncIterator, Sequence
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, Optional, cast
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
     BaseCheckpointSaver,
     Checkpoint,
@@ -21,6 +31,122 @@ from orchestrator.db.connection import get_connection
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per query while listing checkpoints
+LIST_PAGE_SIZE = 50
+
+# Metadata keys that can be filtered on in SurrealQL (``meta.<key>``)
+_META_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+_SUMMARY_FIELDS = "checkpoint_id, parent_checkpoint_id, created_at, meta, metadata"
+
+
+def _index_metadata(metadata: Any) -> dict[str, Any]:
+    """Queryable copy of a checkpoint's scalar metadata."""
+    if not isinstance(metadata, dict):
+        return {}
+    return {
+        key: value
+        for key, value in metadata.items()
+        if _META_KEY.match(str(key)) and isinstance(value, _SCALAR_TYPES)
+    }
+
+
+def _checkpoint_meta(checkpoint: Any, metadata: Any) -> dict[str, Any]:
+    """Queryable metadata stored with a checkpoint, plus its workflow phase."""
+    meta = _index_metadata(metadata)
+    channel_values = checkpoint.get("channel_values") if isinstance(checkpoint, dict) else None
+    phase = (channel_values or {}).get("current_phase")
+    if isinstance(phase, int):
+        meta["phase"] = phase
+    return meta
+
+
+def _matches(metadata: dict, filter: Optional[dict]) -> bool:
+    return all(metadata.get(key) == value for key, value in (filter or {}).items())
+
+
+def _checkpoint_config(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> dict:
+    return {
+        "configurable": {
+            "thread_id": thread_id,
+            "checkpoint_id": checkpoint_id,
+            "checkpoint_ns": checkpoint_ns,
+        }
+    }
+
+
+@dataclass
+class CheckpointSummary:
+    """A checkpoint listed without its channel values."""
+
+    config: dict
+    metadata: dict
+    parent_config: Optional[dict] = None
+    created_at: Any = None
+
+    @property
+    def checkpoint_id(self) -> str:
+        return cast(str, self.config["configurable"]["checkpoint_id"])
+
+    @property
+    def parent_checkpoint_id(self) -> Optional[str]:
+        return self.parent_config["configurable"]["checkpoint_id"] if self.parent_config else None
+
+    @property
+    def step(self) -> Optional[int]:
+        return self.metadata.get("step")
+
+    @property
+    def source(self) -> Optional[str]:
+        return self.metadata.get("source")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-friendly dictionary."""
+        return {
+            "checkpoint_id": self.checkpoint_id,
+            "parent_checkpoint_id": self.parent_checkpoint_id,
+            "created_at": str(self.created_at) if self.created_at is not None else None,
+            "step": self.step,
+            "source": self.source,
+            "metadata": _index_metadata(self.metadata),
+            "config": self.config,
+        }
+
+
+async def alist_checkpoint_summaries(
+    checkpointer: BaseCheckpointSaver,
+    config: dict,
+    *,
+    filter: Optional[dict] = None,
+    before: Optional[dict] = None,
+    limit: Optional[int] = None,
+) -> AsyncIterator[CheckpointSummary]:
+    """List checkpoint summaries from any checkpointer, newest first.
+
+    Uses ``alist_summaries`` when the checkpointer has it (SurrealDBSaver);
+    other checkpointers (e.g. in-memory) are listed with ``alist``.
+    """
+    if isinstance(checkpointer, SurrealDBSaver):
+        async for summary in checkpointer.alist_summaries(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield summary
+        return
+
+    async for item in checkpointer.alist(
+        cast(RunnableConfig, config),
+        filter=filter,
+        before=cast(Optional[RunnableConfig], before),
+        limit=limit,
+    ):
+        yield CheckpointSummary(
+            config=dict(item.config),
+            metadata=dict(item.metadata or {}),
+            parent_config=dict(item.parent_config) if item.parent_config else None,
+            created_at=item.checkpoint.get("ts"),
+        )
+
 
 class SurrealDBSaver(BaseCheckpointSaver):
     """A checkpoint saver that stores state in SurrealDB."""
@@ -136,6 +262,62 @@ class SurrealDBSaver(BaseCheckpointSaver):
                 pending_writes=pending_writes,
             )
 
+    async def _iter_rows(
+        self,
+        config: dict,
+        fields: str,
+        filter: Optional[dict],
+        before: Optional[dict],
+        limit: Optional[int],
+    ) -> AsyncIterator[dict]:
+        """Yield checkpoint rows newest first, one keyset page at a time.
+
+        Scalar filters on identifier keys are pushed into the query. Rows
+        written before ``meta`` existed pass the query and are filtered by
+        the caller after deserializing their metadata.
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        cursor = (before or {}).get("configurable", {}).get("checkpoint_id")
+        page_size = min(limit, LIST_PAGE_SIZE) if limit else LIST_PAGE_SIZE
+
+        conditions = ["thread_id = $thread_id", "checkpoint_ns = $checkpoint_ns"]
+        params: dict[str, Any] = {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "limit": page_size,
+        }
+        for i, (key, value) in enumerate((filter or {}).items()):
+            if _META_KEY.match(str(key)) and isinstance(value, _SCALAR_TYPES):
+                conditions.append(f"(meta = NONE OR meta.{key} = $filter_{i})")
+                params[f"filter_{i}"] = value
+
+        async with get_connection(self.project_name) as conn:
+            while True:
+                page_conditions = conditions
+                if cursor:
+                    page_conditions = [*conditions, "checkpoint_id < $before"]
+                    params["before"] = cursor
+                query = f"""
+                SELECT {fields} FROM graph_checkpoints
+                WHERE {" AND ".join(page_conditions)}
+                ORDER BY checkpoint_id DESC LIMIT $limit
+                """
+                rows = await conn.query(query, params)
+                for row in rows:
+                    yield row
+                if len(rows) < page_size:
+                    return
+                cursor = rows[-1]["checkpoint_id"]
+
+    def _row_metadata(self, row: dict) -> dict:
+        """Row metadata, preferring the queryable copy over the pickled blob."""
+        meta: Optional[dict] = row.get("meta")
+        if meta is not None:
+            return meta
+        metadata: dict = self._deserialize_blob(row["metadata"], "metadata")
+        return metadata
+
     async def alist(
         self,
         config: dict,
@@ -144,53 +326,79 @@ class SurrealDBSaver(BaseCheckpointSaver):
         before: Optional[dict] = None,
         limit: Optional[int] = None,
     ) -> AsyncIterator[CheckpointTuple]:
-        """List checkpoints."""
+        """List checkpoints, newest first.
+
+        Args:
+            config: Config with the thread ID (and optional checkpoint namespace)
+            filter: Metadata key/values checkpoints must match
+            before: Only list checkpoints older than this checkpoint config
+            limit: Maximum number of checkpoints (all if None)
+        """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
 
-        limit = limit or 10
+        count = 0
+        async for row in self._iter_rows(config, "*", filter, before, limit):
+            try:
+                checkpoint = self._deserialize_blob(row["checkpoint"], "checkpoint")
+                metadata = self._deserialize_blob(row["metadata"], "metadata")
+            except ValueError as e:
+                logger.error(f"Skipping corrupted checkpoint in list: {e}")
+                continue
+            if not _matches(metadata, filter):
+                continue
+            parent_id = row.get("parent_checkpoint_id")
 
-        query = """
-        SELECT * FROM graph_checkpoints
-        WHERE thread_id = $thread_id
-        AND checkpoint_ns = $checkpoint_ns
-        """
-        params = {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "limit": limit}
+            yield CheckpointTuple(
+                config=_checkpoint_config(thread_id, checkpoint_ns, row["checkpoint_id"]),
+                checkpoint=checkpoint,
+                metadata=metadata,
+                parent_config=_checkpoint_config(thread_id, checkpoint_ns, parent_id)
+                if parent_id
+                else None,
+            )
+            count += 1
+            if limit is not None and count >= limit:
+                return
 
-        query += " ORDER BY created_at DESC LIMIT $limit"
+    async def alist_summaries(
+        self,
+        config: dict,
+        *,
+        filter: Optional[dict] = None,
+        before: Optional[dict] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointSummary]:
+        """List checkpoint IDs, parents, timestamps and metadata, newest first.
 
-        async with get_connection(self.project_name) as conn:
-            results = await conn.query(query, params)
+        Checkpoint blobs are neither fetched nor deserialized. Arguments are
+        the same as for ``alist``.
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
 
-            for row in results:
-                try:
-                    checkpoint = self._deserialize_blob(row["checkpoint"], "checkpoint")
-                    metadata = self._deserialize_blob(row["metadata"], "metadata")
-                except ValueError as e:
-                    logger.error(f"Skipping corrupted checkpoint in list: {e}")
-                    continue
-                parent_id = row.get("parent_checkpoint_id")
-
-                yield CheckpointTuple(
-                    config={
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_id": row["checkpoint_id"],
-                            "checkpoint_ns": checkpoint_ns,
-                        }
-                    },
-                    checkpoint=checkpoint,
-                    metadata=metadata,
-                    parent_config={
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_id": parent_id,
-                            "checkpoint_ns": checkpoint_ns,
-                        }
-                    }
-                    if parent_id
-                    else None,
-                )
+        count = 0
+        async for row in self._iter_rows(config, _SUMMARY_FIELDS, filter, before, limit):
+            try:
+                metadata = self._row_metadata(row)
+            except ValueError as e:
+                logger.error(f"Skipping corrupted checkpoint in list: {e}")
+                continue
+            if not _matches(metadata, filter):
+                continue
+            parent_id = row.get("parent_checkpoint_id")
+
+            yield CheckpointSummary(
+                config=_checkpoint_config(thread_id, checkpoint_ns, row["checkpoint_id"]),
+                metadata=metadata,
+                parent_config=_checkpoint_config(thread_id, checkpoint_ns, parent_id)
+                if parent_id
+                else None,
+                created_at=row.get("created_at"),
+            )
+            count += 1
+            if limit is not None and count >= limit:
+                return
 
     async def aput(
         self,
@@ -241,6 +449,7 @@ class SurrealDBSaver(BaseCheckpointSaver):
                         "parent_checkpoint_id": parent_id,
                         "checkpoint": checkpoint_blob,
                         "metadata": metadata_blob,
+                        "meta": _checkpoint_meta(checkpoint, metadata),
                     },
                 )
                 logger.info(
@@ -11,11 +11,16 @@ import logging
 from pathlib import Path
 from typing import Any, Optional
 
+from ...config.context_cache import get_active_context_cache
+
 logger = logging.getLogger(__name__)
 
 # Path where auto-generated context summary is saved
 CONTEXT_SUMMARY_FILENAME = "context_summary.md"
 
+# Discovery results persisted by the documentation_discovery node
+DISCOVERY_CACHE_PATH = Path(".workflow") / "phases" / "0" / "discovered_context.json"
+
 
 def load_documentation_context(
     project_dir: Path,
@@ -30,6 +35,9 @@ def load_documentation_context(
     1. File cache (.workflow/phases/0/discovered_context.json)
     2. Direct discovery (runs DocumentationScanner on docs/ folder)
 
+    Inside a workflow run the result is served from the run's context cache
+    until the discovery cache or a file under docs/ changes.
+
     Args:
         project_dir: Path to project directory
         project_name: Project name (for logging)
@@ -44,6 +52,23 @@ def load_documentation_context(
         - architecture_summary: Architecture summary if found
     """
     project_dir = Path(project_dir)
+    cache = get_active_context_cache()
+    if cache is None:
+        return _read_documentation_context(project_dir, project_name)
+
+    from ...validators.documentation_discovery import DocumentationScanner
+
+    return cache.get(
+        "documentation_context",
+        project_dir,
+        lambda: _read_documentation_context(project_dir, project_name),
+        files=[project_dir / DISCOVERY_CACHE_PATH],
+        trees=[project_dir / name for name in DocumentationScanner.DISCOVERY_PATHS],
+    )
+
+
+def _read_documentation_context(project_dir: Path, project_name: str) -> dict[str, Any]:
+    """Load documentation context from disk (see load_documentation_context)."""
     result: dict[str, Any] = {
         "content": "",
         "documents": [],
@@ -54,7 +79,7 @@ def load_documentation_context(
     }
 
     # Try 1: Load from discovery cache file
-    discovery_file = project_dir / ".workflow" / "phases" / "0" / "discovered_context.json"
+    discovery_file = project_dir / DISCOVERY_CACHE_PATH
     if discovery_file.exists():
         try:
             context = json.loads(discovery_file.read_text())
@@ -0,0 +1,222 @@
+"""Lightweight progress streaming for workflow runs.
+
+``graph.astream_events(version="v2")`` emits start/end events for every
+nested runnable (nodes, routers, channel writers, ...) and each
+``on_chain_start`` carries the full input state. Progress callbacks only need
+to know which node started, what it changed and when the phase moved.
+
+``stream_progress`` runs the graph with LangGraph's task stream instead:
+
+- One start and one result record per node (including subgraph nodes).
+- ``on_node_start`` receives a small summary (phase, current task,
+  iteration) maintained from deltas, not the node's input state.
+- ``on_node_end`` receives the delta the node wrote.
+- Phase transitions are derived from deltas by ``PhaseTracker``.
+- The run's final state is the last top-level ``values`` chunk, so no
+  checkpoint read is needed at the end.
+- Top-level deltas are also pushed to the project's ``StateProjector``,
+  which keeps state.json current without re-reading checkpoints.
+
+Set ``ORCHESTRATOR_PROGRESS_STREAM=events`` to use the original
+``astream_events`` path.
+"""
+
+import logging
+import os
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from ...ui.callbacks import ProgressCallback
+    from ...utils.state_projector import StateProjector
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_STREAM_ENV = "ORCHESTRATOR_PROGRESS_STREAM"
+STREAM_UPDATES = "updates"
+STREAM_EVENTS = "events"
+
+# State keys kept up to date from deltas and passed to on_node_start
+SUMMARY_KEYS = ("current_phase", "current_task_id", "iteration_count")
+
+
+def get_progress_stream_mode() -> str:
+    """Progress streaming mode: "updates" (default) or "events" (legacy)."""
+    mode = os.environ.get(PROGRESS_STREAM_ENV, STREAM_UPDATES).lower()
+    if mode not in (STREAM_UPDATES, STREAM_EVENTS):
+        logger.warning(f"Unknown {PROGRESS_STREAM_ENV}={mode!r}, using {STREAM_UPDATES}")
+        return STREAM_UPDATES
+    return mode
+
+
+def _phase_status_value(phase_state: Any) -> Optional[str]:
+    """Status string of a phase entry (dict or PhaseState dataclass)."""
+    if hasattr(phase_state, "to_dict"):
+        phase_state = phase_state.to_dict()
+    if isinstance(phase_state, dict):
+        status = phase_state.get("status")
+    else:
+        status = getattr(phase_state, "status", None)
+    return getattr(status, "value", status)
+
+
+class PhaseTracker:
+    """Derives phase start/end/change callbacks from node deltas.
+
+    ``phase_status`` has no reducer, so the latest delta that wrote it holds
+    the full mapping; the tracker keeps that reference to judge whether the
+    phase being left failed.
+    """
+
+    def __init__(self, callback: "ProgressCallback", state: Optional[dict] = None):
+        """Initialize the tracker.
+
+        Args:
+            callback: Progress callback to notify
+            state: State the run starts from (initial or checkpointed)
+        """
+        state = state or {}
+        self.callback = callback
+        self.phase: Optional[int] = state.get("current_phase")
+        self.phase_status: dict = state.get("phase_status") or {}
+
+    def start(self) -> None:
+        """Announce the phase the run starts in."""
+        if self.phase is not None and hasattr(self.callback, "on_phase_start"):
+            try:
+                self.callback.on_phase_start(phase=self.phase)
+            except Exception as e:
+                logger.warning(f"Callback error on_phase_start (initial): {e}")
+
+    def observe(self, node_name: str, delta: dict) -> None:
+        """Process a node's delta, emitting callbacks if the phase changed."""
+        if "phase_status" in delta and isinstance(delta["phase_status"], dict):
+            self.phase_status = delta["phase_status"]
+
+        current_phase = delta.get("current_phase")
+        if current_phase is None or current_phase == self.phase:
+            return
+
+        previous_phase = self.phase
+        self.phase = current_phase
+        try:
+            if previous_phase is not None and hasattr(self.callback, "on_phase_end"):
+                status = _phase_status_value(self.phase_status.get(str(previous_phase), {}))
+                self.callback.on_phase_end(
+                    phase=previous_phase,
+                    success=status != "failed",
+                    node_name=node_name,
+                )
+            if hasattr(self.callback, "on_phase_change"):
+                self.callback.on_phase_change(
+                    from_phase=previous_phase or 0,
+                    to_phase=current_phase,
+                    status="in_progress",
+                )
+            if hasattr(self.callback, "on_phase_start"):
+                self.callback.on_phase_start(phase=current_phase, node_name=node_name)
+        except Exception as e:
+            logger.warning(f"Callback error on phase change: {e}")
+
+
+async def stream_progress(
+    graph: Any,
+    graph_input: Any,
+    run_config: dict,
+    callback: Optional["ProgressCallback"],
+    state: Optional[dict] = None,
+    projector: Optional["StateProjector"] = None,
+) -> dict[str, Any]:
+    """Run a graph, forwarding node starts, deltas and phase changes.
+
+    Args:
+        graph: Compiled workflow graph
+        graph_input: Initial state, None to continue, or a resume Command
+        run_config: LangGraph run configuration
+        callback: Progress callback handler (None to only project state)
+        state: State the run starts from, for the summary and phase tracking
+            (defaults to ``graph_input`` when that is a dict)
+        projector: State projector fed with top-level node deltas
+
+    Returns:
+        Final workflow state
+    """
+    if state is None and isinstance(graph_input, dict):
+        state = graph_input
+    state = state or {}
+
+    if projector is not None and state:
+        projector.apply_state(state)
+    tracker = PhaseTracker(callback, state) if callback is not None else None
+    if tracker is not None and isinstance(graph_input, dict):
+        # Only fresh runs announce their starting phase
+        tracker.start()
+    summary = {key: state[key] for key in SUMMARY_KEYS if key in state}
+    final_values: Optional[dict] = None
+
+    try:
+        async for namespace, mode, chunk in graph.astream(
+            graph_input,
+            config=run_config,
+            stream_mode=["tasks", "values"],
+            subgraphs=True,
+        ):
+            if mode == "values":
+                if not namespace and isinstance(chunk, dict):
+                    final_values = chunk
+                continue
+
+            node_name = chunk.get("name", "")
+            if not node_name or node_name.startswith("__"):
+                continue
+
+            if "input" in chunk:
+                if callback is None:
+                    continue
+                try:
+                    callback.on_node_start(node_name, dict(summary))
+                except Exception as e:
+                    logger.warning(f"Callback error on_node_start: {e}")
+                continue
+
+            # Failed or interrupted nodes have no completed delta
+            if chunk.get("error") is not None or chunk.get("interrupts"):
+                continue
+            delta = chunk.get("result")
+            if not isinstance(delta, dict):
+                delta = {}
+
+            # Subgraph deltas apply to subgraph state; the parent gets the
+            # subgraph node's own result
+            if projector is not None and not namespace:
+                try:
+                    projector.apply_update(delta)
+                except Exception as e:
+                    logger.warning(f"State projection failed for {node_name}: {e}")
+            if callback is None:
+                continue
+
+            for key in SUMMARY_KEYS:
+                if key in delta:
+                    summary[key] = delta[key]
+            try:
+                callback.on_node_end(node_name, delta)
+            except Exception as e:
+                logger.warning(f"Callback error on_node_end: {e}")
+            if tracker is not None:
+                tracker.observe(node_name, delta)
+    finally:
+        if projector is not None:
+            # Readers go back to the checkpoint once the run stops feeding deltas
+            projector.end_run()
+
+    if final_values is not None:
+        return dict(final_values)
+
+    # Nothing ran (e.g. resuming a finished run); fall back to the checkpoint
+    try:
+        snapshot = await graph.aget_state({"configurable": run_config.get("configurable", {})})
+        if snapshot and snapshot.values:
+            return dict(snapshot.values)
+    except Exception as e:
+        logger.warning(f"Could not retrieve final state from checkpoint: {e}")
+    return dict(state)
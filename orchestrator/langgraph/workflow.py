@@ -16,7 +16,14 @@ from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Command, RetryPolicy, Send
 
+from ..config.context_cache import (
+    ProjectContextCache,
+    activate_context_cache,
+    deactivate_context_cache,
+)
 from ..config.thresholds import ProjectConfig, RetryConfig
+from ..utils.state_projector import get_state_projector
+from .checkpoint_compactor import schedule_compaction
 from .nodes import (  # New risk mitigation nodes; Quality infrastructure nodes; Discussion and Research nodes (GSD pattern); Handoff node (GSD pattern); Error dispatch node; Pause check node; Test pass gate node
     approval_gate_node,
     build_verification_node,
@@ -70,7 +77,8 @@ from .routers import (  # New risk mitigation routers; Quality infrastructure ro
 )
 from .state import WorkflowState, create_initial_state
 from .subgraphs import create_fixer_subgraph, create_task_subgraph
-from .surrealdb_saver import SurrealDBSaver
+from .surrealdb_saver import SurrealDBSaver, alist_checkpoint_summaries
+from .utils.progress_stream import STREAM_EVENTS, get_progress_stream_mode, stream_progress
 
 logger = logging.getLogger(__name__)
 
@@ -616,9 +624,16 @@ class WorkflowRunner:
         self.checkpointer: Any = None
         self.project_config: Optional[ProjectConfig] = None
 
+        # Project config and documentation context shared by nodes for this run
+        self.context_cache = ProjectContextCache()
+        self._context_cache_token: Any = None
+
         # Thread/run configuration
         self.thread_id = f"workflow-{self.project_name}"
 
+        # Keeps .workflow/state.json current from node deltas
+        self.state_projector = get_state_projector(self.project_dir)
+
     async def __aenter__(self) -> "WorkflowRunner":
         """Enter async context, creating checkpointer and graph."""
         if self.checkpointer_type == "memory":
@@ -633,6 +648,10 @@ class WorkflowRunner:
             self.checkpointer = SurrealDBSaver(self.project_name)
             logger.info(f"Using SurrealDBSaver for project: {self.project_name}")
 
+        # Nodes created from this context read project config and docs
+        # through the run-scoped cache
+        self._context_cache_token = activate_context_cache(self.context_cache)
+
         # Load project config for retry settings and task loop limits
         self.project_config = self._load_project_config()
         retry_config = self.project_config.retry if self.project_config else None
@@ -663,8 +682,19 @@ class WorkflowRunner:
             logger.warning(f"Failed to load project config: {e}")
             return None
 
+    def reload_project_context(self) -> None:
+        """Drop cached project config and documentation context.
+
+        Changes on disk are picked up automatically; this forces a re-read
+        for edits that keep file size and mtime unchanged.
+        """
+        self.context_cache.reload()
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit async context."""
+        if self._context_cache_token is not None:
+            deactivate_context_cache(self._context_cache_token)
+            self._context_cache_token = None
         self.checkpointer = None
         self.graph = None
         return False
@@ -747,11 +777,41 @@ class WorkflowRunner:
                 self.graph, initial_state, run_config, progress_callback
             )
         else:
-            result = await self.graph.ainvoke(initial_state, config=run_config)
+            result = await stream_progress(
+                self.graph, initial_state, run_config, None, projector=self.state_projector
+            )
+        self._project_final_state(result)
+        await self._compact_checkpoints()
 
         logger.info(f"Workflow completed for project: {self.project_name}")
         return result
 
+    def _project_final_state(self, result: Optional[dict]) -> None:
+        """Sync state.json with the state a run ended in."""
+        if not result:
+            return
+        try:
+            # The run is over, so this is the checkpointed state, not a live view
+            self.state_projector.apply_state(result, live=False)
+            self.state_projector.flush()
+        except Exception as e:
+            logger.warning(f"Failed to project final state: {e}")
+
+    async def _compact_checkpoints(self) -> None:
+        """Prune old checkpoints of this thread if a pass is due.
+
+        The pass is awaited (it is bounded by the retention policy's budget)
+        because callers like ``asyncio.run`` cancel pending tasks on return.
+        """
+        if not isinstance(self.checkpointer, SurrealDBSaver):
+            return
+        try:
+            task = schedule_compaction(self.project_name, self.thread_id)
+            if task is not None:
+                await task
+        except Exception as e:
+            logger.warning(f"Checkpoint compaction failed: {e}")
+
     async def _ensure_prompt_versions(self) -> None:
         """Ensure initial prompt versions exist in database.
 
@@ -795,17 +855,29 @@ class WorkflowRunner:
         run_config: dict,
         callback: "ProgressCallback",
     ) -> dict[str, Any]:
-        """Run workflow with progress callbacks using event streaming.
+        """Run workflow with progress callbacks.
+
+        Streams node updates by default (see ``utils.progress_stream``);
+        ``ORCHESTRATOR_PROGRESS_STREAM=events`` uses ``astream_events``.
 
         Args:
             graph: Compiled workflow graph
-            initial_state: Initial workflow state
+            initial_state: Initial workflow state (None to continue from checkpoint)
             run_config: LangGraph run configuration
             callback: Progress callback handler
 
         Returns:
             Final workflow state
         """
+        if get_progress_stream_mode() != STREAM_EVENTS:
+            state = initial_state
+            if state is None:
+                snapshot = await graph.aget_state(run_config)
+                state = dict(snapshot.values) if snapshot and snapshot.values else {}
+            return await stream_progress(
+                graph, initial_state, run_config, callback, state, projector=self.state_projector
+            )
+
         result = None
         final_graph_output = None  # Full accumulated state from LangGraph completion
         previous_phase: int | None = initial_state.get("current_phase") if initial_state else None
@@ -1023,7 +1095,14 @@ class WorkflowRunner:
                         command, run_config, progress_callback
                     )
                 else:
-                    result = await self.graph.ainvoke(command, config=run_config)
+                    result = await stream_progress(
+                        self.graph,
+                        command,
+                        run_config,
+                        None,
+                        dict(state_snapshot.values),
+                        projector=self.state_projector,
+                    )
             else:
                 # Workflow has pending tasks but no interrupts - just continue execution
                 logger.info(f"Continuing workflow from: {state_snapshot.next}")
@@ -1032,12 +1111,21 @@ class WorkflowRunner:
                         self.graph, None, run_config, progress_callback
                     )
                 else:
-                    result = await self.graph.ainvoke(None, config=run_config)
+                    result = await stream_progress(
+                        self.graph,
+                        None,
+                        run_config,
+                        None,
+                        dict(state_snapshot.values),
+                        projector=self.state_projector,
+                    )
         else:
             # No pending work, workflow already complete
             logger.info("Workflow already complete, nothing to resume")
             result = state_snapshot.values
 
+        self._project_final_state(result)
+        await self._compact_checkpoints()
         return result
 
     async def _resume_with_callbacks(
@@ -1046,7 +1134,7 @@ class WorkflowRunner:
         run_config: dict,
         callback: "ProgressCallback",
     ) -> dict[str, Any]:
-        """Resume workflow with progress callbacks using event streaming.
+        """Resume workflow with progress callbacks (see ``_run_with_callbacks``).
 
         Args:
             command: LangGraph Command for resuming
@@ -1059,10 +1147,16 @@ class WorkflowRunner:
         if self.graph is None:
             raise RuntimeError("WorkflowRunner must be used as async context manager")
 
-        result = None
-
         # Get current state to track phase changes
         state_snapshot = await self.graph.aget_state(run_config)
+
+        if get_progress_stream_mode() != STREAM_EVENTS:
+            state = dict(state_snapshot.values) if state_snapshot and state_snapshot.values else {}
+            return await stream_progress(
+                self.graph, command, run_config, callback, state, projector=self.state_projector
+            )
+
+        result = None
         previous_phase: int | None = None
         if state_snapshot and state_snapshot.values:
             previous_phase = state_snapshot.values.get("current_phase")
@@ -1169,14 +1263,28 @@ class WorkflowRunner:
     # Maximum checkpoints to return in history
     MAX_HISTORY_CHECKPOINTS = 50
 
-    async def get_history(self, limit: Optional[int] = None) -> list[dict]:
-        """Get the workflow execution history with pagination.
+    async def get_history(
+        self,
+        limit: Optional[int] = None,
+        before: Optional[str] = None,
+        filter: Optional[dict] = None,
+        include_values: bool = False,
+    ) -> list[dict]:
+        """Get the workflow checkpoint history, newest first, one page at a time.
+
+        Entries carry checkpoint IDs, parents, timestamps and step metadata;
+        state values are only loaded with ``include_values`` (or per
+        checkpoint with ``get_checkpoint_state``).
 
         Args:
             limit: Maximum checkpoints to return (default 50)
+            before: Cursor - only return checkpoints older than this checkpoint ID
+            filter: Metadata key/values to match (e.g. ``{"source": "loop"}``)
+            include_values: Also load each checkpoint's state values and next nodes
 
         Returns:
-            List of state snapshots (limited to prevent memory issues)
+            List of checkpoint entries (pass the last ``checkpoint_id`` as
+            ``before`` to get the next page)
         """
         if self.graph is None:
             raise RuntimeError("WorkflowRunner must be used as async context manager")
@@ -1187,22 +1295,47 @@ class WorkflowRunner:
                 "thread_id": self.thread_id,
             },
         }
+        before_config = (
+            {"configurable": {"thread_id": self.thread_id, "checkpoint_id": before}}
+            if before
+            else None
+        )
 
         history = []
-        async for snapshot in self.graph.aget_state_history(run_config):
-            history.append(
-                {
-                    "values": snapshot.values,
-                    "next": snapshot.next,
-                    "config": snapshot.config,
-                }
-            )
-            # Stop collecting after limit to prevent unbounded memory
-            if len(history) >= effective_limit:
-                break
+        async for summary in alist_checkpoint_summaries(
+            self.checkpointer,
+            run_config,
+            filter=filter,
+            before=before_config,
+            limit=effective_limit,
+        ):
+            entry = summary.to_dict()
+            if include_values:
+                snapshot = await self.graph.aget_state(summary.config)
+                entry["values"] = snapshot.values
+                entry["next"] = snapshot.next
+            history.append(entry)
 
         return history
 
+    async def get_checkpoint_state(self, checkpoint_id: str) -> Optional[dict]:
+        """Load the state values of one checkpoint from the history.
+
+        Args:
+            checkpoint_id: Checkpoint ID from ``get_history``
+
+        Returns:
+            State values, or None if the checkpoint doesn't exist
+        """
+        if self.graph is None:
+            raise RuntimeError("WorkflowRunner must be used as async context manager")
+
+        config = {"configurable": {"thread_id": self.thread_id, "checkpoint_id": checkpoint_id}}
+        if await self.checkpointer.aget_tuple(config) is None:
+            return None
+        snapshot = await self.graph.aget_state(config)
+        return snapshot.values
+
     async def get_pending_interrupt_async(self) -> Optional[dict]:
         """Check if workflow is paused for human input (async version).
 
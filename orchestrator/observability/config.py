@@ -67,6 +67,9 @@ class WebhooksConfig:
     timeout_seconds: int = 30
     retry_attempts: int = 3
     retry_delay_seconds: float = 1.0
+    max_retry_delay_seconds: float = 30.0
+    queue_size: int = 1000
+    batch_size: int = 1
     endpoints: list[str] = field(default_factory=list)
 
     @classmethod
@@ -81,6 +84,11 @@ class WebhooksConfig:
             timeout_seconds=int(os.environ.get("OBSERVABILITY_WEBHOOK_TIMEOUT", "30")),
             retry_attempts=int(os.environ.get("OBSERVABILITY_WEBHOOK_RETRIES", "3")),
             retry_delay_seconds=float(os.environ.get("OBSERVABILITY_WEBHOOK_RETRY_DELAY", "1.0")),
+            max_retry_delay_seconds=float(
+                os.environ.get("OBSERVABILITY_WEBHOOK_MAX_RETRY_DELAY", "30.0")
+            ),
+            queue_size=int(os.environ.get("OBSERVABILITY_WEBHOOK_QUEUE_SIZE", "1000")),
+            batch_size=int(os.environ.get("OBSERVABILITY_WEBHOOK_BATCH_SIZE", "1")),
             endpoints=endpoints,
         )
 
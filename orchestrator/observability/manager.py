@@ -3,7 +3,6 @@
 Provides a unified interface for all observability features.
 """
 
-import asyncio
 import logging
 import time
 from collections.abc import Generator
@@ -96,12 +95,10 @@ class ObservabilityManager:
             self.metrics.set_active_workflows(1)  # Simplified for now
 
         if self.webhooks:
-            asyncio.create_task(
-                self.webhooks.dispatch(
-                    WebhookEventType.WORKFLOW_STARTED,
-                    project,
-                    workflow_id,
-                )
+            self.webhooks.enqueue(
+                WebhookEventType.WORKFLOW_STARTED,
+                project,
+                workflow_id,
             )
 
     def record_workflow_completed(
@@ -122,13 +119,11 @@ class ObservabilityManager:
             self.metrics.set_active_workflows(0)
 
         if self.webhooks:
-            asyncio.create_task(
-                self.webhooks.dispatch(
-                    WebhookEventType.WORKFLOW_COMPLETED,
-                    project,
-                    workflow_id,
-                    {"duration_seconds": duration_seconds},
-                )
+            self.webhooks.enqueue(
+                WebhookEventType.WORKFLOW_COMPLETED,
+                project,
+                workflow_id,
+                {"duration_seconds": duration_seconds},
             )
 
     def record_workflow_failed(
@@ -150,13 +145,11 @@ class ObservabilityManager:
             self.metrics.set_active_workflows(0)
 
         if self.webhooks:
-            asyncio.create_task(
-                self.webhooks.dispatch(
-                    WebhookEventType.WORKFLOW_FAILED,
-                    project,
-                    workflow_id,
-                    {"error": error},
-                )
+            self.webhooks.enqueue(
+                WebhookEventType.WORKFLOW_FAILED,
+                project,
+                workflow_id,
+                {"error": error},
             )
 
     # Phase Events
@@ -189,13 +182,11 @@ class ObservabilityManager:
 
         # Send phase started webhook
         if self.webhooks:
-            asyncio.create_task(
-                self.webhooks.dispatch(
-                    WebhookEventType.PHASE_STARTED,
-                    project,
-                    workflow_id,
-                    {"phase": phase},
-                )
+            self.webhooks.enqueue(
+                WebhookEventType.PHASE_STARTED,
+                project,
+                workflow_id,
+                {"phase": phase},
             )
 
         try:
@@ -218,17 +209,15 @@ class ObservabilityManager:
 
             # Send phase completed webhook
             if self.webhooks:
-                asyncio.create_task(
-                    self.webhooks.dispatch(
-                        WebhookEventType.PHASE_COMPLETED,
-                        project,
-                        workflow_id,
-                        {
-                            "phase": phase,
-                            "status": status,
-                            "duration_seconds": duration,
-                        },
-                    )
+                self.webhooks.enqueue(
+                    WebhookEventType.PHASE_COMPLETED,
+                    project,
+                    workflow_id,
+                    {
+                        "phase": phase,
+                        "status": status,
+                        "duration_seconds": duration,
+                    },
                 )
 
     # Agent Events
@@ -283,13 +272,11 @@ class ObservabilityManager:
             self.metrics.set_active_tasks(project, 1)
 
         if self.webhooks:
-            asyncio.create_task(
-                self.webhooks.dispatch(
-                    WebhookEventType.TASK_STARTED,
-                    project,
-                    workflow_id,
-                    {"task_id": task_id},
-                )
+            self.webhooks.enqueue(
+                WebhookEventType.TASK_STARTED,
+                project,
+                workflow_id,
+                {"task_id": task_id},
             )
 
     def record_task_completed(
@@ -311,16 +298,14 @@ class ObservabilityManager:
             self.metrics.set_active_tasks(project, 0)
 
         if self.webhooks:
-            asyncio.create_task(
-                self.webhooks.dispatch(
-                    WebhookEventType.TASK_COMPLETED,
-                    project,
-                    workflow_id,
-                    {
-                        "task_id": task_id,
-                        "duration_seconds": duration_seconds,
-                    },
-                )
+            self.webhooks.enqueue(
+                WebhookEventType.TASK_COMPLETED,
+                project,
+                workflow_id,
+                {
+                    "task_id": task_id,
+                    "duration_seconds": duration_seconds,
+                },
             )
 
     def record_task_failed(
@@ -343,16 +328,14 @@ class ObservabilityManager:
             self.metrics.set_active_tasks(project, 0)
 
         if self.webhooks:
-            asyncio.create_task(
-                self.webhooks.dispatch(
-                    WebhookEventType.TASK_FAILED,
-                    project,
-                    workflow_id,
-                    {
-                        "task_id": task_id,
-                        "error": error,
-                    },
-                )
+            self.webhooks.enqueue(
+                WebhookEventType.TASK_FAILED,
+                project,
+                workflow_id,
+                {
+                    "task_id": task_id,
+                    "error": error,
+                },
             )
 
     # Escalation Events
@@ -380,13 +363,11 @@ class ObservabilityManager:
             if context:
                 data["context"] = context
 
-            asyncio.create_task(
-                self.webhooks.dispatch(
-                    WebhookEventType.ESCALATION_REQUIRED,
-                    project,
-                    workflow_id,
-                    data,
-                )
+            self.webhooks.enqueue(
+                WebhookEventType.ESCALATION_REQUIRED,
+                project,
+                workflow_id,
+                data,
             )
 
 
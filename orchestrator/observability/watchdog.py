@@ -1,21 +1,159 @@
+"""Runtime watchdog that tails error logs and triggers self-healing.
+
+Watches ``.workflow/errors/*.jsonl`` and hands new errors to the FixerAgent:
+
+- Wakes on inotify write events (Linux); other platforms fall back to
+  polling every ``poll_interval`` seconds.
+- Reads only the bytes appended since the last offset, in bounded chunks,
+  and never consumes a partial trailing line.
+- Persists per-file offsets (with inode) so restarts resume where they
+  stopped instead of reprocessing old errors.
+- Coalesces errors arriving in the same wake-up and dispatches each group
+  of related errors to the fixer once.
+"""
+
 import asyncio
+import ctypes
+import ctypes.util
+import hashlib
 import json
+import os
+import struct
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Optional
 
 from orchestrator.fixer.agent import FixerAgent
 from orchestrator.fixer.triage import FixerError
 from orchestrator.utils.logging import LogLevel, OrchestrationLogger
 
+# Read at most this many bytes per file per step
+READ_CHUNK_SIZE = 64 * 1024
+
+# Bound on chunks read per file per check; the rest is read on the next check
+MAX_CHUNKS_PER_CHECK = 16
+
+# Wait this long after a wake-up so bursts land in one batch
+BATCH_WINDOW_SECONDS = 0.05
+
+OFFSETS_FILE = "watchdog_offsets.json"
+
+# inotify constants (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class InotifyWaiter:
+    """Wakes an asyncio loop when files in a directory are written.
+
+    Uses libc inotify through ctypes; ``create`` returns None when inotify
+    is unavailable so callers can fall back to polling.
+    """
+
+    def __init__(self, fd: int):
+        self._fd = fd
+        self._event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def create(cls, directory: Path) -> Optional["InotifyWaiter"]:
+        """Create a waiter for a directory, or None if unsupported."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd < 0:
+                return None
+            mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+            if libc.inotify_add_watch(fd, str(directory).encode(), mask) < 0:
+                os.close(fd)
+                return None
+        except (OSError, AttributeError):
+            return None
+        return cls(fd)
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Register the inotify descriptor with the event loop."""
+        self._loop = loop
+        loop.add_reader(self._fd, self._on_readable)
+
+    def _on_readable(self) -> None:
+        # Drain the event buffer; which file changed is rediscovered by stat
+        try:
+            while os.read(self._fd, 64 * _INOTIFY_EVENT.size):
+                pass
+        except BlockingIOError:
+            pass
+        except OSError:
+            pass
+        self._event.set()
+
+    async def wait(self, timeout: Optional[float]) -> bool:
+        """Wait for a write event.
+
+        Returns:
+            True if woken by an event, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._event.clear()
+
+    def close(self) -> None:
+        """Unregister and close the descriptor."""
+        if self._loop is not None:
+            self._loop.remove_reader(self._fd)
+            self._loop = None
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+
+
+@dataclass
+class ErrorBatch:
+    """Related errors coalesced into a single fixer dispatch."""
+
+    key: str
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    sources: set[str] = field(default_factory=set)
+
+    @property
+    def first(self) -> dict[str, Any]:
+        return self.entries[0]
+
 
 class RuntimeWatchdog:
     """
     Monitors application error logs and triggers self-healing via FixerAgent.
     """
 
-    def __init__(self, project_dir: Path):
+    def __init__(
+        self,
+        project_dir: Path,
+        chunk_size: int = READ_CHUNK_SIZE,
+        max_chunks_per_check: int = MAX_CHUNKS_PER_CHECK,
+        batch_window: float = BATCH_WINDOW_SECONDS,
+        use_inotify: bool = True,
+    ):
         self.project_dir = project_dir
         self.workflow_dir = project_dir / ".workflow"
         self.errors_dir = self.workflow_dir / "errors"
+        self.offsets_file = self.workflow_dir / OFFSETS_FILE
+        self.chunk_size = chunk_size
+        self.max_chunks_per_check = max_chunks_per_check
+        self.batch_window = batch_window
+        self.use_inotify = use_inotify
 
         # Ensure directories exist
         self.errors_dir.mkdir(parents=True, exist_ok=True)
@@ -27,123 +165,241 @@ class RuntimeWatchdog:
 
         self.fixer = FixerAgent(project_dir)
 
-        # State tracking: file path -> last read byte offset
+        # State tracking: file path -> last consumed byte offset (always a line boundary)
         self.file_offsets: dict[Path, int] = {}
+        # Inode per file, to detect rotation across restarts
+        self.file_inodes: dict[Path, int] = {}
         # Keep track of known files to detect new ones
         self.known_files: set[Path] = set()
+        # Set when a check stopped reading before reaching the end of a file
+        self._backlog = False
+        self._load_offsets()
 
     async def start(self, poll_interval: float = 2.0):
-        """Starts the monitoring loop."""
-        self.logger.info("Runtime Watchdog started. Monitoring for errors...")
-
-        while True:
-            try:
-                await self.check_logs()
-            except Exception as e:
-                self.logger.error(f"Watchdog loop error: {e}")
+        """Starts the monitoring loop.
+
+        With inotify, ``poll_interval`` only bounds how long a missed event
+        can go unnoticed; without it, it is the polling period.
+        """
+        waiter = InotifyWaiter.create(self.errors_dir) if self.use_inotify else None
+        if waiter is not None:
+            waiter.attach(asyncio.get_running_loop())
+            self.logger.info("Runtime Watchdog started (inotify). Monitoring for errors...")
+        else:
+            self.logger.info("Runtime Watchdog started (polling). Monitoring for errors...")
 
-            await asyncio.sleep(poll_interval)
+        try:
+            while True:
+                try:
+                    await self.check_logs()
+                except Exception as e:
+                    self.logger.error(f"Watchdog loop error: {e}")
+
+                if self._backlog:
+                    # More data is waiting; yield to the loop and keep reading
+                    await asyncio.sleep(0)
+                elif waiter is not None:
+                    # Safety-net timeout in case an event is missed
+                    if await waiter.wait(max(poll_interval, 30.0)) and self.batch_window:
+                        await asyncio.sleep(self.batch_window)
+                else:
+                    await asyncio.sleep(poll_interval)
+        finally:
+            if waiter is not None:
+                waiter.close()
 
     async def check_logs(self):
-        """Checks for new log files and new content in existing files."""
+        """Checks for new log files and new content, then dispatches errors."""
         current_files = set(self.errors_dir.glob("*.jsonl"))
 
-        # Initialize offsets for new files (start at end to avoid re-processing old errors on restart)
-        # Note: If we want to process ALL errors on startup, set to 0.
-        # For a "Watchdog", catching up on missed errors is usually good,
-        # but avoiding "fix loops" on old errors is also important.
-        # Let's start at 0 but maybe the FixerAgent dedupes?
-        # FixerAgent has fix_history, but re-triggering might be noisy.
-        # Let's default to 0 (process everything) for now, relying on Fixer to be smart.
-        new_files = current_files - self.known_files
-        for f in new_files:
-            self.logger.info(f"New log file detected: {f.name}")
-            # If the file is huge, maybe seek to end?
-            # For now, start from beginning.
-            self.file_offsets[f] = 0
+        # New files are read from the beginning; files seen before a restart
+        # resume from their persisted offset.
+        for f in current_files - self.known_files:
+            if f not in self.file_offsets:
+                self.logger.info(f"New log file detected: {f.name}")
+                self.file_offsets[f] = 0
             self.known_files.add(f)
 
-        # Check for new content
-        for log_file in current_files:
-            await self._process_file(log_file)
-
-    async def _process_file(self, log_file: Path):
-        """Reads new lines from a log file and triggers fixes."""
-        try:
-            current_offset = self.file_offsets.get(log_file, 0)
-
-            if not log_file.exists():
-                return
-
-            # Check size to see if it grew
-            file_size = log_file.stat().st_size
-            if file_size < current_offset:
-                # File was truncated/rotated
-                current_offset = 0
+        entries: list[tuple[Path, dict[str, Any]]] = []
+        changed = False
+        self._backlog = False
+        for log_file in sorted(current_files):
+            lines = self._read_new_lines(log_file)
+            if lines is None:
+                continue
+            changed = True
+            for line in lines:
+                entry = self._parse_error_line(line)
+                if entry is not None:
+                    entries.append((log_file, entry))
 
-            if file_size == current_offset:
-                return
+        if changed:
+            self._save_offsets()
 
-            async with asyncio.Lock():  # Simple lock if we were concurrent, but we are single looped here.
-                with open(log_file, encoding="utf-8") as f:
-                    f.seek(current_offset)
+        for batch in self._group_errors(entries):
+            await self._dispatch_batch(batch)
 
-                    lines = f.readlines()
-                    self.file_offsets[log_file] = f.tell()
+    def _read_new_lines(self, log_file: Path) -> Optional[list[str]]:
+        """Read complete lines appended since the stored offset.
 
-            for line in lines:
-                await self._handle_log_line(line.strip())
+        Reads at most ``max_chunks_per_check`` chunks; any remainder is
+        flagged as backlog and picked up by the next check.
 
-        except Exception as e:
+        Returns:
+            New lines, or None if the file did not change
+        """
+        try:
+            stat = log_file.stat()
+        except OSError:
+            return None
+
+        stored = self.file_offsets.get(log_file, 0)
+        offset = stored
+        if self.file_inodes.get(log_file, stat.st_ino) != stat.st_ino or stat.st_size < offset:
+            # File was rotated or truncated
+            offset = 0
+        self.file_inodes[log_file] = stat.st_ino
+
+        if stat.st_size == offset:
+            self.file_offsets[log_file] = offset
+            return [] if offset != stored else None
+
+        lines: list[str] = []
+        try:
+            with open(log_file, "rb") as f:
+                f.seek(offset)
+                pending = b""
+                chunks = 0
+                while True:
+                    if chunks >= self.max_chunks_per_check and lines:
+                        # Budget spent; continue from here on the next check.
+                        # A single oversized line is still read to its end.
+                        self._backlog = True
+                        break
+                    chunk = f.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    chunks += 1
+                    complete, sep, pending = (pending + chunk).rpartition(b"\n")
+                    if sep:
+                        offset += len(complete) + 1
+                        lines.extend(
+                            line.decode("utf-8", errors="replace") for line in complete.split(b"\n")
+                        )
+        except OSError as e:
             self.logger.error(f"Error reading {log_file.name}: {e}")
+            return None
 
-    async def _handle_log_line(self, line: str):
-        """Parses a log line and attempts a fix if it's an error."""
+        self.file_offsets[log_file] = offset
+        return lines
+
+    def _parse_error_line(self, line: str) -> Optional[dict[str, Any]]:
+        """Parse a log line, returning an error entry or None."""
+        line = line.strip()
         if not line:
-            return
+            return None
 
         try:
             entry = json.loads(line)
         except json.JSONDecodeError:
             # Not a JSONL line, treat as raw log line
-            # Check for common error patterns
             if "Traceback" in line or "Error:" in line or "Exception" in line:
-                entry = {"level": "ERROR", "message": line.strip(), "error_type": "RawLogError"}
-            else:
-                return
+                return {"level": "ERROR", "message": line, "error_type": "RawLogError"}
+            return None
 
-        # We expect specific fields.
-        # Check if it looks like an error we define or just a generic log
-        # LogManager might write various JSONL.
-        # We assume errors.jsonl contains error objects.
-
-        # Basic validation: needs 'level'='ERROR' or 'message' or 'stack_trace'
+        if not isinstance(entry, dict):
+            return None
+        if entry.get("_resolved"):
+            return None
         if entry.get("level") != "ERROR" and "error" not in entry and "stack_trace" not in entry:
-            return
-
-        self.logger.info(f"Error detected: {entry.get('message', 'Unknown Error')[:50]}...")
-
-        # Construct FixerError
-        # Assuming the log structure matches what Fixer expects or we map it.
-        # FixerError expects: error_type, error_message, stack_trace, file_path, line_number (all optional-ish)
+            return None
+        return entry
+
+    def _group_errors(self, entries: list[tuple[Path, dict[str, Any]]]) -> list[ErrorBatch]:
+        """Coalesce related errors (same type, message and location)."""
+        batches: dict[str, ErrorBatch] = {}
+        for log_file, entry in entries:
+            message = str(entry.get("message") or entry.get("error") or "")
+            key_source = "|".join(
+                [
+                    str(entry.get("error_type", "")),
+                    message[:200],
+                    str(entry.get("file_path", "")),
+                ]
+            )
+            key = hashlib.sha256(key_source.encode()).hexdigest()[:16]
+            batch = batches.setdefault(key, ErrorBatch(key=key))
+            batch.entries.append(entry)
+            batch.sources.add(log_file.name)
+        return list(batches.values())
+
+    async def _dispatch_batch(self, batch: ErrorBatch):
+        """Send one group of related errors to the FixerAgent."""
+        entry = batch.first
+        message = entry.get("message") or entry.get("error") or "Unknown error"
+        self.logger.info(
+            f"Error detected ({len(batch.entries)} occurrence(s)): {str(message)[:50]}..."
+        )
 
+        context = dict(entry.get("context") or {})
+        context.update(
+            {
+                "occurrences": len(batch.entries),
+                "log_files": sorted(batch.sources),
+                "file_path": entry.get("file_path"),
+                "line_number": entry.get("line_number"),
+            }
+        )
         fixer_error = FixerError(
+            error_id=str(entry.get("id") or f"watchdog-{batch.key}"),
+            message=str(message),
             error_type=entry.get("error_type", "RuntimeError"),
-            error_message=entry.get("message") or entry.get("error", "Unknown error"),
+            source="watchdog",
+            phase=entry.get("phase"),
+            task_id=entry.get("task_id"),
+            agent=entry.get("agent"),
             stack_trace=entry.get("stack_trace") or entry.get("traceback"),
-            file_path=entry.get("file_path"),
-            line_number=entry.get("line_number"),
+            context=context,
+            timestamp=entry.get("timestamp"),
         )
 
         try:
             self.logger.info("Triggering FixerAgent...")
-            # We don't have a specific Workflow State here, pass None or empty.
-            result = await self.fixer.attempt_fix(fixer_error)
+            attempt = await self.fixer.attempt_fix(fixer_error)
 
-            if result.success:
-                self.logger.info(f"Fix applied successfully: {result.fix_description}")
+            if attempt.result is not None and attempt.result.success:
+                self.logger.info(f"Fix applied for {fixer_error.error_id}")
             else:
-                self.logger.warning(f"Fix attempt failed: {result.error_message}")
+                self.logger.warning(f"Fix attempt for {fixer_error.error_id} did not succeed")
 
         except Exception as e:
             self.logger.error(f"Failed to trigger FixerAgent: {e}")
+
+    def _load_offsets(self) -> None:
+        """Restore offsets persisted by a previous run."""
+        if not self.offsets_file.exists():
+            return
+        try:
+            data = json.loads(self.offsets_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return
+        for name, state in data.get("files", {}).items():
+            path = self.errors_dir / name
+            self.file_offsets[path] = int(state.get("offset", 0))
+            if state.get("inode") is not None:
+                self.file_inodes[path] = int(state["inode"])
+
+    def _save_offsets(self) -> None:
+        """Persist offsets atomically."""
+        data = {
+            "files": {
+                path.name: {"offset": offset, "inode": self.file_inodes.get(path)}
+                for path, offset in self.file_offsets.items()
+            }
+        }
+        tmp_path = self.offsets_file.with_suffix(".json.tmp")
+        try:
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, self.offsets_file)
+        except OSError as e:
+            self.logger.warning(f"Failed to persist watchdog offsets: {e}")
@@ -13,20 +13,34 @@ Webhook Events:
     task.completed - Task implementation completed
     task.failed - Task implementation failed
     escalation.required - Human escalation needed
+
+Delivery:
+    All HTTP requests run on a background event loop owned by
+    ``WebhookDelivery``, over one long-lived session per endpoint, so
+    connections are reused across events. ``enqueue`` puts an event in a
+    bounded per-endpoint outbox and returns immediately; a worker per
+    endpoint drains it, optionally batching several queued events into one
+    signed POST (``{"events": [...]}``), and retries failures with capped
+    exponential backoff. When an outbox is full the oldest event is dropped.
 """
 
 import asyncio
+import atexit
+import concurrent.futures
 import hashlib
 import hmac
 import json
 import logging
+import threading
 import time
+from collections import deque
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-from .config import get_config
+from .config import WebhooksConfig, get_config
 
 logger = logging.getLogger(__name__)
 
@@ -106,245 +120,432 @@ class WebhookDeliveryResult:
     duration_ms: int = 0
 
 
-class WebhookDispatcher:
-    """Dispatcher for webhook events.
+@dataclass
+class WebhookDeliveryStats:
+    """Counters for queued webhook delivery."""
 
-    Handles sending events to configured endpoints with:
-    - HMAC signature verification
-    - Retry logic with exponential backoff
-    - Async and sync delivery modes
+    enqueued: int = 0
+    delivered: int = 0
+    failed: int = 0
+    dropped: int = 0
+    retries: int = 0
+    batches: int = 0
+
+
+class _Outbox:
+    """Queued events for one endpoint."""
+
+    __slots__ = ("endpoint", "items", "lock", "wakeup", "in_flight", "worker")
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.items: deque[WebhookPayload] = deque()
+        self.lock = threading.Lock()
+        self.wakeup = asyncio.Event()
+        self.in_flight = 0
+        self.worker: Optional[concurrent.futures.Future] = None
+
+
+class WebhookDelivery:
+    """Pooled, queued webhook delivery on a background event loop.
+
+    Thread-safe. The loop thread starts on first use; sessions are created
+    per endpoint on that loop and reused until ``close``.
     """
 
-    def __init__(self):
-        """Initialize the webhook dispatcher."""
-        self.config = get_config().webhooks
-        self._session: Optional[Any] = None
+    def __init__(self, config: WebhooksConfig, get_headers: Callable[[str], dict[str, str]]):
+        """Initialize delivery.
 
-    def _compute_signature(self, payload: str) -> str:
-        """Compute HMAC-SHA256 signature for a payload.
+        Args:
+            config: WebhooksConfig (read on every delivery)
+            get_headers: Returns signed request headers for a body
+        """
+        self.config = config
+        self._get_headers = get_headers
+        self.stats = WebhookDeliveryStats()
+        self._stats_lock = threading.Lock()
+        self._outboxes: dict[str, _Outbox] = {}
+        self._outboxes_lock = threading.Lock()
+        self._sessions: dict[str, Any] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Producer API
+    # ------------------------------------------------------------------
+
+    def enqueue(self, payload: WebhookPayload, endpoints: list[str]) -> bool:
+        """Queue an event for background delivery. Never blocks on I/O.
 
         Args:
-            payload: JSON payload string
+            payload: Event payload
+            endpoints: Endpoints to deliver to
 
         Returns:
-            Hex-encoded signature
+            True if the event was queued
         """
-        if not self.config.secret:
-            return ""
+        if self._closed or not endpoints:
+            return False
+        loop = self._ensure_started()
+
+        for endpoint in endpoints:
+            outbox = self._outbox(endpoint, loop)
+            with outbox.lock:
+                dropped = len(outbox.items) >= max(1, self.config.queue_size)
+                if dropped:
+                    outbox.items.popleft()
+                outbox.items.append(payload)
+            self._count(enqueued=1, dropped=int(dropped))
+            if dropped:
+                logger.warning(f"Webhook outbox for {endpoint} is full, dropped oldest event")
+            loop.call_soon_threadsafe(outbox.wakeup.set)
+        return True
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """Run a coroutine on the delivery loop.
 
-        signature = hmac.new(
-            self.config.secret.encode(),
-            payload.encode(),
-            hashlib.sha256,
-        ).hexdigest()
+        Args:
+            coro: Coroutine to run
 
-        return f"sha256={signature}"
+        Returns:
+            Future for its result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
 
-    def _get_headers(self, payload: str) -> dict[str, str]:
-        """Get headers for webhook request.
+    def flush(self, timeout: Optional[float] = 30.0) -> bool:
+        """Wait until every queued event has been delivered or given up on.
+
+        Blocks the calling thread; from async code run it in a thread.
 
         Args:
-            payload: JSON payload string
+            timeout: Seconds to wait (None waits forever)
 
         Returns:
-            Headers dict
+            True if the outboxes drained within the timeout
         """
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Conductor-Orchestrator/1.0",
-        }
+        if self._loop is None:
+            return True
+        try:
+            self.submit(self._wait_idle()).result(timeout)
+            return True
+        except concurrent.futures.TimeoutError:
+            return False
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Flush, close the sessions and stop the delivery loop."""
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.debug(f"Webhook delivery shutdown incomplete: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    # Delivery loop
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        loop, thread = self._loop, self._thread
+        if loop is not None and thread is not None and thread.is_alive():
+            return loop
+        with self._start_lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._outboxes.clear()
+                self._sessions.clear()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="webhook-delivery", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def _outbox(self, endpoint: str, loop: asyncio.AbstractEventLoop) -> _Outbox:
+        with self._outboxes_lock:
+            outbox = self._outboxes.get(endpoint)
+            if outbox is None:
+                outbox = self._outboxes[endpoint] = _Outbox(endpoint)
+                outbox.worker = asyncio.run_coroutine_threadsafe(self._drain(outbox), loop)
+            return outbox
+
+    def _count(self, **counts: int) -> None:
+        with self._stats_lock:
+            for name, value in counts.items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+
+    async def _drain(self, outbox: _Outbox) -> None:
+        """Deliver queued events for an endpoint, in order, until cancelled."""
+        while True:
+            await outbox.wakeup.wait()
+            outbox.wakeup.clear()
+            while True:
+                with outbox.lock:
+                    count = min(len(outbox.items), max(1, self.config.batch_size))
+                    batch = [outbox.items.popleft() for _ in range(count)]
+                    outbox.in_flight = count
+                if not batch:
+                    break
+
+                if len(batch) == 1:
+                    body = batch[0].to_json()
+                else:
+                    body = json.dumps({"events": [p.to_dict() for p in batch]}, sort_keys=True)
+                try:
+                    result = await self.post(outbox.endpoint, body, batch_size=len(batch))
+                except Exception as e:
+                    result = WebhookDeliveryResult(
+                        endpoint=outbox.endpoint, success=False, error=str(e)
+                    )
 
-        signature = self._compute_signature(payload)
-        if signature:
-            headers["X-Webhook-Signature"] = signature
+                if result.success:
+                    self._count(delivered=len(batch), batches=int(len(batch) > 1))
+                else:
+                    self._count(failed=len(batch))
+                    logger.warning(
+                        f"Webhook delivery failed to {result.endpoint} "
+                        f"({len(batch)} events): {result.error}"
+                    )
+                outbox.in_flight = 0
+
+    async def _wait_idle(self) -> None:
+        while True:
+            with self._outboxes_lock:
+                outboxes = list(self._outboxes.values())
+            if not any(o.items or o.in_flight for o in outboxes):
+                return
+            await asyncio.sleep(0.01)
+
+    async def _shutdown(self) -> None:
+        with self._outboxes_lock:
+            workers = [o.worker for o in self._outboxes.values() if o.worker is not None]
+        for worker in workers:
+            worker.cancel()
+        # Let the cancellations run before the loop stops
+        await asyncio.sleep(0)
+        for session in self._sessions.values():
+            try:
+                result = session.close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"Error closing webhook session: {e}")
+        self._sessions.clear()
 
-        return headers
+    def _backoff(self, attempt: int) -> float:
+        """Delay before retrying after a failed attempt."""
+        delay = self.config.retry_delay_seconds * (2.0 ** (attempt - 1))
+        return float(min(delay, self.config.max_retry_delay_seconds))
 
-    async def _deliver_async(
-        self,
-        endpoint: str,
-        payload: WebhookPayload,
-    ) -> WebhookDeliveryResult:
-        """Deliver webhook asynchronously using aiohttp.
+    async def post(self, endpoint: str, body: str, batch_size: int = 1) -> WebhookDeliveryResult:
+        """POST a body to an endpoint with retries. Runs on the delivery loop.
+
+        Connection errors, timeouts, HTTP 408, 429 and 5xx are retried with
+        exponential backoff; other HTTP errors are not.
 
         Args:
             endpoint: Webhook endpoint URL
-            payload: Event payload
+            body: JSON body
+            batch_size: Number of events in the body
 
         Returns:
             Delivery result
         """
-        if not AIOHTTP_AVAILABLE:
-            return await asyncio.to_thread(self._deliver_sync, endpoint, payload)
+        headers = self._get_headers(body)
+        if batch_size > 1:
+            headers["X-Webhook-Batch-Size"] = str(batch_size)
+        attempts = max(1, self.config.retry_attempts)
 
-        json_payload = payload.to_json()
-        headers = self._get_headers(json_payload)
-
-        for attempt in range(1, self.config.retry_attempts + 1):
+        for attempt in range(1, attempts + 1):
             start_time = time.time()
-
+            status_code: Optional[int] = None
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        endpoint,
-                        data=json_payload,
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
-                    ) as response:
-                        duration_ms = int((time.time() - start_time) * 1000)
-
-                        if response.status < 400:
-                            return WebhookDeliveryResult(
-                                endpoint=endpoint,
-                                success=True,
-                                status_code=response.status,
-                                attempt=attempt,
-                                duration_ms=duration_ms,
-                            )
-                        else:
-                            error = f"HTTP {response.status}"
-                            if attempt < self.config.retry_attempts:
-                                await asyncio.sleep(self.config.retry_delay_seconds * attempt)
-                                continue
-
-                            return WebhookDeliveryResult(
-                                endpoint=endpoint,
-                                success=False,
-                                status_code=response.status,
-                                error=error,
-                                attempt=attempt,
-                                duration_ms=duration_ms,
-                            )
-
+                status_code = await self._send(endpoint, body, headers)
+                error = None if status_code < 400 else f"HTTP {status_code}"
             except asyncio.TimeoutError:
-                duration_ms = int((time.time() - start_time) * 1000)
-                if attempt < self.config.retry_attempts:
-                    await asyncio.sleep(self.config.retry_delay_seconds * attempt)
-                    continue
+                error = "Timeout"
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            duration_ms = int((time.time() - start_time) * 1000)
 
+            if error is None:
                 return WebhookDeliveryResult(
                     endpoint=endpoint,
-                    success=False,
-                    error="Timeout",
+                    success=True,
+                    status_code=status_code,
                     attempt=attempt,
                     duration_ms=duration_ms,
                 )
 
-            except Exception as e:
-                duration_ms = int((time.time() - start_time) * 1000)
-                if attempt < self.config.retry_attempts:
-                    await asyncio.sleep(self.config.retry_delay_seconds * attempt)
-                    continue
-
+            retryable = status_code is None or status_code in (408, 429) or status_code >= 500
+            if not retryable or attempt == attempts:
                 return WebhookDeliveryResult(
                     endpoint=endpoint,
                     success=False,
-                    error=str(e),
+                    status_code=status_code,
+                    error=error,
                     attempt=attempt,
                     duration_ms=duration_ms,
                 )
 
+            self._count(retries=1)
+            await asyncio.sleep(self._backoff(attempt))
+
         # Should not reach here
         return WebhookDeliveryResult(
             endpoint=endpoint,
             success=False,
             error="Max retries exceeded",
-            attempt=self.config.retry_attempts,
+            attempt=attempts,
         )
 
-    def _deliver_sync(
-        self,
-        endpoint: str,
-        payload: WebhookPayload,
-    ) -> WebhookDeliveryResult:
-        """Deliver webhook synchronously using requests.
-
-        Args:
-            endpoint: Webhook endpoint URL
-            payload: Event payload
+    async def _send(self, endpoint: str, body: str, headers: dict[str, str]) -> int:
+        """Send one request over the endpoint's pooled session.
 
         Returns:
-            Delivery result
+            HTTP status code
         """
-        if not REQUESTS_AVAILABLE:
-            return WebhookDeliveryResult(
-                endpoint=endpoint,
-                success=False,
-                error="No HTTP client available (install aiohttp or requests)",
-            )
-
-        json_payload = payload.to_json()
-        headers = self._get_headers(json_payload)
-
-        for attempt in range(1, self.config.retry_attempts + 1):
-            start_time = time.time()
+        session = self._sessions.get(endpoint)
 
+        if AIOHTTP_AVAILABLE:
+            if session is None:
+                session = self._sessions[endpoint] = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds)
+                )
+            async with session.post(endpoint, data=body, headers=headers) as response:
+                # Read the body so the connection goes back to the pool
+                await response.read()
+                return int(response.status)
+
+        if REQUESTS_AVAILABLE:
+            if session is None:
+                session = self._sessions[endpoint] = requests.Session()
             try:
-                response = requests.post(
+                reply = await asyncio.to_thread(
+                    session.post,
                     endpoint,
-                    data=json_payload,
+                    data=body,
                     headers=headers,
                     timeout=self.config.timeout_seconds,
                 )
-                duration_ms = int((time.time() - start_time) * 1000)
-
-                if response.status_code < 400:
-                    return WebhookDeliveryResult(
-                        endpoint=endpoint,
-                        success=True,
-                        status_code=response.status_code,
-                        attempt=attempt,
-                        duration_ms=duration_ms,
-                    )
-                else:
-                    if attempt < self.config.retry_attempts:
-                        time.sleep(self.config.retry_delay_seconds * attempt)
-                        continue
+            except requests.Timeout:
+                raise asyncio.TimeoutError() from None
+            return int(reply.status_code)
 
-                    return WebhookDeliveryResult(
-                        endpoint=endpoint,
-                        success=False,
-                        status_code=response.status_code,
-                        error=f"HTTP {response.status_code}",
-                        attempt=attempt,
-                        duration_ms=duration_ms,
-                    )
+        raise RuntimeError("No HTTP client available (install aiohttp or requests)")
 
-            except requests.Timeout:
-                duration_ms = int((time.time() - start_time) * 1000)
-                if attempt < self.config.retry_attempts:
-                    time.sleep(self.config.retry_delay_seconds * attempt)
-                    continue
 
-                return WebhookDeliveryResult(
-                    endpoint=endpoint,
-                    success=False,
-                    error="Timeout",
-                    attempt=attempt,
-                    duration_ms=duration_ms,
-                )
+class WebhookDispatcher:
+    """Dispatcher for webhook events.
 
-            except Exception as e:
-                duration_ms = int((time.time() - start_time) * 1000)
-                if attempt < self.config.retry_attempts:
-                    time.sleep(self.config.retry_delay_seconds * attempt)
-                    continue
+    Handles sending events to configured endpoints with:
+    - HMAC signature verification
+    - Retry logic with exponential backoff
+    - Pooled connections and a background outbox (``enqueue``)
+    - Awaitable and blocking delivery with results (``dispatch``, ``dispatch_sync``)
+    """
 
-                return WebhookDeliveryResult(
-                    endpoint=endpoint,
-                    success=False,
-                    error=str(e),
-                    attempt=attempt,
-                    duration_ms=duration_ms,
-                )
+    def __init__(self) -> None:
+        """Initialize the webhook dispatcher."""
+        self.config = get_config().webhooks
+        self.delivery = WebhookDelivery(self.config, self._get_headers)
 
-        return WebhookDeliveryResult(
-            endpoint=endpoint,
-            success=False,
-            error="Max retries exceeded",
-            attempt=self.config.retry_attempts,
+    def _compute_signature(self, payload: str) -> str:
+        """Compute HMAC-SHA256 signature for a payload.
+
+        Args:
+            payload: JSON payload string
+
+        Returns:
+            Hex-encoded signature
+        """
+        if not self.config.secret:
+            return ""
+
+        signature = hmac.new(
+            self.config.secret.encode(),
+            payload.encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+        return f"sha256={signature}"
+
+    def _get_headers(self, payload: str) -> dict[str, str]:
+        """Get headers for webhook request.
+
+        Args:
+            payload: JSON payload string
+
+        Returns:
+            Headers dict
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "Conductor-Orchestrator/1.0",
+        }
+
+        signature = self._compute_signature(payload)
+        if signature:
+            headers["X-Webhook-Signature"] = signature
+
+        return headers
+
+    def _build_payload(
+        self,
+        event_type: WebhookEventType,
+        project: str,
+        workflow_id: str,
+        data: Optional[dict[str, Any]],
+    ) -> Optional[WebhookPayload]:
+        if not self.config.enabled or not self.config.endpoints:
+            return None
+
+        return WebhookPayload(
+            event_type=event_type,
+            project=project,
+            workflow_id=workflow_id,
+            data=data or {},
         )
 
+    def _submit_all(self, payload: WebhookPayload) -> list[concurrent.futures.Future]:
+        body = payload.to_json()
+        return [
+            self.delivery.submit(self.delivery.post(endpoint, body))
+            for endpoint in self.config.endpoints
+        ]
+
+    def enqueue(
+        self,
+        event_type: WebhookEventType,
+        project: str,
+        workflow_id: str,
+        data: Optional[dict[str, Any]] = None,
+    ) -> bool:
+        """Queue a webhook event for background delivery.
+
+        Returns immediately; safe to call with or without a running event loop.
+
+        Args:
+            event_type: Type of event
+            project: Project name
+            workflow_id: Workflow ID
+            data: Optional event data
+
+        Returns:
+            True if the event was queued
+        """
+        payload = self._build_payload(event_type, project, workflow_id, data)
+        if payload is None:
+            return False
+        return self.delivery.enqueue(payload, list(self.config.endpoints))
+
     async def dispatch(
         self,
         event_type: WebhookEventType,
@@ -363,20 +564,14 @@ class WebhookDispatcher:
         Returns:
             List of delivery results
         """
-        if not self.config.enabled or not self.config.endpoints:
+        payload = self._build_payload(event_type, project, workflow_id, data)
+        if payload is None:
             return []
 
-        payload = WebhookPayload(
-            event_type=event_type,
-            project=project,
-            workflow_id=workflow_id,
-            data=data or {},
-        )
-
-        # Deliver to all endpoints concurrently
-        tasks = [self._deliver_async(endpoint, payload) for endpoint in self.config.endpoints]
+        # Deliver to all endpoints concurrently on the delivery loop
+        futures = [asyncio.wrap_future(f) for f in self._submit_all(payload)]
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*futures, return_exceptions=True)
 
         # Convert exceptions to failed results
         final_results = []
@@ -413,6 +608,9 @@ class WebhookDispatcher:
     ) -> list[WebhookDeliveryResult]:
         """Dispatch a webhook event synchronously.
 
+        Endpoints are delivered to concurrently; the call blocks until all
+        of them have finished.
+
         Args:
             event_type: Type of event
             project: Project name
@@ -422,23 +620,29 @@ class WebhookDispatcher:
         Returns:
             List of delivery results
         """
-        if not self.config.enabled or not self.config.endpoints:
+        payload = self._build_payload(event_type, project, workflow_id, data)
+        if payload is None:
             return []
 
-        payload = WebhookPayload(
-            event_type=event_type,
-            project=project,
-            workflow_id=workflow_id,
-            data=data or {},
-        )
-
         results = []
-        for endpoint in self.config.endpoints:
-            result = self._deliver_sync(endpoint, payload)
-            results.append(result)
+        for endpoint, future in zip(self.config.endpoints, self._submit_all(payload), strict=True):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(
+                    WebhookDeliveryResult(endpoint=endpoint, success=False, error=str(e))
+                )
 
         return results
 
+    def flush(self, timeout: Optional[float] = 30.0) -> bool:
+        """Wait for queued events to be delivered. See ``WebhookDelivery.flush``."""
+        return self.delivery.flush(timeout)
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Deliver queued events and release pooled connections."""
+        self.delivery.close(timeout)
+
 
 # Singleton dispatcher
 _dispatcher: Optional[WebhookDispatcher] = None
@@ -455,3 +659,15 @@ def get_webhook_dispatcher() -> WebhookDispatcher:
     if _dispatcher is None:
         _dispatcher = WebhookDispatcher()
     return _dispatcher
+
+
+def shutdown_webhook_dispatcher() -> None:
+    """Deliver queued events and close the shared dispatcher."""
+    global _dispatcher
+
+    dispatcher, _dispatcher = _dispatcher, None
+    if dispatcher is not None:
+        dispatcher.close(timeout=10.0)
+
+
+atexit.register(shutdown_webhook_dispatcher)
@@ -2,6 +2,7 @@
 
 from orchestrator.recovery.handlers import (
     ErrorCategory,
+    ErrorContext,
     RecoveryHandler,
     RecoveryResult,
     handle_agent_failure,
@@ -13,6 +14,7 @@ __all__ = [
     "RecoveryHandler",
     "RecoveryResult",
     "ErrorCategory",
+    "ErrorContext",
     "handle_transient_error",
     "handle_agent_failure",
     "handle_review_conflict",
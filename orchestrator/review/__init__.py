@@ -5,6 +5,7 @@ from orchestrator.review.cycle import (
     ReviewCycleResult,
     ReviewDecision,
     ReviewIteration,
+    ReviewPolicy,
 )
 from orchestrator.review.resolver import ConflictResolver, ResolutionResult, ReviewResult
 
@@ -13,6 +14,7 @@ __all__ = [
     "ReviewCycleResult",
     "ReviewDecision",
     "ReviewIteration",
+    "ReviewPolicy",
     "ConflictResolver",
     "ResolutionResult",
     "ReviewResult",
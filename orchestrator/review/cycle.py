@@ -9,6 +9,7 @@ Flow:
     1. EXECUTE: Agent performs task
     2. REVIEW (PARALLEL): 2 reviewers assess work
     3. DECISION: Both approve → DONE, Either rejects → OPTIMIZE
+       (see ReviewPolicy; outstanding reviewers are cancelled once decided)
     4. OPTIMIZE: Original agent fixes issues with feedback
     5. REPEAT from step 2 (or ESCALATE if max iterations)
 
@@ -48,6 +49,22 @@ class ReviewDecision(Enum):
     ERROR = "error"
 
 
+class ReviewPolicy(str, Enum):
+    """How reviewer verdicts combine into a decision.
+
+    ALL: Every reviewer must approve; split verdicts go to the conflict resolver.
+        A rejection with real blocking issues (not process gaps) is final, since
+        the resolver rejects those whatever the other reviewers say
+    QUORUM: Approved once a quorum of reviewers approve
+    ANY_BLOCKING_REJECTS: Like ALL, but any rejection with blocking issues,
+        process gaps included, rejects without conflict resolution
+    """
+
+    ALL = "all"
+    QUORUM = "quorum"
+    ANY_BLOCKING_REJECTS = "any_blocking_rejects"
+
+
 @dataclass
 class ReviewFeedback:
     """Feedback from a single reviewer."""
@@ -78,6 +95,11 @@ class ReviewFeedback:
             timestamp=result.timestamp,
         )
 
+    @property
+    def failed(self) -> bool:
+        """Whether the review itself failed rather than producing a verdict."""
+        return self.cli_used == "error"
+
 
 @dataclass
 class ReviewIteration:
@@ -185,6 +207,8 @@ class ReviewCycle:
         dispatcher: AgentDispatcher,
         project_dir: Path,
         conflict_resolver: Optional[ConflictResolver] = None,
+        policy: ReviewPolicy = ReviewPolicy.ALL,
+        quorum: Optional[int] = None,
     ):
         """Initialize review cycle.
 
@@ -192,10 +216,14 @@ class ReviewCycle:
             dispatcher: Agent dispatcher for executing agents
             project_dir: Project directory
             conflict_resolver: Custom conflict resolver (uses default if None)
+            policy: How reviewer verdicts combine into a decision
+            quorum: Approvals required under QUORUM policy (majority if None)
         """
         self.dispatcher = dispatcher
         self.project_dir = Path(project_dir)
         self.conflict_resolver = conflict_resolver or ConflictResolver()
+        self.policy = ReviewPolicy(policy)
+        self.quorum = quorum
         self._cycle_log: list[dict[str, Any]] = []
 
     async def run(
@@ -298,10 +326,13 @@ class ReviewCycle:
                 work_result,
                 task,
                 iteration_num,
+                approval_score,
             )
 
             # Step 3: Determine decision
-            decision, resolution = self._determine_decision(reviews, approval_score)
+            decision, resolution = self._determine_decision(
+                reviews, approval_score, len(reviewer_ids)
+            )
 
             # Record iteration
             iteration = ReviewIteration(
@@ -379,17 +410,23 @@ class ReviewCycle:
         work_result: DispatchResult,
         original_task: Task,
         iteration: int,
+        approval_score: float = DEFAULT_APPROVAL_SCORE,
     ) -> list[ReviewFeedback]:
-        """Run reviews in parallel by all reviewers.
+        """Run reviews in parallel, stopping once the decision is final.
+
+        Reviews are consumed as they complete. As soon as the configured
+        policy makes the outcome certain, outstanding reviewers are
+        cancelled (which terminates their CLI subprocesses).
 
         Args:
             reviewer_ids: List of reviewer agent IDs
             work_result: Result from working agent
             original_task: Original task for context
             iteration: Current iteration number
+            approval_score: Minimum score for approval
 
         Returns:
-            List of ReviewFeedback from each reviewer
+            List of ReviewFeedback from completed reviewers, in reviewer order
         """
         # Prepare review context
         work_to_review = {
@@ -432,25 +469,101 @@ class ReviewCycle:
                     blocking_issues=[f"Review failed: {str(e)}"],
                 )
 
-        tasks = [run_review(rid) for rid in reviewer_ids]
-        reviews = await asyncio.gather(*tasks)
+        tasks = [asyncio.ensure_future(run_review(rid)) for rid in reviewer_ids]
+        reviews: list[ReviewFeedback] = []
+        try:
+            for next_review in asyncio.as_completed(tasks):
+                reviews.append(await next_review)
+                if len(reviews) < len(tasks) and self._is_decided(
+                    reviews, approval_score, len(reviewer_ids)
+                ):
+                    break
+        finally:
+            pending = [t for t in tasks if not t.done()]
+            for t in pending:
+                t.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.info(
+                    f"Review decision final after {len(reviews)}/{len(reviewer_ids)} "
+                    f"reviewers ({self.policy.value}); cancelled {len(pending)}"
+                )
+
+        order = {rid: i for i, rid in enumerate(reviewer_ids)}
+        return sorted(reviews, key=lambda r: order.get(r.reviewer_id, len(order)))
 
-        return list(reviews)
+    def _required_approvals(self, total_reviewers: int) -> int:
+        """Number of approvals required under the QUORUM policy."""
+        if self.quorum is not None:
+            return max(1, min(self.quorum, total_reviewers))
+        return total_reviewers // 2 + 1
+
+    def _is_decided(
+        self,
+        reviews: list[ReviewFeedback],
+        approval_score: float,
+        total_reviewers: int,
+    ) -> bool:
+        """Check whether the outstanding reviews can still change the decision.
+
+        Args:
+            reviews: Reviews completed so far
+            approval_score: Minimum score for approval
+            total_reviewers: Number of reviewers dispatched
+
+        Returns:
+            True if the decision is final
+        """
+        if self.policy == ReviewPolicy.ANY_BLOCKING_REJECTS:
+            return any(not r.approved and r.blocking_issues and not r.failed for r in reviews)
+
+        if self.policy == ReviewPolicy.QUORUM:
+            required = self._required_approvals(total_reviewers)
+            approvals = sum(1 for r in reviews if r.approved and r.score >= approval_score)
+            rejections = len(reviews) - approvals
+            return approvals >= required or rejections > total_reviewers - required
+
+        # ALL: split verdicts need every review, unless a real blocker already
+        # guarantees the conflict resolver rejects
+        return any(
+            not r.approved
+            and not r.failed
+            and any(
+                not self.conflict_resolver.is_process_gap(str(issue).lower())
+                for issue in r.blocking_issues
+            )
+            for r in reviews
+        )
 
     def _determine_decision(
         self,
         reviews: list[ReviewFeedback],
         approval_score: float,
+        total_reviewers: Optional[int] = None,
     ) -> tuple[ReviewDecision, Optional[ResolutionResult]]:
         """Determine the overall decision from reviews.
 
         Args:
             reviews: List of review feedback
             approval_score: Minimum score for approval
+            total_reviewers: Number of reviewers dispatched (defaults to len(reviews))
 
         Returns:
             Tuple of (decision, optional resolution if there was a conflict)
         """
+        total_reviewers = total_reviewers or len(reviews)
+
+        if self.policy == ReviewPolicy.QUORUM:
+            approvals = sum(1 for r in reviews if r.approved and r.score >= approval_score)
+            if approvals >= self._required_approvals(total_reviewers):
+                return ReviewDecision.APPROVED, None
+            return ReviewDecision.NEEDS_CHANGES, None
+
+        if self.policy == ReviewPolicy.ANY_BLOCKING_REJECTS and self._is_decided(
+            reviews, approval_score, total_reviewers
+        ):
+            return ReviewDecision.NEEDS_CHANGES, None
+
         # Check if all reviews passed
         all_approved = all(r.approved and r.score >= approval_score for r in reviews)
         any_approved = any(r.approved and r.score >= approval_score for r in reviews)
@@ -496,6 +609,7 @@ class ReviewCycle:
         log_entry = {
             "iteration": iteration.iteration_number,
             "decision": iteration.decision.value,
+            "policy": self.policy.value,
             "reviews": [
                 {
                     "reviewer": r.reviewer_id,
@@ -190,7 +190,7 @@ class ConflictResolver:
         # Filter out process gaps from blocking issues
         # Process gaps are important feedback but shouldn't block validation
         real_blockers = [
-            b for b in all_blockers if not self._is_process_gap(str(b["issue"]).lower())
+            b for b in all_blockers if not self.is_process_gap(str(b["issue"]).lower())
         ]
 
         # If real blockers exist (actual vulnerabilities), reject regardless of score
@@ -270,7 +270,7 @@ class ConflictResolver:
             issue_text = str(item["issue"])
 
             # Skip if this looks like a process gap rather than actual vulnerability
-            if self._is_process_gap(issue_text):
+            if self.is_process_gap(issue_text):
                 continue
 
             # Check patterns against domains
@@ -280,7 +280,7 @@ class ConflictResolver:
 
         return None
 
-    def _is_process_gap(self, issue_text: str) -> bool:
+    def is_process_gap(self, issue_text: str) -> bool:
         """Check if issue text indicates a process gap rather than actual vulnerability.
 
         Uses compiled regex patterns for accurate matching with word boundaries.
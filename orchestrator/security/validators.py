@@ -35,6 +35,8 @@ ALLOWED_TABLES: frozenset[str] = frozenset(
         "milestones",
         # Audit and tracking
         "audit_entries",
+        "audit_rollups",
+        "audit_rollup_state",
         "error_patterns",
         "checkpoints",
         "git_commits",
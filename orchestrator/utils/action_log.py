@@ -16,6 +16,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from .log_writer import LogWriter, get_log_writer
+
 
 class ActionType(str, Enum):
     """Types of actions that can be logged."""
@@ -207,7 +209,8 @@ class ActionLog:
     """Unified action log for workflow observability.
 
     Thread-safe, append-only log with real-time console output
-    and queryable persistence.
+    and queryable persistence. Entries and the index are persisted by the
+    shared background LogWriter; readers flush it first.
     """
 
     def __init__(
@@ -215,6 +218,7 @@ class ActionLog:
         workflow_dir: str | Path,
         console_output: bool = True,
         console_colors: bool = True,
+        writer: Optional[LogWriter] = None,
     ):
         """Initialize the action log.
 
@@ -222,6 +226,7 @@ class ActionLog:
             workflow_dir: Directory for log storage (.workflow/)
             console_output: Whether to output to console in real-time
             console_colors: Whether to use ANSI colors in console output
+            writer: Background writer (shared process writer if None)
         """
         self.workflow_dir = Path(workflow_dir)
         self.log_file = self.workflow_dir / "action_log.jsonl"
@@ -229,6 +234,7 @@ class ActionLog:
         self.console_output = console_output
         self.console_colors = console_colors
         self._lock = threading.Lock()
+        self._writer = writer or get_log_writer()
         self._index: dict = {"total": 0, "by_phase": {}, "by_agent": {}, "errors": 0}
         self._ensure_dir()
         self._load_index()
@@ -239,6 +245,7 @@ class ActionLog:
 
     def _load_index(self) -> None:
         """Load index from file if it exists."""
+        self._writer.flush()  # Another instance may have a pending snapshot
         if self.index_file.exists():
             try:
                 with open(self.index_file, encoding="utf-8") as f:
@@ -279,6 +286,22 @@ class ActionLog:
                 except OSError:
                     pass
 
+    def _schedule_index_save(self) -> None:
+        """Schedule a debounced index write from a copy of the current index.
+
+        Must be called with self._lock held.
+        """
+        index = {
+            **self._index,
+            "by_phase": dict(self._index["by_phase"]),
+            "by_agent": dict(self._index["by_agent"]),
+        }
+        self._writer.schedule_snapshot(self.index_file, lambda: json.dumps(index))
+
+    def flush(self) -> None:
+        """Wait until queued entries and the index are on disk."""
+        self._writer.flush()
+
     def _update_index(self, entry: ActionEntry) -> None:
         """Update the index with a new entry."""
         self._index["total"] += 1
@@ -294,7 +317,7 @@ class ActionLog:
             self._index["errors"] += 1
 
         self._index["last_updated"] = datetime.now().isoformat()
-        self._save_index()
+        self._schedule_index_save()
 
     def _format_console(self, entry: ActionEntry) -> str:
         """Format entry for console output with colors."""
@@ -388,13 +411,10 @@ class ActionLog:
         )
 
         with self._lock:
-            # Append to log file with proper flush/sync
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry.to_dict()) + "\n")
-                f.flush()
-                os.fsync(f.fileno())
+            # Queue append; the writer batches and fsyncs per its policy
+            self._writer.append(self.log_file, json.dumps(entry.to_dict()) + "\n")
 
-            # Update index (uses atomic write internally)
+            # Update index (debounced atomic write)
             self._update_index(entry)
 
             # Console output
@@ -415,6 +435,7 @@ class ActionLog:
             List of ActionEntry objects (newest first)
         """
         entries = []
+        self.flush()
         if not self.log_file.exists():
             return entries
 
@@ -528,6 +549,7 @@ class ActionLog:
         Returns:
             List of error ActionEntry objects (newest first)
         """
+        self.flush()
         if not self.log_file.exists():
             return []
 
@@ -555,6 +577,7 @@ class ActionLog:
         Returns:
             List of ActionEntry objects for the phase (newest first)
         """
+        self.flush()
         if not self.log_file.exists():
             return []
 
@@ -574,6 +597,7 @@ class ActionLog:
         Returns:
             List of ActionEntry objects for the agent (newest first)
         """
+        self.flush()
         if not self.log_file.exists():
             return []
 
@@ -593,6 +617,7 @@ class ActionLog:
         Returns:
             List of ActionEntry objects for the task (newest first)
         """
+        self.flush()
         if not self.log_file.exists():
             return []
 
@@ -619,7 +644,9 @@ class ActionLog:
 
     def clear(self) -> None:
         """Clear the action log (for testing/reset)."""
+        self.flush()
         with self._lock:
+            self._writer.discard_snapshot(self.index_file)
             if self.log_file.exists():
                 self.log_file.unlink()
             self._index = {"total": 0, "by_phase": {}, "by_agent": {}, "errors": 0}
@@ -14,6 +14,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from .token_counter import TokenCounter, get_token_counter
+
 
 class CacheStrategy(Enum):
     """Caching strategies for different use cases."""
@@ -100,6 +102,7 @@ class PromptCache:
         strategy: CacheStrategy = CacheStrategy.EXACT,
         max_entries: int = 10000,
         default_ttl: int = DEFAULT_TTL,
+        token_counter: Optional[TokenCounter] = None,
     ):
         """Initialize prompt cache.
 
@@ -108,12 +111,14 @@ class PromptCache:
             strategy: Caching strategy to use
             max_entries: Maximum cache entries before eviction
             default_ttl: Default time-to-live in seconds
+            token_counter: Token counter (shared counter if not provided)
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.strategy = strategy
         self.max_entries = max_entries
         self.default_ttl = default_ttl
+        self.token_counter = token_counter or get_token_counter()
         self.stats = CacheStats()
         self._cache: dict[str, CacheEntry] = {}
         self._load_cache()
@@ -162,9 +167,8 @@ class PromptCache:
         return hashlib.sha256(content.encode()).hexdigest()
 
     def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count (rough approximation)."""
-        # Average ~4 chars per token for English text
-        return len(text) // 4
+        """Count tokens with the configured token counter."""
+        return self.token_counter.count(text)
 
     def _estimate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
         """Estimate cost for tokens."""
@@ -404,7 +408,7 @@ class ConversationCompressor:
         """
 
         def count_tokens(messages):
-            return sum(len(m.get("content", "")) // 4 for m in messages)
+            return sum(get_token_counter().count_many(m.get("content", "") for m in messages))
 
         original_tokens = count_tokens(original)
         compressed_tokens = count_tokens(compressed)
@@ -123,9 +123,9 @@ class CheckpointManager:
         falling back to state.json for backwards compatibility.
         """
         try:
-            from .state_projector import StateProjector
+            from .state_projector import get_state_projector
 
-            projector = StateProjector(self.project_dir)
+            projector = get_state_projector(self.project_dir)
             state = projector.get_state()
             if state is not None:
                 return state
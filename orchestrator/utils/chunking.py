@@ -6,11 +6,16 @@ Implements:
 - Selective context loading (only relevant chunks)
 """
 
+import heapq
+import math
 import re
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
+from .token_counter import TokenCounter, get_token_counter
+
 
 class ChunkStrategy(Enum):
     """Chunking strategies."""
@@ -96,6 +101,7 @@ class SemanticChunker:
         min_chunk_size: int = 100,
         max_chunk_size: int = 1000,
         overlap_tokens: int = 50,
+        token_counter: Optional[TokenCounter] = None,
     ):
         """Initialize chunker.
 
@@ -104,15 +110,17 @@ class SemanticChunker:
             min_chunk_size: Minimum chunk size
             max_chunk_size: Maximum chunk size
             overlap_tokens: Overlap between chunks for context
+            token_counter: Token counter (shared counter if not provided)
         """
         self.target_chunk_size = target_chunk_size
         self.min_chunk_size = min_chunk_size
         self.max_chunk_size = max_chunk_size
         self.overlap_tokens = overlap_tokens
+        self.token_counter = token_counter or get_token_counter()
 
     def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count (~4 chars per token for English)."""
-        return len(text) // 4
+        """Count tokens with the configured token counter."""
+        return self.token_counter.count(text)
 
     def chunk(
         self,
@@ -179,6 +187,8 @@ class SemanticChunker:
         sentences = self.SENTENCE_END.split(text)
         chunks = []
         current_content = ""
+        # Running sum of piece counts, so packing never re-counts the chunk
+        current_tokens = 0
         current_start = 0
         index = 0
         char_pos = 0
@@ -191,7 +201,7 @@ class SemanticChunker:
             sentence_tokens = self._estimate_tokens(sentence)
 
             # If adding this sentence exceeds max, start new chunk
-            if self._estimate_tokens(current_content + " " + sentence) > self.max_chunk_size:
+            if current_tokens + sentence_tokens > self.max_chunk_size:
                 if current_content:
                     chunks.append(
                         Chunk(
@@ -205,9 +215,11 @@ class SemanticChunker:
                     index += 1
 
                 current_content = sentence
+                current_tokens = sentence_tokens
                 current_start = char_pos
             else:
                 current_content += " " + sentence if current_content else sentence
+                current_tokens += sentence_tokens
 
             char_pos += len(sentence) + 1
 
@@ -230,6 +242,7 @@ class SemanticChunker:
         paragraphs = self.PARAGRAPH_BREAK.split(text)
         chunks = []
         current_content = ""
+        current_tokens = 0
         current_start = 0
         index = 0
         char_pos = 0
@@ -255,6 +268,7 @@ class SemanticChunker:
                     )
                     index += 1
                     current_content = ""
+                    current_tokens = 0
                     current_start = char_pos
 
                 # Split large paragraph by sentences
@@ -266,7 +280,7 @@ class SemanticChunker:
                     chunks.append(sub)
                     index += 1
 
-            elif self._estimate_tokens(current_content + "\n\n" + para) > self.max_chunk_size:
+            elif current_tokens + para_tokens > self.max_chunk_size:
                 if current_content:
                     chunks.append(
                         Chunk(
@@ -280,9 +294,11 @@ class SemanticChunker:
                     index += 1
 
                 current_content = para
+                current_tokens = para_tokens
                 current_start = char_pos
             else:
                 current_content += "\n\n" + para if current_content else para
+                current_tokens += para_tokens
 
             char_pos += len(para) + 2
 
@@ -425,13 +441,41 @@ class SemanticChunker:
         return min(1.0, score)
 
 
+_TERM_PATTERN = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split text into lowercase word terms."""
+    return _TERM_PATTERN.findall(text.lower())
+
+
+@dataclass
+class _DocumentIndex:
+    """Postings for one indexed document."""
+
+    # term -> [(chunk position, term frequency), ...]
+    postings: dict[str, list[tuple[int, int]]]
+    # Per chunk: term count and lowercased heading
+    lengths: list[int]
+    headings: list[str]
+
+
 class SelectiveContextLoader:
     """Loads only relevant context chunks based on query.
 
     Instead of loading entire documents into context,
     selects and prioritizes relevant chunks.
+
+    Documents are tokenized once at index time into a postings index, and
+    queries are ranked with BM25 (scaled by chunk importance and boosted on
+    heading matches), so a query only touches chunks containing its terms.
     """
 
+    # BM25 term frequency saturation and length normalization
+    BM25_K1 = 1.5
+    BM25_B = 0.75
+    HEADING_BOOST = 1.5
+
     def __init__(self, chunker: Optional[SemanticChunker] = None):
         """Initialize loader.
 
@@ -440,10 +484,17 @@ class SelectiveContextLoader:
         """
         self.chunker = chunker or SemanticChunker()
         self._document_chunks: dict[str, ChunkingResult] = {}
+        self._indexes: dict[str, _DocumentIndex] = {}
+        # Corpus statistics across all documents
+        self._doc_freq: dict[str, int] = {}
+        self._chunk_count = 0
+        self._total_length = 0
 
     def index_document(self, doc_id: str, content: str) -> ChunkingResult:
         """Index a document for selective loading.
 
+        Re-indexing a doc_id replaces its previous content.
+
         Args:
             doc_id: Unique document identifier
             content: Document content
@@ -452,9 +503,48 @@ class SelectiveContextLoader:
             ChunkingResult
         """
         result = self.chunker.chunk(content, ChunkStrategy.SEMANTIC)
+        self.remove_document(doc_id)
+
+        postings: dict[str, list[tuple[int, int]]] = {}
+        lengths = []
+        headings = []
+        for position, chunk in enumerate(result.chunks):
+            terms = _tokenize(chunk.content)
+            for term, tf in Counter(terms).items():
+                postings.setdefault(term, []).append((position, tf))
+            lengths.append(len(terms))
+            headings.append(chunk.heading.lower() if chunk.heading else "")
+
+        for term, entries in postings.items():
+            self._doc_freq[term] = self._doc_freq.get(term, 0) + len(entries)
+        self._chunk_count += len(lengths)
+        self._total_length += sum(lengths)
+
         self._document_chunks[doc_id] = result
+        self._indexes[doc_id] = _DocumentIndex(postings, lengths, headings)
         return result
 
+    def remove_document(self, doc_id: str) -> bool:
+        """Remove a document from the index.
+
+        Returns:
+            True if the document was indexed
+        """
+        index = self._indexes.pop(doc_id, None)
+        self._document_chunks.pop(doc_id, None)
+        if index is None:
+            return False
+
+        for term, entries in index.postings.items():
+            remaining = self._doc_freq[term] - len(entries)
+            if remaining:
+                self._doc_freq[term] = remaining
+            else:
+                del self._doc_freq[term]
+        self._chunk_count -= len(index.lengths)
+        self._total_length -= sum(index.lengths)
+        return True
+
     def select_context(
         self,
         query: str,
@@ -472,28 +562,24 @@ class SelectiveContextLoader:
             Selected context string
         """
         doc_ids = doc_ids or list(self._document_chunks.keys())
-        query_lower = query.lower()
-        query_terms = set(query_lower.split())
+        query_terms = set(_tokenize(query))
 
-        # Score all chunks
+        # Score chunks containing at least one query term
         scored_chunks = []
         for doc_id in doc_ids:
-            if doc_id not in self._document_chunks:
-                continue
-
-            for chunk in self._document_chunks[doc_id].chunks:
-                score = self._score_relevance(chunk, query_terms)
-                if score > 0:
-                    scored_chunks.append((chunk, score, doc_id))
-
-        # Sort by score
-        scored_chunks.sort(key=lambda x: -x[1])
-
-        # Select chunks within budget
+            for position, score in self._score_document(doc_id, query_terms).items():
+                chunk = self._document_chunks[doc_id].chunks[position]
+                # Ties keep document/chunk order
+                scored_chunks.append((-score, len(scored_chunks), chunk, doc_id))
+
+        # Pop best chunks until the budget is exhausted or nothing else fits
+        heapq.heapify(scored_chunks)
+        smallest = min((entry[2].token_estimate for entry in scored_chunks), default=0)
         selected = []
         total_tokens = 0
 
-        for chunk, score, doc_id in scored_chunks:
+        while scored_chunks and token_budget - total_tokens >= smallest:
+            _, _, chunk, doc_id = heapq.heappop(scored_chunks)
             if total_tokens + chunk.token_estimate > token_budget:
                 continue
 
@@ -512,29 +598,44 @@ class SelectiveContextLoader:
 
         return "\n\n---\n\n".join(context_parts)
 
-    def _score_relevance(self, chunk: Chunk, query_terms: set[str]) -> float:
-        """Score chunk relevance to query terms."""
-        content_lower = chunk.content.lower()
-        content_terms = set(content_lower.split())
-
-        # Term overlap
-        overlap = len(query_terms & content_terms)
-        if overlap == 0:
-            return 0.0
+    def _score_document(self, doc_id: str, query_terms: set[str]) -> dict[int, float]:
+        """Score a document's chunks against query terms.
 
-        # Base score from overlap
-        score = overlap / len(query_terms)
+        Returns:
+            Mapping of chunk position to score, for chunks with any match
+        """
+        index = self._indexes.get(doc_id)
+        if index is None or not query_terms:
+            return {}
+
+        avg_length = self._total_length / self._chunk_count if self._chunk_count else 0.0
+        k1 = self.BM25_K1
+        b = self.BM25_B
+
+        scores: dict[int, float] = {}
+        for term in query_terms:
+            entries = index.postings.get(term)
+            if not entries:
+                continue
+            df = self._doc_freq[term]
+            idf = math.log(1 + (self._chunk_count - df + 0.5) / (df + 0.5))
+            for position, tf in entries:
+                norm = 1 - b + b * index.lengths[position] / avg_length if avg_length else 1.0
+                scores[position] = scores.get(position, 0.0) + idf * tf * (k1 + 1) / (
+                    tf + k1 * norm
+                )
 
-        # Boost by chunk importance
-        score *= chunk.importance
+        chunks = self._document_chunks[doc_id].chunks
+        for position in scores:
+            # Boost by chunk importance
+            scores[position] *= chunks[position].importance
 
-        # Boost if terms appear in heading
-        if chunk.heading:
-            heading_lower = chunk.heading.lower()
-            if any(term in heading_lower for term in query_terms):
-                score *= 1.5
+            # Boost if terms appear in heading
+            heading = index.headings[position]
+            if heading and any(term in heading for term in query_terms):
+                scores[position] *= self.HEADING_BOOST
 
-        return score
+        return scores
 
     def get_document_summary(self, doc_id: str) -> Optional[dict]:
         """Get summary of indexed document.
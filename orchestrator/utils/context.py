@@ -15,6 +15,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from .fingerprint import FileFingerprint, get_fingerprinter
+
 
 class CheckpointTrigger(Enum):
     """Triggers for creating checkpoints."""
@@ -163,6 +165,7 @@ class ContextManager:
         """
         self.project_dir = Path(project_dir)
         self._tracked_files = self.TRACKED_FILES.copy()
+        self._fingerprinter = get_fingerprinter(self.project_dir)
 
         # Auto-discover documents
         self._discover_documents()
@@ -217,22 +220,17 @@ class ContextManager:
         self._tracked_files.pop(key, None)
 
     def compute_checksum(self, file_path: Path) -> str:
-        """Compute SHA-256 checksum of a file.
+        """Compute the checksum of a file.
+
+        Unchanged files (same inode, mtime and size) reuse the cached digest.
 
         Args:
             file_path: Absolute path to the file
 
         Returns:
-            Hexadecimal checksum string
+            Hexadecimal checksum string (SHA-256 by default)
         """
-        if not file_path.exists():
-            return ""
-
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return self._fingerprinter.digest(file_path) or ""
 
     def get_file_info(self, file_path: Path) -> Optional[FileChecksum]:
         """Get checksum information for a file.
@@ -243,28 +241,40 @@ class ContextManager:
         Returns:
             FileChecksum if file exists, None otherwise
         """
-        if not file_path.exists():
+        fingerprint = self._fingerprinter.fingerprint(file_path)
+        self._fingerprinter.save()
+        return self._to_checksum(file_path, fingerprint)
+
+    def _to_checksum(
+        self, file_path: Path, fingerprint: Optional[FileFingerprint]
+    ) -> Optional[FileChecksum]:
+        if fingerprint is None:
             return None
-
-        stat = file_path.stat()
         return FileChecksum(
             path=str(file_path.relative_to(self.project_dir)),
-            checksum=self.compute_checksum(file_path),
-            last_modified=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            size=stat.st_size,
+            checksum=fingerprint.digest,
+            last_modified=datetime.fromtimestamp(fingerprint.mtime).isoformat(),
+            size=fingerprint.size,
         )
 
     def capture_context(self) -> ContextState:
         """Capture current state of all tracked files.
 
+        Only files whose stat changed since they were last hashed are read;
+        those are hashed in parallel.
+
         Returns:
             ContextState with checksums of all tracked files
         """
         context = ContextState()
 
-        for key, rel_path in self._tracked_files.items():
-            file_path = self.project_dir / rel_path
-            file_info = self.get_file_info(file_path)
+        keys = list(self._tracked_files)
+        paths = [self.project_dir / self._tracked_files[key] for key in keys]
+        fingerprints = self._fingerprinter.fingerprint_many(paths)
+        self._fingerprinter.save()
+
+        for key, file_path, fingerprint in zip(keys, paths, fingerprints, strict=True):
+            file_info = self._to_checksum(file_path, fingerprint)
             if file_info:
                 context.files[key] = file_info
 
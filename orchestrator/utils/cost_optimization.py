@@ -6,8 +6,12 @@ Implements:
 - Cost forecasting and reporting
 """
 
+import copy
 import json
 import logging
+import os
+import threading
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -177,6 +181,41 @@ class UsageSummary:
         return asdict(self)
 
 
+@dataclass
+class UsageRollup:
+    """Aggregated token usage for one rollup bucket."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+    calls: int = 0
+
+    def add(self, input_tokens: int, output_tokens: int, cost: float, calls: int = 1) -> None:
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.cost += cost
+        self.calls += calls
+
+    def merge(self, other: "UsageRollup") -> None:
+        self.add(other.input_tokens, other.output_tokens, other.cost, other.calls)
+
+    @property
+    def tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# Rollup cell key within an hour: (model, phase, task_type)
+CellKey = tuple[str, Optional[int], str]
+
+
+def _hour_key(moment: datetime) -> str:
+    """Hour bucket key, matching the first 13 characters of an ISO timestamp."""
+    return moment.strftime("%Y-%m-%dT%H")
+
+
 class TokenTracker:
     """Tracks token usage across the workflow.
 
@@ -185,48 +224,191 @@ class TokenTracker:
     - Aggregated statistics
     - Budget enforcement
     - Cost forecasting
+
+    Each call is appended as one line to ``token_usage.jsonl``. Totals and
+    per-hour rollups keyed by model, phase and task type are maintained
+    incrementally, so budget checks are O(1) and summaries are O(buckets).
+    The rollups are snapshotted to ``token_usage.json`` every
+    ``snapshot_interval`` records together with the log offset they cover;
+    on startup only the log tail after that offset is replayed. Individual
+    records are only read back from the log on request (``iter_usage``) or
+    for the partial hours at the edges of a ``since``/``until`` window.
     """
 
+    LOG_FILE = "token_usage.jsonl"
+    SNAPSHOT_FILE = "token_usage.json"
+    SNAPSHOT_VERSION = 2
+
     def __init__(
         self,
         storage_dir: str | Path,
         budget_limit: Optional[float] = None,
+        snapshot_interval: int = 100,
     ):
         """Initialize token tracker.
 
         Args:
             storage_dir: Directory to store usage data
             budget_limit: Optional budget limit in dollars
+            snapshot_interval: Records between rollup snapshots
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.budget_limit = budget_limit
-        self._usage_log: list[TokenUsage] = []
+        self.snapshot_interval = snapshot_interval
+        self._lock = threading.Lock()
+        self._reset_rollups()
         self._load_usage()
 
+    def _reset_rollups(self) -> None:
+        self._totals = UsageRollup()
+        self._hours: dict[str, dict[CellKey, UsageRollup]] = {}
+        self._days: dict[str, UsageRollup] = {}
+        # hour -> [first byte offset, end byte offset] of its log lines
+        self._hour_spans: dict[str, list[int]] = {}
+        self._log_offset = 0
+        self._unsnapshotted = 0
+
     def _get_usage_file(self) -> Path:
-        return self.storage_dir / "token_usage.json"
+        return self.storage_dir / self.LOG_FILE
+
+    def _get_snapshot_file(self) -> Path:
+        return self.storage_dir / self.SNAPSHOT_FILE
 
     def _load_usage(self) -> None:
-        """Load usage history from disk."""
-        usage_file = self._get_usage_file()
-        if usage_file.exists():
+        """Restore rollups from the snapshot and replay the log tail."""
+        data = self._read_snapshot()
+        log_file = self._get_usage_file()
+
+        if isinstance(data.get("usage"), list) and not log_file.exists():
+            self._migrate_legacy(data["usage"])
+            return
+
+        try:
+            log_size = log_file.stat().st_size
+        except OSError:
+            log_size = 0
+        if data.get("version") == self.SNAPSHOT_VERSION and data.get("log_offset", 0) <= log_size:
+            self._restore_snapshot(data)
+
+        self._replay_log()
+
+    def _read_snapshot(self) -> dict:
+        try:
+            with open(self._get_snapshot_file()) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _restore_snapshot(self, data: dict) -> None:
+        try:
+            for hour, cells in data["hours"].items():
+                for model, phase, task_type, input_tokens, output_tokens, cost, calls in cells:
+                    self._add_to_rollups(
+                        hour, (model, phase, task_type), input_tokens, output_tokens, cost, calls
+                    )
+            self._hour_spans = {hour: list(span) for hour, span in data["spans"].items()}
+            self._log_offset = int(data["log_offset"])
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Invalid token usage snapshot, rebuilding from log")
+            self._reset_rollups()
+
+    def _replay_log(self) -> None:
+        """Apply log lines written after the snapshot."""
+        log_file = self._get_usage_file()
+        if not log_file.exists():
+            return
+        with open(log_file, "rb+") as f:
+            f.seek(self._log_offset)
+            offset = self._log_offset
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Torn write from a crash; drop it so appends stay line-aligned
+                    f.truncate(offset)
+                    break
+                try:
+                    usage = TokenUsage.from_dict(json.loads(line))
+                except (json.JSONDecodeError, TypeError, UnicodeDecodeError):
+                    logger.warning(f"Skipping invalid token usage record at offset {offset}")
+                else:
+                    self._apply(usage, offset, offset + len(line))
+                offset += len(line)
+                self._unsnapshotted += 1
+            self._log_offset = offset
+
+    def _migrate_legacy(self, entries: list[dict]) -> None:
+        """Convert a pre-rollup ``{"usage": [...]}`` file into the log."""
+        lines = []
+        for entry in entries:
             try:
-                with open(usage_file) as f:
-                    data = json.load(f)
-                self._usage_log = [TokenUsage.from_dict(u) for u in data.get("usage", [])]
-            except (json.JSONDecodeError, KeyError):
-                self._usage_log = []
-
-    def _save_usage(self) -> None:
-        """Persist usage to disk."""
-        usage_file = self._get_usage_file()
+                lines.append(json.dumps(TokenUsage.from_dict(entry).to_dict()) + "\n")
+            except TypeError:
+                continue
+        with open(self._get_usage_file(), "w") as f:
+            f.writelines(lines)
+        self._replay_log()
+        self._save_snapshot()
+        logger.info(f"Migrated {len(lines)} token usage records to {self.LOG_FILE}")
+
+    def _add_to_rollups(
+        self,
+        hour: str,
+        key: CellKey,
+        input_tokens: int,
+        output_tokens: int,
+        cost: float,
+        calls: int = 1,
+    ) -> None:
+        cells = self._hours.setdefault(hour, {})
+        cell = cells.get(key)
+        if cell is None:
+            cell = cells[key] = UsageRollup()
+        cell.add(input_tokens, output_tokens, cost, calls)
+        self._days.setdefault(hour[:10], UsageRollup()).add(
+            input_tokens, output_tokens, cost, calls
+        )
+        self._totals.add(input_tokens, output_tokens, cost, calls)
+
+    def _apply(self, usage: TokenUsage, start: int, end: int) -> None:
+        hour = usage.timestamp[:13]
+        self._add_to_rollups(
+            hour,
+            (usage.model, usage.phase, usage.task_type),
+            usage.input_tokens,
+            usage.output_tokens,
+            usage.cost,
+        )
+        span = self._hour_spans.get(hour)
+        if span is None:
+            self._hour_spans[hour] = [start, end]
+        else:
+            span[0] = min(span[0], start)
+            span[1] = max(span[1], end)
+
+    def _save_snapshot(self) -> None:
+        """Persist rollups and the log offset they cover, atomically."""
         data = {
-            "usage": [u.to_dict() for u in self._usage_log],
+            "version": self.SNAPSHOT_VERSION,
+            "log_offset": self._log_offset,
+            "hours": {
+                hour: [
+                    [*key, c.input_tokens, c.output_tokens, c.cost, c.calls]
+                    for key, c in cells.items()
+                ]
+                for hour, cells in self._hours.items()
+            },
+            "spans": self._hour_spans,
             "saved_at": datetime.now().isoformat(),
         }
-        with open(usage_file, "w") as f:
-            json.dump(data, f, indent=2)
+        snapshot_file = self._get_snapshot_file()
+        tmp_path = snapshot_file.with_suffix(".json.tmp")
+        try:
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, snapshot_file)
+            self._unsnapshotted = 0
+        except OSError as e:
+            logger.warning(f"Failed to save token usage snapshot: {e}")
 
     def record(
         self,
@@ -255,9 +437,20 @@ class TokenTracker:
             task_type=task_type,
             phase=phase,
         )
-
-        self._usage_log.append(usage)
-        self._save_usage()
+        line = (json.dumps(usage.to_dict()) + "\n").encode()
+
+        with self._lock:
+            with open(self._get_usage_file(), "ab") as f:
+                start = f.tell()
+                f.write(line)
+            self._log_offset = start + len(line)
+            self._apply(usage, start, self._log_offset)
+            self._unsnapshotted += 1
+            if (
+                self._unsnapshotted >= self.snapshot_interval
+                or not self._get_snapshot_file().exists()
+            ):
+                self._save_snapshot()
 
         logger.info(
             f"Token usage: {model} - {input_tokens}in/{output_tokens}out = ${usage.cost:.4f}"
@@ -265,6 +458,94 @@ class TokenTracker:
 
         return usage
 
+    def flush(self) -> None:
+        """Snapshot rollups now so the next startup replays nothing."""
+        with self._lock:
+            if self._unsnapshotted:
+                self._save_snapshot()
+
+    def iter_usage(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[TokenUsage]:
+        """Stream individual usage records from the log.
+
+        Args:
+            since: Only yield usage at or after this time
+            until: Only yield usage at or before this time
+
+        Yields:
+            TokenUsage records in the order they were recorded
+        """
+        yield from self._read_range(0, None, since, until)
+
+    def _read_range(
+        self,
+        start: int,
+        end: Optional[int],
+        since: Optional[datetime],
+        until: Optional[datetime],
+        hour: Optional[str] = None,
+    ) -> Iterator[TokenUsage]:
+        try:
+            f = open(self._get_usage_file(), "rb")
+        except OSError:
+            return
+        with f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if end is not None and offset >= end:
+                    break
+                offset += len(line)
+                try:
+                    usage = TokenUsage.from_dict(json.loads(line))
+                except (json.JSONDecodeError, TypeError, UnicodeDecodeError):
+                    continue
+                if hour is not None and usage.timestamp[:13] != hour:
+                    continue
+                moment = datetime.fromisoformat(usage.timestamp)
+                if since is not None and moment < since:
+                    continue
+                if until is not None and moment > until:
+                    continue
+                yield usage
+
+    def _rollups_between(
+        self,
+        since: Optional[datetime],
+        until: Optional[datetime],
+    ) -> Iterator[tuple[CellKey, UsageRollup]]:
+        """Yield rollup cells covering a period.
+
+        Whole hours inside the period come from the rollups; the hours
+        containing ``since`` and ``until`` are filtered exactly from the log.
+        """
+        since_hour = _hour_key(since) if since else None
+        until_hour = _hour_key(until) if until else None
+
+        with self._lock:
+            edges: list[tuple[str, int, Optional[int]]] = []
+            selected: list[tuple[CellKey, UsageRollup]] = []
+            for hour, cells in self._hours.items():
+                if (since_hour and hour < since_hour) or (until_hour and hour > until_hour):
+                    continue
+                if hour == since_hour or hour == until_hour:
+                    span = self._hour_spans.get(hour)
+                    # Without a recorded span the hour is read from the start
+                    edges.append((hour, span[0], span[1]) if span else (hour, 0, None))
+                else:
+                    selected.extend((key, copy.copy(cell)) for key, cell in cells.items())
+
+        yield from selected
+        for hour, start, end in edges:
+            for usage in self._read_range(start, end, since, until, hour=hour):
+                yield (
+                    (usage.model, usage.phase, usage.task_type),
+                    UsageRollup(usage.input_tokens, usage.output_tokens, usage.cost, 1),
+                )
+
     def get_total_cost(self, since: Optional[datetime] = None) -> float:
         """Get total cost, optionally filtered by time.
 
@@ -275,9 +556,9 @@ class TokenTracker:
             Total cost in dollars
         """
         if since is None:
-            return sum(u.cost for u in self._usage_log)
+            return self._totals.cost
 
-        return sum(u.cost for u in self._usage_log if datetime.fromisoformat(u.timestamp) >= since)
+        return sum(cell.cost for _, cell in self._rollups_between(since, None))
 
     def check_budget(self, estimated_cost: float = 0.0) -> tuple[bool, float]:
         """Check if within budget.
@@ -296,6 +577,21 @@ class TokenTracker:
 
         return (total + estimated_cost) <= self.budget_limit, remaining
 
+    def get_daily_usage(self) -> dict[str, UsageRollup]:
+        """Get usage rolled up per day (``YYYY-MM-DD``)."""
+        with self._lock:
+            return {day: copy.copy(rollup) for day, rollup in sorted(self._days.items())}
+
+    def get_hourly_usage(self) -> dict[str, UsageRollup]:
+        """Get usage rolled up per hour (``YYYY-MM-DDTHH``)."""
+        with self._lock:
+            hourly = {}
+            for hour, cells in sorted(self._hours.items()):
+                rollup = hourly[hour] = UsageRollup()
+                for cell in cells.values():
+                    rollup.merge(cell)
+            return hourly
+
     def get_summary(
         self,
         since: Optional[datetime] = None,
@@ -310,48 +606,26 @@ class TokenTracker:
         Returns:
             UsageSummary with aggregated statistics
         """
-        filtered = self._usage_log
-
-        if since:
-            filtered = [u for u in filtered if datetime.fromisoformat(u.timestamp) >= since]
-        if until:
-            filtered = [u for u in filtered if datetime.fromisoformat(u.timestamp) <= until]
-
         summary = UsageSummary(
             period_start=since.isoformat() if since else None,
             period_end=until.isoformat() if until else None,
         )
 
-        for usage in filtered:
-            summary.total_input_tokens += usage.input_tokens
-            summary.total_output_tokens += usage.output_tokens
-            summary.total_cost += usage.cost
-            summary.total_calls += 1
-
-            # By model
-            if usage.model not in summary.by_model:
-                summary.by_model[usage.model] = {"tokens": 0, "cost": 0.0, "calls": 0}
-            summary.by_model[usage.model]["tokens"] += usage.input_tokens + usage.output_tokens
-            summary.by_model[usage.model]["cost"] += usage.cost
-            summary.by_model[usage.model]["calls"] += 1
-
-            # By phase
-            if usage.phase is not None:
-                phase_key = str(usage.phase)
-                if phase_key not in summary.by_phase:
-                    summary.by_phase[phase_key] = {"tokens": 0, "cost": 0.0, "calls": 0}
-                summary.by_phase[phase_key]["tokens"] += usage.input_tokens + usage.output_tokens
-                summary.by_phase[phase_key]["cost"] += usage.cost
-                summary.by_phase[phase_key]["calls"] += 1
-
-            # By task type
-            if usage.task_type not in summary.by_task_type:
-                summary.by_task_type[usage.task_type] = {"tokens": 0, "cost": 0.0, "calls": 0}
-            summary.by_task_type[usage.task_type]["tokens"] += (
-                usage.input_tokens + usage.output_tokens
-            )
-            summary.by_task_type[usage.task_type]["cost"] += usage.cost
-            summary.by_task_type[usage.task_type]["calls"] += 1
+        for (model, phase, task_type), cell in self._rollups_between(since, until):
+            summary.total_input_tokens += cell.input_tokens
+            summary.total_output_tokens += cell.output_tokens
+            summary.total_cost += cell.cost
+            summary.total_calls += cell.calls
+
+            groups = [(summary.by_model, model), (summary.by_task_type, task_type)]
+            if phase is not None:
+                groups.append((summary.by_phase, str(phase)))
+            for group, key in groups:
+                if key not in group:
+                    group[key] = {"tokens": 0, "cost": 0.0, "calls": 0}
+                group[key]["tokens"] += cell.tokens
+                group[key]["cost"] += cell.cost
+                group[key]["calls"] += cell.calls
 
         return summary
 
@@ -13,6 +13,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from .log_writer import LogWriter, get_log_writer
+
 
 class ErrorSource(str, Enum):
     """Source of the error."""
@@ -145,7 +147,8 @@ class ErrorAggregator:
     """Aggregates errors from multiple sources.
 
     Provides deduplication, categorization, and a unified view
-    of all errors in the workflow.
+    of all errors in the workflow. The error log and unresolved snapshot
+    are persisted by the shared background LogWriter.
     """
 
     # Maximum unresolved errors to keep in memory
@@ -153,12 +156,18 @@ class ErrorAggregator:
     # Percentage to prune when limit reached
     PRUNE_PERCENTAGE = 0.25
 
-    def __init__(self, workflow_dir: str | Path, max_unresolved: int = None):
+    def __init__(
+        self,
+        workflow_dir: str | Path,
+        max_unresolved: int = None,
+        writer: Optional[LogWriter] = None,
+    ):
         """Initialize the error aggregator.
 
         Args:
             workflow_dir: Directory for error storage
             max_unresolved: Maximum unresolved errors to keep (default 500)
+            writer: Background writer (shared process writer if None)
         """
         self.workflow_dir = Path(workflow_dir)
         self.errors_dir = self.workflow_dir / "errors"
@@ -166,6 +175,7 @@ class ErrorAggregator:
         self.unresolved_file = self.errors_dir / "unresolved.json"
         self.max_unresolved = max_unresolved or self.MAX_UNRESOLVED
         self._lock = threading.Lock()
+        self._writer = writer or get_log_writer()
         self._unresolved: dict[str, AggregatedError] = {}
         self._fingerprints: dict[str, str] = {}  # fingerprint -> error_id
         self._ensure_dir()
@@ -177,6 +187,7 @@ class ErrorAggregator:
 
     def _load_unresolved(self) -> None:
         """Load unresolved errors from file."""
+        self._writer.flush()  # Another instance may have a pending snapshot
         if self.unresolved_file.exists():
             try:
                 with open(self.unresolved_file, encoding="utf-8") as f:
@@ -189,14 +200,29 @@ class ErrorAggregator:
                 pass
 
     def _save_unresolved(self) -> None:
-        """Save unresolved errors to file."""
-        data = {
-            "errors": {k: v.to_dict() for k, v in self._unresolved.items()},
-            "fingerprints": self._fingerprints,
-            "updated_at": datetime.now().isoformat(),
-        }
-        with open(self.unresolved_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        """Schedule a debounced write of the unresolved errors snapshot.
+
+        Must be called with self._lock held; the snapshot is rendered on the
+        writer thread from shallow copies taken here.
+        """
+        errors = dict(self._unresolved)
+        fingerprints = dict(self._fingerprints)
+        updated_at = datetime.now().isoformat()
+
+        def render() -> str:
+            return json.dumps(
+                {
+                    "errors": {k: v.to_dict() for k, v in errors.items()},
+                    "fingerprints": fingerprints,
+                    "updated_at": updated_at,
+                }
+            )
+
+        self._writer.schedule_snapshot(self.unresolved_file, render)
+
+    def flush(self) -> None:
+        """Wait until the error log and unresolved snapshot are on disk."""
+        self._writer.flush()
 
     def _prune_old_errors(self) -> int:
         """Prune oldest errors when limit reached.
@@ -339,8 +365,7 @@ class ErrorAggregator:
             self._fingerprints[fingerprint] = error_id
 
             # Append to all errors log
-            with open(self.all_errors_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(error.to_dict()) + "\n")
+            self._writer.append(self.all_errors_file, json.dumps(error.to_dict()) + "\n")
 
             self._save_unresolved()
             return error
@@ -368,10 +393,9 @@ class ErrorAggregator:
             self._fingerprints.pop(fingerprint, None)
 
             # Update the all errors log entry
-            with open(self.all_errors_file, "a", encoding="utf-8") as f:
-                resolved_entry = error.to_dict()
-                resolved_entry["_resolved"] = True
-                f.write(json.dumps(resolved_entry) + "\n")
+            resolved_entry = error.to_dict()
+            resolved_entry["_resolved"] = True
+            self._writer.append(self.all_errors_file, json.dumps(resolved_entry) + "\n")
 
             self._save_unresolved()
             return error
@@ -425,6 +449,7 @@ class ErrorAggregator:
             List of errors (newest first, excluding resolution entries)
         """
         errors = []
+        self.flush()
         if not self.all_errors_file.exists():
             return errors
 
@@ -483,6 +508,7 @@ class ErrorAggregator:
         Returns:
             Number of new errors collected
         """
+        self.flush()  # The action log may have queued entries
         if not action_log_file.exists():
             return 0
 
@@ -626,6 +652,7 @@ class ErrorAggregator:
 
     def clear(self) -> None:
         """Clear all errors (for testing/reset)."""
+        self.flush()
         with self._lock:
             self._unresolved = {}
             self._fingerprints = {}
@@ -0,0 +1,291 @@
+"""Stat-first file fingerprints with a persisted digest cache.
+
+Drift checks run at every phase boundary and on resume, and most of the time
+nothing has changed. ``FileFingerprinter`` therefore stats files first and
+only hashes a file when its (inode, mtime_ns, size) differs from the cached
+entry:
+
+- Digests are cached per path with the stat they were computed from and
+  persisted to ``.workflow/fingerprints.json``, so a new process (resume)
+  also skips unchanged files.
+- Entries whose mtime is within ``RACY_WINDOW_NS`` of the time they were
+  hashed are not trusted, because a same-size write in the same timestamp
+  tick would be invisible to stat. They are re-hashed on the next lookup.
+- Small files are read in large buffers, big files are hashed from an mmap,
+  and when many files need hashing they are hashed on a thread pool
+  (hashlib releases the GIL).
+
+The hash defaults to SHA-256 so digests match previously stored checksums.
+Any ``hashlib`` algorithm can be chosen, e.g. ``blake2b``, which is faster on
+CPUs without SHA extensions, with the ``ORCHESTRATOR_FINGERPRINT_HASH``
+environment variable. Changing it makes stored checksums differ once.
+
+Usage:
+    fingerprinter = get_fingerprinter(project_dir)
+    fingerprint = fingerprinter.fingerprint(path)
+    fingerprints = fingerprinter.fingerprint_many(paths)
+    fingerprinter.save()
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import stat
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, cast
+
+logger = logging.getLogger(__name__)
+
+HASH_ALGORITHM_ENV = "ORCHESTRATOR_FINGERPRINT_HASH"
+DEFAULT_ALGORITHM = "sha256"
+
+CACHE_FILE = ".workflow/fingerprints.json"
+CACHE_VERSION = 1
+MAX_CACHE_ENTRIES = 10000
+
+READ_BUFFER_SIZE = 1024 * 1024
+MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# Hash on a thread pool when at least this many files changed
+PARALLEL_MIN_FILES = 4
+MAX_HASH_WORKERS = 8
+
+# Digests of files modified this close to hashing time are re-checked
+RACY_WINDOW_NS = 1_000_000_000
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Digest of a regular file and the stat it was computed from."""
+
+    path: str
+    digest: str
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @property
+    def mtime(self) -> float:
+        return self.mtime_ns / 1e9
+
+
+def hash_file(path: str | Path, algorithm: str = DEFAULT_ALGORITHM) -> str:
+    """Hash a file's contents.
+
+    Args:
+        path: File to hash
+        algorithm: Any ``hashlib`` algorithm name
+
+    Returns:
+        Hexadecimal digest
+    """
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        else:
+            for block in iter(lambda: f.read(READ_BUFFER_SIZE), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int, int]:
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class FileFingerprinter:
+    """Fingerprints files, hashing only those whose stat changed.
+
+    Thread-safe. Entries are stored as
+    ``path -> [inode, mtime_ns, size, digest, hashed_at_ns]``.
+    """
+
+    def __init__(
+        self,
+        cache_file: Optional[Path] = None,
+        algorithm: Optional[str] = None,
+        max_workers: int = MAX_HASH_WORKERS,
+    ):
+        """Initialize the fingerprinter.
+
+        Args:
+            cache_file: JSON file persisting digests (in-memory only if None)
+            algorithm: Hash algorithm (defaults to ``ORCHESTRATOR_FINGERPRINT_HASH``
+                or SHA-256)
+            max_workers: Threads used to hash many changed files
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.algorithm = algorithm or os.environ.get(HASH_ALGORITHM_ENV) or DEFAULT_ALGORITHM
+        hashlib.new(self.algorithm)  # Fail fast on unknown algorithms
+        self.max_workers = max_workers
+        self._entries: dict[str, list] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hashed = 0
+        self.reused = 0
+        self._load()
+
+    def _load(self) -> None:
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable fingerprint cache {self.cache_file}: {e}")
+            return
+        if data.get("version") == CACHE_VERSION and data.get("algorithm") == self.algorithm:
+            self._entries = data.get("entries", {})
+
+    def save(self) -> None:
+        """Persist the cache if it changed (atomic replace)."""
+        if self.cache_file is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            if len(self._entries) > MAX_CACHE_ENTRIES:
+                newest = sorted(self._entries.items(), key=lambda item: item[1][4])
+                self._entries = dict(newest[-MAX_CACHE_ENTRIES:])
+            payload = json.dumps(
+                {"version": CACHE_VERSION, "algorithm": self.algorithm, "entries": self._entries}
+            )
+            self._dirty = False
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_name(f".{self.cache_file.name}.tmp")
+            tmp_path.write_text(payload)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to save fingerprint cache: {e}")
+
+    def _cached(self, key: str, st: os.stat_result) -> Optional[str]:
+        # Caller holds self._lock
+        entry = self._entries.get(key)
+        if entry is None or tuple(entry[:3]) != _stat_key(st):
+            return None
+        if st.st_mtime_ns >= entry[4] - RACY_WINDOW_NS:
+            return None
+        return cast(str, entry[3])
+
+    def _hash(self, key: str, st: os.stat_result) -> Optional[str]:
+        hashed_at = time.time_ns()
+        try:
+            digest = hash_file(key, self.algorithm)
+            after = os.stat(key)
+        except OSError:
+            return None
+        with self._lock:
+            self.hashed += 1
+            # Don't cache a digest of a file that changed while it was read
+            if _stat_key(after) == _stat_key(st):
+                self._entries[key] = [*_stat_key(st), digest, hashed_at]
+                self._dirty = True
+        return digest
+
+    def fingerprint(self, path: str | Path) -> Optional[FileFingerprint]:
+        """Fingerprint one file.
+
+        Args:
+            path: File path
+
+        Returns:
+            FileFingerprint, or None if the path is missing or not a regular file
+        """
+        return self.fingerprint_many([path])[0]
+
+    def fingerprint_many(self, paths: Sequence[str | Path]) -> list[Optional[FileFingerprint]]:
+        """Fingerprint several files, hashing changed ones in parallel.
+
+        Args:
+            paths: File paths
+
+        Returns:
+            Fingerprints in input order (None for missing or non-regular paths)
+        """
+        keys = [os.path.abspath(path) for path in paths]
+        stats: list[Optional[os.stat_result]] = []
+        for key in keys:
+            try:
+                st = os.stat(key)
+            except OSError:
+                st = None
+            stats.append(st if st is not None and stat.S_ISREG(st.st_mode) else None)
+
+        digests: list[Optional[str]] = [None] * len(keys)
+        misses: list[tuple[int, os.stat_result]] = []
+        with self._lock:
+            for i, (key, st) in enumerate(zip(keys, stats, strict=True)):
+                if st is None:
+                    continue
+                digests[i] = self._cached(key, st)
+                if digests[i] is None:
+                    misses.append((i, st))
+            self.reused += len(keys) - len(misses) - stats.count(None)
+
+        if len(misses) >= PARALLEL_MIN_FILES and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(misses))) as pool:
+                hashed = list(pool.map(lambda miss: self._hash(keys[miss[0]], miss[1]), misses))
+        else:
+            hashed = [self._hash(keys[i], st) for i, st in misses]
+        for (i, _), digest in zip(misses, hashed, strict=True):
+            digests[i] = digest
+
+        return [
+            (
+                FileFingerprint(str(path), digest, st.st_size, st.st_mtime_ns, st.st_ino)
+                if st is not None and digest is not None
+                else None
+            )
+            for path, st, digest in zip(paths, stats, digests, strict=True)
+        ]
+
+    def digest(self, path: str | Path) -> Optional[str]:
+        """Digest of a file's contents, or None if it is missing."""
+        fingerprint = self.fingerprint(path)
+        return fingerprint.digest if fingerprint else None
+
+    def record(self, path: str | Path, digest: str) -> None:
+        """Record the digest of content just written to a file.
+
+        Args:
+            path: File that was written
+            digest: Digest of the written content (same algorithm)
+        """
+        key = os.path.abspath(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return
+        with self._lock:
+            self._entries[key] = [*_stat_key(st), digest, time.time_ns()]
+            self._dirty = True
+
+    def hash_bytes(self, data: bytes) -> str:
+        """Digest of in-memory content with this fingerprinter's algorithm."""
+        return hashlib.new(self.algorithm, data).hexdigest()
+
+
+_fingerprinters: dict[str, FileFingerprinter] = {}
+_fingerprinters_lock = threading.Lock()
+
+
+def get_fingerprinter(project_dir: str | Path) -> FileFingerprinter:
+    """Get the shared fingerprinter for a project.
+
+    Its cache is persisted under the project's ``.workflow`` directory.
+    """
+    key = str(Path(project_dir).resolve())
+    with _fingerprinters_lock:
+        fingerprinter = _fingerprinters.get(key)
+        if fingerprinter is None:
+            fingerprinter = FileFingerprinter(Path(key) / CACHE_FILE)
+            _fingerprinters[key] = fingerprinter
+        return fingerprinter
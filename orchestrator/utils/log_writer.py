@@ -0,0 +1,372 @@
+"""Group-commit writer for append-only logs and JSON snapshots.
+
+Hot paths such as ``AuditTrail.commit_entry``, ``ActionLog.log`` and
+``ErrorAggregator.add_error`` hand their lines to a shared background
+thread instead of opening, writing and closing files themselves:
+
+- Appends go through a bounded queue; the writer drains everything queued,
+  groups lines per file and writes each group with a single ``writev``.
+- fsync follows a policy (never, at most once per interval, every batch).
+- Snapshot files (indexes, unresolved sets) are debounced: only the latest
+  render is kept and it is written atomically once the delay expires.
+- ``flush()`` blocks until everything queued so far is on disk, and an
+  ``atexit`` hook flushes on interpreter shutdown.
+
+Readers that need read-your-writes consistency call ``flush()`` first.
+
+Usage:
+    writer = get_log_writer()
+    writer.append(path, json.dumps(entry) + "\\n")
+    writer.schedule_snapshot(index_path, lambda: json.dumps(index_copy))
+    writer.flush()
+"""
+
+import atexit
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Maximum buffers per writev call (POSIX guarantees at least 16, Linux allows 1024)
+_IOV_MAX = 512
+
+
+class FsyncPolicy(str, Enum):
+    """When appended data is fsynced."""
+
+    NEVER = "never"  # Leave it to the OS
+    INTERVAL = "interval"  # At most once per fsync_interval per file
+    ALWAYS = "always"  # After every batch
+
+
+@dataclass
+class LogWriterConfig:
+    """Configuration for the background log writer.
+
+    Attributes:
+        max_queue_size: Bound on queued appends; producers block when full
+        max_batch_size: Maximum appends written per batch
+        fsync_policy: When appended data is fsynced
+        fsync_interval: Seconds between fsyncs under INTERVAL policy
+        snapshot_delay: Seconds a snapshot is debounced before being written
+    """
+
+    max_queue_size: int = 10_000
+    max_batch_size: int = 1_000
+    fsync_policy: FsyncPolicy = FsyncPolicy.INTERVAL
+    fsync_interval: float = 1.0
+    snapshot_delay: float = 0.5
+
+
+class _FlushRequest:
+    """Queue marker completed once everything queued before it is written."""
+
+    def __init__(self, stop: bool = False):
+        self.done = threading.Event()
+        self.stop = stop
+
+
+class LogWriter:
+    """Background writer batching appends and debouncing snapshots.
+
+    Thread-safe. Snapshot render callables run on the writer thread and
+    must not acquire locks that callers hold while appending.
+    """
+
+    def __init__(self, config: Optional[LogWriterConfig] = None):
+        """Initialize the writer.
+
+        Args:
+            config: Writer configuration
+        """
+        self.config = config or LogWriterConfig()
+        self._queue: queue.Queue = queue.Queue(maxsize=self.config.max_queue_size)
+        self._snapshots: dict[Path, tuple[float, Callable[[], str]]] = {}
+        self._snapshot_lock = threading.Lock()
+        self._last_fsync: dict[Path, float] = {}
+        self._unsynced: set[Path] = set()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Producer API
+    # ------------------------------------------------------------------
+
+    def append(self, path: Union[str, Path], data: Union[str, bytes]) -> None:
+        """Queue data to be appended to a file.
+
+        Blocks while the queue is full (backpressure).
+
+        Args:
+            path: File to append to
+            data: Text (UTF-8 encoded) or bytes, including the trailing newline
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if self._closed:
+            self._write_batch({Path(path): [data]})
+            return
+        self._ensure_started()
+        self._queue.put((Path(path), data))
+
+    def schedule_snapshot(
+        self,
+        path: Union[str, Path],
+        render: Callable[[], str],
+        delay: Optional[float] = None,
+    ) -> None:
+        """Schedule an atomic rewrite of a snapshot file.
+
+        Repeated calls within the delay coalesce; only the latest render runs.
+
+        Args:
+            path: Snapshot file
+            render: Callable returning the full file content
+            delay: Debounce delay in seconds (config default if None)
+        """
+        path = Path(path)
+        if self._closed:
+            self._write_snapshot(path, render)
+            return
+        delay = self.config.snapshot_delay if delay is None else delay
+        with self._snapshot_lock:
+            due = self._snapshots[path][0] if path in self._snapshots else time.monotonic() + delay
+            self._snapshots[path] = (due, render)
+        self._ensure_started()
+        # Wake the writer so it can recompute its sleep deadline
+        self._queue.put(None)
+
+    def discard_snapshot(self, path: Union[str, Path]) -> None:
+        """Drop a pending snapshot without writing it."""
+        with self._snapshot_lock:
+            self._snapshots.pop(Path(path), None)
+
+    def flush(self, timeout: Optional[float] = 30.0) -> bool:
+        """Write everything queued so far, including pending snapshots.
+
+        Must not be called while holding a lock a snapshot render acquires.
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            True if the flush completed within the timeout
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._flush_snapshots(force=True)
+            return True
+        request = _FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Flush and stop the writer thread.
+
+        Later appends are written synchronously.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            request = _FlushRequest(stop=True)
+            self._queue.put(request)
+            request.done.wait(timeout)
+        else:
+            self._flush_snapshots(force=True)
+        self._sync_unsynced()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self._next_wakeup())
+            except queue.Empty:
+                item = None
+
+            items = [item]
+            while len(items) < self.config.max_batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            batch: dict[Path, list[bytes]] = {}
+            for entry in items:
+                if isinstance(entry, _FlushRequest):
+                    # Everything queued before the marker must land first
+                    self._write_batch(batch)
+                    batch = {}
+                    self._flush_snapshots(force=True)
+                    self._sync_unsynced()
+                    entry.done.set()
+                    if entry.stop:
+                        return
+                elif entry is not None:
+                    path, data = entry
+                    batch.setdefault(path, []).append(data)
+
+            self._write_batch(batch)
+            self._flush_snapshots(force=False)
+
+    def _next_wakeup(self) -> Optional[float]:
+        """Seconds until the next snapshot is due (None to block)."""
+        with self._snapshot_lock:
+            if not self._snapshots:
+                return None
+            due = min(d for d, _ in self._snapshots.values())
+        return max(0.0, due - time.monotonic())
+
+    def _write_batch(self, batch: dict[Path, list[bytes]]) -> None:
+        """Append each file's buffers with one open and writev."""
+        for path, buffers in batch.items():
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    _write_buffers(fd, buffers)
+                    self._maybe_fsync(path, fd)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                logger.error(f"Failed to append {len(buffers)} line(s) to {path}: {e}")
+
+    def _maybe_fsync(self, path: Path, fd: int) -> None:
+        policy = self.config.fsync_policy
+        if policy == FsyncPolicy.NEVER:
+            return
+        now = time.monotonic()
+        if policy == FsyncPolicy.ALWAYS or (
+            now - self._last_fsync.get(path, 0.0) >= self.config.fsync_interval
+        ):
+            os.fsync(fd)
+            self._last_fsync[path] = now
+            self._unsynced.discard(path)
+        else:
+            self._unsynced.add(path)
+
+    def _sync_unsynced(self) -> None:
+        """fsync files with appends not yet synced under INTERVAL policy."""
+        for path in list(self._unsynced):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+            self._last_fsync[path] = time.monotonic()
+        self._unsynced.clear()
+
+    def _flush_snapshots(self, force: bool) -> None:
+        """Write snapshots that are due (or all of them when forced)."""
+        now = time.monotonic()
+        with self._snapshot_lock:
+            due = [
+                (path, render)
+                for path, (deadline, render) in self._snapshots.items()
+                if force or deadline <= now
+            ]
+            for path, _ in due:
+                del self._snapshots[path]
+        for path, render in due:
+            self._write_snapshot(path, render)
+
+    def _write_snapshot(self, path: Path, render: Callable[[], str]) -> None:
+        """Write a snapshot using write-to-temp then atomic rename."""
+        tmp_path = None
+        try:
+            content = render()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                dir=path.parent,
+                prefix=f".{path.stem}_",
+                suffix=".tmp",
+                delete=False,
+                encoding="utf-8",
+            ) as tmp_file:
+                tmp_path = tmp_file.name
+                tmp_file.write(content)
+                if self.config.fsync_policy != FsyncPolicy.NEVER:
+                    tmp_file.flush()
+                    os.fsync(tmp_file.fileno())
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except Exception as e:
+            logger.error(f"Failed to write snapshot {path}: {e}")
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+
+def _write_buffers(fd: int, buffers: list[bytes]) -> None:
+    """Write all buffers, using writev where available."""
+    if not hasattr(os, "writev"):
+        _write_all(fd, b"".join(buffers))
+        return
+    for start in range(0, len(buffers), _IOV_MAX):
+        chunk = buffers[start : start + _IOV_MAX]
+        written = os.writev(fd, chunk)
+        total = sum(len(b) for b in chunk)
+        if written < total:
+            _write_all(fd, b"".join(chunk)[written:])
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+# Process-wide writer shared by all logs
+_log_writer: Optional[LogWriter] = None
+_log_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> LogWriter:
+    """Get the shared log writer, creating it on first use."""
+    global _log_writer
+
+    with _log_writer_lock:
+        if _log_writer is None:
+            _log_writer = LogWriter()
+        return _log_writer
+
+
+def shutdown_log_writer() -> None:
+    """Flush and stop the shared log writer."""
+    global _log_writer
+
+    with _log_writer_lock:
+        writer, _log_writer = _log_writer, None
+    if writer is not None:
+        writer.close()
+
+
+atexit.register(shutdown_log_writer)
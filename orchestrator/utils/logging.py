@@ -5,6 +5,7 @@ import logging as _logging
 import re
 import sys
 import threading
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -44,6 +45,10 @@ class SecretsRedactor:
 
     Automatically detects and redacts sensitive information like
     API keys, passwords, tokens, and bearer tokens from log output.
+
+    Each pattern only runs when one of its literal triggers occurs in the
+    text, so clean text costs a few substring scans. Large agent output
+    can be redacted chunk by chunk with ``redact_stream``.
     """
 
     PATTERNS = [
@@ -97,25 +102,196 @@ class SecretsRedactor:
         ),
     ]
 
-    def __init__(self):
-        """Initialize with compiled patterns."""
-        self._compiled_patterns = [
-            (re.compile(pattern), replacement) for pattern, replacement in self.PATTERNS
-        ]
+    # Literal triggers per pattern, in PATTERNS order: a pattern can only
+    # match text containing one of its triggers and is skipped otherwise.
+    # Triggers of case-insensitive patterns are matched against the
+    # lowercased text.
+    PATTERN_TRIGGERS = [
+        ("sk-",),
+        ("ghp_",),
+        ("ghu_",),
+        ("gho_",),
+        ("ghs_",),
+        ("ghr_",),
+        ("github_pat_",),
+        ("aws_secret_access_key",),
+        ("aws_access_key_id",),
+        ("AKIA",),
+        ("_api_key",),
+        ("AIza",),
+        ("api",),
+        ("pass", "pwd"),
+        ("secret", "token"),
+        ("bearer",),
+        ("aws",),
+        ("xox",),
+        ("-----BEGIN",),
+    ]
+    PRIVATE_KEY_TRIGGER = "-----BEGIN"
+
+    # Characters held back by redact_stream so secrets split across chunks
+    # are still matched; longer than any single-token pattern
+    STREAM_HOLDBACK = 4096
+    # Longest private key block redact_stream waits for before emitting it
+    MAX_PRIVATE_KEY_SIZE = 64 * 1024
+    # Cuts tried per redact_stream emission before waiting for more input
+    MAX_CUT_ATTEMPTS = 8
+
+    # Compiled once per process: (pattern, replacement, triggers)
+    _compiled_patterns: list[tuple["re.Pattern[str]", str, tuple[str, ...]]] = [
+        (re.compile(pattern), replacement, triggers)
+        for (pattern, replacement), triggers in zip(PATTERNS, PATTERN_TRIGGERS, strict=True)
+    ]
+    # All triggers, for a single check before any pattern is considered
+    _case_sensitive_triggers = frozenset(
+        trigger
+        for (pattern, _), triggers in zip(PATTERNS, PATTERN_TRIGGERS, strict=True)
+        if not pattern.startswith("(?i)")
+        for trigger in triggers
+    )
+    _lowercase_triggers = frozenset(
+        trigger
+        for (pattern, _), triggers in zip(PATTERNS, PATTERN_TRIGGERS, strict=True)
+        if pattern.startswith("(?i)")
+        for trigger in triggers
+    )
+
+    def _present_triggers(self, message: str) -> set[str]:
+        """Find the triggers occurring in the message.
+
+        Case-insensitive triggers are looked up in the lowercased text.
+        Unicode case folding lets a pattern match text without its lowercase
+        trigger (e.g. "ſ" matches "s"), so for non-ASCII text they are all
+        assumed present.
+        """
+        present = {trigger for trigger in self._case_sensitive_triggers if trigger in message}
+        if message.isascii():
+            lowered = message.lower()
+            present.update(trigger for trigger in self._lowercase_triggers if trigger in lowered)
+        else:
+            present |= self._lowercase_triggers
+        return present
 
     def redact(self, message: str) -> str:
         """Redact sensitive information from message.
 
+        Patterns are applied one after another, so a later pattern sees
+        the replacements of earlier ones. A pattern whose literal triggers
+        do not occur in the text is skipped, so clean text costs a few
+        substring scans and never reaches the regex engine.
+
         Args:
             message: The log message that may contain secrets
 
         Returns:
             The message with secrets redacted
         """
-        for pattern, replacement in self._compiled_patterns:
-            message = pattern.sub(replacement, message)
+        present = self._present_triggers(message)
+        if not present:
+            return message
+        for pattern, replacement, triggers in self._compiled_patterns:
+            if present.isdisjoint(triggers):
+                continue
+            redacted = pattern.sub(replacement, message)
+            if redacted != message:
+                # Replacements add text, so triggers are looked up again
+                message = redacted
+                present = self._present_triggers(message)
         return message
 
+    def redact_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Redact a stream of text chunks, e.g. large agent output.
+
+        Keeps a bounded tail buffered so secrets split across chunk
+        boundaries are still redacted. Joining the output gives the same
+        result as ``redact`` on the joined input.
+
+        Args:
+            chunks: Text chunks in order
+
+        Yields:
+            Redacted text chunks
+        """
+        buffer = ""
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) < 2 * self.STREAM_HOLDBACK:
+                continue
+            consumed = self._safe_prefix_end(buffer)
+            if consumed:
+                yield self.redact(buffer[:consumed])
+                buffer = buffer[consumed:]
+        if buffer:
+            yield self.redact(buffer)
+
+    def _safe_prefix_end(self, buffer: str) -> int:
+        """Find how much of the buffer can be redacted and emitted now.
+
+        The cut never falls inside a match or an unterminated private key
+        block, and sits after whitespace so word boundaries are preserved.
+        Returns 0 if no such cut is found, so the buffer keeps growing.
+        """
+        cut = len(buffer) - self.STREAM_HOLDBACK
+        begin = buffer.rfind(self.PRIVATE_KEY_TRIGGER, 0, cut)
+        if (
+            begin != -1
+            and "-----END" not in buffer[begin:]
+            and len(buffer) - begin < self.MAX_PRIVATE_KEY_SIZE
+        ):
+            cut = begin
+        cut = self._after_space(buffer, cut)
+
+        for _ in range(self.MAX_CUT_ATTEMPTS):
+            if cut <= 0:
+                return 0
+            earlier = self._straddling_start(buffer, cut)
+            if earlier is None:
+                return cut
+            cut = self._after_space(buffer, min(earlier, cut - 1))
+        return 0
+
+    def _straddling_start(self, buffer: str, cut: int) -> Optional[int]:
+        """Check that redacting both sides of the cut separately changes nothing.
+
+        Replays ``redact`` on the buffer and looks for a match that spans the
+        cut in any pattern's input, including text left by earlier
+        replacements.
+
+        Returns:
+            None if no match spans the cut, else an estimate of where the
+            first spanning match starts in the original buffer
+        """
+        text = buffer
+        present = self._present_triggers(text)
+        shift = 0  # Length change of the text before the cut so far
+        for pattern, replacement, triggers in self._compiled_patterns:
+            if present.isdisjoint(triggers):
+                continue
+            boundary = cut + shift  # The cut in this pattern's input
+            parts = []
+            pos = 0
+            for match in pattern.finditer(text):
+                start, end = match.span()
+                if start < boundary < end:
+                    return max(0, start - (boundary - cut))
+                redacted = match.expand(replacement)
+                if end <= boundary:
+                    shift += len(redacted) - (end - start)
+                parts.append(text[pos:start])
+                parts.append(redacted)
+                pos = end
+            if parts:
+                parts.append(text[pos:])
+                text = "".join(parts)
+                present = self._present_triggers(text)
+        return None
+
+    @staticmethod
+    def _after_space(buffer: str, cut: int) -> int:
+        """Move the cut back to just after the last whitespace before it."""
+        space = max(buffer.rfind(" ", 0, cut), buffer.rfind("\n", 0, cut))
+        return space + 1 if space > 0 else cut
+
 
 class OrchestrationLogger:
     """Logger for multi-agent orchestration.
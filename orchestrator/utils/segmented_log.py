@@ -0,0 +1,309 @@
+"""Size-capped, segment-rotated JSONL logs with tail-seek reads.
+
+The active segment is an ordinary JSONL file appended through the shared
+``LogWriter``. Once it grows past ``segment_bytes`` it is sealed: moved into
+a sibling directory as ``segment-NNNNNN.jsonl`` and recorded in an atomically
+written ``index.json`` (segment number, entry count, size). Only the newest
+``max_segments`` sealed segments are kept.
+
+Reads never parse the whole history. ``tail`` and ``page`` read lines
+backwards in fixed-size blocks from a byte offset, crossing into older
+segments only when a page needs more entries. Pages are addressed by an
+opaque ``"<segment>:<offset>"`` cursor, so older history loads on demand.
+
+Usage:
+    log = get_segmented_log(project_dir / ".workflow" / "chat_history.jsonl")
+    log.append({"role": "user", "content": "Hello"})
+    latest = log.tail(50)  # Oldest first
+
+    page = log.page(limit=50)
+    older = log.page(limit=50, before=page.cursor)
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .log_writer import LogWriter, get_log_writer
+
+logger = logging.getLogger(__name__)
+
+# Size at which the active segment is sealed
+DEFAULT_SEGMENT_BYTES = 1_000_000
+
+# Sealed segments kept before the oldest is dropped
+DEFAULT_MAX_SEGMENTS = 20
+
+# Block size for backwards reads
+READ_BLOCK_SIZE = 8192
+
+
+@dataclass
+class LogPage:
+    """A page of log entries.
+
+    Attributes:
+        entries: Entries in the page, oldest first
+        cursor: Cursor for the next older page, or None at the start of history
+    """
+
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    cursor: Optional[str] = None
+
+
+def _iter_lines_backwards(path: Path, end: int) -> Iterator[tuple[int, bytes]]:
+    """Yield (start offset, line) pairs before ``end``, newest first.
+
+    Reads backwards in fixed-size blocks, so only the bytes needed for the
+    lines actually consumed are read.
+    """
+    with open(path, "rb") as f:
+        position = end
+        remainder = b""
+        while position > 0:
+            read_size = min(READ_BLOCK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + remainder
+            lines = data.split(b"\n")
+
+            # The first piece may continue in the previous block
+            remainder = lines[0]
+            offset = position + len(data)
+            for line in reversed(lines[1:]):
+                offset -= len(line) + 1
+                yield offset + 1, line
+        yield 0, remainder
+
+
+class SegmentedLog:
+    """Append-only JSONL log split into size-capped segments.
+
+    Thread-safe. Appends go through the shared ``LogWriter``; reads flush it
+    first so they see every entry appended before the call.
+    """
+
+    def __init__(
+        self,
+        active_file: Union[str, Path],
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+        writer: Optional[LogWriter] = None,
+    ):
+        """Initialize the log.
+
+        Args:
+            active_file: JSONL file receiving new entries
+            segment_bytes: Size at which the active file is sealed
+            max_segments: Sealed segments to keep
+            writer: Log writer (shared writer if None)
+        """
+        self.active_file = Path(active_file)
+        self.segments_dir = self.active_file.with_suffix("")
+        self.index_file = self.segments_dir / "index.json"
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+        self._writer = writer
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._active_number = 0
+        self._segments: list[dict[str, int]] = []
+        self._active_bytes = 0
+
+    @property
+    def writer(self) -> LogWriter:
+        """Log writer used for appends."""
+        return self._writer or get_log_writer()
+
+    def append(self, entry: dict[str, Any]) -> None:
+        """Append an entry, sealing the active segment once it is full.
+
+        Args:
+            entry: JSON-serializable entry
+        """
+        data = (json.dumps(entry) + "\n").encode("utf-8")
+        with self._lock:
+            self._load()
+            self.writer.append(self.active_file, data)
+            self._active_bytes += len(data)
+            if self._active_bytes >= self.segment_bytes:
+                self._rotate()
+
+    def tail(self, limit: int = 50) -> list[dict[str, Any]]:
+        """Get the newest entries.
+
+        Args:
+            limit: Maximum entries to return
+
+        Returns:
+            Entries, oldest first
+        """
+        return self.page(limit=limit).entries
+
+    def page(self, limit: int = 50, before: Optional[str] = None) -> LogPage:
+        """Get a page of entries ending before a cursor.
+
+        Args:
+            limit: Maximum entries to return
+            before: Cursor from a previous page (newest entries if None)
+
+        Returns:
+            LogPage with entries oldest first and the cursor for older entries
+        """
+        self.writer.flush()
+        with self._lock:
+            self._load()
+            numbers = [s["number"] for s in self._segments] + [self._active_number]
+            if before is None:
+                number, offset = self._active_number, None
+            else:
+                number, offset = self._parse_cursor(before)
+                if number not in numbers:
+                    # Older than the retained history
+                    return LogPage()
+
+            entries: list[dict[str, Any]] = []
+            position = numbers.index(number)
+            cursor = None
+            while limit > 0:
+                path = self._segment_path(number)
+                size = path.stat().st_size if path.exists() else 0
+                end = size if offset is None else min(offset, size)
+                if end > 0:
+                    for start, line in _iter_lines_backwards(path, end):
+                        if not line.strip():
+                            continue
+                        try:
+                            entries.append(json.loads(line))
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            continue
+                        if len(entries) >= limit:
+                            if start > 0 or position > 0:
+                                cursor = f"{number}:{start}"
+                            break
+
+                if len(entries) >= limit or position == 0:
+                    break
+                position -= 1
+                number, offset = numbers[position], None
+
+        entries.reverse()
+        return LogPage(entries=entries, cursor=cursor)
+
+    def clear(self) -> None:
+        """Delete the active file and all sealed segments."""
+        self.writer.flush()
+        with self._lock:
+            if self.active_file.exists():
+                self.active_file.unlink()
+            shutil.rmtree(self.segments_dir, ignore_errors=True)
+            self._active_number = 0
+            self._segments = []
+            self._active_bytes = 0
+            self._loaded = True
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _parse_cursor(cursor: str) -> tuple[int, int]:
+        try:
+            number, offset = cursor.split(":", 1)
+            return int(number), int(offset)
+        except ValueError:
+            raise ValueError(f"Invalid log cursor: {cursor!r}") from None
+
+    def _segment_path(self, number: int) -> Path:
+        if number == self._active_number:
+            return self.active_file
+        return self.segments_dir / f"segment-{number:06d}.jsonl"
+
+    def _load(self) -> None:
+        """Read the segment index on first use."""
+        if self._loaded:
+            return
+        if self.index_file.exists():
+            try:
+                index = json.loads(self.index_file.read_text())
+                self._active_number = int(index.get("active", 0))
+                self._segments = list(index.get("segments", []))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable segment index {self.index_file}: {e}")
+        self.writer.flush()
+        self._active_bytes = self.active_file.stat().st_size if self.active_file.exists() else 0
+        self._loaded = True
+
+    def _rotate(self) -> None:
+        """Seal the active file and drop segments beyond the cap."""
+        self.writer.flush()
+        if not self.active_file.exists():
+            self._active_bytes = 0
+            return
+
+        with open(self.active_file, "rb") as f:
+            entries = sum(1 for line in f if line.strip())
+        size = self.active_file.stat().st_size
+
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        sealed = self.segments_dir / f"segment-{self._active_number:06d}.jsonl"
+        os.replace(self.active_file, sealed)
+        self._segments.append({"number": self._active_number, "entries": entries, "bytes": size})
+        self._active_number += 1
+        self._active_bytes = 0
+
+        while len(self._segments) > self.max_segments:
+            dropped = self._segments.pop(0)
+            try:
+                (self.segments_dir / f"segment-{dropped['number']:06d}.jsonl").unlink()
+            except FileNotFoundError:
+                pass
+
+        self._write_index()
+
+    def _write_index(self) -> None:
+        """Atomically write the segment index."""
+        content = json.dumps({"active": self._active_number, "segments": self._segments}, indent=2)
+        fd, temp_path = tempfile.mkstemp(
+            prefix=".index_",
+            suffix=".json.tmp",
+            dir=str(self.segments_dir),
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+            os.replace(temp_path, str(self.index_file))
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+
+_logs: dict[str, SegmentedLog] = {}
+_logs_lock = threading.Lock()
+
+
+def get_segmented_log(active_file: Union[str, Path]) -> SegmentedLog:
+    """Get the shared segmented log for a file.
+
+    Args:
+        active_file: JSONL file receiving new entries
+
+    Returns:
+        SegmentedLog instance
+    """
+    key = str(Path(active_file).resolve())
+    with _logs_lock:
+        log = _logs.get(key)
+        if log is None:
+            log = _logs[key] = SegmentedLog(active_file)
+        return log
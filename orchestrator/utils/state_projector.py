@@ -1,36 +1,85 @@
-"""State projector for generating state.json from SQLite checkpoints.
+"""State projector for generating state.json from workflow state.
 
 This module provides a read-only projection of workflow state from the
-authoritative SQLite checkpoint database. This ensures state.json is
-always consistent with the checkpoint and eliminates dual-write issues.
+authoritative checkpoint database. This ensures state.json is always
+consistent with the checkpoint and eliminates dual-write issues.
+
+While a workflow runs, the projector is fed node output deltas (see
+``utils.progress_stream``) and keeps the legacy view in memory, applying
+the same reducers as ``WorkflowState``. state.json is rewritten (debounced,
+atomically) only when a projected field changed, so status views and MCP
+tools can read it without re-projecting the checkpoint. When the run ends
+(``end_run``) readers go back to the latest checkpoint, which other
+processes may have advanced since.
 
 Usage:
-    projector = StateProjector(project_dir)
+    projector = get_state_projector(project_dir)
     state = projector.project_state_sync()  # Generates state.json
 
     # Or async version
     state = await projector.project_state()
+
+    # Incremental updates from a running workflow
+    projector.apply_update(node_delta)
 """
 
-import asyncio
+import atexit
+import functools
 import json
 import logging
 import os
 import tempfile
+import threading
+import time
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Seconds during which repeated state.json writes are coalesced
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+
+# WorkflowState keys the legacy state.json view is built from
+PROJECTED_KEYS = (
+    "project_name",
+    "current_phase",
+    "iteration_count",
+    "phase_status",
+    "git_commits",
+    "created_at",
+    "updated_at",
+    "tasks",
+    "completed_task_ids",
+    "failed_task_ids",
+    "current_task_id",
+    "errors",
+)
+
+
+@functools.cache
+def _reducers() -> dict[str, Callable[[Any, Any], Any]]:
+    """Reducers WorkflowState declares for projected keys."""
+    from typing import get_type_hints
+
+    from ..langgraph.state import WorkflowState
+
+    hints = get_type_hints(WorkflowState, include_extras=True)
+    return {
+        key: hints[key].__metadata__[0]
+        for key in PROJECTED_KEYS
+        if key in hints and getattr(hints[key], "__metadata__", None)
+    }
+
 
 class StateProjector:
-    """Projects workflow state from SQLite checkpoints to state.json.
+    """Projects workflow state from checkpoints and node deltas to state.json.
 
     This class provides a single source of truth for state by:
-    1. Reading state from SQLite checkpoint (authoritative source)
+    1. Reading state from the checkpoint, or applying node deltas as they stream
     2. Converting to legacy state.json format
-    3. Writing atomically to prevent corruption
+    3. Writing atomically (and only on change) to prevent corruption
 
     The projection is read-only from the perspective of state consumers -
     all state modifications should go through the LangGraph workflow.
@@ -39,15 +88,141 @@ class StateProjector:
     def __init__(
         self,
         project_dir: str | Path,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
     ):
         """Initialize the state projector.
 
         Args:
             project_dir: Project directory path
+            debounce_seconds: Window in which state.json writes are coalesced
         """
         self.project_dir = Path(project_dir)
         self.workflow_dir = self.project_dir / ".workflow"
         self.state_file = self.workflow_dir / "state.json"
+        self.debounce_seconds = debounce_seconds
+
+        self._lock = threading.RLock()
+        # Projected subset of the live WorkflowState (None until fed)
+        self._live: Optional[dict[str, Any]] = None
+        self._streaming = False
+        self._view: Optional[dict[str, Any]] = None
+        self._written: Optional[str] = None
+        self._pending: Optional[str] = None
+        self._timer: Optional[threading.Timer] = None
+        self._last_write = 0.0
+        self.writes = 0
+
+    @property
+    def is_live(self) -> bool:
+        """Whether a workflow in this process is feeding this projector."""
+        return self._streaming
+
+    def apply_state(self, state: dict[str, Any], live: bool = True) -> None:
+        """Replace the projection with a full workflow state.
+
+        Args:
+            state: Full (or checkpointed) WorkflowState values
+            live: Whether the state comes from a workflow running in this
+                process (False for checkpoint reads)
+        """
+        with self._lock:
+            self._streaming = self._streaming or live
+            self._live = {key: state[key] for key in PROJECTED_KEYS if key in state}
+            self._stamp()
+            self._refresh()
+
+    def end_run(self) -> None:
+        """Stop serving the live view once the feeding workflow run ends.
+
+        Pending writes are flushed; later reads project the checkpoint.
+        """
+        with self._lock:
+            self._streaming = False
+        self.flush()
+
+    def apply_update(self, delta: dict[str, Any]) -> bool:
+        """Apply a node's output delta to the live projection.
+
+        Args:
+            delta: State update returned by a node
+
+        Returns:
+            True if a projected field changed
+        """
+        keys = [key for key in PROJECTED_KEYS if key in delta]
+        if not keys:
+            return False
+        reducers = _reducers()
+        with self._lock:
+            self._streaming = True
+            if self._live is None:
+                self._live = {}
+            for key in keys:
+                reducer = reducers.get(key)
+                if reducer is not None and key in self._live:
+                    self._live[key] = reducer(self._live[key], delta[key])
+                else:
+                    self._live[key] = delta[key]
+            self._stamp()
+            return self._refresh()
+
+    def _stamp(self) -> None:
+        # Caller holds self._lock. Fix defaulted timestamps so unchanged
+        # state projects to identical JSON.
+        assert self._live is not None
+        now = datetime.now().isoformat()
+        self._live.setdefault("created_at", now)
+        self._live.setdefault("updated_at", now)
+
+    def _refresh(self) -> bool:
+        """Rebuild the legacy view and schedule a write if it changed."""
+        # Caller holds self._lock
+        assert self._live is not None
+        view = self._convert_to_legacy_format(self._live)
+        content = json.dumps(view, indent=2, default=str)
+        latest = self._pending if self._pending is not None else self._written
+        if content == latest:
+            return False
+        self._view = view
+        if content == self._written:
+            # Changed back to what is on disk; drop the pending write
+            self._pending = None
+        else:
+            self._request_write(content)
+        return True
+
+    def _request_write(self, content: str) -> None:
+        """Write now, or coalesce with other writes in the debounce window."""
+        # Caller holds self._lock
+        wait = self._last_write + self.debounce_seconds - time.monotonic()
+        if wait <= 0 and self._timer is None:
+            self._write_content(content)
+            return
+        self._pending = content
+        if self._timer is None:
+            self._timer = threading.Timer(max(wait, 0.0), self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write any pending debounced projection now."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            content, self._pending = self._pending, None
+            if content is not None:
+                try:
+                    self._write_content(content)
+                except OSError as e:
+                    logger.warning(f"Failed to write {self.state_file}: {e}")
+
+    def _write_content(self, content: str) -> None:
+        # Caller holds self._lock
+        self._last_write = time.monotonic()
+        self._atomic_write_text(content)
+        self._written = content
+        self.writes += 1
 
     async def project_state(
         self,
@@ -72,11 +247,11 @@ class StateProjector:
                 logger.debug("No checkpoint state found")
                 return self._load_fallback_state()
 
-            # Convert to legacy format
-            legacy_state = self._convert_to_legacy_format(lg_state)
-
-            # Atomic write to state.json
-            self._atomic_write_state(legacy_state)
+            # Convert to legacy format and write atomically if it changed
+            with self._lock:
+                self.apply_state(lg_state, live=False)
+                self.flush()
+                legacy_state = dict(self._view or {})
 
             logger.info(f"Projected state to {self.state_file}")
             return legacy_state
@@ -97,20 +272,9 @@ class StateProjector:
         Returns:
             The projected state dict, or None if no checkpoint exists
         """
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
+        from ..storage.async_utils import run_async
 
-        if loop is not None:
-            # We're in an async context, create a new task
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, self.project_state(thread_id))
-                return future.result()
-        else:
-            return asyncio.run(self.project_state(thread_id))
+        return run_async(self.project_state(thread_id))
 
     async def _load_checkpoint_state(
         self,
@@ -262,6 +426,10 @@ class StateProjector:
         Args:
             state: State dict to write
         """
+        self._atomic_write_text(json.dumps(state, indent=2, default=str))
+
+    def _atomic_write_text(self, content: str) -> None:
+        """Write serialized state atomically using temp file + rename."""
         # Ensure workflow directory exists
         self.workflow_dir.mkdir(parents=True, exist_ok=True)
 
@@ -274,7 +442,7 @@ class StateProjector:
 
         try:
             with os.fdopen(fd, "w") as f:
-                json.dump(state, f, indent=2, default=str)
+                f.write(content)
 
             # Atomic rename
             os.replace(temp_path, str(self.state_file))
@@ -308,11 +476,16 @@ class StateProjector:
     def get_state(self) -> Optional[dict[str, Any]]:
         """Get current state, projecting from checkpoint if available.
 
-        This is the primary method for reading state.
+        This is the primary method for reading state. While a workflow in
+        this process feeds the projector, its in-memory view is returned.
 
         Returns:
             State dict or None
         """
+        with self._lock:
+            if self._view is not None and self.is_live:
+                return dict(self._view)
+
         # Try to project from checkpoint
         state = self.project_state_sync()
 
@@ -323,8 +496,13 @@ class StateProjector:
         return self._load_fallback_state()
 
 
+# Projectors shared per project so a running workflow's view serves readers
+_projectors: dict[str, StateProjector] = {}
+_projectors_lock = threading.Lock()
+
+
 def get_state_projector(project_dir: str | Path) -> StateProjector:
-    """Factory function to create a state projector.
+    """Get the shared state projector for a project.
 
     Args:
         project_dir: Project directory path
@@ -332,4 +510,20 @@ def get_state_projector(project_dir: str | Path) -> StateProjector:
     Returns:
         StateProjector instance
     """
-    return StateProjector(project_dir)
+    key = str(Path(project_dir).resolve())
+    with _projectors_lock:
+        projector = _projectors.get(key)
+        if projector is None:
+            projector = _projectors[key] = StateProjector(project_dir)
+        return projector
+
+
+def flush_state_projections() -> None:
+    """Write pending debounced projections for all projects."""
+    with _projectors_lock:
+        projectors = list(_projectors.values())
+    for projector in projectors:
+        projector.flush()
+
+
+atexit.register(flush_state_projections)
@@ -0,0 +1,258 @@
+"""Token counting shared by chunking, caching and budgeting.
+
+Counts come from a local BPE tokenizer (``tiktoken``) when it is installed,
+and otherwise from a heuristic calibrated against BPE tokenizers, which is
+much closer than ``len(text) // 4`` for code, numbers and non-English text.
+
+Counts are memoized by content hash in a bounded LRU, and ``count_many``
+counts a batch of texts with one tokenizer call for the cache misses.
+
+Usage:
+    counter = get_token_counter()
+    tokens = counter.count(prompt)
+    sizes = counter.count_many([chunk.content for chunk in chunks])
+
+The backend can be chosen with the ``ORCHESTRATOR_TOKENIZER`` environment
+variable: ``auto`` (default), ``tiktoken`` or ``heuristic``.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "cl100k_base"
+DEFAULT_CACHE_SIZE = 8192
+
+# Texts shorter than this are cached by value rather than by digest
+_DIGEST_THRESHOLD = 64
+
+# Letter runs, digit runs, whitespace runs, or any other single character
+_PIECE_PATTERN = re.compile(r"[A-Za-z]+|[0-9]+|\s+|.", re.DOTALL)
+
+
+class TokenizerBackend(ABC):
+    """Abstract base class for token counting backends."""
+
+    name = "base"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Count tokens in a single text."""
+
+    def count_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens in several texts."""
+        return [self.count(text) for text in texts]
+
+
+class HeuristicBackend(TokenizerBackend):
+    """Approximates BPE token counts without a tokenizer.
+
+    Calibrated against cl100k-style tokenizers:
+    - English words are usually one token; long words split about every
+      12 letters
+    - Digits are grouped in runs of up to 3
+    - Whitespace runs merge into one token; a single space joins the next word
+    - Punctuation and non-ASCII characters count one token each
+    """
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        tokens = 0
+        for piece in _PIECE_PATTERN.findall(text):
+            first = piece[0]
+            if first.isspace():
+                if piece != " ":
+                    tokens += 1
+            elif first.isascii() and first.isalpha():
+                tokens += 1 + (len(piece) - 1) // 12
+            elif first.isascii() and first.isdigit():
+                tokens += (len(piece) + 2) // 3
+            else:
+                tokens += 1
+        return tokens
+
+
+class TiktokenBackend(TokenizerBackend):
+    """Exact counts from a local tiktoken encoding."""
+
+    name = "tiktoken"
+
+    def __init__(self, encoding_name: str = DEFAULT_ENCODING):
+        import tiktoken
+
+        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.name = f"tiktoken:{encoding_name}"
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode_ordinary(text))
+
+    def count_batch(self, texts: list[str]) -> list[int]:
+        return [len(tokens) for tokens in self.encoding.encode_ordinary_batch(texts)]
+
+
+def create_backend(kind: Optional[str] = None) -> TokenizerBackend:
+    """Create a tokenizer backend.
+
+    Args:
+        kind: "auto", "tiktoken" or "heuristic" (defaults to
+            ``ORCHESTRATOR_TOKENIZER`` or "auto")
+
+    Returns:
+        TokenizerBackend, falling back to the heuristic if tiktoken or its
+        encoding data is unavailable
+    """
+    kind = (kind or os.environ.get("ORCHESTRATOR_TOKENIZER") or "auto").lower()
+    if kind in ("auto", "tiktoken"):
+        try:
+            return TiktokenBackend()
+        except Exception as e:
+            # ImportError, or encoding files not cached and no network
+            log = logger.warning if kind == "tiktoken" else logger.debug
+            log(f"tiktoken unavailable, using heuristic token counts: {e}")
+    return HeuristicBackend()
+
+
+class TokenCounter:
+    """Memoizing token counter over a pluggable backend.
+
+    Thread-safe. Counts are cached by content (short texts) or SHA-1 digest
+    (longer texts) in an LRU of ``cache_size`` entries.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[TokenizerBackend] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """Initialize the counter.
+
+        Args:
+            backend: Tokenizer backend (auto-detected if not provided)
+            cache_size: Maximum number of memoized counts
+        """
+        self.backend = backend or create_backend()
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str | bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend_name(self) -> str:
+        return self.backend.name
+
+    @staticmethod
+    def _key(text: str) -> str | bytes:
+        # Digests are bytes, so they never collide with short texts kept as str
+        if len(text) < _DIGEST_THRESHOLD:
+            return text
+        return hashlib.sha1(text.encode("utf-8", "surrogatepass")).digest()
+
+    def _lookup(self, key: str | bytes) -> Optional[int]:
+        # Caller holds self._lock
+        count = self._cache.get(key)
+        if count is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+        return count
+
+    def _store(self, key: str | bytes, count: int) -> None:
+        # Caller holds self._lock
+        self._cache[key] = count
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def count(self, text: str) -> int:
+        """Count tokens in a text."""
+        if not text:
+            return 0
+        key = self._key(text)
+        with self._lock:
+            count = self._lookup(key)
+            if count is not None:
+                return count
+            self.misses += 1
+
+        count = self.backend.count(text)
+        with self._lock:
+            self._store(key, count)
+        return count
+
+    def count_many(self, texts: Iterable[str]) -> list[int]:
+        """Count tokens in many texts, tokenizing cache misses in one batch.
+
+        Args:
+            texts: Texts to count
+
+        Returns:
+            Token counts in input order
+        """
+        texts = list(texts)
+        counts = [0] * len(texts)
+        missing: dict[str | bytes, list[int]] = {}
+        missing_texts: list[str] = []
+
+        keys = [self._key(text) if text else "" for text in texts]
+        with self._lock:
+            for i, (text, key) in enumerate(zip(texts, keys, strict=True)):
+                if not text:
+                    continue
+                cached = self._lookup(key)
+                if cached is not None:
+                    counts[i] = cached
+                elif key in missing:
+                    missing[key].append(i)
+                else:
+                    missing[key] = [i]
+                    missing_texts.append(text)
+            self.misses += len(missing_texts)
+
+        if missing_texts:
+            results = self.backend.count_batch(missing_texts)
+            with self._lock:
+                for (key, positions), count in zip(missing.items(), results, strict=True):
+                    self._store(key, count)
+                    for i in positions:
+                        counts[i] = count
+        return counts
+
+    def clear(self) -> None:
+        """Drop all memoized counts."""
+        with self._lock:
+            self._cache.clear()
+
+
+_default_counter: Optional[TokenCounter] = None
+_default_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """Get the shared token counter."""
+    global _default_counter
+    if _default_counter is None:
+        with _default_lock:
+            if _default_counter is None:
+                _default_counter = TokenCounter()
+    return _default_counter
+
+
+def set_token_counter(counter: Optional[TokenCounter]) -> None:
+    """Replace the shared token counter (None re-detects on next use)."""
+    global _default_counter
+    with _default_lock:
+        _default_counter = counter
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in a text with the shared counter."""
+    return get_token_counter().count(text)
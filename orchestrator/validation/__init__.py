@@ -8,6 +8,7 @@ from orchestrator.validation.tdd import (
     validate_implement_phase,
     validate_test_phase,
 )
+from orchestrator.validation.test_impact import TestImpactAnalyzer, TestSelection
 
 __all__ = [
     "TDDValidator",
@@ -15,6 +16,8 @@ __all__ = [
     "TDDPhase",
     "validate_test_phase",
     "validate_implement_phase",
+    "TestImpactAnalyzer",
+    "TestSelection",
     "SchemaValidator",
     "validate_output",
 ]
@@ -22,6 +22,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
+from orchestrator.validation.test_impact import TestImpactAnalyzer
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,28 +141,38 @@ class TDDValidator:
         self,
         project_dir: Path,
         coverage_threshold: float = COVERAGE_THRESHOLD,
+        impact_analyzer: Optional[TestImpactAnalyzer] = None,
     ):
         """Initialize TDD validator.
 
         Args:
             project_dir: Project directory
             coverage_threshold: Minimum required coverage percentage
+            impact_analyzer: Optional analyzer to run only affected tests
         """
         self.project_dir = Path(project_dir)
         self.coverage_threshold = coverage_threshold
+        self.impact_analyzer = impact_analyzer
 
     async def run_tests(
         self,
         test_files: list[str],
         with_coverage: bool = False,
         source_dir: str = "src",
+        changed_files: Optional[list[str]] = None,
     ) -> TestResult:
         """Run tests and return results.
 
+        With an impact analyzer configured, only tests affected by changes
+        since the previous run are executed. A passing partial run is
+        confirmed with a full run. Coverage runs always use the full set,
+        since coverage of a subset is meaningless.
+
         Args:
             test_files: List of test file paths
             with_coverage: Whether to run with coverage
             source_dir: Source directory for coverage
+            changed_files: Files known to have changed since the previous run
 
         Returns:
             TestResult with test execution details
@@ -168,6 +180,41 @@ class TDDValidator:
         if not test_files:
             return TestResult(output="No test files provided")
 
+        if self.impact_analyzer is None or with_coverage:
+            return await self._execute_tests(test_files, with_coverage, source_dir)
+
+        selection = self.impact_analyzer.select_tests(test_files, changed_files)
+        result = await self._execute_tests(selection.tests, with_coverage, source_dir)
+        self.impact_analyzer.record_result(
+            selection, result.all_pass, [t["file"] for t in result.failed_tests]
+        )
+
+        if result.all_pass and not selection.full_run:
+            selection = self.impact_analyzer.full_selection(test_files, "confirm partial pass")
+            result = await self._execute_tests(test_files, with_coverage, source_dir)
+            self.impact_analyzer.record_result(
+                selection, result.all_pass, [t["file"] for t in result.failed_tests]
+            )
+
+        return result
+
+    async def _execute_tests(
+        self,
+        test_files: list[str],
+        with_coverage: bool,
+        source_dir: str,
+    ) -> TestResult:
+        """Execute the test runner for the given files.
+
+        Args:
+            test_files: List of test file paths
+            with_coverage: Whether to run with coverage
+            source_dir: Source directory for coverage
+
+        Returns:
+            TestResult with test execution details
+        """
+
         # Determine test runner based on file extension
         extensions = set(Path(f).suffix for f in test_files)
         if len(extensions) > 1:
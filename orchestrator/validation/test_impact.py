@@ -0,0 +1,477 @@
+"""
+Test impact analysis.
+
+Maps source files to the test files that (transitively) import them so that
+iterative loops only rerun the tests affected by the latest edits:
+
+1. Build a static import graph for the given test files (Python via ``ast``,
+   JS/TS via import/require specifiers) and persist it with per-file stat
+   fingerprints, so unchanged files are never re-parsed.
+2. Detect changed files by comparing stats against the last selection, plus
+   any changes reported explicitly by the caller.
+3. Select the affected tests plus any tests still known to be failing.
+4. Fall back to a full run on the first selection, after changes to global
+   test configuration (conftest, pyproject, package.json...), for files the
+   graph cannot attribute, and every ``full_run_interval`` selections.
+
+A subset that passes is never proof that the whole suite passes, so callers
+should confirm with a full run before declaring success.
+
+Usage:
+    from orchestrator.validation import TestImpactAnalyzer
+
+    analyzer = TestImpactAnalyzer(project_dir)
+    selection = analyzer.select_tests(test_files, changed_files)
+    ...run selection.tests...
+    analyzer.record_result(selection, passed, failed_test_files)
+"""
+
+import ast
+import json
+import logging
+import os
+import re
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the persisted layout changes
+STATE_VERSION = 1
+
+# Default location of the persisted impact map, relative to the project
+DEFAULT_STATE_PATH = Path(".workflow") / "test_impact.json"
+
+# Files whose modification may affect every test
+GLOBAL_TEST_FILES = {
+    "conftest.py",
+    "pytest.ini",
+    "pyproject.toml",
+    "setup.cfg",
+    "setup.py",
+    "tox.ini",
+    "package.json",
+    "package-lock.json",
+    "pnpm-lock.yaml",
+    "yarn.lock",
+    "bun.lockb",
+    "tsconfig.json",
+    "jest.config.js",
+    "jest.config.ts",
+    "jest.setup.js",
+    "jest.setup.ts",
+    "vitest.config.js",
+    "vitest.config.ts",
+    "babel.config.js",
+    ".babelrc",
+}
+
+PYTHON_SUFFIXES = {".py"}
+JS_SUFFIXES = [".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs"]
+CODE_SUFFIXES = PYTHON_SUFFIXES | set(JS_SUFFIXES)
+
+# Directories searched when resolving absolute Python imports
+PYTHON_SOURCE_ROOTS = ["", "src", "lib", "app"]
+
+_JS_IMPORT_PATTERN = re.compile(
+    r"""(?:\bfrom\s*|\bimport\s*\(?\s*|\brequire\s*\(\s*)['"](\.{1,2}/[^'"]+)['"]"""
+)
+_PYTEST_FAILURE_PATTERN = re.compile(r"^(?:FAILED|ERROR)\s+([^\s:]+\.py)", re.MULTILINE)
+
+
+@dataclass
+class TestSelection:
+    """Tests chosen for one run."""
+
+    __test__ = False  # Not a pytest test class
+
+    tests: list[str]
+    full_run: bool
+    reason: str
+    changed_files: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "tests": self.tests,
+            "full_run": self.full_run,
+            "reason": self.reason,
+            "changed_files": self.changed_files,
+        }
+
+
+class TestImpactAnalyzer:
+    """Selects the minimal set of tests affected by file changes."""
+
+    __test__ = False  # Not a pytest test class
+
+    # Force a full run after this many consecutive partial selections
+    FULL_RUN_INTERVAL = 5
+
+    def __init__(
+        self,
+        project_dir: Path,
+        full_run_interval: int = FULL_RUN_INTERVAL,
+        state_path: Optional[Path] = None,
+    ):
+        """Initialize the analyzer.
+
+        Args:
+            project_dir: Project directory
+            full_run_interval: Partial selections allowed between full runs
+            state_path: Where to persist the impact map (default .workflow/test_impact.json)
+        """
+        self.project_dir = Path(project_dir).resolve()
+        self.full_run_interval = max(1, full_run_interval)
+        self.state_path = Path(state_path) if state_path else self.project_dir / DEFAULT_STATE_PATH
+
+        self._files: dict[str, dict[str, Any]] = {}
+        self._pending: set[str] = set()
+        self._partial_runs = 0
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def select_tests(
+        self,
+        test_files: list[str],
+        changed_files: Optional[Iterable[str]] = None,
+    ) -> TestSelection:
+        """Select the tests affected since the previous selection.
+
+        Args:
+            test_files: Candidate test files (relative to project or absolute)
+            changed_files: Files reported as changed by the caller, if known
+
+        Returns:
+            TestSelection with the tests to run
+        """
+        self._load()
+        tests = [self._normalize(t) for t in test_files]
+        first_run = not self._files
+
+        changed = {self._normalize(f) for f in (changed_files or [])}
+        new_tests = {t for t in tests if t not in self._files}
+        changed |= self._refresh_graph(tests)
+        changed |= self._refresh_global_files(tests)
+        self._save()
+
+        changed_list = sorted(changed)
+
+        if first_run:
+            return self._full(tests, "no impact map yet", changed_list)
+        if self._partial_runs >= self.full_run_interval:
+            return self._full(tests, "periodic full run", changed_list)
+
+        unattributable = [f for f in changed if not self._is_attributable(f)]
+        if unattributable:
+            return self._full(
+                tests,
+                f"global or non-code change: {', '.join(sorted(unattributable)[:3])}",
+                changed_list,
+            )
+
+        affected = {t for t in tests if t in changed or t in new_tests or t in self._pending}
+        for test in tests:
+            if test not in affected and self._dependencies(test) & changed:
+                affected.add(test)
+
+        if not affected:
+            return self._full(tests, "no affected tests", changed_list)
+        if len(affected) == len(set(tests)):
+            return self._full(tests, "all tests affected", changed_list)
+
+        selected = [t for t in tests if t in affected]
+        logger.info(f"Test impact: running {len(selected)}/{len(tests)} affected test files")
+        return TestSelection(
+            tests=selected,
+            full_run=False,
+            reason="affected by changes",
+            changed_files=changed_list,
+        )
+
+    def record_result(
+        self,
+        selection: TestSelection,
+        passed: bool,
+        failed_tests: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Record the outcome of running a selection.
+
+        Tests that failed stay pending and are re-selected until they pass.
+        When the failing files are unknown, the whole selection stays pending.
+
+        Args:
+            selection: Selection that was run
+            passed: Whether every selected test passed
+            failed_tests: Test files that failed, if they could be determined
+        """
+        self._load()
+        selected = set(selection.tests)
+        self._pending -= selected
+        if not passed:
+            failed = {self._normalize(f) for f in (failed_tests or [])} & selected
+            self._pending |= failed or selected
+
+        self._partial_runs = 0 if selection.full_run else self._partial_runs + 1
+        self._save()
+
+    def full_selection(self, test_files: list[str], reason: str) -> TestSelection:
+        """Build a selection that runs every test file."""
+        return self._full([self._normalize(t) for t in test_files], reason, [])
+
+    def affected_by(self, source_file: str) -> set[str]:
+        """Return known test files that depend on a source file."""
+        self._load()
+        target = self._normalize(source_file)
+        return {
+            test
+            for test, entry in self._files.items()
+            if entry.get("test") and (test == target or target in self._dependencies(test))
+        }
+
+    @staticmethod
+    def failed_test_files(output: str) -> list[str]:
+        """Extract failing test files from pytest output."""
+        return sorted(set(_PYTEST_FAILURE_PATTERN.findall(output)))
+
+    # ------------------------------------------------------------------
+    # Graph maintenance
+    # ------------------------------------------------------------------
+
+    def _refresh_graph(self, tests: list[str]) -> set[str]:
+        """Re-stat every file reachable from the tests, re-parsing changed ones.
+
+        Returns:
+            Files whose stat differs from the previous selection
+        """
+        changed: set[str] = set()
+        queue = list(tests)
+        seen: set[str] = set()
+
+        while queue:
+            rel = queue.pop()
+            if rel in seen:
+                continue
+            seen.add(rel)
+
+            stat = self._stat(rel)
+            entry = self._files.get(rel)
+            if stat is None:
+                if entry is not None:
+                    changed.add(rel)
+                    del self._files[rel]
+                continue
+
+            if entry is None or (entry["mtime_ns"], entry["size"]) != stat:
+                if entry is not None:
+                    changed.add(rel)
+                entry = {
+                    "mtime_ns": stat[0],
+                    "size": stat[1],
+                    "deps": sorted(self._parse_dependencies(rel)),
+                }
+                self._files[rel] = entry
+
+            entry["test"] = entry.get("test", False) or rel in tests
+            queue.extend(entry["deps"])
+
+        return changed
+
+    def _refresh_global_files(self, tests: list[str]) -> set[str]:
+        """Re-stat configuration files that affect every test."""
+        candidates = {name for name in GLOBAL_TEST_FILES if (self.project_dir / name).exists()}
+        for test in tests:
+            parent = Path(test).parent
+            while parent != Path("."):
+                conftest = (parent / "conftest.py").as_posix()
+                if (self.project_dir / conftest).exists():
+                    candidates.add(conftest)
+                parent = parent.parent
+
+        changed = set()
+        for rel in candidates:
+            stat = self._stat(rel)
+            entry = self._files.get(rel)
+            if stat is None:
+                continue
+            if entry is None or (entry["mtime_ns"], entry["size"]) != stat:
+                if entry is not None:
+                    changed.add(rel)
+                self._files[rel] = {"mtime_ns": stat[0], "size": stat[1], "deps": []}
+        return changed
+
+    def _dependencies(self, test: str) -> set[str]:
+        """Return the transitive dependencies of a file."""
+        deps: set[str] = set()
+        stack = list(self._files.get(test, {}).get("deps", []))
+        while stack:
+            dep = stack.pop()
+            if dep in deps:
+                continue
+            deps.add(dep)
+            stack.extend(self._files.get(dep, {}).get("deps", []))
+        return deps
+
+    def _is_attributable(self, rel: str) -> bool:
+        """Check whether the import graph can attribute a change to specific tests."""
+        path = Path(rel)
+        if path.name in GLOBAL_TEST_FILES:
+            return False
+        return path.suffix in CODE_SUFFIXES
+
+    def _parse_dependencies(self, rel: str) -> set[str]:
+        """Parse the local imports of a file."""
+        path = self.project_dir / rel
+        suffix = path.suffix
+        try:
+            source = path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return set()
+
+        if suffix in PYTHON_SUFFIXES:
+            return self._python_dependencies(rel, source)
+        if suffix in JS_SUFFIXES:
+            return self._js_dependencies(rel, source)
+        return set()
+
+    def _python_dependencies(self, rel: str, source: str) -> set[str]:
+        """Resolve Python imports to project files."""
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            return set()
+
+        package_parts = list(Path(rel).parent.parts)
+        modules: list[tuple[list[str], int]] = []
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    modules.append((alias.name.split("."), 0))
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module.split(".") if node.module else []
+                modules.append((base, node.level))
+                for alias in node.names:
+                    if alias.name != "*":
+                        modules.append((base + [alias.name], node.level))
+
+        deps: set[str] = set()
+        for parts, level in modules:
+            if level:
+                anchor = package_parts[: max(0, len(package_parts) - (level - 1))]
+                roots = [Path(*anchor) if anchor else Path(".")]
+            else:
+                roots = [Path(root) for root in PYTHON_SOURCE_ROOTS]
+            for root in roots:
+                deps |= self._resolve_python_module(root, parts)
+        deps.discard(rel)
+        return deps
+
+    def _resolve_python_module(self, root: Path, parts: list[str]) -> set[str]:
+        """Resolve a dotted module under a root, including parent packages."""
+        found: set[str] = set()
+        current = root
+        for i, part in enumerate(parts):
+            current = current / part
+            init = current / "__init__.py"
+            if (self.project_dir / init).is_file():
+                found.add(init.as_posix())
+            elif i == len(parts) - 1 and (self.project_dir / current.with_suffix(".py")).is_file():
+                found.add(current.with_suffix(".py").as_posix())
+            elif not (self.project_dir / current).is_dir():
+                break
+        return found
+
+    def _js_dependencies(self, rel: str, source: str) -> set[str]:
+        """Resolve relative JS/TS import specifiers to project files."""
+        deps: set[str] = set()
+        base = Path(rel).parent
+        for specifier in _JS_IMPORT_PATTERN.findall(source):
+            target = Path(os.path.normpath(base / specifier))
+            if target.parts and target.parts[0] == "..":
+                continue
+            candidates = [target]
+            candidates += [target.parent / (target.name + ext) for ext in JS_SUFFIXES]
+            candidates += [target / f"index{ext}" for ext in JS_SUFFIXES]
+            for candidate in candidates:
+                if (self.project_dir / candidate).is_file():
+                    deps.add(candidate.as_posix())
+                    break
+        return deps
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _full(self, tests: list[str], reason: str, changed: list[str]) -> TestSelection:
+        logger.info(f"Test impact: full run ({reason})")
+        return TestSelection(tests=list(tests), full_run=True, reason=reason, changed_files=changed)
+
+    def _normalize(self, path: str) -> str:
+        """Normalize a path to a POSIX path relative to the project."""
+        candidate = Path(path)
+        if candidate.is_absolute():
+            try:
+                candidate = candidate.resolve().relative_to(self.project_dir)
+            except ValueError:
+                return candidate.as_posix()
+        return Path(os.path.normpath(candidate)).as_posix()
+
+    def _stat(self, rel: str) -> Optional[tuple[int, int]]:
+        try:
+            stat = (self.project_dir / rel).stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> None:
+        """Load persisted state once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.state_path.exists():
+            return
+        try:
+            data = json.loads(self.state_path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable test impact map: {e}")
+            return
+        if data.get("version") != STATE_VERSION:
+            return
+        self._files = data.get("files", {})
+        self._pending = set(data.get("pending", []))
+        self._partial_runs = data.get("partial_runs", 0)
+
+    def _save(self) -> None:
+        """Persist state using write-to-temp then atomic rename."""
+        data = {
+            "version": STATE_VERSION,
+            "files": self._files,
+            "pending": sorted(self._pending),
+            "partial_runs": self._partial_runs,
+        }
+        tmp_path = None
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                dir=str(self.state_path.parent),
+                prefix=".test_impact_",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp_file:
+                tmp_path = tmp_file.name
+                json.dump(data, tmp_file)
+            os.replace(tmp_path, str(self.state_path))
+            tmp_path = None
+        except OSError as e:
+            logger.warning(f"Failed to persist test impact map: {e}")
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
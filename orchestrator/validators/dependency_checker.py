@@ -4,13 +4,23 @@ Provides strategies for checking:
 - NPM package updates and vulnerabilities
 - Docker image security and best practices
 - Framework version compatibility
+
+Strategies run concurrently. Each strategy's findings are cached on disk
+(``.workflow/cache/dependencies``), keyed by a hash of the manifests it
+reads (package.json/package-lock.json, Dockerfile, compose files), so a
+repeated check of unchanged manifests within the TTL runs no subprocesses.
 """
 
+import hashlib
 import json
 import logging
+import os
 import re
 import subprocess
+import tempfile
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -18,6 +28,12 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Seconds cached findings stay valid for unchanged manifests
+DEFAULT_CACHE_TTL_SECONDS = 6 * 3600
+
+# Bumped when the cached finding format changes
+CACHE_VERSION = 1
+
 
 class DependencySeverity(Enum):
     """Severity levels for dependency issues."""
@@ -61,6 +77,11 @@ class DependencyFinding:
             "fix_command": self.fix_command,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "DependencyFinding":
+        """Create from dictionary."""
+        return cls(**{**data, "severity": DependencySeverity(data["severity"])})
+
 
 @dataclass
 class DependencyCheckResult:
@@ -94,6 +115,23 @@ class DependencyCheckResult:
 class DependencyStrategy(ABC):
     """Abstract base class for dependency checking strategies."""
 
+    # Identifies the strategy's cache entry
+    name: str = "dependency"
+
+    # Set by check() when a tool failed, so partial findings are not cached
+    incomplete: bool = False
+
+    def cache_inputs(self, project_dir: Path) -> list[Path]:
+        """Files whose contents determine this strategy's findings.
+
+        Args:
+            project_dir: Project directory path
+
+        Returns:
+            Paths (missing files are part of the cache key too)
+        """
+        return []
+
     @abstractmethod
     def check(self, project_dir: Path) -> list[DependencyFinding]:
         """Run dependency checks.
@@ -110,6 +148,16 @@ class DependencyStrategy(ABC):
 class NpmDependencyStrategy(DependencyStrategy):
     """Strategy for checking npm dependencies."""
 
+    name = "npm"
+
+    def cache_inputs(self, project_dir: Path) -> list[Path]:
+        """Manifest and lockfiles read by npm outdated and npm audit."""
+        return [
+            project_dir / "package.json",
+            project_dir / "package-lock.json",
+            project_dir / "npm-shrinkwrap.json",
+        ]
+
     def check(self, project_dir: Path) -> list[DependencyFinding]:
         """Check npm dependencies for outdated packages and vulnerabilities.
 
@@ -120,17 +168,19 @@ class NpmDependencyStrategy(DependencyStrategy):
             List of findings
         """
         findings: list[DependencyFinding] = []
+        self.incomplete = False
 
         # Check if package.json exists
         package_json = project_dir / "package.json"
         if not package_json.exists():
             return findings
 
-        # Check for outdated packages
-        findings.extend(self._check_outdated(project_dir))
-
-        # Check for vulnerabilities
-        findings.extend(self._check_audit(project_dir))
+        # Check for outdated packages and vulnerabilities concurrently
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="npm-check") as pool:
+            outdated = pool.submit(self._check_outdated, project_dir)
+            audit = pool.submit(self._check_audit, project_dir)
+            findings.extend(outdated.result())
+            findings.extend(audit.result())
 
         return findings
 
@@ -152,6 +202,7 @@ class NpmDependencyStrategy(DependencyStrategy):
                 try:
                     outdated = json.loads(proc.stdout)
                 except json.JSONDecodeError:
+                    self.incomplete = True
                     return findings
 
                 for package, info in outdated.items():
@@ -186,10 +237,13 @@ class NpmDependencyStrategy(DependencyStrategy):
                     )
 
         except subprocess.TimeoutExpired:
+            self.incomplete = True
             logger.warning("npm outdated timed out")
         except FileNotFoundError:
+            self.incomplete = True
             logger.warning("npm not found")
         except Exception as e:
+            self.incomplete = True
             logger.warning(f"npm outdated failed: {e}")
 
         return findings
@@ -211,6 +265,7 @@ class NpmDependencyStrategy(DependencyStrategy):
                 try:
                     audit = json.loads(proc.stdout)
                 except json.JSONDecodeError:
+                    self.incomplete = True
                     return findings
 
                 vulnerabilities = audit.get("vulnerabilities", {})
@@ -248,10 +303,13 @@ class NpmDependencyStrategy(DependencyStrategy):
                     )
 
         except subprocess.TimeoutExpired:
+            self.incomplete = True
             logger.warning("npm audit timed out")
         except FileNotFoundError:
+            self.incomplete = True
             logger.warning("npm not found")
         except Exception as e:
+            self.incomplete = True
             logger.warning(f"npm audit failed: {e}")
 
         return findings
@@ -295,6 +353,8 @@ class NpmDependencyStrategy(DependencyStrategy):
 class DockerImageStrategy(DependencyStrategy):
     """Strategy for checking Docker image security."""
 
+    name = "docker"
+
     # Known LTS versions for common base images
     LTS_VERSIONS = {
         "node": ["20", "22"],
@@ -304,6 +364,14 @@ class DockerImageStrategy(DependencyStrategy):
         "debian": ["bookworm", "trixie"],
     }
 
+    def cache_inputs(self, project_dir: Path) -> list[Path]:
+        """Dockerfile, compose files and .dockerignore."""
+        return [
+            project_dir / "Dockerfile",
+            project_dir / ".dockerignore",
+            *sorted(project_dir.glob("docker-compose*.y*ml")),
+        ]
+
     def check(self, project_dir: Path) -> list[DependencyFinding]:
         """Check Docker files for security issues.
 
@@ -461,6 +529,8 @@ class DockerImageStrategy(DependencyStrategy):
 class FrameworkVersionStrategy(DependencyStrategy):
     """Strategy for checking framework version compatibility."""
 
+    name = "framework"
+
     # Framework compatibility matrix
     FRAMEWORK_VERSIONS = {
         "react": {
@@ -495,6 +565,10 @@ class FrameworkVersionStrategy(DependencyStrategy):
         },
     }
 
+    def cache_inputs(self, project_dir: Path) -> list[Path]:
+        """package.json, which declares the framework versions."""
+        return [project_dir / "package.json"]
+
     def check(self, project_dir: Path) -> list[DependencyFinding]:
         """Check framework versions for compatibility.
 
@@ -569,6 +643,8 @@ class DependencyChecker:
         check_docker: bool = True,
         check_frameworks: bool = True,
         blocking_severities: list[DependencySeverity] | None = None,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        cache_dir: Optional[Path] = None,
     ):
         """Initialize the dependency checker.
 
@@ -578,8 +654,16 @@ class DependencyChecker:
             check_docker: Whether to check Docker files
             check_frameworks: Whether to check framework versions
             blocking_severities: Severities that block the workflow
+            cache_ttl_seconds: How long cached findings stay valid (0 disables caching)
+            cache_dir: Cache directory (defaults to .workflow/cache/dependencies)
         """
         self.project_dir = Path(project_dir)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_dir = (
+            Path(cache_dir)
+            if cache_dir
+            else self.project_dir / ".workflow" / "cache" / "dependencies"
+        )
         self.check_npm = check_npm
         self.check_docker = check_docker
         self.check_frameworks = check_frameworks
@@ -605,13 +689,17 @@ class DependencyChecker:
         """
         all_findings: list[DependencyFinding] = []
 
-        # Run all strategies
-        for strategy in self.strategies:
-            try:
-                findings = strategy.check(self.project_dir)
-                all_findings.extend(findings)
-            except Exception as e:
-                logger.warning(f"Strategy {strategy.__class__.__name__} failed: {e}")
+        # Run all strategies concurrently, keeping their order in the result
+        if self.strategies:
+            with ThreadPoolExecutor(
+                max_workers=len(self.strategies), thread_name_prefix="dependency-check"
+            ) as pool:
+                futures = [pool.submit(self._run_strategy, s) for s in self.strategies]
+                for strategy, future in zip(self.strategies, futures, strict=True):
+                    try:
+                        all_findings.extend(future.result())
+                    except Exception as e:
+                        logger.warning(f"Strategy {strategy.__class__.__name__} failed: {e}")
 
         # Count blocking findings
         blocking_findings = sum(1 for f in all_findings if f.severity in self.blocking_severities)
@@ -642,6 +730,84 @@ class DependencyChecker:
             auto_fixable=auto_fixable,
         )
 
+    def _run_strategy(self, strategy: DependencyStrategy) -> list[DependencyFinding]:
+        """Run a strategy, serving unchanged manifests from the cache."""
+        if self.cache_ttl_seconds <= 0:
+            return strategy.check(self.project_dir)
+
+        key = self._cache_key(strategy)
+        cached = self._read_cache(strategy, key)
+        if cached is not None:
+            logger.debug(f"Using cached {strategy.name} dependency findings")
+            return cached
+
+        findings = strategy.check(self.project_dir)
+        if not strategy.incomplete:
+            self._write_cache(strategy, key, findings)
+        return findings
+
+    def _cache_key(self, strategy: DependencyStrategy) -> str:
+        """Hash the strategy's input files (and which of them are missing)."""
+        digest = hashlib.sha256(f"{CACHE_VERSION}:{strategy.name}".encode())
+        for path in strategy.cache_inputs(self.project_dir):
+            digest.update(b"\0" + path.name.encode() + b"\0")
+            try:
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+            except FileNotFoundError:
+                digest.update(b"<missing>")
+        return digest.hexdigest()
+
+    def _cache_file(self, strategy: DependencyStrategy) -> Path:
+        return self.cache_dir / f"{strategy.name}.json"
+
+    def _read_cache(self, strategy: DependencyStrategy, key: str) -> list[DependencyFinding] | None:
+        """Read cached findings if they match the key and have not expired."""
+        cache_file = self._cache_file(strategy)
+        try:
+            entry = json.loads(cache_file.read_text())
+            if entry.get("key") != key:
+                return None
+            if time.time() - float(entry.get("created_at", 0)) > self.cache_ttl_seconds:
+                return None
+            return [DependencyFinding.from_dict(f) for f in entry.get("findings", [])]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable dependency cache {cache_file}: {e}")
+            return None
+
+    def _write_cache(
+        self, strategy: DependencyStrategy, key: str, findings: list[DependencyFinding]
+    ) -> None:
+        """Atomically write a strategy's findings to the cache."""
+        content = json.dumps(
+            {
+                "key": key,
+                "created_at": time.time(),
+                "findings": [f.to_dict() for f in findings],
+            },
+            indent=2,
+        )
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                prefix=f".{strategy.name}_",
+                suffix=".json.tmp",
+                dir=str(self.cache_dir),
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(content)
+                os.replace(temp_path, str(self._cache_file(strategy)))
+            except Exception:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write dependency cache: {e}")
+
     def _build_npm_analysis(self, findings: list[DependencyFinding]) -> dict:
         """Build npm analysis section."""
         npm_findings = [f for f in findings if f.category == "npm"]
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark progress streaming: astream_events against the node update stream.
+Runs a chain of nodes over a state with large documents and reports time per
+superstep, callback count and peak traced memory for both modes.
+Usage: uv run scripts/bench_progress_stream.py [--nodes N] [--state-kb KB] [--runs N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, TypedDict
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from langgraph.graph import END, START, StateGraph
+
+from orchestrator.langgraph.utils.progress_stream import PROGRESS_STREAM_ENV
+from orchestrator.langgraph.workflow import WorkflowRunner
+
+
+class BenchState(TypedDict, total=False):
+    current_phase: int
+    phase_status: dict
+    documents: dict
+    step: int
+
+
+class CountingCallback:
+    def __init__(self):
+        self.calls = 0
+
+    def on_node_start(self, node_name: str, state: dict) -> None:
+        self.calls += 1
+
+    def on_node_end(self, node_name: str, state: dict) -> None:
+        self.calls += 1
+
+
+def build_graph(nodes: int):
+    builder = StateGraph(BenchState)
+
+    def make_node(i: int):
+        def node(state: BenchState) -> dict:
+            return {"step": i, "current_phase": 1 + i * 5 // nodes}
+
+        return node
+
+    previous = START
+    for i in range(nodes):
+        builder.add_node(f"node_{i}", make_node(i))
+        builder.add_edge(previous, f"node_{i}")
+        previous = f"node_{i}"
+    builder.add_edge(previous, END)
+    return builder.compile()
+
+
+def initial_state(state_kb: int) -> dict[str, Any]:
+    documents = {f"doc_{i}.md": "lorem ipsum " * 85 for i in range(state_kb)}
+    return {"current_phase": 1, "phase_status": {}, "documents": documents, "step": 0}
+
+
+async def run_mode(mode: str, nodes: int, state_kb: int, runs: int) -> tuple[float, float, int]:
+    os.environ[PROGRESS_STREAM_ENV] = mode
+    runner = WorkflowRunner(project_root)
+    graph = build_graph(nodes)
+    config = {"configurable": {"thread_id": "bench"}, "recursion_limit": nodes + 10}
+
+    elapsed = 0.0
+    peak = 0
+    calls = 0
+    for _ in range(runs):
+        callback = CountingCallback()
+        state = initial_state(state_kb)
+        tracemalloc.start()
+        start = time.perf_counter()
+        await runner._run_with_callbacks(graph, state, config, callback)
+        elapsed += time.perf_counter() - start
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        calls = callback.calls
+    return elapsed / runs / nodes * 1e3, peak / 1024 / 1024, calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=40)
+    parser.add_argument("--state-kb", type=int, default=512)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    os.environ.setdefault("LANGGRAPH_CHECKPOINTER", "memory")
+
+    print(f"{args.nodes} nodes, ~{args.state_kb} KB state, {args.runs} runs (traced)")
+    print(f"{'mode':<10}{'per step':>12}{'peak mem':>12}{'callbacks':>11}")
+    results = {}
+    for mode in ("events", "updates"):
+        per_step, peak_mb, calls = asyncio.run(run_mode(mode, args.nodes, args.state_kb, args.runs))
+        results[mode] = per_step
+        print(f"{mode:<10}{per_step:>10.2f}ms{peak_mb:>10.1f}MB{calls:>11}")
+    print(f"speedup: {results['events'] / results['updates']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Load benchmark for the dashboard rate limiter against the per-client timestamp list.
+Usage: uv run scripts/bench_rate_limit.py [--clients N] [--requests N] [--threads N]
+(requires the dashboard backend dependencies)
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add dashboard backend to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "dashboard" / "backend"))
+
+from app.middleware.rate_limit import RateLimitConfig, RateLimitMiddleware
+
+PER_MINUTE = 600
+PER_SECOND = 50
+
+
+class TimestampListLimiter:
+    """The previous sliding window: a list of timestamps per client."""
+
+    def __init__(self):
+        self._clients: dict[str, list[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def check(self, client_id: str) -> bool:
+        now = time.time()
+        with self._lock:
+            timestamps = self._clients[client_id]
+            timestamps[:] = [ts for ts in timestamps if ts > now - 60]
+            if sum(1 for ts in timestamps if ts > now - 1) >= PER_SECOND:
+                return False
+            if len(timestamps) >= PER_MINUTE:
+                return False
+            timestamps.append(now)
+            return True
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+
+def _percentile(samples: list[int], q: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * q))] / 1000
+
+
+def run(check, clients: list[str], threads: int) -> tuple[list[int], float]:
+    """Issue one check per client ID from each thread, timing every call in ns."""
+    samples: list[int] = []
+    samples_lock = threading.Lock()
+
+    def worker(ids: list[str]) -> None:
+        local = []
+        for client_id in ids:
+            start = time.perf_counter_ns()
+            check(client_id)
+            local.append(time.perf_counter_ns() - start)
+        with samples_lock:
+            samples.extend(local)
+
+    chunks = [clients[i::threads] for i in range(threads)]
+    workers = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sorted(samples), time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=20000, help="distinct client IPs")
+    parser.add_argument("--requests", type=int, default=200000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--max-clients", type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    ips = [f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(args.clients)]
+    # Skewed traffic: a few busy clients behind the proxy, a long tail of one-off ones
+    hot = ips[: max(1, args.clients // 100)]
+    traffic = [
+        rng.choice(hot) if rng.random() < 0.5 else rng.choice(ips) for _ in range(args.requests)
+    ]
+
+    legacy = TimestampListLimiter()
+    middleware = RateLimitMiddleware(MagicMock(), RateLimitConfig(max_clients=args.max_clients))
+    cases = [
+        ("timestamp list", legacy.check, lambda: legacy.client_count),
+        (
+            "gcra + lru",
+            lambda c: middleware._check_rate_limit(c, PER_MINUTE, PER_SECOND),
+            lambda: middleware.client_count,
+        ),
+    ]
+
+    print(
+        f"{args.requests} requests, {args.clients} clients, {args.threads} threads\n"
+        f"{'limiter':<16}{'p50':>12}{'p99':>12}{'p99.9':>12}{'req/s':>12}{'clients':>10}"
+    )
+    for name, check, count in cases:
+        samples, elapsed = run(check, traffic, args.threads)
+        print(
+            f"{name:<16}{_percentile(samples, 0.5):>10.2f}us{_percentile(samples, 0.99):>10.2f}us"
+            f"{_percentile(samples, 0.999):>10.2f}us{len(samples) / elapsed:>12,.0f}{count():>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for SecretsRedactor against the sequential per-pattern pass.
+Usage: uv run scripts/bench_redaction.py [--iterations N]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from orchestrator.utils.logging import SecretsRedactor
+
+TYPICAL_CLEAN = "Phase 3 complete: 12 files reviewed, 0 blocking issues found"
+TYPICAL_SECRET = "Calling provider with api_key=abcdefghijklmnopqrstuvwxyz0123 for task T4"
+AGENT_OUTPUT_LINE = "INFO  src/orders/service.py:120 processed batch in 35ms (retries=0)\n"
+
+
+def sequential_redact(patterns, message: str) -> str:
+    for pattern, replacement in patterns:
+        message = pattern.sub(replacement, message)
+    return message
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    redactor = SecretsRedactor()
+    sequential = [(re.compile(p), r) for p, r in SecretsRedactor.PATTERNS]
+    large_clean = AGENT_OUTPUT_LINE * 30000  # ~2 MB
+    large_secret = large_clean + "export GITHUB_TOKEN=ghp_" + "a" * 36 + "\n"
+    chunks = [large_secret[i : i + 65536] for i in range(0, len(large_secret), 65536)]
+
+    cases = [
+        ("typical clean", TYPICAL_CLEAN, args.iterations),
+        ("typical secret", TYPICAL_SECRET, args.iterations),
+        ("large clean (2MB)", large_clean, 5),
+        ("large with secret", large_secret, 5),
+    ]
+
+    print(f"{'case':<22}{'sequential':>14}{'single-pass':>14}{'speedup':>10}")
+    for name, message, number in cases:
+        assert "ghp_a" not in redactor.redact(message)
+        old = timeit.timeit(lambda m=message: sequential_redact(sequential, m), number=number)
+        new = timeit.timeit(lambda m=message: redactor.redact(m), number=number)
+        print(
+            f"{name:<22}{old / number * 1e6:>12.1f}us{new / number * 1e6:>12.1f}us"
+            f"{old / new:>9.1f}x"
+        )
+
+    stream = timeit.timeit(lambda: "".join(redactor.redact_stream(chunks)), number=5)
+    print(f"{'stream (64KB chunks)':<22}{'':>14}{stream / 5 * 1e6:>12.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""Tests for audit statistics rollups.
+
+Tests cover:
+1. Splitting a time range into daily, hourly and raw pieces
+2. Rolling settled entries up into hourly and daily rollups
+3. Statistics merged from rollups and the un-rolled tail
+4. Idempotent, bounded roll-up passes
+
+Run with: pytest tests/db/test_audit_rollups.py -v
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from orchestrator.db.repositories import audit as audit_module
+from orchestrator.db.repositories.audit import AuditRepository, _stat_segments
+
+NOW = datetime(2026, 3, 10, 12, 30)
+
+
+def _time(value) -> datetime:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+class FakeAuditConnection:
+    """Evaluates the audit statistics and roll-up queries over in-memory rows."""
+
+    def __init__(self, entries: list[dict]):
+        self.entries = entries
+        self.rollups: list[dict] = []
+        self.state: dict | None = None
+        self.raw_rows_scanned = 0
+
+    @staticmethod
+    def _in_range(rows, query, params, field):
+        if f"{field} >= <datetime>$since" in query:
+            rows = [r for r in rows if _time(r[field]) >= _time(params["since"])]
+        if f"{field} < <datetime>$until" in query:
+            rows = [r for r in rows if _time(r[field]) < _time(params["until"])]
+        return rows
+
+    @staticmethod
+    def _group(rows, keys, count_field=None):
+        groups: dict[tuple, dict] = {}
+        for row in rows:
+            key = tuple(row[k] for k in keys)
+            group = groups.setdefault(
+                key, {**dict(zip(keys, key, strict=True)), "n": 0, "cost": 0.0, "duration": 0.0}
+            )
+            group["n"] += row[count_field] if count_field else 1
+            group["cost"] += row.get("cost_usd") or 0
+            group["duration"] += row.get("duration_seconds") or 0
+        return list(groups.values())
+
+    async def query(self, query: str, params: dict | None = None) -> list[dict]:
+        params = params or {}
+        if "audit_rollup_state:current" in query:
+            return [self.state] if self.state else []
+        if query.startswith("SELECT timestamp FROM audit_entries"):
+            return sorted(self.entries, key=lambda e: e["timestamp"])[:1]
+        if "DELETE audit_rollups" in query:
+            doomed = self._in_range(
+                [r for r in self.rollups if r["granularity"] == params["granularity"]],
+                query,
+                params,
+                "bucket",
+            )
+            self.rollups = [r for r in self.rollups if not any(r is d for d in doomed)]
+            return []
+        if query.startswith("INSERT INTO audit_rollups"):
+            self.rollups.extend(dict(r) for r in params["rows"])
+            return []
+
+        if "time::floor(timestamp, 1h)" in query:
+            rows = self._in_range(self.entries, query, params, "timestamp")
+            rows = [{**r, "bucket": _time(r["timestamp"]).replace(minute=0)} for r in rows]
+            return [
+                {**g, "count": g["n"], "cost_usd": g["cost"], "duration_seconds": g["duration"]}
+                for g in self._group(rows, ("bucket", "agent", "status", "model"))
+            ]
+        if "time::floor(bucket, 1d)" in query:
+            rows = [r for r in self.rollups if r["granularity"] == "hour"]
+            rows = self._in_range(rows, query, params, "bucket")
+            rows = [{**r, "day": _time(r["bucket"]).replace(hour=0)} for r in rows]
+            return [
+                {**g, "count": g["n"], "cost_usd": g["cost"], "duration_seconds": g["duration"]}
+                for g in self._group(rows, ("day", "agent", "status", "model"), "count")
+            ]
+
+        if "FROM audit_entries" in query:
+            rows = self._in_range(self.entries, query, params, "timestamp")
+            self.raw_rows_scanned += len(rows)
+            groups = self._group(rows, ("agent", "status"))
+        else:
+            rows = [r for r in self.rollups if r["granularity"] == params["granularity"]]
+            groups = self._group(
+                self._in_range(rows, query, params, "bucket"), ("agent", "status"), "count"
+            )
+        return [
+            {
+                "agent": g["agent"],
+                "status": g["status"],
+                "total": g["n"],
+                "total_cost": g["cost"],
+                "total_duration": g["duration"],
+            }
+            for g in groups
+        ]
+
+    async def create(self, table, data, record_id=None):
+        self.state = dict(data)
+        return {"id": f"{table}:{record_id}", **data}
+
+
+def _entries(days: int = 10) -> list[dict]:
+    """One entry every 20 minutes for the given days before NOW."""
+    entries = []
+    start = NOW - timedelta(days=days)
+    for i in range(days * 72):
+        timestamp = start + timedelta(minutes=20 * i)
+        entries.append(
+            {
+                "agent": ["claude", "cursor", "gemini"][i % 3],
+                "status": ["success", "success", "failed", "timeout"][i % 4],
+                "model": "sonnet" if i % 2 else None,
+                "cost_usd": 0.25 if i % 5 else None,
+                "duration_seconds": float(i % 7),
+                "timestamp": timestamp.isoformat(),
+            }
+        )
+    return entries
+
+
+def _expected(entries, since=None, until=None) -> dict:
+    selected = [
+        e
+        for e in entries
+        if (since is None or _time(e["timestamp"]) >= since)
+        and (until is None or _time(e["timestamp"]) < until)
+    ]
+    by_agent: dict[str, int] = {}
+    by_status: dict[str, int] = {}
+    for e in selected:
+        by_agent[e["agent"]] = by_agent.get(e["agent"], 0) + 1
+        by_status[e["status"]] = by_status.get(e["status"], 0) + 1
+    return {
+        "total": len(selected),
+        "by_agent": by_agent,
+        "by_status": by_status,
+        "cost": sum(e["cost_usd"] or 0 for e in selected),
+        "duration": sum(e["duration_seconds"] for e in selected),
+    }
+
+
+@pytest.fixture
+def db():
+    conn = FakeAuditConnection(_entries())
+
+    @asynccontextmanager
+    async def fake_connection(project_name):
+        yield conn
+
+    with patch.object(audit_module, "get_connection", fake_connection):
+        yield conn
+
+
+@pytest.fixture
+def repo():
+    return AuditRepository("test-project")
+
+
+class TestStatSegments:
+    """Tests for _stat_segments."""
+
+    def test_no_rollups_scans_everything(self):
+        assert _stat_segments(None, None, None) == [("raw", None, None)]
+
+    def test_all_time_uses_days_hours_and_tail(self):
+        rolled = datetime(2026, 3, 10, 11)
+
+        assert _stat_segments(None, None, rolled) == [
+            ("raw", rolled, None),
+            ("day", None, datetime(2026, 3, 10)),
+            ("hour", datetime(2026, 3, 10), rolled),
+        ]
+
+    def test_partial_hours_at_edges_are_raw(self):
+        since = datetime(2026, 3, 1, 9, 15)
+        until = datetime(2026, 3, 5, 14, 45)
+
+        segments = _stat_segments(since, until, datetime(2026, 3, 10))
+
+        assert segments == [
+            ("raw", since, datetime(2026, 3, 1, 10)),
+            ("raw", datetime(2026, 3, 5, 14), until),
+            ("hour", datetime(2026, 3, 1, 10), datetime(2026, 3, 2)),
+            ("day", datetime(2026, 3, 2), datetime(2026, 3, 5)),
+            ("hour", datetime(2026, 3, 5), datetime(2026, 3, 5, 14)),
+        ]
+
+    def test_range_after_watermark_is_raw(self):
+        since = datetime(2026, 3, 10, 11, 30)
+
+        assert _stat_segments(since, None, datetime(2026, 3, 10, 11)) == [("raw", since, None)]
+
+    def test_range_within_one_hour_is_raw(self):
+        since = datetime(2026, 3, 1, 9, 15)
+        until = datetime(2026, 3, 1, 9, 45)
+
+        assert _stat_segments(since, until, datetime(2026, 3, 10)) == [("raw", since, until)]
+
+
+class TestRollUp:
+    """Tests for AuditRepository.roll_up."""
+
+    async def test_rolls_settled_hours(self, repo, db, monkeypatch):
+        monkeypatch.setattr(audit_module, "ROLLUP_MAX_HOURS_PER_PASS", 24 * 30)
+        hours = await repo.roll_up(now=NOW)
+
+        assert hours == 10 * 24 - 1
+        assert db.state["rolled_until"] == datetime(2026, 3, 10, 11).isoformat()
+        hourly = [r for r in db.rollups if r["granularity"] == "hour"]
+        daily = [r for r in db.rollups if r["granularity"] == "day"]
+        assert sum(r["count"] for r in hourly) == sum(r["count"] for r in daily)
+        assert {r["model"] for r in hourly} == {"sonnet", ""}
+
+    async def test_repeated_pass_is_idempotent(self, repo, db, monkeypatch):
+        monkeypatch.setattr(audit_module, "ROLLUP_MAX_HOURS_PER_PASS", 24 * 30)
+        await repo.roll_up(now=NOW)
+        rollups = len(db.rollups)
+
+        db.state = None
+        await repo.roll_up(now=NOW)
+
+        assert len(db.rollups) == rollups
+        assert await repo.roll_up(now=NOW) == 0
+
+    async def test_pass_is_bounded(self, repo, db, monkeypatch):
+        monkeypatch.setattr(audit_module, "ROLLUP_MAX_HOURS_PER_PASS", 24)
+
+        assert await repo.roll_up(now=NOW) == 24
+        assert await repo.roll_up(now=NOW) == 24
+        assert db.state["rolled_until"] == (NOW - timedelta(days=8)).replace(minute=0).isoformat()
+
+    async def test_empty_table(self, repo, db):
+        db.entries = []
+
+        assert await repo.roll_up(now=NOW) == 0
+        assert db.state is None
+
+
+class TestStatistics:
+    """Tests for statistics merged from rollups and the tail."""
+
+    @pytest.mark.parametrize(
+        "since,until",
+        [
+            (None, None),
+            (NOW - timedelta(days=3, minutes=50), None),
+            (NOW - timedelta(days=6, hours=5, minutes=10), NOW - timedelta(days=1, minutes=35)),
+            (NOW - timedelta(minutes=40), None),
+        ],
+    )
+    async def test_matches_full_aggregation(self, repo, db, since, until):
+        await repo.roll_up(now=NOW)
+        await repo.roll_up(now=NOW)
+        assert db.state["rolled_until"] == datetime(2026, 3, 10, 11).isoformat()
+        with patch.object(repo, "roll_up", new=AsyncMock(return_value=0)):
+            stats = await repo.get_statistics(since=since, until=until)
+
+        expected = _expected(db.entries, since, until)
+        assert stats.total == expected["total"]
+        assert stats.by_agent == expected["by_agent"]
+        assert stats.by_status == expected["by_status"]
+        assert stats.success_count == expected["by_status"].get("success", 0)
+        assert stats.total_cost_usd == pytest.approx(expected["cost"])
+        assert stats.avg_duration_seconds == pytest.approx(expected["duration"] / expected["total"])
+
+    async def test_only_tail_entries_scanned(self, repo, db):
+        await repo.roll_up(now=NOW)
+        db.raw_rows_scanned = 0
+
+        stats = await repo.get_statistics()
+
+        assert stats.total == len(db.entries)
+        assert db.raw_rows_scanned <= 3 * 2
+
+    async def test_new_entries_counted_before_roll_up(self, repo, db):
+        await repo.roll_up(now=NOW)
+        db.entries.append(
+            {
+                "agent": "claude",
+                "status": "success",
+                "model": None,
+                "cost_usd": 1.0,
+                "duration_seconds": 1.0,
+                "timestamp": NOW.isoformat(),
+            }
+        )
+
+        stats = await repo.get_statistics()
+
+        assert stats.total == len(db.entries)
+
+    async def test_roll_up_failure_falls_back(self, repo, db):
+        with patch.object(repo, "roll_up", side_effect=RuntimeError("boom")):
+            stats = await repo.get_statistics()
+
+        assert stats.total == len(db.entries)
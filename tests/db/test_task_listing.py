@@ -0,0 +1,229 @@
+"""Tests for paginated task listing and cached task progress.
+
+Tests cover:
+1. Keyset pagination ordered by task ID
+2. Combined status, milestone and priority filters in the query
+3. Field projection for list views
+4. Progress cache hits, live query invalidation and TTL fallback
+
+Run with: pytest tests/db/test_task_listing.py -v
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from orchestrator.db.repositories import tasks as tasks_module
+from orchestrator.db.repositories.tasks import TaskRepository
+
+
+class FakeTaskConnection:
+    """Evaluates the task listing and progress queries over in-memory rows."""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.queries: list[tuple[str, dict]] = []
+
+    async def query(self, query: str, params: dict | None = None) -> list[dict]:
+        params = params or {}
+        self.queries.append((query, dict(params)))
+        if "GROUP BY status" in query:
+            counts: dict[str, int] = {}
+            for row in self.rows:
+                counts[row["status"]] = counts.get(row["status"], 0) + 1
+            return [{"status": status, "count": count} for status, count in counts.items()]
+        if "MERGE $updates" in query:
+            updated = [r for r in self.rows if r["task_id"] == params["task_id"]]
+            for row in updated:
+                row.update(params["updates"])
+            return updated
+
+        rows = self.rows
+        if "statuses" in params:
+            rows = [r for r in rows if r["status"] in params["statuses"]]
+        if "milestone_id" in params:
+            rows = [r for r in rows if r.get("milestone_id") == params["milestone_id"]]
+        if "priorities" in params:
+            rows = [r for r in rows if r["priority"] in params["priorities"]]
+        if "after" in params:
+            rows = [r for r in rows if r["task_id"] > params["after"]]
+        rows = sorted(rows, key=lambda r: r["task_id"])[: params["limit"]]
+        projection = query.split("SELECT", 1)[1].split("FROM", 1)[0].strip()
+        if projection != "*":
+            fields = [f.strip() for f in projection.split(",")]
+            rows = [{f: r[f] for f in fields if f in r} for r in rows]
+        return rows
+
+
+def _row(i: int, status: str = "pending", priority: str = "medium", milestone: str = "M1"):
+    return {
+        "task_id": f"T{i:03d}",
+        "title": f"Task {i}",
+        "user_story": "story",
+        "acceptance_criteria": ["criterion"] * 20,
+        "status": status,
+        "priority": priority,
+        "milestone_id": milestone,
+        "files_to_create": ["a.py"],
+        "files_to_modify": ["b.py"],
+        "implementation_notes": "x" * 1000,
+    }
+
+
+@pytest.fixture
+def db():
+    statuses = ["pending", "in_progress", "completed", "failed"]
+    conn = FakeTaskConnection(
+        [
+            _row(
+                i,
+                status=statuses[i % 4],
+                priority="high" if i % 3 == 0 else "medium",
+                milestone="M1" if i < 30 else "M2",
+            )
+            for i in range(50)
+        ]
+    )
+
+    @asynccontextmanager
+    async def fake_connection(project_name):
+        yield conn
+
+    with patch.object(tasks_module, "get_connection", fake_connection):
+        yield conn
+
+
+@pytest.fixture
+def repo():
+    return TaskRepository("test-project")
+
+
+class TestListTasks:
+    """Tests for TaskRepository.list_tasks."""
+
+    async def test_pages_with_cursor(self, repo, db):
+        first = await repo.list_tasks(limit=20)
+        second = await repo.list_tasks(limit=20, after=first.next_cursor)
+        last = await repo.list_tasks(limit=20, after=second.next_cursor)
+
+        assert [t.id for t in first.tasks][:2] == ["T000", "T001"]
+        assert first.next_cursor == "T019"
+        assert second.tasks[0].id == "T020"
+        assert len(last.tasks) == 10
+        assert last.next_cursor is None
+        assert db.queries[0][1]["limit"] == 21
+
+    async def test_exact_last_page_has_no_cursor(self, repo, db):
+        page = await repo.list_tasks(limit=50)
+
+        assert len(page.tasks) == 50
+        assert page.next_cursor is None
+
+    async def test_combined_filters_in_query(self, repo, db):
+        page = await repo.list_tasks(
+            statuses=["pending", "failed"], milestone_id="M1", priorities=["high"]
+        )
+
+        assert [t.id for t in page.tasks] == ["T000", "T003", "T012", "T015", "T024", "T027"]
+        query, params = db.queries[0]
+        assert "status IN $statuses" in query
+        assert "milestone_id = $milestone_id" in query
+        assert "priority IN $priorities" in query
+        assert params["statuses"] == ["pending", "failed"]
+
+    async def test_list_fields_projected(self, repo, db):
+        page = await repo.list_tasks(limit=1)
+
+        task = page.tasks[0]
+        assert task.title == "Task 0"
+        assert task.files_to_modify == ["b.py"]
+        assert task.acceptance_criteria == []
+        assert task.implementation_notes == ""
+        assert "implementation_notes" not in db.queries[0][0]
+
+    async def test_detail_fetches_all_fields(self, repo, db):
+        page = await repo.list_tasks(limit=1, fields=None)
+
+        assert page.tasks[0].acceptance_criteria == ["criterion"] * 20
+        assert "SELECT * FROM tasks" in db.queries[0][0]
+
+    async def test_unknown_field_rejected(self, repo, db):
+        with pytest.raises(ValueError):
+            await repo.list_tasks(fields=["title", "status; DELETE tasks"])
+
+    async def test_limit_is_capped(self, repo, db):
+        await repo.list_tasks(limit=10**6)
+
+        assert db.queries[0][1]["limit"] == tasks_module.MAX_PAGE_SIZE + 1
+
+
+class TestProgressCache:
+    """Tests for TaskProgressCache."""
+
+    @pytest.fixture
+    def live(self):
+        with patch.object(tasks_module, "LiveQueryManager") as manager_cls:
+            manager_cls.return_value.subscribe = AsyncMock(return_value="tasks_progress")
+            manager_cls.return_value.close = AsyncMock()
+            yield manager_cls.return_value
+
+    async def test_progress_computed_once(self, repo, db, live):
+        first = await repo.get_cached_progress()
+        second = await repo.get_cached_progress()
+
+        assert first == second
+        assert first["total"] == 50
+        assert first["completed"] == 12
+        assert sum("GROUP BY status" in q for q, _ in db.queries) == 1
+        assert repo.progress_cache.hits == 1
+        assert repo.progress_cache.is_watching
+        live.subscribe.assert_awaited_once()
+
+    async def test_live_event_invalidates(self, repo, db, live):
+        await repo.get_cached_progress()
+        on_change = live.subscribe.await_args.args[1]
+
+        db.rows.append(_row(99, status="completed"))
+        on_change(None)
+        progress = await repo.get_cached_progress()
+
+        assert progress["completed"] == 13
+        assert live.subscribe.await_count == 1
+
+    async def test_change_during_query_not_cached(self, repo, db, live):
+        original = repo.get_progress
+
+        async def racing_progress():
+            progress = await original()
+            repo.progress_cache.invalidate()
+            return progress
+
+        with patch.object(repo, "get_progress", racing_progress):
+            await repo.get_cached_progress()
+
+        assert repo.progress_cache._progress is None
+
+    async def test_local_status_change_invalidates(self, repo, db, live):
+        await repo.get_cached_progress()
+
+        await repo.update_task("T001", status="completed")
+
+        assert repo.progress_cache._progress is None
+
+    async def test_ttl_without_live_query(self, repo, db, live, monkeypatch):
+        live.subscribe.side_effect = ConnectionError("no live queries")
+        await repo.get_cached_progress()
+        await repo.get_cached_progress()
+        assert not repo.progress_cache.is_watching
+        assert sum("GROUP BY status" in q for q, _ in db.queries) == 1
+
+        monkeypatch.setattr(tasks_module, "PROGRESS_UNWATCHED_TTL_SECONDS", 0.0)
+        await repo.get_cached_progress()
+        assert sum("GROUP BY status" in q for q, _ in db.queries) == 2
+
+    async def test_returns_copies(self, repo, db, live):
+        progress = await repo.get_cached_progress()
+        progress["total"] = -1
+
+        assert (await repo.get_cached_progress())["total"] == 50
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Fake Claude CLI speaking the stream-json protocol, for tests.
+
+Point ``ORCHESTRATOR_WORKER_CLI`` (or ``AgentWorkerPool(cli=...)``) at
+``"<python> tests/helpers/fake_claude_stream.py"``. Each user message read
+from stdin is answered with an init, an assistant and a result event; the
+result text is ``"echo: <prompt>"`` and the event also carries the process
+``pid`` and the message ``turn`` within the process.
+
+Prompts containing ``FAIL`` produce an error result, ``CRASH`` exits the
+process and ``HANG`` never answers. Every start is appended as a JSON line
+to ``$FAKE_CLAUDE_LOG`` (if set), and ``$FAKE_CLAUDE_STARTUP_DELAY`` seconds
+are slept before reading input, to simulate CLI boot.
+"""
+
+import json
+import os
+import sys
+import time
+import uuid
+
+
+def emit(event: dict) -> None:
+    print(json.dumps(event), flush=True)
+
+
+def option(args: list[str], name: str):
+    return args[args.index(name) + 1] if name in args else None
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    if "-p" not in args and "--print" not in args:
+        print("fake claude: stream-json formats only work with -p/--print", file=sys.stderr)
+        return 2
+    if option(args, "--input-format") != "stream-json":
+        print("fake claude: only --input-format stream-json is supported", file=sys.stderr)
+        return 2
+
+    session_id = option(args, "--session-id") or option(args, "--resume") or str(uuid.uuid4())
+    log_path = os.environ.get("FAKE_CLAUDE_LOG")
+    if log_path:
+        with open(log_path, "a") as f:
+            f.write(json.dumps({"pid": os.getpid(), "args": args}) + "\n")
+    time.sleep(float(os.environ.get("FAKE_CLAUDE_STARTUP_DELAY", "0")))
+
+    turn = 0
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        message = json.loads(line)
+        prompt = "".join(
+            part.get("text", "") for part in message["message"]["content"] if isinstance(part, dict)
+        )
+        turn += 1
+        if "CRASH" in prompt:
+            print("fake claude: crashed", file=sys.stderr, flush=True)
+            return 3
+        if "HANG" in prompt:
+            time.sleep(3600)
+
+        text = f"echo: {prompt}"
+        is_error = "FAIL" in prompt
+        emit({"type": "system", "subtype": "init", "session_id": session_id})
+        emit(
+            {
+                "type": "assistant",
+                "session_id": session_id,
+                "message": {"role": "assistant", "content": [{"type": "text", "text": text}]},
+            }
+        )
+        emit(
+            {
+                "type": "result",
+                "subtype": "error_during_execution" if is_error else "success",
+                "is_error": is_error,
+                "result": text,
+                "session_id": session_id,
+                "num_turns": 1,
+                "total_cost_usd": 0.001,
+                "pid": os.getpid(),
+                "turn": turn,
+            }
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Fake Claude CLI answering Linear MCP prompts, for tests.
+
+Point ``LinearConfig.cli_command`` (or ``LINEAR_MCP_CLI``) at
+``"<python> tests/helpers/fake_linear_cli.py"``. Every invocation is
+appended as a JSON line to ``$FAKE_LINEAR_LOG`` (if set) with its start and
+end times, and ``$FAKE_LINEAR_DELAY`` seconds are slept before answering.
+Issue lookups report no existing issues.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+
+def answer(prompt: str) -> str:
+    if "listIssues" in prompt:
+        return "LOOKUP_DONE"
+    if "listTeams" in prompt:
+        return json.dumps({"teams": [{"id": "TEAM123", "name": "Test"}]})
+    if "ISSUE_ID[" in prompt:
+        task_ids = re.findall(r"^Issue \[([^\]]+)\]:", prompt, re.MULTILINE)
+        return "\n".join(f"ISSUE_ID[{task_id}]: LIN-{task_id}" for task_id in task_ids)
+    if "createIssue" in prompt:
+        task_id = re.search(r'title: "\[([^\]]+)\]', prompt).group(1)
+        return f"ISSUE_ID: LIN-{task_id}"
+    if "RESULT[" in prompt:
+        operations = re.findall(r"^- \[([^\]]+)\] ", prompt, re.MULTILINE)
+        return "\n".join(f"RESULT[{operation}]: SUCCESS" for operation in operations)
+    return "SUCCESS"
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    prompt = args[args.index("-p") + 1]
+    start = time.time()
+    time.sleep(float(os.environ.get("FAKE_LINEAR_DELAY", "0")))
+    log_path = os.environ.get("FAKE_LINEAR_LOG")
+    if log_path:
+        entry = {"prompt": prompt, "args": args, "start": start, "end": time.time()}
+        with open(log_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+    print(answer(prompt))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,468 @@
+"""Tests for checkpoint retention and garbage collection.
+
+Tests cover:
+1. Keeping the newest checkpoints per thread and namespace
+2. Keeping phase-boundary checkpoints, including legacy rows
+3. Dropping superseded and orphaned pending writes
+4. Batch, backfill and time budgets and reclaimed bytes reporting
+5. Policy configuration and scheduling, including passes awaited under asyncio.run
+
+Run with: pytest tests/langgraph/test_checkpoint_compactor.py -v
+"""
+
+import asyncio
+import base64
+import itertools
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from orchestrator.langgraph import checkpoint_compactor, surrealdb_saver
+from orchestrator.langgraph.checkpoint_compactor import (
+    CheckpointCompactor,
+    RetentionPolicy,
+    schedule_compaction,
+)
+
+
+class FakeSerde:
+    """Serializer storing values as JSON."""
+
+    def dumps_typed(self, data):
+        return ("json", json.dumps(data).encode())
+
+    def loads_typed(self, data):
+        return json.loads(data[1])
+
+
+def _blob(value) -> str:
+    return json.dumps(
+        {"type": "json", "data": base64.b64encode(json.dumps(value).encode()).decode()}
+    )
+
+
+class FakeCompactionConnection:
+    """Evaluates the queries CheckpointCompactor issues over in-memory rows."""
+
+    def __init__(self, checkpoints: list[dict], writes: list[dict]):
+        self.checkpoints = checkpoints
+        self.writes = writes
+        self.queries: list[tuple[str, dict]] = []
+
+    def _scoped(self, rows: list[dict], params: dict) -> list[dict]:
+        return [
+            row
+            for row in rows
+            if row["thread_id"] == params["thread_id"]
+            and row["checkpoint_ns"] == params["checkpoint_ns"]
+        ]
+
+    async def query(self, query: str, params: dict) -> list[dict]:
+        self.queries.append((query, dict(params)))
+        query = " ".join(query.split())
+
+        if query.startswith("DELETE FROM graph_writes"):
+            doomed = {id(row) for row in self._scoped(self.writes, params)}
+            self.writes = [
+                row
+                for row in self.writes
+                if id(row) not in doomed or row["checkpoint_id"] not in params["ids"]
+            ]
+            return []
+        if query.startswith("DELETE FROM graph_checkpoints"):
+            doomed = {id(row) for row in self._scoped(self.checkpoints, params)}
+            self.checkpoints = [
+                row
+                for row in self.checkpoints
+                if id(row) not in doomed or row["checkpoint_id"] not in params["ids"]
+            ]
+            return []
+        if query.startswith("UPDATE graph_checkpoints"):
+            for row in self._scoped(self.checkpoints, params):
+                if row["checkpoint_id"] == params["checkpoint_id"]:
+                    row["meta"] = params["meta"]
+            return []
+        if "GROUP BY thread_id, checkpoint_ns" in query:
+            groups = {
+                (row["thread_id"], row["checkpoint_ns"])
+                for row in self.checkpoints
+                if "thread_id" not in params or row["thread_id"] == params["thread_id"]
+            }
+            return [{"thread_id": t, "checkpoint_ns": ns} for t, ns in sorted(groups)]
+        if "FROM graph_writes" in query:
+            stats: dict[str, dict] = {}
+            for row in self._scoped(self.writes, params):
+                entry = stats.setdefault(
+                    row["checkpoint_id"],
+                    {"checkpoint_id": row["checkpoint_id"], "rows": 0, "size": 0},
+                )
+                entry["rows"] += 1
+                entry["size"] += len(row["value"])
+            return list(stats.values())
+        if "checkpoint_id IN $ids" in query:
+            return [
+                {key: row[key] for key in ("checkpoint_id", "checkpoint", "metadata")}
+                for row in self._scoped(self.checkpoints, params)
+                if row["checkpoint_id"] in params["ids"]
+            ]
+
+        rows = self._scoped(self.checkpoints, params)
+        if "checkpoint_id < $before" in query:
+            rows = [row for row in rows if row["checkpoint_id"] < params["before"]]
+        rows.sort(key=lambda row: row["checkpoint_id"], reverse=True)
+        return [
+            {
+                "checkpoint_id": row["checkpoint_id"],
+                "meta": row.get("meta"),
+                "size": len(row["checkpoint"]) + len(row["metadata"]),
+            }
+            for row in rows[: params["limit"]]
+        ]
+
+
+def _checkpoint(
+    i: int, phase: int = 1, thread: str = "thread", ns: str = "", legacy: bool = False
+) -> dict:
+    metadata = {"source": "loop", "step": i}
+    row = {
+        "thread_id": thread,
+        "checkpoint_ns": ns,
+        "checkpoint_id": f"cp-{i:04d}",
+        "checkpoint": _blob({"id": f"cp-{i:04d}", "channel_values": {"current_phase": phase}}),
+        "metadata": _blob(metadata),
+    }
+    if not legacy:
+        row["meta"] = {**metadata, "phase": phase}
+    return row
+
+
+def _write(i: int, thread: str = "thread", value: str = "x" * 10) -> dict:
+    return {
+        "thread_id": thread,
+        "checkpoint_ns": "",
+        "checkpoint_id": f"cp-{i:04d}",
+        "value": value,
+    }
+
+
+def _ids(conn: FakeCompactionConnection, thread: str = "thread") -> list[str]:
+    return sorted(row["checkpoint_id"] for row in conn.checkpoints if row["thread_id"] == thread)
+
+
+@pytest.fixture
+def db():
+    conn = FakeCompactionConnection([], [])
+
+    @asynccontextmanager
+    async def fake_connection(project_name):
+        yield conn
+
+    with patch.object(checkpoint_compactor, "get_connection", fake_connection):
+        yield conn
+
+
+def _compactor(**policy) -> CheckpointCompactor:
+    compactor = CheckpointCompactor("test-project", RetentionPolicy(**policy))
+    compactor._saver.serde = FakeSerde()
+    return compactor
+
+
+class TestRetention:
+    """Tests for which checkpoints survive a pass."""
+
+    async def test_keeps_newest_per_thread(self, db):
+        db.checkpoints = [_checkpoint(i) for i in range(10)] + [
+            _checkpoint(i, thread="other") for i in range(3)
+        ]
+
+        report = await _compactor(keep_last=4).compact()
+
+        assert _ids(db) == ["cp-0006", "cp-0007", "cp-0008", "cp-0009"]
+        assert len(_ids(db, "other")) == 3
+        assert report.threads == 2
+        assert report.checkpoints_scanned == 13
+        assert report.checkpoints_deleted == 6
+
+    async def test_namespaces_compacted_separately(self, db):
+        db.checkpoints = [_checkpoint(i) for i in range(5)] + [
+            _checkpoint(i, ns="task_subgraph:1") for i in range(5)
+        ]
+
+        await _compactor(keep_last=2).compact()
+
+        kept = sorted((row["checkpoint_ns"], row["checkpoint_id"]) for row in db.checkpoints)
+        assert kept == [
+            ("", "cp-0003"),
+            ("", "cp-0004"),
+            ("task_subgraph:1", "cp-0003"),
+            ("task_subgraph:1", "cp-0004"),
+        ]
+
+    async def test_only_requested_thread(self, db):
+        db.checkpoints = [_checkpoint(i) for i in range(5)] + [
+            _checkpoint(i, thread="other") for i in range(5)
+        ]
+
+        report = await _compactor(keep_last=1).compact("thread")
+
+        assert _ids(db) == ["cp-0004"]
+        assert len(_ids(db, "other")) == 5
+        assert report.threads == 1
+
+    async def test_phase_boundaries_kept(self, db):
+        phases = [1, 1, 1, 2, 2, 2, 3, 3, 3, 3]
+        db.checkpoints = [_checkpoint(i, phase) for i, phase in enumerate(phases)]
+
+        await _compactor(keep_last=2).compact()
+
+        assert _ids(db) == ["cp-0002", "cp-0003", "cp-0005", "cp-0006", "cp-0008", "cp-0009"]
+
+    async def test_phase_boundaries_optional(self, db):
+        db.checkpoints = [_checkpoint(i, 1 if i < 5 else 2) for i in range(10)]
+
+        await _compactor(keep_last=2, keep_phase_boundaries=False).compact()
+
+        assert _ids(db) == ["cp-0008", "cp-0009"]
+
+    async def test_legacy_rows_decoded_once_and_backfilled(self, db):
+        db.checkpoints = [_checkpoint(i, 1 if i < 3 else 2, legacy=True) for i in range(6)]
+
+        await _compactor(keep_last=1).compact()
+
+        assert _ids(db) == ["cp-0002", "cp-0003", "cp-0005"]
+        assert all(row["meta"]["phase"] in (1, 2) for row in db.checkpoints)
+        assert db.checkpoints[0]["meta"]["source"] == "loop"
+
+        db.queries.clear()
+        await _compactor(keep_last=1).compact()
+        assert not any("checkpoint_id IN $ids" in q and "SELECT" in q for q, _ in db.queries)
+
+
+class TestWrites:
+    """Tests for pending write garbage collection."""
+
+    async def test_superseded_and_orphaned_writes_dropped(self, db):
+        db.checkpoints = [_checkpoint(i) for i in range(3)]
+        db.writes = [_write(i) for i in range(4)] + [_write(2), _write(9, thread="other")]
+
+        report = await _compactor(keep_last=5).compact("thread")
+
+        assert sorted(
+            row["checkpoint_id"] for row in db.writes if row["thread_id"] == "thread"
+        ) == [
+            "cp-0002",
+            "cp-0002",
+            "cp-0003",
+        ]
+        assert report.writes_deleted == 2
+        assert report.checkpoints_deleted == 0
+
+    async def test_superseded_writes_can_be_kept(self, db):
+        db.checkpoints = [_checkpoint(i) for i in range(4)]
+        db.writes = [_write(i) for i in range(4)]
+
+        report = await _compactor(keep_last=2, drop_superseded_writes=False).compact()
+
+        assert sorted(row["checkpoint_id"] for row in db.writes) == ["cp-0002", "cp-0003"]
+        assert report.writes_deleted == 2
+
+
+class TestBatches:
+    """Tests for bounded batches and reporting."""
+
+    async def test_deletes_in_batches(self, db):
+        db.checkpoints = [_checkpoint(i) for i in range(25)]
+
+        report = await _compactor(keep_last=5, batch_size=4).compact()
+
+        deletes = [params for query, params in db.queries if "DELETE" in query]
+        assert [len(params["ids"]) for params in deletes] == [4, 4, 4, 4, 4]
+        assert report.batches == 5
+        assert report.complete
+        assert len(_ids(db)) == 5
+
+    async def test_max_batches_leaves_pass_incomplete(self, db):
+        db.checkpoints = [_checkpoint(i) for i in range(25)]
+
+        report = await _compactor(keep_last=5, batch_size=4, max_batches=2).compact()
+
+        assert report.checkpoints_deleted == 8
+        assert not report.complete
+        assert len(_ids(db)) == 17
+
+        await _compactor(keep_last=5, batch_size=4).compact()
+        assert len(_ids(db)) == 5
+
+    async def test_time_budget_leaves_pass_incomplete(self, db):
+        db.checkpoints = [_checkpoint(i) for i in range(10)]
+
+        report = await _compactor(keep_last=5, time_budget_seconds=0).compact()
+
+        assert not report.complete
+        assert report.batches == 0
+        assert len(_ids(db)) == 10
+
+    async def test_backfill_capped_per_pass(self, db):
+        db.checkpoints = [_checkpoint(i, legacy=True) for i in range(10)]
+
+        report = await _compactor(keep_last=2, batch_size=3, max_backfill=4).compact()
+
+        assert report.phases_backfilled == 4
+        assert not report.complete
+        assert report.checkpoints_deleted == 0
+        assert sum("meta" in row for row in db.checkpoints) == 4
+
+        report = await _compactor(keep_last=2, batch_size=3).compact()
+        assert report.complete
+        assert report.phases_backfilled == 6
+        assert len(_ids(db)) == 2
+
+    async def test_time_budget_stops_scan_and_backfill(self, db, monkeypatch):
+        db.checkpoints = [_checkpoint(i, legacy=True) for i in range(10)]
+        # Every clock read advances one second
+        clock = itertools.count()
+        monkeypatch.setattr(
+            checkpoint_compactor, "time", SimpleNamespace(monotonic=lambda: next(clock))
+        )
+
+        # The scan's first page fits the budget, the second does not
+        report = await _compactor(keep_last=2, batch_size=4, time_budget_seconds=1.5).compact()
+        assert not report.complete
+        assert report.checkpoints_scanned == 0
+        assert report.phases_backfilled == 0
+
+        # The scan fits, the backfill is cut off after a few rows
+        report = await _compactor(keep_last=2, batch_size=20, time_budget_seconds=5.5).compact()
+        assert not report.complete
+        assert report.checkpoints_scanned == 10
+        assert 0 < report.phases_backfilled < 10
+        assert report.checkpoints_deleted == 0
+        assert len(_ids(db)) == 10
+
+    async def test_reports_reclaimed_bytes(self, db):
+        db.checkpoints = [_checkpoint(i) for i in range(3)]
+        db.writes = [_write(0, value="v" * 100)]
+        expected = 100 + len(db.checkpoints[0]["checkpoint"]) + len(db.checkpoints[0]["metadata"])
+
+        report = await _compactor(keep_last=2).compact()
+
+        assert report.bytes_reclaimed == expected
+        assert report.rows_deleted == 2
+        assert report.to_dict()["bytes_reclaimed"] == expected
+
+
+class TestPolicy:
+    """Tests for configuration and scheduling."""
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv(checkpoint_compactor.KEEP_ENV, "7")
+        monkeypatch.setenv(checkpoint_compactor.INTERVAL_ENV, "30")
+        monkeypatch.setenv(checkpoint_compactor.BUDGET_ENV, "2.5")
+
+        policy = RetentionPolicy.from_env()
+
+        assert policy.keep_last == 7
+        assert policy.min_interval_seconds == 30
+        assert policy.time_budget_seconds == 2.5
+
+    def test_invalid_env_uses_defaults(self, monkeypatch):
+        monkeypatch.setenv(checkpoint_compactor.KEEP_ENV, "lots")
+
+        assert RetentionPolicy.from_env().keep_last == checkpoint_compactor.DEFAULT_KEEP_LAST
+
+    async def test_disabled_policy_touches_nothing(self, db):
+        db.checkpoints = [_checkpoint(i) for i in range(5)]
+
+        report = await _compactor(keep_last=0).compact()
+
+        assert report.checkpoints_deleted == 0
+        assert db.queries == []
+        assert schedule_compaction("test-project", policy=RetentionPolicy(keep_last=0)) is None
+
+    async def test_schedule_throttled_per_project(self, db, monkeypatch):
+        monkeypatch.setattr(checkpoint_compactor, "_compactions", {})
+        monkeypatch.setattr(checkpoint_compactor, "_last_started", {})
+        db.checkpoints = [_checkpoint(i) for i in range(5)]
+        policy = RetentionPolicy(keep_last=2, min_interval_seconds=60)
+
+        task = schedule_compaction("test-project", policy=policy)
+        assert schedule_compaction("test-project", policy=policy) is None
+        report = await task
+
+        assert report.checkpoints_deleted == 3
+        assert schedule_compaction("test-project", policy=policy) is None
+        other = schedule_compaction("other-project", policy=policy)
+        assert other is not None
+        await asyncio.wait_for(other, 1)
+
+    async def test_incomplete_pass_not_throttled(self, db, monkeypatch):
+        monkeypatch.setattr(checkpoint_compactor, "_compactions", {})
+        monkeypatch.setattr(checkpoint_compactor, "_last_started", {})
+        db.checkpoints = [_checkpoint(i) for i in range(10)]
+        policy = RetentionPolicy(keep_last=2, batch_size=4, max_batches=1, min_interval_seconds=60)
+
+        first = await schedule_compaction("test-project", policy=policy)
+        second = await schedule_compaction("test-project", policy=policy)
+
+        assert not first.complete and second.complete
+        assert len(_ids(db)) == 2
+        assert schedule_compaction("test-project", policy=policy) is None
+
+    async def test_cancelled_pass_reported(self, db, monkeypatch, caplog):
+        monkeypatch.setattr(checkpoint_compactor, "_compactions", {})
+        monkeypatch.setattr(checkpoint_compactor, "_last_started", {})
+        db.checkpoints = [_checkpoint(i) for i in range(5)]
+        policy = RetentionPolicy(keep_last=2, min_interval_seconds=60)
+
+        task = schedule_compaction("test-project", policy=policy)
+        await asyncio.sleep(0)  # Into the first delete batch
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert "cancelled" in caplog.text
+        assert schedule_compaction("test-project", policy=policy) is not None
+
+    def test_workflow_pass_finishes_under_asyncio_run(self, db, monkeypatch):
+        from orchestrator.langgraph.workflow import WorkflowRunner
+
+        monkeypatch.setattr(checkpoint_compactor, "_compactions", {})
+        monkeypatch.setattr(checkpoint_compactor, "_last_started", {})
+        monkeypatch.setenv(checkpoint_compactor.KEEP_ENV, "2")
+        db.checkpoints = [_checkpoint(i) for i in range(5)]
+        runner = WorkflowRunner.__new__(WorkflowRunner)
+        runner.project_name = "test-project"
+        runner.thread_id = "thread"
+        runner.checkpointer = surrealdb_saver.SurrealDBSaver("test-project", serde=FakeSerde())
+
+        # Like the CLI: the loop closes as soon as the coroutine returns
+        asyncio.run(runner._compact_checkpoints())
+
+        assert _ids(db) == ["cp-0003", "cp-0004"]
+
+
+async def test_aput_stores_phase_in_meta():
+    created = {}
+
+    class Conn:
+        async def create(self, table, record):
+            created.update(record)
+            return {"id": "graph_checkpoints:1"}
+
+    @asynccontextmanager
+    async def fake_connection(project_name):
+        yield Conn()
+
+    saver = surrealdb_saver.SurrealDBSaver("test-project", serde=FakeSerde())
+    with patch.object(surrealdb_saver, "get_connection", fake_connection):
+        await saver.aput(
+            {"configurable": {"thread_id": "thread", "checkpoint_ns": ""}},
+            {"id": "cp-1", "channel_values": {"current_phase": 3}},
+            {"source": "loop", "step": 1},
+            {},
+        )
+
+    assert created["meta"] == {"source": "loop", "step": 1, "phase": 3}
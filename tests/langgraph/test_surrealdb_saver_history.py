@@ -0,0 +1,283 @@
+"""Tests for paginated, metadata-only checkpoint history.
+
+Tests cover:
+1. alist honoring before, limit and metadata filters in the query
+2. Keyset pagination across several pages
+3. alist_summaries skipping checkpoint blobs
+4. Legacy rows without queryable metadata
+5. WorkflowRunner.get_history paging and lazy state loading
+
+Run with: pytest tests/langgraph/test_surrealdb_saver_history.py -v
+"""
+
+import base64
+import json
+import re
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+
+from orchestrator.langgraph import surrealdb_saver
+from orchestrator.langgraph.surrealdb_saver import SurrealDBSaver, alist_checkpoint_summaries
+
+
+class FakeSerde:
+    """Serializer storing values as JSON, counting loads."""
+
+    def __init__(self):
+        self.loads = 0
+
+    def dumps_typed(self, data):
+        return ("json", json.dumps(data).encode())
+
+    def loads_typed(self, data):
+        self.loads += 1
+        return json.loads(data[1])
+
+
+class FakeCheckpointConnection:
+    """Evaluates the listing queries SurrealDBSaver issues over in-memory rows."""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.queries: list[tuple[str, dict]] = []
+
+    async def query(self, query: str, params: dict) -> list[dict]:
+        self.queries.append((query, dict(params)))
+        rows = [
+            row
+            for row in self.rows
+            if row["thread_id"] == params["thread_id"]
+            and row["checkpoint_ns"] == params["checkpoint_ns"]
+        ]
+        if "checkpoint_id < $before" in query:
+            rows = [row for row in rows if row["checkpoint_id"] < params["before"]]
+        for key, name in re.findall(r"meta\.(\w+) = \$(filter_\d+)", query):
+            rows = [
+                row
+                for row in rows
+                if row.get("meta") is None or row["meta"].get(key) == params[name]
+            ]
+        rows.sort(key=lambda row: row["checkpoint_id"], reverse=True)
+        rows = rows[: params["limit"]]
+        match = re.search(r"SELECT (.+?) FROM", query)
+        if match and match.group(1).strip() != "*":
+            fields = [field.strip() for field in match.group(1).split(",")]
+            rows = [{field: row.get(field) for field in fields} for row in rows]
+        return rows
+
+
+def _blob(value) -> str:
+    return json.dumps(
+        {"type": "json", "data": base64.b64encode(json.dumps(value).encode()).decode()}
+    )
+
+
+def _row(i: int, source: str = "loop", legacy: bool = False) -> dict:
+    metadata = {"source": source, "step": i}
+    row = {
+        "thread_id": "thread",
+        "checkpoint_ns": "",
+        "checkpoint_id": f"cp-{i:04d}",
+        "parent_checkpoint_id": f"cp-{i - 1:04d}" if i else None,
+        "checkpoint": _blob({"id": f"cp-{i:04d}", "channel_values": {"big": "x" * 100}}),
+        "metadata": _blob(metadata),
+        "created_at": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}Z",
+    }
+    if not legacy:
+        row["meta"] = metadata
+    return row
+
+
+@pytest.fixture
+def saver():
+    s = SurrealDBSaver.__new__(SurrealDBSaver)
+    s.project_name = "test-project"
+    s.serde = FakeSerde()
+    return s
+
+
+@pytest.fixture
+def db():
+    conn = FakeCheckpointConnection([_row(i, "input" if i == 0 else "loop") for i in range(120)])
+
+    @asynccontextmanager
+    async def fake_connection(project_name):
+        yield conn
+
+    with patch.object(surrealdb_saver, "get_connection", fake_connection):
+        yield conn
+
+
+CONFIG = {"configurable": {"thread_id": "thread", "checkpoint_ns": ""}}
+
+
+def _before(checkpoint_id: str) -> dict:
+    return {"configurable": {"thread_id": "thread", "checkpoint_id": checkpoint_id}}
+
+
+class TestAlist:
+    """Tests for alist arguments applied in the query."""
+
+    async def test_newest_first_with_limit(self, saver, db):
+        items = [item async for item in saver.alist(CONFIG, limit=3)]
+
+        assert [i.config["configurable"]["checkpoint_id"] for i in items] == [
+            "cp-0119",
+            "cp-0118",
+            "cp-0117",
+        ]
+        assert items[0].parent_config["configurable"]["checkpoint_id"] == "cp-0118"
+        assert len(db.queries) == 1
+
+    async def test_before_is_a_query_cursor(self, saver, db):
+        items = [item async for item in saver.alist(CONFIG, before=_before("cp-0010"), limit=2)]
+
+        assert [i.checkpoint["id"] for i in items] == ["cp-0009", "cp-0008"]
+        assert db.queries[0][1]["before"] == "cp-0010"
+
+    async def test_filter_is_pushed_into_query(self, saver, db):
+        items = [item async for item in saver.alist(CONFIG, filter={"source": "input"})]
+
+        assert [i.metadata["step"] for i in items] == [0]
+        assert "meta.source = $filter_0" in db.queries[0][0]
+
+    async def test_no_limit_pages_through_everything(self, saver, db):
+        items = [item async for item in saver.alist(CONFIG)]
+
+        assert len(items) == 120
+        assert len(db.queries) == 3
+        assert db.queries[1][1]["before"] == "cp-0070"
+
+
+class TestAlistSummaries:
+    """Tests for listing without checkpoint blobs."""
+
+    async def test_blobs_are_not_fetched_or_deserialized(self, saver, db):
+        summaries = [s async for s in saver.alist_summaries(CONFIG, limit=5)]
+
+        assert [s.step for s in summaries] == [119, 118, 117, 116, 115]
+        assert summaries[0].source == "loop"
+        assert summaries[0].parent_checkpoint_id == "cp-0118"
+        assert summaries[0].created_at == "2026-01-01T00:01:59Z"
+        assert "checkpoint," not in db.queries[0][0]
+        assert saver.serde.loads == 0
+
+    async def test_legacy_rows_filtered_after_deserialization(self, saver, db):
+        db.rows = [_row(i, "input" if i % 2 else "loop", legacy=True) for i in range(6)]
+
+        summaries = [s async for s in saver.alist_summaries(CONFIG, filter={"source": "input"})]
+
+        assert [s.step for s in summaries] == [5, 3, 1]
+        assert saver.serde.loads == 6
+
+    async def test_pagination_with_cursor(self, saver, db):
+        first = [s async for s in saver.alist_summaries(CONFIG, limit=50)]
+        second = [
+            s
+            async for s in saver.alist_summaries(
+                CONFIG, before=_before(first[-1].checkpoint_id), limit=50
+            )
+        ]
+
+        assert first[-1].step == 70
+        assert second[0].step == 69
+        assert len(second) == 50
+
+    async def test_to_dict(self, saver, db):
+        summary = [s async for s in saver.alist_summaries(CONFIG, limit=1)][0]
+
+        assert summary.to_dict()["checkpoint_id"] == "cp-0119"
+        assert summary.to_dict()["metadata"] == {"source": "loop", "step": 119}
+
+
+class TestAput:
+    """Tests for storing queryable metadata."""
+
+    async def test_scalar_metadata_stored_as_meta(self, saver):
+        created = {}
+
+        class Conn:
+            async def create(self, table, record):
+                created.update(record)
+                return {"id": "graph_checkpoints:1"}
+
+        @asynccontextmanager
+        async def fake_connection(project_name):
+            yield Conn()
+
+        with patch.object(surrealdb_saver, "get_connection", fake_connection):
+            await saver.aput(
+                CONFIG,
+                {"id": "cp-1"},
+                {"source": "loop", "step": 3, "parents": {}, "writes": {"node": {}}},
+                {},
+            )
+
+        assert created["meta"] == {"source": "loop", "step": 3}
+
+
+class TestWorkflowRunnerHistory:
+    """Tests for WorkflowRunner.get_history on the in-memory checkpointer."""
+
+    @pytest.fixture
+    async def runner(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LANGGRAPH_CHECKPOINTER", "memory")
+        from orchestrator.langgraph.workflow import WorkflowRunner
+
+        runner = WorkflowRunner(tmp_path)
+        runner.checkpointer = MemorySaver()
+
+        builder = StateGraph(dict)
+        for i in range(5):
+            builder.add_node(f"n{i}", lambda state, i=i: {"step": i})
+        builder.add_edge(START, "n0")
+        for i in range(4):
+            builder.add_edge(f"n{i}", f"n{i + 1}")
+        builder.add_edge("n4", END)
+        runner.graph = builder.compile(checkpointer=runner.checkpointer)
+        await runner.graph.ainvoke({"step": -1}, {"configurable": {"thread_id": runner.thread_id}})
+        return runner
+
+    async def test_history_lists_without_values(self, runner):
+        history = await runner.get_history(limit=3)
+
+        assert len(history) == 3
+        assert history[0]["step"] > history[1]["step"]
+        assert "values" not in history[0]
+        assert history[0]["parent_checkpoint_id"] == history[1]["checkpoint_id"]
+
+    async def test_history_pages_with_cursor(self, runner):
+        first = await runner.get_history(limit=3)
+        second = await runner.get_history(limit=3, before=first[-1]["checkpoint_id"])
+
+        assert second[0]["parent_checkpoint_id"] == second[1]["checkpoint_id"]
+        assert first[-1]["parent_checkpoint_id"] == second[0]["checkpoint_id"]
+
+    async def test_values_loaded_on_demand(self, runner):
+        history = await runner.get_history(filter={"source": "loop"})
+
+        assert len(history) == 6
+        assert await runner.get_checkpoint_state(history[-1]["checkpoint_id"]) == {"step": -1}
+        assert await runner.get_checkpoint_state("missing") is None
+        latest = (await runner.get_history(limit=1, include_values=True))[0]
+        assert latest["values"] == {"step": 4}
+
+
+async def test_generic_summaries_from_memory_saver():
+    saver = MemorySaver()
+    builder = StateGraph(dict)
+    builder.add_node("only", lambda state: {"done": True})
+    builder.add_edge(START, "only")
+    builder.add_edge("only", END)
+    graph = builder.compile(checkpointer=saver)
+    config = {"configurable": {"thread_id": "t"}}
+    await graph.ainvoke({}, config)
+
+    summaries = [s async for s in alist_checkpoint_summaries(saver, config)]
+
+    assert [s.source for s in summaries] == ["loop", "loop", "input"]
+    assert summaries[0].created_at is not None
@@ -108,7 +108,8 @@ class TestActionLog:
         assert entry.message == "Starting phase 1"
         assert entry.phase == 1
 
-        # Check file was written
+        # Check file was written once the background writer is flushed
+        action_log.flush()
         log_file = temp_workflow_dir / "action_log.jsonl"
         assert log_file.exists()
 
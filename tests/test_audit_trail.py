@@ -176,7 +176,8 @@ class TestAuditTrail:
 
         audit_trail.commit_entry(entry)
 
-        # Verify entry was written
+        # Verify entry was written once the background writer is flushed
+        audit_trail.flush()
         log_file = temp_project / ".workflow" / "audit" / "invocations.jsonl"
         assert log_file.exists()
 
@@ -0,0 +1,143 @@
+"""Tests for incremental Kanban board syncing.
+
+Tests cover:
+1. Column files written with cards sorted by priority
+2. Unchanged columns and files are not rewritten
+3. Only changed cards are re-rendered
+4. Debounced syncs coalesce into one write
+
+Run with: pytest tests/test_board_sync.py -v
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from orchestrator.langgraph.integrations import board_sync
+from orchestrator.langgraph.integrations.board_sync import BoardSyncer, sync_board
+
+
+def _task(task_id: str, status: str = "pending", **extra) -> dict:
+    return {"id": task_id, "title": f"Task {task_id}", "status": status, **extra}
+
+
+def _state(tasks: list[dict]) -> dict:
+    return {"tasks": tasks}
+
+
+@pytest.fixture
+def syncer(tmp_path):
+    return BoardSyncer(tmp_path, debounce_seconds=0.2)
+
+
+class TestIncrementalSync:
+    """Tests for diff-aware rendering."""
+
+    def test_writes_all_columns(self, syncer):
+        syncer.sync(
+            _state(
+                [
+                    _task("T2", priority="low"),
+                    _task("T1", priority="critical"),
+                    _task("T3", "completed"),
+                ]
+            )
+        )
+
+        backlog = (syncer.board_dir / "backlog.md").read_text()
+        assert "Count: 2" in backlog
+        assert backlog.index("[T1]") < backlog.index("[T2]")
+        assert "[T3]" in (syncer.board_dir / "done.md").read_text()
+        assert "_No tasks_" in (syncer.board_dir / "blocked.md").read_text()
+        assert syncer.files_written == 5
+
+    def test_only_changed_columns_are_written(self, syncer):
+        tasks = [_task("T1"), _task("T2"), _task("T3", "completed")]
+        syncer.sync(_state(tasks))
+        blocked = syncer.board_dir / "blocked.md"
+        mtime = blocked.stat().st_mtime_ns
+
+        tasks[0] = _task("T1", "in_progress")
+        syncer.files_written = 0
+        syncer.sync(_state(tasks))
+
+        assert syncer.files_written == 2
+        assert blocked.stat().st_mtime_ns == mtime
+        assert "[T1]" in (syncer.board_dir / "in-progress.md").read_text()
+        assert "[T1]" not in (syncer.board_dir / "backlog.md").read_text()
+
+    def test_identical_state_writes_nothing(self, syncer):
+        tasks = [_task("T1"), _task("T2", "blocked")]
+        syncer.sync(_state(tasks))
+        syncer.files_written = 0
+
+        syncer.sync(_state([dict(t) for t in tasks]))
+
+        assert syncer.files_written == 0
+
+    def test_existing_identical_files_are_not_rewritten(self, syncer, tmp_path):
+        tasks = [_task("T1"), _task("T2", "completed")]
+        syncer.sync(_state(tasks))
+
+        restarted = BoardSyncer(tmp_path)
+        restarted.sync(_state(tasks))
+
+        assert restarted.files_written == 0
+
+    def test_only_changed_cards_are_rendered(self, syncer):
+        tasks = [_task(f"T{i}") for i in range(10)]
+        syncer.sync(_state(tasks))
+
+        tasks[3] = _task("T3", title="Renamed")
+        with patch.object(syncer, "_format_task_card", wraps=syncer._format_task_card) as render:
+            syncer.sync(_state(tasks))
+
+        assert render.call_count == 1
+        assert "Renamed" in (syncer.board_dir / "backlog.md").read_text()
+
+    def test_no_temp_files_left(self, syncer):
+        syncer.sync(_state([_task("T1")]))
+
+        assert not list(syncer.board_dir.glob(".*.tmp"))
+
+
+class TestDebounce:
+    """Tests for coalescing bursts of sync requests."""
+
+    def test_burst_coalesces_to_latest_state(self, syncer):
+        syncer.request_sync(_state([_task("T1")]))
+        assert syncer.files_written == 5
+
+        syncer.request_sync(_state([_task("T1", "in_progress")]))
+        syncer.request_sync(_state([_task("T1", "completed")]))
+        assert "[T1]" in (syncer.board_dir / "backlog.md").read_text()
+
+        syncer.flush()
+
+        assert "[T1]" in (syncer.board_dir / "done.md").read_text()
+        assert "_No tasks_" in (syncer.board_dir / "in-progress.md").read_text()
+        assert syncer.files_written == 7
+
+    def test_pending_sync_is_written_by_timer(self, syncer):
+        syncer.request_sync(_state([_task("T1")]))
+        syncer.request_sync(_state([_task("T1", "completed")]))
+
+        done = syncer.board_dir / "done.md"
+        deadline = time.monotonic() + 5
+        while "[T1]" not in done.read_text() and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        assert "[T1]" in done.read_text()
+        assert syncer._pending is None
+
+    def test_sync_board_uses_shared_syncer(self, tmp_path):
+        state = {"project_dir": str(tmp_path), "tasks": [_task("T1")]}
+
+        sync_board(state)
+        syncer = board_sync.get_board_syncer(tmp_path)
+        sync_board({**state, "tasks": [_task("T1", "completed")]})
+        board_sync.flush_board_syncs()
+
+        assert syncer is board_sync.get_board_syncer(tmp_path)
+        assert "[T1]" in (tmp_path / ".board" / "done.md").read_text()
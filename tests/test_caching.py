@@ -634,12 +634,13 @@ class TestTokenCosts:
 
     def test_token_estimation(self, cache):
         """Test token count estimation."""
-        text = "A" * 400  # 400 chars
+        text = "The quick brown fox jumps over the lazy dog. " * 10
 
         tokens = cache._estimate_tokens(text)
 
-        # Approx 4 chars per token
-        assert tokens == 100
+        # BPE tokenizers count ~10 tokens per sentence here
+        assert 90 <= tokens <= 110
+        assert tokens == cache.token_counter.count(text)
 
     def test_cost_saved_tracking(self, cache):
         """Test cost saved is tracked on cache hits."""
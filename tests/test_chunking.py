@@ -0,0 +1,94 @@
+"""Tests for semantic chunking and selective context loading.
+
+Tests cover:
+1. Postings index maintenance on index and removal
+2. BM25 ranking with importance and heading boosts
+3. Budgeted selection of the best chunks
+
+Run with: pytest tests/test_chunking.py -v
+"""
+
+import pytest
+
+from orchestrator.utils.chunking import SelectiveContextLoader, SemanticChunker
+
+AUTH_DOC = """# Authentication
+
+Users log in with OAuth tokens. Token refresh happens every hour.
+
+# Billing
+
+Invoices are generated monthly from usage records.
+"""
+
+DEPLOY_DOC = """# Deployment
+
+Services deploy with rolling updates. Tokens are never logged.
+"""
+
+
+@pytest.fixture
+def loader():
+    loader = SelectiveContextLoader(SemanticChunker())
+    loader.index_document("auth", AUTH_DOC)
+    loader.index_document("deploy", DEPLOY_DOC)
+    return loader
+
+
+class TestIndex:
+    """Tests for the postings index."""
+
+    def test_document_frequencies(self, loader):
+        assert loader._doc_freq["tokens"] == 2
+        assert loader._doc_freq["invoices"] == 1
+        assert loader._chunk_count == sum(len(i.lengths) for i in loader._indexes.values())
+
+    def test_reindex_replaces_postings(self, loader):
+        loader.index_document("auth", "# Notes\n\nNothing relevant here.\n")
+
+        assert "invoices" not in loader._doc_freq
+        assert loader._doc_freq["tokens"] == 1
+
+    def test_remove_document(self, loader):
+        assert loader.remove_document("deploy") is True
+        assert loader.remove_document("deploy") is False
+
+        assert loader.get_document_summary("deploy") is None
+        assert "rolling" not in loader._doc_freq
+        assert loader.select_context("rolling updates") == ""
+
+
+class TestSelectContext:
+    """Tests for ranked, budgeted selection."""
+
+    def test_ranks_matching_chunks(self, loader):
+        context = loader.select_context("when are invoices generated")
+
+        assert context.startswith("[From auth - Billing]")
+        assert "Invoices are generated" in context
+
+    def test_heading_match_ranks_first(self, loader):
+        context = loader.select_context("deployment tokens")
+
+        assert context.startswith("[From deploy")
+        assert "OAuth" in context
+
+    def test_punctuation_does_not_block_matches(self, loader):
+        assert "OAuth" in loader.select_context("oauth?")
+
+    def test_budget_limits_selection(self, loader):
+        full = loader.select_context("tokens", token_budget=10_000)
+        limited = loader.select_context("tokens", token_budget=20)
+
+        assert full.count("[From") == 2
+        assert limited.count("[From") == 1
+
+    def test_doc_filter(self, loader):
+        context = loader.select_context("tokens", doc_ids=["deploy"])
+
+        assert context.count("[From") == 1
+        assert "[From deploy" in context
+
+    def test_no_terms_selects_nothing(self, loader):
+        assert loader.select_context("   ") == ""
+        assert loader.select_context("kubernetes") == ""
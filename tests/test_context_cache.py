@@ -0,0 +1,147 @@
+"""Tests for the run-scoped project context cache.
+
+Tests cover:
+1. Memoized project config with stat-based invalidation
+2. Documentation context invalidation when docs change
+3. Copy isolation and explicit reload
+4. WorkflowRunner activating the cache for its run
+
+Run with: pytest tests/test_context_cache.py -v
+"""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from orchestrator.config import (
+    ProjectContextCache,
+    get_active_context_cache,
+    load_project_config,
+    thresholds,
+    use_context_cache,
+)
+from orchestrator.langgraph.utils.doc_context import load_documentation_context
+
+
+def _write(path: Path, content: str) -> None:
+    """Write content and bump mtime so stat changes are always visible."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def project(tmp_path):
+    _write(tmp_path / ".project-config.json", json.dumps({"quality": {"coverage_threshold": 60}}))
+    _write(tmp_path / "docs" / "vision.md", "# Vision\n\nBuild a thing.\n")
+    return tmp_path
+
+
+class TestProjectConfigCache:
+    """Tests for cached load_project_config."""
+
+    def test_repeated_loads_hit_cache(self, project):
+        cache = ProjectContextCache()
+
+        with use_context_cache(cache):
+            with patch.object(
+                thresholds, "_read_project_config", wraps=thresholds._read_project_config
+            ) as read:
+                for _ in range(5):
+                    config = load_project_config(project)
+
+        assert read.call_count == 1
+        assert config.quality.coverage_threshold == 60.0
+        assert cache.hits == 4
+
+    def test_file_change_invalidates(self, project):
+        cache = ProjectContextCache()
+
+        with use_context_cache(cache):
+            load_project_config(project)
+            _write(
+                project / ".project-config.json",
+                json.dumps({"quality": {"coverage_threshold": 90}}),
+            )
+            config = load_project_config(project)
+
+        assert config.quality.coverage_threshold == 90.0
+        assert cache.misses == 2
+
+    def test_new_source_file_invalidates(self, tmp_path):
+        cache = ProjectContextCache()
+
+        with use_context_cache(cache):
+            assert load_project_config(tmp_path).project_type == "base"
+            _write(tmp_path / "package.json", json.dumps({"dependencies": {"express": "4"}}))
+            assert load_project_config(tmp_path).project_type == "node-api"
+
+    def test_results_are_isolated_copies(self, project):
+        with use_context_cache(ProjectContextCache()):
+            load_project_config(project).quality.coverage_threshold = 1.0
+
+            assert load_project_config(project).quality.coverage_threshold == 60.0
+
+    def test_explicit_reload(self, project):
+        cache = ProjectContextCache()
+
+        with use_context_cache(cache):
+            load_project_config(project)
+            cache.reload(project)
+            load_project_config(project)
+
+        assert cache.misses == 2
+
+    def test_no_cache_outside_run(self, project):
+        assert get_active_context_cache() is None
+        assert load_project_config(project).quality.coverage_threshold == 60.0
+
+
+class TestDocumentationContextCache:
+    """Tests for cached load_documentation_context."""
+
+    def test_docs_change_invalidates(self, project):
+        cache = ProjectContextCache()
+
+        with use_context_cache(cache):
+            first = load_documentation_context(project)
+            again = load_documentation_context(project)
+            _write(project / "docs" / "architecture.md", "# Architecture\n\nServices.\n")
+            updated = load_documentation_context(project)
+
+        assert first == again
+        assert cache.hits == 1
+        assert len(updated["documents"]) == len(first["documents"]) + 1
+
+    def test_discovery_cache_file_invalidates(self, project):
+        cache = ProjectContextCache()
+
+        with use_context_cache(cache):
+            assert load_documentation_context(project)["source"] == "direct_discovery"
+            _write(
+                project / ".workflow" / "phases" / "0" / "discovered_context.json",
+                json.dumps({"documents": [], "product_vision": "Cached vision"}),
+            )
+            result = load_documentation_context(project)
+
+        assert result["source"] == "discovery_cache"
+        assert result["product_vision"] == "Cached vision"
+
+
+class TestWorkflowRunnerScope:
+    """Tests for the runner installing its cache."""
+
+    async def test_runner_activates_cache(self, project, monkeypatch):
+        from orchestrator.langgraph.workflow import WorkflowRunner
+
+        monkeypatch.setenv("LANGGRAPH_CHECKPOINTER", "memory")
+        runner = WorkflowRunner(project)
+
+        async with runner:
+            assert get_active_context_cache() is runner.context_cache
+
+        assert get_active_context_cache() is None
@@ -414,6 +414,135 @@ class TestTokenTracker:
         assert tracker.get_total_cost() == 0.0
 
 
+class TestTokenTrackerRollups:
+    """Tests for the append-only log and incremental rollups."""
+
+    @staticmethod
+    def _write_log(tmp_path, entries):
+        with open(tmp_path / "token_usage.jsonl", "w") as f:
+            for timestamp, model, phase in entries:
+                usage = TokenUsage(
+                    model=model,
+                    input_tokens=1000,
+                    output_tokens=1000,
+                    timestamp=timestamp,
+                    phase=phase,
+                )
+                f.write(json.dumps(usage.to_dict()) + "\n")
+
+    def test_record_appends_lines(self, tmp_path):
+        """Test each record appends one line to the log."""
+        tracker = TokenTracker(storage_dir=tmp_path)
+        for _ in range(3):
+            tracker.record(model="gpt-4.5-turbo", input_tokens=10, output_tokens=10)
+
+        lines = (tmp_path / "token_usage.jsonl").read_text().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0])["model"] == "gpt-4.5-turbo"
+
+    def test_restart_replays_only_log_tail(self, tmp_path):
+        """Test startup restores the snapshot and replays newer lines."""
+        tracker = TokenTracker(storage_dir=tmp_path, snapshot_interval=2)
+        for _ in range(4):
+            tracker.record(model="gpt-4.5-turbo", input_tokens=1000, output_tokens=1000)
+
+        snapshot = json.loads((tmp_path / "token_usage.json").read_text())
+        log_size = (tmp_path / "token_usage.jsonl").stat().st_size
+        assert 0 < snapshot["log_offset"] < log_size
+
+        restarted = TokenTracker(storage_dir=tmp_path)
+
+        assert restarted.get_total_cost() == pytest.approx(0.08)
+        assert restarted.get_summary().total_calls == 4
+        assert restarted._unsnapshotted == 1
+
+    def test_flush_snapshots_everything(self, tmp_path):
+        """Test flush covers the whole log."""
+        tracker = TokenTracker(storage_dir=tmp_path, snapshot_interval=100)
+        tracker.record(model="gpt-4.5-turbo", input_tokens=1, output_tokens=1)
+        tracker.record(model="gpt-4.5-turbo", input_tokens=1, output_tokens=1)
+
+        tracker.flush()
+
+        snapshot = json.loads((tmp_path / "token_usage.json").read_text())
+        assert snapshot["log_offset"] == (tmp_path / "token_usage.jsonl").stat().st_size
+
+    def test_migrates_legacy_file(self, tmp_path):
+        """Test a legacy token_usage.json list is moved into the log."""
+        usage = TokenUsage(model="gpt-4.5-turbo", input_tokens=1000, output_tokens=1000, phase=2)
+        (tmp_path / "token_usage.json").write_text(json.dumps({"usage": [usage.to_dict()] * 2}))
+
+        tracker = TokenTracker(storage_dir=tmp_path)
+
+        assert tracker.get_total_cost() == pytest.approx(0.04)
+        assert tracker.get_summary().by_phase["2"]["calls"] == 2
+        assert len((tmp_path / "token_usage.jsonl").read_text().splitlines()) == 2
+        assert "usage" not in json.loads((tmp_path / "token_usage.json").read_text())
+
+    def test_torn_trailing_line_is_dropped(self, tmp_path):
+        """Test a partial last line from a crash does not corrupt later appends."""
+        self._write_log(tmp_path, [("2026-01-05T10:00:00", "gpt-4.5-turbo", None)])
+        with open(tmp_path / "token_usage.jsonl", "a") as f:
+            f.write('{"model": "gpt-4.5')
+
+        tracker = TokenTracker(storage_dir=tmp_path)
+        tracker.record(model="gpt-4.5-turbo", input_tokens=1000, output_tokens=1000)
+
+        assert tracker.get_summary().total_calls == 2
+        assert len(list(TokenTracker(storage_dir=tmp_path).iter_usage())) == 2
+
+    def test_period_edges_are_exact(self, tmp_path):
+        """Test partial hours at the period edges are filtered per record."""
+        self._write_log(
+            tmp_path,
+            [
+                ("2026-01-05T10:10:00", "a", 1),
+                ("2026-01-05T10:50:00", "b", 1),
+                ("2026-01-05T11:30:00", "c", 2),
+                ("2026-01-05T12:20:00", "d", 2),
+                ("2026-01-05T12:40:00", "e", 3),
+            ],
+        )
+        tracker = TokenTracker(storage_dir=tmp_path)
+
+        summary = tracker.get_summary(
+            since=datetime(2026, 1, 5, 10, 30), until=datetime(2026, 1, 5, 12, 30)
+        )
+
+        assert summary.total_calls == 3
+        assert sorted(summary.by_model) == ["b", "c", "d"]
+        # Unknown models use default pricing: $0.04 per record here
+        assert tracker.get_total_cost(since=datetime(2026, 1, 5, 12, 30)) == pytest.approx(0.04)
+
+    def test_iter_usage_streams_history(self, tmp_path):
+        """Test full history is available through iter_usage."""
+        self._write_log(
+            tmp_path,
+            [("2026-01-05T10:00:00", "a", None), ("2026-01-06T10:00:00", "b", None)],
+        )
+        tracker = TokenTracker(storage_dir=tmp_path)
+
+        assert [u.model for u in tracker.iter_usage()] == ["a", "b"]
+        assert [u.model for u in tracker.iter_usage(since=datetime(2026, 1, 6))] == ["b"]
+
+    def test_daily_and_hourly_rollups(self, tmp_path):
+        """Test day and hour rollups."""
+        self._write_log(
+            tmp_path,
+            [
+                ("2026-01-05T10:00:00", "a", None),
+                ("2026-01-05T11:00:00", "a", None),
+                ("2026-01-06T09:00:00", "a", None),
+            ],
+        )
+        tracker = TokenTracker(storage_dir=tmp_path)
+
+        daily = tracker.get_daily_usage()
+        assert list(daily) == ["2026-01-05", "2026-01-06"]
+        assert daily["2026-01-05"].calls == 2
+        assert tracker.get_hourly_usage()["2026-01-06T09"].tokens == 2000
+
+
 # =============================================================================
 # Model Router Tests
 # =============================================================================
@@ -0,0 +1,216 @@
+"""Tests for concurrent, cached dependency checks.
+
+Tests cover:
+1. npm outdated/audit parsing through a fake npm on PATH
+2. Strategies and npm subcommands running concurrently
+3. On-disk caching keyed by the lockfile, Dockerfile and compose files
+4. TTL expiry, disabled caching and failed runs that are not cached
+
+Run with: pytest tests/test_dependency_checker.py -v
+"""
+
+import json
+import os
+import stat
+import sys
+
+import pytest
+
+from orchestrator.validators.dependency_checker import (
+    DependencyChecker,
+    DependencyFinding,
+    DependencySeverity,
+)
+
+FAKE_NPM = """#!{python}
+import json, os, sys, time
+
+with open(os.environ["FAKE_NPM_LOG"], "a") as f:
+    f.write(f"start {{sys.argv[1]}} {{time.time()}}\\n")
+time.sleep(float(os.environ.get("FAKE_NPM_DELAY", "0")))
+with open(os.environ["FAKE_NPM_LOG"], "a") as f:
+    f.write(f"end {{sys.argv[1]}} {{time.time()}}\\n")
+
+if os.environ.get("FAKE_NPM_BROKEN"):
+    print("npm ERR! registry unreachable")
+    sys.exit(1)
+if sys.argv[1] == "outdated":
+    print(json.dumps({{"lodash": {{"current": "4.17.20", "latest": "4.17.21"}}}}))
+    sys.exit(1)
+if sys.argv[1] == "audit":
+    print(json.dumps({{"vulnerabilities": {{"minimist": {{
+        "severity": "high",
+        "via": [{{"title": "Prototype Pollution",
+                  "url": "https://github.com/advisories/GHSA-xvch-5gv4-984h"}}],
+        "fixAvailable": True,
+    }}}}}}))
+    sys.exit(1)
+"""
+
+
+@pytest.fixture
+def npm_log(tmp_path, monkeypatch):
+    """Put a fake npm on PATH; returns a function listing its invocations."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    npm = bin_dir / "npm"
+    npm.write_text(FAKE_NPM.format(python=sys.executable))
+    npm.chmod(npm.stat().st_mode | stat.S_IEXEC)
+    log_file = tmp_path / "npm.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_NPM_LOG", str(log_file))
+
+    def calls(event: str = "start") -> list[tuple[str, float]]:
+        if not log_file.exists():
+            return []
+        lines = [line.split() for line in log_file.read_text().splitlines()]
+        return [(command, float(ts)) for kind, command, ts in lines if kind == event]
+
+    return calls
+
+
+@pytest.fixture
+def project(tmp_path):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "package.json").write_text(
+        json.dumps({"dependencies": {"react": "^17.0.2", "lodash": "^4.17.20"}})
+    )
+    (project_dir / "package-lock.json").write_text(json.dumps({"lockfileVersion": 3}))
+    (project_dir / "Dockerfile").write_text("FROM node:latest\n")
+    return project_dir
+
+
+def _summary(result) -> list[tuple[str, str]]:
+    return [(f.category, f.package) for f in result.findings]
+
+
+class TestNpmFindings:
+    """Tests for npm findings from the fake npm."""
+
+    def test_outdated_and_audit_findings(self, project, npm_log):
+        result = DependencyChecker(project, check_docker=False, check_frameworks=False).check()
+
+        assert _summary(result) == [("npm", "lodash"), ("npm", "minimist")]
+        assert result.findings[1].severity == DependencySeverity.HIGH
+        assert result.findings[1].cve == "GHSA-xvch-5gv4-984h"
+        assert result.passed is False
+        assert sorted(command for command, _ in npm_log()) == ["audit", "outdated"]
+
+    def test_npm_subcommands_run_concurrently(self, project, npm_log, monkeypatch):
+        monkeypatch.setenv("FAKE_NPM_DELAY", "0.5")
+
+        DependencyChecker(project, check_docker=False, check_frameworks=False).check()
+
+        starts = dict(npm_log("start"))
+        ends = dict(npm_log("end"))
+        assert starts["outdated"] < ends["audit"]
+        assert starts["audit"] < ends["outdated"]
+
+    def test_findings_keep_strategy_order(self, project, npm_log, monkeypatch):
+        monkeypatch.setenv("FAKE_NPM_DELAY", "0.2")
+
+        result = DependencyChecker(project).check()
+
+        assert [f.category for f in result.findings] == [
+            "npm",
+            "npm",
+            "docker",
+            "docker",
+            "framework",
+        ]
+
+
+class TestCache:
+    """Tests for on-disk caching of findings."""
+
+    def test_unchanged_manifests_run_no_subprocesses(self, project, npm_log):
+        first = DependencyChecker(project).check()
+        second = DependencyChecker(project).check()
+
+        assert len(npm_log()) == 2
+        assert second.to_dict() == first.to_dict()
+        assert (project / ".workflow" / "cache" / "dependencies" / "npm.json").exists()
+
+    def test_lockfile_change_invalidates_npm_only(self, project, npm_log):
+        DependencyChecker(project).check()
+        docker_cache = project / ".workflow" / "cache" / "dependencies" / "docker.json"
+        docker_mtime = docker_cache.stat().st_mtime_ns
+
+        (project / "package-lock.json").write_text(json.dumps({"lockfileVersion": 3, "x": 1}))
+        DependencyChecker(project).check()
+
+        assert len(npm_log()) == 4
+        assert docker_cache.stat().st_mtime_ns == docker_mtime
+
+    def test_dockerfile_change_invalidates_docker(self, project, npm_log):
+        DependencyChecker(project).check()
+
+        (project / "Dockerfile").write_text("FROM node:22\n")
+        result = DependencyChecker(project).check()
+
+        docker = [f for f in result.findings if f.category == "docker"]
+        assert [f.package for f in docker] == [".dockerignore"]
+        assert len(npm_log()) == 2
+
+    def test_new_compose_file_invalidates_docker(self, project, npm_log):
+        DependencyChecker(project).check()
+
+        (project / "docker-compose.yml").write_text("services:\n  db:\n    image: postgres\n")
+        result = DependencyChecker(project).check()
+
+        assert ("docker", "docker-compose") in _summary(result)
+
+    def test_expired_entries_rerun(self, project, npm_log):
+        DependencyChecker(project, cache_ttl_seconds=60).check()
+        cache_file = project / ".workflow" / "cache" / "dependencies" / "npm.json"
+        entry = json.loads(cache_file.read_text())
+        entry["created_at"] -= 120
+        cache_file.write_text(json.dumps(entry))
+
+        DependencyChecker(project, cache_ttl_seconds=60).check()
+
+        assert len(npm_log()) == 4
+
+    def test_zero_ttl_disables_cache(self, project, npm_log):
+        DependencyChecker(project, cache_ttl_seconds=0).check()
+        DependencyChecker(project, cache_ttl_seconds=0).check()
+
+        assert len(npm_log()) == 4
+        assert not (project / ".workflow" / "cache").exists()
+
+    def test_failed_npm_run_not_cached(self, project, npm_log, monkeypatch):
+        monkeypatch.setenv("FAKE_NPM_BROKEN", "1")
+        result = DependencyChecker(project, check_docker=False, check_frameworks=False).check()
+        assert result.findings == []
+
+        monkeypatch.delenv("FAKE_NPM_BROKEN")
+        result = DependencyChecker(project, check_docker=False, check_frameworks=False).check()
+
+        assert len(result.findings) == 2
+        assert len(npm_log()) == 4
+
+    def test_corrupt_cache_ignored(self, project, npm_log):
+        cache_dir = project / ".workflow" / "cache" / "dependencies"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "npm.json").write_text("not json")
+
+        result = DependencyChecker(project, check_docker=False, check_frameworks=False).check()
+
+        assert len(result.findings) == 2
+
+
+class TestDependencyFinding:
+    """Tests for DependencyFinding serialization."""
+
+    def test_round_trip(self):
+        finding = DependencyFinding(
+            severity=DependencySeverity.CRITICAL,
+            category="docker",
+            package="Dockerfile",
+            message="Potential hardcoded secret in ENV",
+            file="Dockerfile",
+            line=3,
+        )
+
+        assert DependencyFinding.from_dict(finding.to_dict()) == finding
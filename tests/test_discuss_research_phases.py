@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 import pytest
 
+from orchestrator.db.repositories.logs import LogEntry
 from orchestrator.langgraph.nodes.discuss_phase import (
     CONTEXT_MD_TEMPLATE,
     DISCUSSION_QUESTIONS,
@@ -12,8 +13,14 @@ from orchestrator.langgraph.nodes.discuss_phase import (
     _write_context_md,
     discuss_phase_node,
 )
-from orchestrator.langgraph.nodes.research_phase import RESEARCH_AGENTS, research_phase_node
+from orchestrator.langgraph.nodes.research_phase import (
+    RESEARCH_AGENTS,
+    _match_cached_research,
+    _research_fingerprints,
+    research_phase_node,
+)
 from orchestrator.langgraph.routers.general import discuss_router, research_router
+from tests.helpers.mock_factories import create_mock_logs_repo
 
 
 class TestDiscussionQuestions:
@@ -238,6 +245,115 @@ class TestResearchPhaseNode:
             assert result.get("research_complete") is True
 
 
+class TestResearchCache:
+    """Tests for fingerprint-keyed research reuse."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        project_dir = tmp_path / "project"
+        (project_dir / "src" / "services").mkdir(parents=True)
+        (project_dir / "src" / "services" / "user.py").write_text("x = 1\n")
+        (project_dir / "docs").mkdir()
+        (project_dir / "docs" / "vision.md").write_text("# Vision\n")
+        (project_dir / "package.json").write_text('{"dependencies": {"react": "18"}}')
+        return project_dir
+
+    @pytest.fixture
+    def state(self, project):
+        return {"project_dir": str(project), "project_name": "test-project"}
+
+    @staticmethod
+    def _history(project, fingerprints=None):
+        content = {
+            "tech_stack": {"languages": ["javascript"]},
+            "existing_patterns": {"architecture": "Service-oriented"},
+            "web_research": {"pitfalls": []},
+            "errors": [],
+            "fingerprints": fingerprints or _research_fingerprints(project),
+        }
+        return [LogEntry(log_type="research_aggregated", content=content)]
+
+    @staticmethod
+    def _changed(before, after):
+        return {agent_id for agent_id in before if before[agent_id] != after[agent_id]}
+
+    def test_code_edits_keep_fingerprints(self, project):
+        before = _research_fingerprints(project)
+        (project / "src" / "services" / "user.py").write_text("x = 2\n")
+        (project / "src" / "services" / "order.py").write_text("y = 1\n")
+
+        assert _research_fingerprints(project) == before
+
+    def test_changes_affect_only_dependent_areas(self, project):
+        base = _research_fingerprints(project)
+
+        (project / "docs" / "vision.md").write_text("# Vision\n\nUpdated.\n")
+        docs = _research_fingerprints(project)
+        (project / "src" / "domain").mkdir()
+        layout = _research_fingerprints(project)
+        (project / "package-lock.json").write_text("{}")
+        manifests = _research_fingerprints(project)
+
+        assert self._changed(base, docs) == {"web_research"}
+        assert self._changed(docs, layout) == {"existing_patterns"}
+        assert self._changed(layout, manifests) == set(base)
+
+    async def test_unchanged_project_reuses_all_research(self, state, project):
+        with (
+            patch(
+                "orchestrator.langgraph.nodes.research_phase._load_research_history_from_db",
+                return_value=self._history(project),
+            ),
+            patch("orchestrator.langgraph.nodes.research_phase._run_research_agent") as mock_run,
+        ):
+            result = await research_phase_node(state)
+
+        mock_run.assert_not_called()
+        assert result["research_complete"] is True
+        assert result["research_findings"]["tech_stack"] == {"languages": ["javascript"]}
+
+    async def test_only_changed_area_is_researched(self, state, project):
+        history = self._history(project)
+        (project / "docs" / "architecture.md").write_text("# Architecture\n")
+
+        with (
+            patch(
+                "orchestrator.langgraph.nodes.research_phase._load_research_history_from_db",
+                return_value=history,
+            ),
+            patch("orchestrator.langgraph.nodes.research_phase._run_research_agent") as mock_run,
+        ):
+            mock_run.return_value = {"pitfalls": ["new"]}
+            result = await research_phase_node(state)
+
+        assert [call.args[1].id for call in mock_run.call_args_list] == ["web_research"]
+        findings = result["research_findings"]
+        assert findings["web_research"] == {"pitfalls": ["new"]}
+        assert findings["existing_patterns"] == {"architecture": "Service-oriented"}
+        assert findings["fingerprints"] == _research_fingerprints(project)
+
+    async def test_reads_log_records_from_repository(self, state, project):
+        repo = create_mock_logs_repo()
+        repo.get_by_type.return_value = self._history(project)
+
+        with (
+            patch("orchestrator.db.repositories.logs.get_logs_repository", return_value=repo),
+            patch("orchestrator.langgraph.nodes.research_phase._run_research_agent") as mock_run,
+        ):
+            result = await research_phase_node(state)
+
+        mock_run.assert_not_called()
+        assert result["research_findings"]["web_research"] == {"pitfalls": []}
+
+    def test_failed_and_skipped_results_are_not_reused(self, project):
+        fingerprints = _research_fingerprints(project)
+        history = self._history(project)
+        history[0].content["web_research"] = {"skipped": True}
+        history[0].content["errors"] = [{"agent": "tech_stack", "error": "timeout"}]
+
+        assert set(_match_cached_research(history, fingerprints)) == {"existing_patterns"}
+
+
 class TestDiscussRouter:
     """Tests for discuss router."""
 
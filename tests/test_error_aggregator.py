@@ -121,7 +121,8 @@ class TestErrorAggregator:
         assert error.message == "Test error message"
         assert error.phase == 2
 
-        # Check persistence
+        # Check persistence once the background writer is flushed
+        error_aggregator.flush()
         unresolved_file = temp_workflow_dir / "errors" / "unresolved.json"
         assert unresolved_file.exists()
 
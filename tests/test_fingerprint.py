@@ -0,0 +1,208 @@
+"""Tests for stat-first file fingerprints.
+
+Tests cover:
+1. Digests reused while a file's stat is unchanged
+2. Racily-clean files re-hashed
+3. Persisted cache shared across instances
+4. Parallel and mmap hashing matching hashlib
+5. ContextManager and MarkdownTracker skipping unchanged files
+
+Run with: pytest tests/test_fingerprint.py -v
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from orchestrator.utils import fingerprint as fingerprint_module
+from orchestrator.utils.context import ContextManager
+from orchestrator.utils.fingerprint import FileFingerprinter, get_fingerprinter
+
+
+def _write(path: Path, content: str, age_seconds: int = 60) -> None:
+    """Write content with an mtime in the past, outside the racy window."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    stat = path.stat()
+    mtime_ns = stat.st_mtime_ns - age_seconds * 1_000_000_000
+    os.utime(path, ns=(stat.st_atime_ns, mtime_ns))
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class TestFileFingerprinter:
+    """Tests for the digest cache."""
+
+    def test_unchanged_file_is_not_rehashed(self, tmp_path):
+        path = tmp_path / "a.md"
+        _write(path, "hello")
+        fingerprinter = FileFingerprinter()
+
+        first = fingerprinter.fingerprint(path)
+        second = fingerprinter.fingerprint(path)
+
+        assert first == second
+        assert first.digest == _sha256(path)
+        assert fingerprinter.hashed == 1
+        assert fingerprinter.reused == 1
+
+    def test_changed_file_is_rehashed(self, tmp_path):
+        path = tmp_path / "a.md"
+        _write(path, "hello")
+        fingerprinter = FileFingerprinter()
+        before = fingerprinter.digest(path)
+
+        _write(path, "hello world", age_seconds=30)
+
+        assert fingerprinter.digest(path) == _sha256(path) != before
+        assert fingerprinter.hashed == 2
+
+    def test_recently_modified_file_is_rehashed(self, tmp_path):
+        path = tmp_path / "a.md"
+        path.write_text("fresh")
+        fingerprinter = FileFingerprinter()
+
+        fingerprinter.digest(path)
+        fingerprinter.digest(path)
+
+        assert fingerprinter.hashed == 2
+
+    def test_missing_and_non_regular_paths(self, tmp_path):
+        fingerprinter = FileFingerprinter()
+
+        assert fingerprinter.fingerprint(tmp_path / "missing.md") is None
+        assert fingerprinter.fingerprint(tmp_path) is None
+
+    def test_cache_persists_across_instances(self, tmp_path):
+        path = tmp_path / "a.md"
+        _write(path, "hello")
+        cache_file = tmp_path / ".workflow" / "fingerprints.json"
+        first = FileFingerprinter(cache_file)
+        first.digest(path)
+        first.save()
+
+        restarted = FileFingerprinter(cache_file)
+
+        assert restarted.digest(path) == _sha256(path)
+        assert restarted.hashed == 0
+
+    def test_algorithm_change_ignores_cache(self, tmp_path):
+        path = tmp_path / "a.md"
+        _write(path, "hello")
+        cache_file = tmp_path / "fingerprints.json"
+        sha = FileFingerprinter(cache_file)
+        sha.digest(path)
+        sha.save()
+
+        blake = FileFingerprinter(cache_file, algorithm="blake2b")
+
+        assert blake.digest(path) == hashlib.blake2b(b"hello").hexdigest()
+        assert blake.hashed == 1
+
+    def test_algorithm_from_environment(self, monkeypatch):
+        monkeypatch.setenv(fingerprint_module.HASH_ALGORITHM_ENV, "blake2b")
+
+        assert FileFingerprinter().algorithm == "blake2b"
+
+    def test_many_files_hashed_in_parallel(self, tmp_path):
+        paths = [tmp_path / f"doc{i}.md" for i in range(20)]
+        for i, path in enumerate(paths):
+            _write(path, f"document {i}\n" * (i + 1))
+        fingerprinter = FileFingerprinter(max_workers=4)
+
+        fingerprints = fingerprinter.fingerprint_many([*paths, tmp_path / "missing.md"])
+
+        assert [f.digest for f in fingerprints[:-1]] == [_sha256(p) for p in paths]
+        assert fingerprints[-1] is None
+        assert fingerprinter.hashed == 20
+
+    def test_large_files_hashed_via_mmap(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fingerprint_module, "MMAP_THRESHOLD", 1024)
+        path = tmp_path / "big.bin"
+        path.write_bytes(os.urandom(64 * 1024))
+
+        assert fingerprint_module.hash_file(path) == _sha256(path)
+
+    def test_shared_fingerprinter_per_project(self, tmp_path):
+        fingerprinter = get_fingerprinter(tmp_path)
+
+        assert get_fingerprinter(tmp_path / ".") is fingerprinter
+        assert fingerprinter.cache_file == tmp_path.resolve() / ".workflow" / "fingerprints.json"
+
+
+class TestContextManagerFingerprints:
+    """Tests for drift checks reusing digests."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        _write(tmp_path / "AGENTS.md", "# Agents")
+        for i in range(6):
+            _write(tmp_path / "docs" / f"doc{i}.md", f"# Doc {i}")
+        return tmp_path
+
+    def test_unchanged_validation_hashes_nothing(self, project):
+        manager = ContextManager(project)
+        stored = manager.capture_context()
+        fingerprinter = get_fingerprinter(project)
+        hashed = fingerprinter.hashed
+
+        drift = ContextManager(project).validate_context(stored)
+
+        assert not drift.has_drift
+        assert fingerprinter.hashed == hashed
+
+    def test_change_is_detected(self, project):
+        manager = ContextManager(project)
+        stored = manager.capture_context()
+
+        _write(project / "docs" / "doc3.md", "# Doc 3, revised", age_seconds=30)
+        drift = manager.validate_context(stored)
+
+        assert drift.has_drift
+        assert len(drift.changed_files) == 1
+
+    def test_cache_file_written(self, project):
+        ContextManager(project).capture_context()
+
+        data = json.loads((project / ".workflow" / "fingerprints.json").read_text())
+        assert str(project / "AGENTS.md") in data["entries"]
+
+
+class TestMarkdownTrackerFingerprints:
+    """Tests for task file integrity checks."""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        from orchestrator.langgraph.integrations.markdown_tracker import (
+            MarkdownTracker,
+            MarkdownTrackerConfig,
+        )
+
+        return MarkdownTracker(tmp_path, MarkdownTrackerConfig(make_readonly=False))
+
+    def _age(self, path: Path) -> None:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 60_000_000_000))
+
+    def test_unchanged_task_is_not_reread(self, tracker, tmp_path):
+        tracker.create_task_files([{"id": "T1", "title": "Task 1"}])
+        self._age(tracker.tasks_dir / "T1.md")
+        fingerprinter = get_fingerprinter(tmp_path)
+
+        assert tracker.validate_task_integrity("T1") is True
+        hashed = fingerprinter.hashed
+        assert tracker.validate_task_integrity("T1") is True
+
+        assert fingerprinter.hashed == hashed
+
+    def test_status_update_keeps_integrity(self, tracker):
+        tracker.create_task_files([{"id": "T1", "title": "Task 1"}])
+
+        tracker.update_task_status("T1", "completed")
+
+        assert tracker.validate_task_integrity("T1") is True
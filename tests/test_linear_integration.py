@@ -11,6 +11,10 @@ Run with: pytest tests/test_linear_integration.py -v
 """
 
 import json
+import re
+import sys
+import time
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -308,6 +312,264 @@ class TestMCPAvailability:
             assert result is True
 
 
+# =============================================================================
+# Test Batched Sync (fake CLI)
+# =============================================================================
+
+FAKE_CLI = Path(__file__).parent / "helpers" / "fake_linear_cli.py"
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch):
+    """Route MCP calls to the fake CLI and return a reader for its call log."""
+    log_file = tmp_path / "calls.jsonl"
+    monkeypatch.setenv("FAKE_LINEAR_LOG", str(log_file))
+
+    def calls(entries=False):
+        if not log_file.exists():
+            return []
+        logged = [json.loads(line) for line in log_file.read_text().splitlines()]
+        return logged if entries else [entry["prompt"] for entry in logged]
+
+    return calls
+
+
+def _fake_adapter(**overrides):
+    from orchestrator.langgraph.integrations.linear import LinearAdapter, LinearConfig
+
+    config = LinearConfig(
+        enabled=True,
+        team_id="TEAM123",
+        cli_command=f"{sys.executable} {FAKE_CLI}",
+        **overrides,
+    )
+    return LinearAdapter(config)
+
+
+def _tasks(count):
+    return [{"id": f"T{i}", "title": f"Task {i}", "acceptance_criteria": []} for i in range(count)]
+
+
+class TestBatchedSync:
+    """Test batched issue creation and coalesced updates."""
+
+    def test_issues_created_in_batches(self, fake_cli):
+        adapter = _fake_adapter(batch_size=10)
+
+        mapping = adapter.create_issues_from_tasks(_tasks(25), "demo")
+
+        assert mapping == {f"T{i}": f"LIN-T{i}" for i in range(25)}
+        creates = [p for p in fake_cli() if "createIssue" in p]
+        assert len(creates) == 3
+
+    def test_missing_batch_results_fall_back_to_single_calls(self):
+        adapter = _fake_adapter(batch_size=3)
+        adapter._mcp_available = True
+
+        def respond(prompt, **kwargs):
+            if "listIssues" in prompt:
+                return "LOOKUP_DONE"
+            if "ISSUE_ID[" in prompt:
+                return "ISSUE_ID[T0]: LIN-0\nISSUE_ID[T2]: LIN-2"
+            return "ISSUE_ID: LIN-1"
+
+        with patch.object(adapter, "_run_mcp_command", side_effect=respond) as run:
+            mapping = adapter.create_issues_from_tasks(_tasks(3), "demo")
+
+        assert mapping == {"T0": "LIN-0", "T1": "LIN-1", "T2": "LIN-2"}
+        prompts = [call.args[0] for call in run.call_args_list]
+        assert len(prompts) == 3
+        assert '"[T1]"' in prompts[1] and "[T0]" not in prompts[1]
+
+    def test_issue_created_before_timeout_not_duplicated(self):
+        adapter = _fake_adapter(batch_size=3)
+        adapter._mcp_available = True
+
+        def respond(prompt, **kwargs):
+            if "listIssues" in prompt:
+                return "ISSUE_ID[T0]: LIN-0\nISSUE_ID[T1]: LIN-1\nLOOKUP_DONE"
+            if "ISSUE_ID[" in prompt:
+                return None  # Timed out after creating T0 and T1
+            return "ISSUE_ID: LIN-new"
+
+        with patch.object(adapter, "_run_mcp_command", side_effect=respond) as run:
+            mapping = adapter.create_issues_from_tasks(_tasks(3), "demo")
+
+        assert mapping == {"T0": "LIN-0", "T1": "LIN-1", "T2": "LIN-new"}
+        creates = [c for c in run.call_args_list if 'title: "[' in c.args[0]]
+        assert len(creates) == 2  # The batch, then T2 alone
+
+    def test_failed_lookup_leaves_tasks_unresolved(self):
+        adapter = _fake_adapter(batch_size=2)
+        adapter._mcp_available = True
+        replies = {"batch": "ISSUE_ID[T0]: LIN-0", "lookup": "ISSUE_ID[T1]: LIN-"}
+
+        def respond(prompt, **kwargs):
+            if "listIssues" in prompt:
+                return replies["lookup"]
+            if "ISSUE_ID[" in prompt:
+                return replies["batch"]
+            return "ISSUE_ID: LIN-1"
+
+        with patch.object(adapter, "_run_mcp_command", side_effect=respond) as run:
+            mapping = adapter.create_issues_from_tasks(_tasks(2), "demo")
+            assert mapping == {"T0": "LIN-0"}
+            assert adapter.unresolved_tasks == {"T1"}
+            assert run.call_count == 2
+
+            # The next run looks the task up again before creating it
+            replies["lookup"] = "LOOKUP_DONE"
+            mapping = adapter.create_issues_from_tasks(_tasks(2)[1:], "demo")
+
+        assert mapping == {"T1": "LIN-1"}
+        assert adapter.unresolved_tasks == set()
+        assert "listIssues" in run.call_args_list[2].args[0]
+
+    def test_batches_run_concurrently(self, fake_cli, monkeypatch):
+        monkeypatch.setenv("FAKE_LINEAR_DELAY", "0.3")
+        adapter = _fake_adapter(batch_size=2, max_workers=4)
+        adapter._mcp_available = True
+
+        mapping = adapter.create_issues_from_tasks(_tasks(8), "demo")
+
+        assert len(mapping) == 8
+        calls = fake_cli(entries=True)
+        assert len(calls) == 4
+        peak = max(
+            sum(o["start"] < c["end"] and c["start"] < o["end"] for o in calls) for c in calls
+        )
+        assert peak > 1
+
+    def test_deferred_updates_coalesce(self, fake_cli):
+        from orchestrator.langgraph.state import TaskStatus
+
+        adapter = _fake_adapter(update_delay=60.0)
+        adapter.load_issue_mapping({"T1": "LIN-1", "T2": "LIN-2"})
+
+        adapter.update_issue_status("T1", TaskStatus.IN_PROGRESS, defer=True)
+        adapter.update_issue_status("T1", TaskStatus.COMPLETED, defer=True)
+        adapter.add_completion_comment("T1", "all green", defer=True)
+        adapter.update_issue_status("T2", TaskStatus.BLOCKED, defer=True)
+        assert fake_cli() == []
+
+        assert adapter.flush_updates() is True
+
+        calls = fake_cli()
+        assert len(calls) == 1
+        assert '"Done"' in calls[0] and '"In Progress"' not in calls[0]
+        assert "all green" in calls[0] and "LIN-2" in calls[0]
+        assert len(adapter.updates) == 0
+
+    def test_unconfirmed_updates_stay_queued(self, fake_cli):
+        from orchestrator.langgraph.state import TaskStatus
+
+        adapter = _fake_adapter(update_delay=60.0)
+        adapter.load_issue_mapping({"T1": "LIN-1", "T2": "LIN-2", "T3": "LIN-3"})
+        adapter.update_issue_status("T1", TaskStatus.COMPLETED, defer=True)
+        adapter.add_blocker_comment("T1", "waiting on API", defer=True)
+        adapter.add_blocker_comment("T2", "waiting on review", defer=True)
+        adapter.update_issue_status("T3", TaskStatus.BLOCKED, defer=True)
+
+        # Truncated reply: LIN-3's status errored, LIN-1's comment failed and
+        # LIN-2's comment has no result line
+        reply = (
+            "RESULT[LIN-1/status]: SUCCESS\n"
+            "RESULT[LIN-1/comment-1]: ERROR rate limited\n"
+            "RESULT[LIN-3/status]: ERROR state not found"
+        )
+        with patch.object(adapter, "_run_mcp_command", return_value=reply):
+            assert adapter.flush_updates() is False
+
+        # The unreported comment may have been posted, so it is not resent
+        assert adapter.updates._statuses == {"LIN-3": "Blocked"}
+        assert adapter.updates._comments == {"LIN-1": ["🚫 **Blocked**: waiting on API"]}
+
+        assert adapter.flush_updates() is True
+        assert len(adapter.updates) == 0
+        calls = fake_cli()
+        assert "waiting on API" in calls[0] and "waiting on review" not in calls[0]
+
+    def test_failed_updates_dropped_after_max_attempts(self):
+        from orchestrator.langgraph.integrations.linear import LinearUpdateQueue
+        from orchestrator.langgraph.state import TaskStatus
+
+        adapter = _fake_adapter(update_delay=60.0)
+        adapter.load_issue_mapping({"T1": "LIN-1"})
+        adapter.update_issue_status("T1", TaskStatus.COMPLETED, defer=True)
+        adapter.add_blocker_comment("T1", "waiting on API", defer=True)
+
+        reply = "RESULT[LIN-1/status]: ERROR down\nRESULT[LIN-1/comment-1]: ERROR down"
+        with patch.object(adapter, "_run_mcp_command", return_value=reply) as run:
+            for _ in range(LinearUpdateQueue.MAX_ATTEMPTS + 1):
+                adapter.flush_updates()
+
+        assert run.call_count == LinearUpdateQueue.MAX_ATTEMPTS
+        assert len(adapter.updates) == 0
+
+    def test_unresolved_tasks_looked_up_before_batch(self):
+        adapter = _fake_adapter(batch_size=3)
+        adapter._mcp_available = True
+        adapter.load_unresolved_tasks(["T1"])
+
+        def respond(prompt, **kwargs):
+            if "listIssues" in prompt:
+                return None  # Lookup fails again
+            if "ISSUE_ID[" in prompt:
+                task_ids = re.findall(r"^Issue \[([^\]]+)\]:", prompt, re.MULTILINE)
+                return "\n".join(f"ISSUE_ID[{t}]: LIN-{t}" for t in task_ids)
+            return "ISSUE_ID: LIN-new"
+
+        with patch.object(adapter, "_run_mcp_command", side_effect=respond) as run:
+            mapping = adapter.create_issues_from_tasks(_tasks(3), "demo")
+
+        assert mapping == {"T0": "LIN-T0", "T2": "LIN-T2"}
+        assert adapter.unresolved_tasks == {"T1"}
+        prompts = [call.args[0] for call in run.call_args_list]
+        assert "listIssues" in prompts[0]
+        assert all("[T1]" not in prompt for prompt in prompts[1:])
+
+    def test_unresolved_tasks_persist(self, temp_project_dir):
+        from orchestrator.langgraph.integrations.linear import (
+            load_unresolved_tasks,
+            save_unresolved_tasks,
+        )
+
+        save_unresolved_tasks(temp_project_dir, {"T2", "T1"})
+        assert load_unresolved_tasks(temp_project_dir) == {"T1", "T2"}
+
+        save_unresolved_tasks(temp_project_dir, set())
+        assert load_unresolved_tasks(temp_project_dir) == set()
+        assert not (temp_project_dir / ".workflow" / "linear_unresolved.json").exists()
+
+    def test_deferred_updates_flush_after_delay(self, fake_cli):
+        from orchestrator.langgraph.state import TaskStatus
+
+        adapter = _fake_adapter(update_delay=0.05)
+        adapter.load_issue_mapping({"T1": "LIN-1"})
+
+        adapter.update_issue_status("T1", TaskStatus.COMPLETED, defer=True)
+
+        deadline = time.monotonic() + 10
+        while not fake_cli() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert len(fake_cli()) == 1
+
+    def test_shared_adapter_per_project(self, temp_project_dir):
+        from orchestrator.langgraph.integrations.linear import get_linear_adapter
+
+        config_file = temp_project_dir / ".project-config.json"
+        config_file.write_text(
+            json.dumps({"integrations": {"linear": {"enabled": True, "team_id": "A"}}})
+        )
+        first = get_linear_adapter(temp_project_dir)
+        assert get_linear_adapter(temp_project_dir) is first
+
+        config_file.write_text(
+            json.dumps({"integrations": {"linear": {"enabled": True, "team_id": "B"}}})
+        )
+        assert get_linear_adapter(temp_project_dir) is not first
+
+
 # =============================================================================
 # Test Integration Exports
 # =============================================================================
@@ -0,0 +1,139 @@
+"""Tests for the group-commit log writer."""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from orchestrator.utils.log_writer import FsyncPolicy, LogWriter, LogWriterConfig
+
+
+@pytest.fixture
+def writer():
+    """Create a writer that is closed after the test."""
+    writer = LogWriter(LogWriterConfig(snapshot_delay=60.0))
+    yield writer
+    writer.close()
+
+
+class TestAppends:
+    """Tests for batched appends."""
+
+    def test_flush_makes_appends_visible(self, writer, tmp_path):
+        log_file = tmp_path / "nested" / "log.jsonl"
+
+        for i in range(5):
+            writer.append(log_file, json.dumps({"n": i}) + "\n")
+        assert writer.flush()
+
+        lines = log_file.read_text().splitlines()
+        assert [json.loads(line)["n"] for line in lines] == [0, 1, 2, 3, 4]
+
+    def test_concurrent_appends_preserve_lines(self, writer, tmp_path):
+        log_file = tmp_path / "log.jsonl"
+
+        def produce(worker_id):
+            for i in range(200):
+                writer.append(log_file, f"{worker_id}:{i}\n")
+
+        threads = [threading.Thread(target=produce, args=(w,)) for w in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.flush()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 800
+        for w in range(4):
+            own = [int(line.split(":")[1]) for line in lines if line.startswith(f"{w}:")]
+            assert own == list(range(200))
+
+    def test_appends_are_batched_per_file(self, tmp_path):
+        writer = LogWriter(LogWriterConfig(fsync_policy=FsyncPolicy.NEVER))
+        log_file = tmp_path / "log.jsonl"
+        gate = threading.Event()
+        opened = []
+        real_write_batch = writer._write_batch
+
+        def slow_write_batch(batch):
+            gate.wait(5)
+            opened.append(sum(len(v) for v in batch.values()))
+            real_write_batch(batch)
+
+        with patch.object(writer, "_write_batch", side_effect=slow_write_batch):
+            writer.append(log_file, "first\n")
+            for i in range(50):
+                writer.append(log_file, f"line {i}\n")
+            gate.set()
+            writer.flush()
+        writer.close()
+
+        assert log_file.read_text().count("\n") == 51
+        # Lines queued while the writer was busy land in very few batches
+        assert len([n for n in opened if n]) <= 3
+
+    def test_append_after_close_writes_synchronously(self, tmp_path):
+        writer = LogWriter()
+        writer.close()
+
+        writer.append(tmp_path / "log.jsonl", "late\n")
+
+        assert (tmp_path / "log.jsonl").read_text() == "late\n"
+
+
+class TestSnapshots:
+    """Tests for debounced snapshots."""
+
+    def test_snapshots_coalesce_to_latest(self, writer, tmp_path):
+        index_file = tmp_path / "index.json"
+        renders = []
+
+        for i in range(10):
+
+            def render(i=i):
+                renders.append(i)
+                return json.dumps({"total": i})
+
+            writer.schedule_snapshot(index_file, render)
+
+        assert not index_file.exists()
+        writer.flush()
+
+        assert json.loads(index_file.read_text()) == {"total": 9}
+        assert renders == [9]
+
+    def test_snapshot_written_after_delay(self, tmp_path):
+        writer = LogWriter(LogWriterConfig(snapshot_delay=0.01))
+        index_file = tmp_path / "index.json"
+        done = threading.Event()
+
+        def render():
+            done.set()
+            return "{}"
+
+        writer.schedule_snapshot(index_file, render)
+
+        assert done.wait(5)
+        writer.close()
+        assert index_file.read_text() == "{}"
+
+    def test_discarded_snapshot_is_not_written(self, writer, tmp_path):
+        index_file = tmp_path / "index.json"
+
+        writer.schedule_snapshot(index_file, lambda: "{}")
+        writer.discard_snapshot(index_file)
+        writer.flush()
+
+        assert not index_file.exists()
+
+    def test_close_flushes_pending_work(self, tmp_path):
+        writer = LogWriter(LogWriterConfig(snapshot_delay=60.0))
+        writer.append(tmp_path / "log.jsonl", "entry\n")
+        writer.schedule_snapshot(tmp_path / "index.json", lambda: '{"total": 1}')
+
+        writer.close()
+
+        assert (tmp_path / "log.jsonl").read_text() == "entry\n"
+        assert json.loads((tmp_path / "index.json").read_text()) == {"total": 1}
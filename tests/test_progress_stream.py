@@ -0,0 +1,306 @@
+"""Tests for lightweight progress streaming.
+
+Tests cover:
+1. Node start/end callbacks carrying a summary and the node delta
+2. Phase transitions derived from deltas
+3. Subgraph nodes, interrupts and resume
+4. WorkflowRunner selecting the update stream or legacy events
+
+Run with: pytest tests/test_progress_stream.py -v
+"""
+
+import operator
+from typing import Annotated, Optional, TypedDict
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Command, interrupt
+
+from orchestrator.langgraph.utils import progress_stream
+from orchestrator.langgraph.utils.progress_stream import PhaseTracker, stream_progress
+
+
+class FlowState(TypedDict, total=False):
+    current_phase: int
+    current_task_id: Optional[str]
+    phase_status: dict
+    payload: str
+    log: Annotated[list, operator.add]
+
+
+class RecordingCallback:
+    """Progress callback that records every call."""
+
+    def __init__(self):
+        self.calls: list[tuple] = []
+
+    def on_node_start(self, node_name, state):
+        self.calls.append(("start", node_name, state))
+
+    def on_node_end(self, node_name, state):
+        self.calls.append(("end", node_name, state))
+
+    def on_phase_start(self, phase, node_name=None):
+        self.calls.append(("phase_start", phase))
+
+    def on_phase_end(self, phase, success, node_name=None):
+        self.calls.append(("phase_end", phase, success))
+
+    def on_phase_change(self, from_phase, to_phase, status):
+        self.calls.append(("phase_change", from_phase, to_phase))
+
+    def of(self, kind: str) -> list[tuple]:
+        return [call for call in self.calls if call[0] == kind]
+
+
+def _planning(state: FlowState) -> dict:
+    return {
+        "current_phase": 2,
+        "phase_status": {"1": {"status": "completed"}, "2": {"status": "in_progress"}},
+        "log": ["planning"],
+    }
+
+
+def _select(state: FlowState) -> dict:
+    return {"current_task_id": "T1", "log": ["select"]}
+
+
+def _implement(state: FlowState) -> dict:
+    return {"log": ["implement"]}
+
+
+def _build_task_subgraph():
+    builder = StateGraph(FlowState)
+    builder.add_node("select_task", _select)
+    builder.add_node("implement_task", _implement)
+    builder.add_edge(START, "select_task")
+    builder.add_edge("select_task", "implement_task")
+    builder.add_edge("implement_task", END)
+    return builder.compile()
+
+
+def _build_graph(with_gate: bool = False, failing_phase: bool = False):
+    def implementation(state: FlowState) -> dict:
+        status = "failed" if failing_phase else "completed"
+        phase_status = {**state["phase_status"], "2": {"status": status}}
+        return {"current_phase": 3, "phase_status": phase_status, "log": ["implementation"]}
+
+    def gate(state: FlowState) -> dict:
+        answer = interrupt({"question": "continue?"})
+        return {"log": [f"gate:{answer['action']}"]}
+
+    builder = StateGraph(FlowState)
+    builder.add_node("planning", _planning)
+    builder.add_node("task_subgraph", _build_task_subgraph())
+    builder.add_node("implementation", implementation)
+    builder.add_edge(START, "planning")
+    builder.add_edge("planning", "task_subgraph")
+    builder.add_edge("task_subgraph", "implementation")
+    if with_gate:
+        builder.add_node("gate", gate)
+        builder.add_edge("implementation", "gate")
+        builder.add_edge("gate", END)
+    else:
+        builder.add_edge("implementation", END)
+    return builder.compile(checkpointer=MemorySaver())
+
+
+def _initial_state() -> dict:
+    return {
+        "current_phase": 1,
+        "phase_status": {"1": {"status": "in_progress"}},
+        "payload": "x" * 10_000,
+        "log": [],
+    }
+
+
+def _config(thread_id: str = "t1") -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+class TestStreamProgress:
+    """Tests for node and phase callbacks from the update stream."""
+
+    async def test_node_callbacks_receive_summary_and_delta(self):
+        callback = RecordingCallback()
+
+        await stream_progress(_build_graph(), _initial_state(), _config(), callback)
+
+        starts = {name: state for _, name, state in callback.of("start")}
+        assert starts["planning"] == {"current_phase": 1}
+        # The full input state (with its large payload) is never forwarded
+        assert all("payload" not in state for state in starts.values())
+        assert starts["implementation"] == {"current_phase": 2, "current_task_id": "T1"}
+
+        ends = {name: delta for _, name, delta in callback.of("end")}
+        assert ends["select_task"] == {"current_task_id": "T1", "log": ["select"]}
+        assert "payload" not in ends["planning"]
+
+    async def test_subgraph_nodes_are_reported(self):
+        callback = RecordingCallback()
+
+        await stream_progress(_build_graph(), _initial_state(), _config(), callback)
+
+        names = [name for _, name, _ in callback.of("start")]
+        assert names == [
+            "planning",
+            "task_subgraph",
+            "select_task",
+            "implement_task",
+            "implementation",
+        ]
+
+    async def test_phase_transitions(self):
+        callback = RecordingCallback()
+
+        await stream_progress(_build_graph(), _initial_state(), _config(), callback)
+
+        phase_calls = [call for call in callback.calls if call[0].startswith("phase")]
+        assert phase_calls == [
+            ("phase_start", 1),
+            ("phase_end", 1, True),
+            ("phase_change", 1, 2),
+            ("phase_start", 2),
+            ("phase_end", 2, True),
+            ("phase_change", 2, 3),
+            ("phase_start", 3),
+        ]
+
+    async def test_failed_phase_reported(self):
+        callback = RecordingCallback()
+
+        await stream_progress(
+            _build_graph(failing_phase=True), _initial_state(), _config(), callback
+        )
+
+        assert ("phase_end", 2, False) in callback.calls
+
+    async def test_returns_full_final_state(self):
+        result = await stream_progress(
+            _build_graph(), _initial_state(), _config(), RecordingCallback()
+        )
+
+        assert result["current_phase"] == 3
+        assert result["current_task_id"] == "T1"
+        assert result["log"][0] == "planning"
+        assert result["log"][-1] == "implementation"
+        assert len(result["payload"]) == 10_000
+
+    async def test_callback_errors_do_not_stop_the_run(self):
+        class BrokenCallback(RecordingCallback):
+            def on_node_end(self, node_name, state):
+                raise RuntimeError("boom")
+
+        result = await stream_progress(
+            _build_graph(), _initial_state(), _config(), BrokenCallback()
+        )
+
+        assert result["current_phase"] == 3
+
+
+class TestInterruptAndResume:
+    """Tests for interrupted runs."""
+
+    async def test_interrupted_node_not_reported_as_ended(self):
+        graph = _build_graph(with_gate=True)
+        callback = RecordingCallback()
+
+        result = await stream_progress(graph, _initial_state(), _config(), callback)
+
+        assert "gate" in [name for _, name, _ in callback.of("start")]
+        assert "gate" not in [name for _, name, _ in callback.of("end")]
+        assert "__interrupt__" in result
+
+    async def test_resume_continues_from_checkpoint(self):
+        graph = _build_graph(with_gate=True)
+        await stream_progress(graph, _initial_state(), _config(), RecordingCallback())
+        snapshot = await graph.aget_state(_config())
+        callback = RecordingCallback()
+
+        result = await stream_progress(
+            graph,
+            Command(resume={"action": "continue"}),
+            _config(),
+            callback,
+            dict(snapshot.values),
+        )
+
+        assert callback.of("end") == [("end", "gate", {"log": ["gate:continue"]})]
+        assert callback.of("start") == [
+            ("start", "gate", {"current_phase": 3, "current_task_id": "T1"})
+        ]
+        # Resuming doesn't re-announce the phase it was already in
+        assert callback.of("phase_start") == []
+        assert result["log"][-1] == "gate:continue"
+
+
+class TestPhaseTracker:
+    """Tests for deriving phase status from deltas."""
+
+    def test_status_object_with_enum(self):
+        class Status:
+            value = "failed"
+
+        class PhaseState:
+            status = Status()
+
+        callback = RecordingCallback()
+        tracker = PhaseTracker(callback, {"current_phase": 1})
+
+        tracker.observe("node", {"phase_status": {"1": PhaseState()}})
+        tracker.observe("node", {"current_phase": 2})
+
+        assert ("phase_end", 1, False) in callback.calls
+
+    def test_same_phase_emits_nothing(self):
+        callback = RecordingCallback()
+        tracker = PhaseTracker(callback, {"current_phase": 1})
+
+        tracker.observe("node", {"current_phase": 1})
+
+        assert callback.calls == []
+
+
+class TestWorkflowRunnerMode:
+    """Tests for WorkflowRunner choosing the streaming path."""
+
+    @pytest.fixture
+    def runner(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LANGGRAPH_CHECKPOINTER", "memory")
+        from orchestrator.langgraph.workflow import WorkflowRunner
+
+        return WorkflowRunner(tmp_path)
+
+    def test_default_mode_is_updates(self, monkeypatch):
+        monkeypatch.delenv(progress_stream.PROGRESS_STREAM_ENV, raising=False)
+
+        assert progress_stream.get_progress_stream_mode() == "updates"
+
+    def test_unknown_mode_falls_back(self, monkeypatch):
+        monkeypatch.setenv(progress_stream.PROGRESS_STREAM_ENV, "verbose")
+
+        assert progress_stream.get_progress_stream_mode() == "updates"
+
+    async def test_runner_uses_update_stream(self, runner, monkeypatch):
+        monkeypatch.delenv(progress_stream.PROGRESS_STREAM_ENV, raising=False)
+        callback = RecordingCallback()
+
+        result = await runner._run_with_callbacks(
+            _build_graph(), _initial_state(), _config(), callback
+        )
+
+        assert result["current_phase"] == 3
+        assert all("payload" not in state for _, _, state in callback.of("start"))
+
+    async def test_runner_legacy_events_mode(self, runner, monkeypatch):
+        monkeypatch.setenv(progress_stream.PROGRESS_STREAM_ENV, "events")
+        callback = RecordingCallback()
+
+        result = await runner._run_with_callbacks(
+            _build_graph(), _initial_state(), _config(), callback
+        )
+
+        assert result["current_phase"] == 3
+        # astream_events forwards each node's full input state
+        assert any("payload" in state for _, _, state in callback.of("start"))
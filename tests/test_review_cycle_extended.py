@@ -9,16 +9,19 @@ Tests cover additional scenarios beyond the basic tests in test_review_cycle.py:
 - Single reviewer error handling
 - Working agent failure handling
 - Max iterations escalation
+- Decision policies with early termination
+- Review policy wiring from the project config
 """
 
 import asyncio
+import json
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from orchestrator.dispatch import DispatchResult, Task
-from orchestrator.review.cycle import ReviewCycle, ReviewDecision, ReviewFeedback
+from orchestrator.review.cycle import ReviewCycle, ReviewDecision, ReviewFeedback, ReviewPolicy
 from orchestrator.review.resolver import ResolutionResult
 
 
@@ -557,3 +560,230 @@ class TestReviewFeedbackFromDispatchResult:
         assert feedback.blocking_issues == []
         assert feedback.suggestions == []
         assert feedback.security_findings == []
+
+
+class TestReviewPolicies:
+    """Tests for decision policies and early termination."""
+
+    @pytest.fixture
+    def mock_dispatcher(self):
+        """Create a mock dispatcher."""
+        dispatcher = MagicMock()
+        dispatcher.dispatch = AsyncMock()
+        return dispatcher
+
+    @pytest.fixture
+    def work_result(self):
+        """Create a working agent result."""
+        return DispatchResult(
+            task_id="task-1",
+            agent_id="A04",
+            status="completed",
+            output={},
+            cli_used="claude",
+        )
+
+    @pytest.fixture
+    def task(self):
+        """Create a task."""
+        return Task(
+            id="task-1",
+            title="Test Task",
+            description="A test task",
+            acceptance_criteria=["It works"],
+        )
+
+    @staticmethod
+    def _reviewer(delays, outputs, cancelled):
+        """Build a dispatch_reviewer side effect with per-reviewer delays."""
+
+        async def review(reviewer_id, *args, **kwargs):
+            try:
+                await asyncio.sleep(delays[reviewer_id])
+            except asyncio.CancelledError:
+                cancelled.append(reviewer_id)
+                raise
+            return DispatchResult(
+                task_id=f"review-{reviewer_id}",
+                agent_id=reviewer_id,
+                status="completed",
+                output=outputs[reviewer_id],
+                cli_used="test",
+            )
+
+        return review
+
+    @pytest.mark.asyncio
+    async def test_blocking_rejection_cancels_outstanding_reviewers(
+        self, mock_dispatcher, work_result, task, tmp_path
+    ):
+        """Test that a blocking issue decides the review without waiting."""
+        cancelled = []
+        mock_dispatcher.dispatch_reviewer = AsyncMock(
+            side_effect=self._reviewer(
+                {"A07": 0.0, "A08": 10.0},
+                {
+                    "A07": {"approved": False, "score": 3.0, "blocking_issues": ["SQL injection"]},
+                    "A08": {"approved": True, "score": 9.0},
+                },
+                cancelled,
+            )
+        )
+        cycle = ReviewCycle(mock_dispatcher, tmp_path, policy=ReviewPolicy.ANY_BLOCKING_REJECTS)
+
+        reviews = await cycle._run_parallel_reviews(["A07", "A08"], work_result, task, 1)
+        decision, _ = cycle._determine_decision(reviews, 7.0, total_reviewers=2)
+
+        assert [r.reviewer_id for r in reviews] == ["A07"]
+        assert cancelled == ["A08"]
+        assert decision == ReviewDecision.NEEDS_CHANGES
+
+    @pytest.mark.asyncio
+    async def test_quorum_approves_without_slowest_reviewer(
+        self, mock_dispatcher, work_result, task, tmp_path
+    ):
+        """Test that QUORUM approves once enough reviewers approve."""
+        cancelled = []
+        mock_dispatcher.dispatch_reviewer = AsyncMock(
+            side_effect=self._reviewer(
+                {"A07": 0.01, "A08": 0.0, "A09": 10.0},
+                {rid: {"approved": True, "score": 8.0} for rid in ("A07", "A08", "A09")},
+                cancelled,
+            )
+        )
+        cycle = ReviewCycle(mock_dispatcher, tmp_path, policy=ReviewPolicy.QUORUM)
+
+        reviews = await cycle._run_parallel_reviews(["A07", "A08", "A09"], work_result, task, 1)
+        decision, _ = cycle._determine_decision(reviews, 7.0, total_reviewers=3)
+
+        assert [r.reviewer_id for r in reviews] == ["A07", "A08"]
+        assert cancelled == ["A09"]
+        assert decision == ReviewDecision.APPROVED
+
+    @pytest.mark.asyncio
+    async def test_quorum_rejects_once_unreachable(
+        self, mock_dispatcher, work_result, task, tmp_path
+    ):
+        """Test that QUORUM stops when approval can no longer be reached."""
+        cancelled = []
+        mock_dispatcher.dispatch_reviewer = AsyncMock(
+            side_effect=self._reviewer(
+                {"A07": 0.0, "A08": 10.0},
+                {
+                    "A07": {"approved": False, "score": 4.0},
+                    "A08": {"approved": True, "score": 9.0},
+                },
+                cancelled,
+            )
+        )
+        cycle = ReviewCycle(mock_dispatcher, tmp_path, policy=ReviewPolicy.QUORUM, quorum=2)
+
+        reviews = await cycle._run_parallel_reviews(["A07", "A08"], work_result, task, 1)
+        decision, _ = cycle._determine_decision(reviews, 7.0, total_reviewers=2)
+
+        assert cancelled == ["A08"]
+        assert decision == ReviewDecision.NEEDS_CHANGES
+
+    @pytest.mark.asyncio
+    async def test_all_policy_waits_on_process_gap_rejection(
+        self, mock_dispatcher, work_result, task, tmp_path
+    ):
+        """Test that the default policy collects every verdict for a split it must resolve."""
+        cancelled = []
+        mock_dispatcher.dispatch_reviewer = AsyncMock(
+            side_effect=self._reviewer(
+                {"A07": 0.0, "A08": 0.01},
+                {
+                    "A07": {
+                        "approved": False,
+                        "score": 5.0,
+                        "blocking_issues": ["Missing documentation for the API"],
+                    },
+                    "A08": {"approved": True, "score": 9.0},
+                },
+                cancelled,
+            )
+        )
+        cycle = ReviewCycle(mock_dispatcher, tmp_path)
+
+        reviews = await cycle._run_parallel_reviews(["A07", "A08"], work_result, task, 1)
+
+        assert [r.reviewer_id for r in reviews] == ["A07", "A08"]
+        assert cancelled == []
+
+    @pytest.mark.asyncio
+    async def test_all_policy_stops_on_blocking_rejection(
+        self, mock_dispatcher, work_result, task, tmp_path
+    ):
+        """Test that a real blocker is final under the default policy."""
+        cancelled = []
+        mock_dispatcher.dispatch_reviewer = AsyncMock(
+            side_effect=self._reviewer(
+                {"A07": 0.0, "A08": 10.0},
+                {
+                    "A07": {"approved": False, "score": 3.0, "blocking_issues": ["SQL injection"]},
+                    "A08": {"approved": True, "score": 9.0},
+                },
+                cancelled,
+            )
+        )
+        cycle = ReviewCycle(mock_dispatcher, tmp_path)
+
+        reviews = await cycle._run_parallel_reviews(["A07", "A08"], work_result, task, 1)
+        decision, _ = cycle._determine_decision(reviews, 7.0, total_reviewers=2)
+
+        assert [r.reviewer_id for r in reviews] == ["A07"]
+        assert cancelled == ["A08"]
+        assert decision == ReviewDecision.NEEDS_CHANGES
+
+
+class TestReviewCycleNodePolicy:
+    """Tests for the review cycle node's policy wiring."""
+
+    @pytest.mark.asyncio
+    async def test_policy_and_quorum_from_project_config(self, tmp_path):
+        """Test that the node builds the cycle from ProjectConfig.review."""
+        from orchestrator.langgraph.nodes import review_cycle as node_module
+
+        (tmp_path / ".project-config.json").write_text(
+            json.dumps({"review": {"policy": "quorum", "quorum": 2}})
+        )
+        cycle = MagicMock()
+        cycle.run = AsyncMock(side_effect=RuntimeError("stop"))
+        recovery = MagicMock()
+        recovery.handle_error = AsyncMock(return_value=MagicMock(escalation_required=False))
+
+        with (
+            patch.object(node_module, "AgentDispatcher"),
+            patch.object(node_module, "CleanupManager"),
+            patch.object(node_module, "RecoveryHandler", return_value=recovery),
+            patch.object(node_module, "ReviewCycle", return_value=cycle) as cycle_class,
+        ):
+            await node_module.review_cycle_node(
+                {"project_dir": str(tmp_path), "current_task": {"id": "T1"}}
+            )
+
+        assert cycle_class.call_args.kwargs == {"policy": ReviewPolicy.QUORUM, "quorum": 2}
+
+    @pytest.mark.asyncio
+    async def test_unknown_policy_falls_back_to_all(self, tmp_path):
+        """Test that an invalid configured policy doesn't break the node."""
+        from orchestrator.langgraph.nodes import review_cycle as node_module
+
+        (tmp_path / ".project-config.json").write_text(json.dumps({"review": {"policy": "most"}}))
+        cycle = MagicMock()
+        cycle.run = AsyncMock(side_effect=RuntimeError("stop"))
+        recovery = MagicMock()
+        recovery.handle_error = AsyncMock(return_value=MagicMock(escalation_required=False))
+
+        with (
+            patch.object(node_module, "AgentDispatcher"),
+            patch.object(node_module, "CleanupManager"),
+            patch.object(node_module, "RecoveryHandler", return_value=recovery),
+            patch.object(node_module, "ReviewCycle", return_value=cycle) as cycle_class,
+        ):
+            await node_module.review_cycle_node(
+                {"project_dir": str(tmp_path), "current_task": {"id": "T1"}}
+            )
+
+        assert cycle_class.call_args.kwargs["policy"] == ReviewPolicy.ALL
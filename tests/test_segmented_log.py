@@ -0,0 +1,204 @@
+"""Tests for segment-rotated JSONL logs.
+
+Tests cover:
+1. Backwards line iteration across read blocks
+2. Tail reads returning the newest entries oldest first
+3. Segment rotation, the segment index and the retention cap
+4. Cursor pagination across segments
+
+Run with: pytest tests/test_segmented_log.py -v
+"""
+
+import json
+
+import pytest
+
+from orchestrator.utils import segmented_log as segmented_log_module
+from orchestrator.utils.log_writer import LogWriter, LogWriterConfig
+from orchestrator.utils.segmented_log import (
+    SegmentedLog,
+    _iter_lines_backwards,
+    get_segmented_log,
+)
+
+
+@pytest.fixture
+def writer():
+    """Create a writer that is closed after the test."""
+    writer = LogWriter(LogWriterConfig(snapshot_delay=60.0))
+    yield writer
+    writer.close()
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    return tmp_path / ".workflow" / "chat_history.jsonl"
+
+
+def _fill(log: SegmentedLog, count: int, start: int = 0) -> None:
+    for i in range(start, start + count):
+        log.append({"n": i, "content": "x" * 40})
+
+
+def _numbers(entries: list[dict]) -> list[int]:
+    return [e["n"] for e in entries]
+
+
+class TestIterLinesBackwards:
+    """Tests for _iter_lines_backwards."""
+
+    def test_offsets_across_blocks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(segmented_log_module, "READ_BLOCK_SIZE", 7)
+        path = tmp_path / "log.jsonl"
+        lines = [f"line-{i}" * (i + 1) for i in range(6)]
+        content = "".join(line + "\n" for line in lines).encode()
+        path.write_bytes(content)
+
+        result = [
+            (offset, line) for offset, line in _iter_lines_backwards(path, len(content)) if line
+        ]
+
+        assert [line.decode() for _, line in result] == list(reversed(lines))
+        for offset, line in result:
+            assert content[offset : offset + len(line)] == line
+
+    def test_stops_at_end_offset(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b"a\nb\nc\n")
+
+        assert [line for _, line in _iter_lines_backwards(path, 4) if line] == [b"b", b"a"]
+
+
+class TestTail:
+    """Tests for SegmentedLog.tail."""
+
+    def test_empty(self, log_file, writer):
+        assert SegmentedLog(log_file, writer=writer).tail() == []
+
+    def test_newest_entries_oldest_first(self, log_file, writer):
+        log = SegmentedLog(log_file, writer=writer)
+        _fill(log, 10)
+
+        assert _numbers(log.tail(4)) == [6, 7, 8, 9]
+        assert _numbers(log.tail(50)) == list(range(10))
+
+    def test_skips_corrupt_lines(self, log_file, writer):
+        log_file.parent.mkdir(parents=True)
+        log_file.write_text('{"n": 0}\nnot json\n\n{"n": 1}\n')
+
+        assert _numbers(SegmentedLog(log_file, writer=writer).tail()) == [0, 1]
+
+    def test_reads_across_segments(self, log_file, writer):
+        log = SegmentedLog(log_file, segment_bytes=500, writer=writer)
+        _fill(log, 40)
+
+        assert len(list(log.segments_dir.glob("segment-*.jsonl"))) > 2
+        assert _numbers(log.tail(25)) == list(range(15, 40))
+
+
+class TestRotation:
+    """Tests for segment rotation and retention."""
+
+    def test_active_file_sealed_when_full(self, log_file, writer):
+        log = SegmentedLog(log_file, segment_bytes=500, writer=writer)
+        _fill(log, 20)
+
+        index = json.loads(log.index_file.read_text())
+        assert index["active"] == len(index["segments"])
+        writer.flush()
+        active_entries = len(log_file.read_text().splitlines())
+        assert sum(s["entries"] for s in index["segments"]) + active_entries == 20
+        for segment in index["segments"]:
+            path = log.segments_dir / f"segment-{segment['number']:06d}.jsonl"
+            assert path.stat().st_size == segment["bytes"]
+            assert len(path.read_text().splitlines()) == segment["entries"]
+        assert log_file.stat().st_size < 500
+
+    def test_oldest_segments_dropped(self, log_file, writer):
+        log = SegmentedLog(log_file, segment_bytes=500, max_segments=2, writer=writer)
+        _fill(log, 60)
+
+        index = json.loads(log.index_file.read_text())
+        assert len(index["segments"]) == 2
+        assert len(list(log.segments_dir.glob("segment-*.jsonl"))) == 2
+        remaining = log.tail(100)
+        assert _numbers(remaining) == list(range(60 - len(remaining), 60))
+
+    def test_index_reloaded(self, log_file, writer):
+        _fill(SegmentedLog(log_file, segment_bytes=500, writer=writer), 30)
+
+        reopened = SegmentedLog(log_file, segment_bytes=500, writer=writer)
+        _fill(reopened, 5, start=30)
+
+        assert _numbers(reopened.tail(35)) == list(range(35))
+
+    def test_clear_removes_segments(self, log_file, writer):
+        log = SegmentedLog(log_file, segment_bytes=500, writer=writer)
+        _fill(log, 30)
+
+        log.clear()
+
+        assert not log_file.exists()
+        assert not log.segments_dir.exists()
+        assert log.tail() == []
+        _fill(log, 2)
+        assert _numbers(log.tail()) == [0, 1]
+
+
+class TestPage:
+    """Tests for SegmentedLog.page."""
+
+    def test_pages_walk_back_through_segments(self, log_file, writer):
+        log = SegmentedLog(log_file, segment_bytes=500, writer=writer)
+        _fill(log, 40)
+
+        seen = []
+        page = log.page(limit=7)
+        while True:
+            seen = _numbers(page.entries) + seen
+            if page.cursor is None:
+                break
+            page = log.page(limit=7, before=page.cursor)
+
+        assert seen == list(range(40))
+
+    def test_exact_last_page_has_no_cursor(self, log_file, writer):
+        log = SegmentedLog(log_file, writer=writer)
+        _fill(log, 5)
+
+        page = log.page(limit=5)
+
+        assert _numbers(page.entries) == list(range(5))
+        assert page.cursor is None
+
+    def test_cursor_stable_across_appends(self, log_file, writer):
+        log = SegmentedLog(log_file, writer=writer)
+        _fill(log, 10)
+        cursor = log.page(limit=3).cursor
+
+        _fill(log, 5, start=10)
+
+        assert _numbers(log.page(limit=3, before=cursor).entries) == [4, 5, 6]
+
+    def test_cursor_into_dropped_segment(self, log_file, writer):
+        log = SegmentedLog(log_file, segment_bytes=500, max_segments=1, writer=writer)
+        _fill(log, 5)
+        assert log.page(limit=1).cursor.startswith("0:")
+        _fill(log, 40, start=5)
+
+        page = log.page(limit=10, before="0:100")
+
+        assert page.entries == []
+        assert page.cursor is None
+
+    def test_invalid_cursor(self, log_file, writer):
+        with pytest.raises(ValueError):
+            SegmentedLog(log_file, writer=writer).page(before="latest")
+
+
+class TestGetSegmentedLog:
+    """Tests for the shared instance accessor."""
+
+    def test_shared_per_file(self, log_file):
+        assert get_segmented_log(log_file) is get_segmented_log(str(log_file))
+        assert get_segmented_log(log_file) is not get_segmented_log(log_file.with_name("x.jsonl"))
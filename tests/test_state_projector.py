@@ -0,0 +1,209 @@
+"""Tests for incremental state.json projection.
+
+Tests cover:
+1. Node deltas applied with WorkflowState reducers
+2. state.json written only when projected fields change
+3. Debounced, atomic writes
+4. Live view served without checkpoint reads while a run streams
+5. Projection fed from the workflow update stream
+
+Run with: pytest tests/test_state_projector.py -v
+"""
+
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+
+from orchestrator.langgraph.state import WorkflowState
+from orchestrator.langgraph.utils.progress_stream import stream_progress
+from orchestrator.utils.state_projector import StateProjector, get_state_projector
+
+
+def _state(**overrides) -> dict:
+    state = {
+        "project_name": "demo",
+        "current_phase": 1,
+        "iteration_count": 0,
+        "phase_status": {"1": {"status": "in_progress"}},
+        "errors": [],
+        "created_at": "2026-01-01T00:00:00",
+        "updated_at": "2026-01-01T00:00:00",
+        "project_dir": "/tmp/demo",
+        "context": {"huge": "x" * 1000},
+    }
+    state.update(overrides)
+    return state
+
+
+def _read(projector: StateProjector) -> dict:
+    return json.loads(projector.state_file.read_text())
+
+
+@pytest.fixture
+def projector(tmp_path):
+    return StateProjector(tmp_path, debounce_seconds=0)
+
+
+class TestIncrementalProjection:
+    """Tests for applying node deltas."""
+
+    def test_apply_state_writes_legacy_view(self, projector):
+        projector.apply_state(_state())
+
+        view = _read(projector)
+        assert view["project_name"] == "demo"
+        assert view["phases"]["planning"]["status"] == "in_progress"
+        assert "context" not in view
+
+    def test_deltas_use_state_reducers(self, projector):
+        projector.apply_state(_state(errors=[{"message": "first"}]))
+
+        projector.apply_update({"errors": [{"message": "second"}], "current_phase": 2})
+
+        view = _read(projector)
+        assert view["current_phase"] == 2
+        assert view["errors_count"] == 2
+
+    def test_unprojected_delta_is_ignored(self, projector):
+        projector.apply_state(_state())
+
+        assert projector.apply_update({"context": {"other": 1}}) is False
+        assert projector.writes == 1
+
+    def test_unchanged_projection_not_rewritten(self, projector):
+        projector.apply_state(_state())
+        mtime = projector.state_file.stat().st_mtime_ns
+
+        assert projector.apply_update({"current_phase": 1}) is False
+
+        assert projector.writes == 1
+        assert projector.state_file.stat().st_mtime_ns == mtime
+
+    def test_no_temp_files_left(self, projector):
+        projector.apply_state(_state())
+        projector.apply_update({"current_phase": 2})
+
+        assert [p.name for p in projector.workflow_dir.iterdir()] == ["state.json"]
+
+
+class TestDebounce:
+    """Tests for coalescing bursts of updates."""
+
+    def test_burst_coalesced_into_one_write(self, tmp_path):
+        projector = StateProjector(tmp_path, debounce_seconds=60)
+        projector.apply_state(_state())
+
+        for iteration in range(1, 20):
+            projector.apply_update({"iteration_count": iteration})
+
+        assert projector.writes == 1
+        assert _read(projector)["iteration_count"] == 0
+        projector.flush()
+        assert projector.writes == 2
+        assert _read(projector)["iteration_count"] == 19
+
+    def test_pending_write_fires_after_window(self, tmp_path):
+        projector = StateProjector(tmp_path, debounce_seconds=0.05)
+        projector.apply_state(_state())
+        projector.apply_update({"current_phase": 3})
+
+        time.sleep(0.3)
+
+        assert _read(projector)["current_phase"] == 3
+
+    def test_change_reverted_before_write_is_dropped(self, tmp_path):
+        projector = StateProjector(tmp_path, debounce_seconds=60)
+        projector.apply_state(_state())
+
+        projector.apply_update({"current_phase": 2})
+        projector.apply_update({"current_phase": 1})
+        projector.flush()
+
+        assert projector.writes == 1
+
+
+class TestReading:
+    """Tests for get_state and checkpoint projection."""
+
+    def test_live_view_skips_checkpoint(self, projector):
+        projector.apply_update({"current_phase": 4})
+
+        with patch.object(projector, "_load_checkpoint_state", new=AsyncMock()) as load:
+            state = projector.get_state()
+
+        assert state["current_phase"] == 4
+        load.assert_not_called()
+
+    def test_ended_run_reads_checkpoint(self, projector):
+        projector.apply_update({"current_phase": 4})
+        projector.end_run()
+
+        with patch.object(projector, "_load_checkpoint_state", new=AsyncMock()) as load:
+            projector.get_state()
+
+        assert not projector.is_live
+        load.assert_called_once()
+
+    def test_checkpoint_projection_is_not_live(self, projector):
+        with patch.object(
+            projector, "_load_checkpoint_state", new=AsyncMock(return_value=_state())
+        ) as load:
+            assert projector.get_state()["project_name"] == "demo"
+            projector.get_state()
+
+        assert not projector.is_live
+        assert load.await_count == 2
+        assert projector.writes == 1
+
+    async def test_sync_projection_from_async_code(self, projector):
+        with patch.object(
+            projector, "_load_checkpoint_state", new=AsyncMock(return_value=_state())
+        ):
+            state = projector.project_state_sync()
+
+        assert state["current_phase"] == 1
+
+    def test_shared_projector_per_project(self, tmp_path):
+        assert get_state_projector(tmp_path) is get_state_projector(tmp_path / ".")
+
+
+class TestStreamProjection:
+    """Tests for projecting from the workflow update stream."""
+
+    async def test_top_level_deltas_are_projected(self, tmp_path):
+        def planning(state: WorkflowState) -> dict:
+            return {"current_phase": 2, "errors": [{"message": "warn"}]}
+
+        def implementation(state: WorkflowState) -> dict:
+            return {"current_phase": 3, "iteration_count": 1}
+
+        builder = StateGraph(WorkflowState)
+        builder.add_node("planning", planning)
+        builder.add_node("implementation", implementation)
+        builder.add_edge(START, "planning")
+        builder.add_edge("planning", "implementation")
+        builder.add_edge("implementation", END)
+        graph = builder.compile(checkpointer=MemorySaver())
+        projector = StateProjector(tmp_path, debounce_seconds=0)
+        seen = []
+        original = projector.apply_update
+        projector.apply_update = lambda delta: seen.append(delta) or original(delta)
+
+        await stream_progress(
+            graph,
+            _state(),
+            {"configurable": {"thread_id": "t"}},
+            None,
+            projector=projector,
+        )
+
+        assert len(seen) == 2
+        view = _read(projector)
+        assert view["current_phase"] == 3
+        assert view["iteration_count"] == 1
+        assert view["errors_count"] == 1
+        assert not projector.is_live
@@ -0,0 +1,193 @@
+"""Tests for test impact analysis.
+
+Tests cover:
+1. Import graph construction (Python and JS/TS)
+2. Affected test selection from stat changes and reported changes
+3. Full-run fallbacks (first run, global config, periodic)
+4. Pending failures and persistence
+5. Ralph loop confirmation run
+
+Run with: pytest tests/test_test_impact.py -v
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from orchestrator.langgraph.integrations.ralph_loop import RalphLoopConfig, _run_impacted_tests
+from orchestrator.validation.test_impact import TestImpactAnalyzer
+
+
+def _touch(path: Path, content: str) -> None:
+    """Write content and bump mtime so stat changes are always visible."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def py_project(tmp_path):
+    """Create a small Python project with two independent modules."""
+    _touch(tmp_path / "src" / "app" / "__init__.py", "")
+    _touch(tmp_path / "src" / "app" / "auth.py", "from .utils import helper\n")
+    _touch(tmp_path / "src" / "app" / "utils.py", "def helper():\n    return 1\n")
+    _touch(tmp_path / "src" / "app" / "billing.py", "def charge():\n    return 2\n")
+    _touch(tmp_path / "tests" / "test_auth.py", "from app.auth import helper\n")
+    _touch(tmp_path / "tests" / "test_billing.py", "from app import billing\n")
+    return tmp_path
+
+
+TESTS = ["tests/test_auth.py", "tests/test_billing.py"]
+
+
+class TestImportGraph:
+    """Test dependency resolution."""
+
+    def test_python_transitive_dependencies(self, py_project):
+        analyzer = TestImpactAnalyzer(py_project)
+        analyzer.select_tests(TESTS)
+
+        assert analyzer.affected_by("src/app/utils.py") == {"tests/test_auth.py"}
+        assert analyzer.affected_by("src/app/billing.py") == {"tests/test_billing.py"}
+        assert analyzer.affected_by("src/app/__init__.py") == set(TESTS)
+
+    def test_js_relative_imports(self, tmp_path):
+        _touch(tmp_path / "src" / "cart.ts", "export const total = 1;\n")
+        _touch(tmp_path / "src" / "index.ts", "export * from './cart';\n")
+        _touch(tmp_path / "tests" / "cart.test.ts", "import { total } from '../src';\n")
+
+        analyzer = TestImpactAnalyzer(tmp_path)
+        analyzer.select_tests(["tests/cart.test.ts"])
+
+        assert analyzer.affected_by("src/cart.ts") == {"tests/cart.test.ts"}
+
+
+class TestAffectedSelection:
+    """Test affected test selection."""
+
+    def test_first_selection_is_full_run(self, py_project):
+        selection = TestImpactAnalyzer(py_project).select_tests(TESTS)
+
+        assert selection.full_run is True
+        assert selection.tests == TESTS
+
+    def test_selects_only_affected_tests(self, py_project):
+        analyzer = TestImpactAnalyzer(py_project)
+        analyzer.record_result(analyzer.select_tests(TESTS), passed=True)
+
+        _touch(py_project / "src" / "app" / "utils.py", "def helper():\n    return 3\n")
+        selection = analyzer.select_tests(TESTS)
+
+        assert selection.full_run is False
+        assert selection.tests == ["tests/test_auth.py"]
+        assert "src/app/utils.py" in selection.changed_files
+
+    def test_reported_changes_are_used(self, py_project):
+        analyzer = TestImpactAnalyzer(py_project)
+        analyzer.record_result(analyzer.select_tests(TESTS), passed=True)
+
+        selection = analyzer.select_tests(TESTS, changed_files=["src/app/billing.py"])
+
+        assert selection.tests == ["tests/test_billing.py"]
+
+    def test_global_config_change_forces_full_run(self, py_project):
+        _touch(py_project / "tests" / "conftest.py", "")
+        analyzer = TestImpactAnalyzer(py_project)
+        analyzer.record_result(analyzer.select_tests(TESTS), passed=True)
+
+        _touch(py_project / "tests" / "conftest.py", "import os\n")
+        selection = analyzer.select_tests(TESTS)
+
+        assert selection.full_run is True
+        assert "tests/conftest.py" in selection.reason
+
+    def test_periodic_full_run(self, py_project):
+        analyzer = TestImpactAnalyzer(py_project, full_run_interval=2)
+        analyzer.record_result(analyzer.select_tests(TESTS), passed=True)
+
+        for value in range(2):
+            _touch(py_project / "src" / "app" / "billing.py", f"X = {value}\n")
+            selection = analyzer.select_tests(TESTS)
+            assert selection.full_run is False
+            analyzer.record_result(selection, passed=True)
+
+        _touch(py_project / "src" / "app" / "billing.py", "X = 9\n")
+        selection = analyzer.select_tests(TESTS)
+
+        assert selection.full_run is True
+        assert selection.reason == "periodic full run"
+
+    def test_failing_tests_stay_selected(self, py_project):
+        analyzer = TestImpactAnalyzer(py_project)
+        analyzer.record_result(
+            analyzer.select_tests(TESTS), passed=False, failed_tests=["tests/test_auth.py"]
+        )
+
+        _touch(py_project / "src" / "app" / "billing.py", "X = 1\n")
+        selection = analyzer.select_tests(TESTS)
+
+        assert selection.full_run is True
+        assert selection.reason == "all tests affected"
+
+        analyzer.record_result(selection, passed=False, failed_tests=["tests/test_auth.py"])
+        selection = analyzer.select_tests(TESTS)
+
+        assert selection.tests == ["tests/test_auth.py"]
+
+    def test_state_persists_across_instances(self, py_project):
+        analyzer = TestImpactAnalyzer(py_project)
+        analyzer.record_result(analyzer.select_tests(TESTS), passed=True)
+        assert (py_project / ".workflow" / "test_impact.json").exists()
+
+        _touch(py_project / "src" / "app" / "billing.py", "X = 1\n")
+        selection = TestImpactAnalyzer(py_project).select_tests(TESTS)
+
+        assert selection.tests == ["tests/test_billing.py"]
+
+    def test_failed_test_files_from_pytest_output(self):
+        output = (
+            "FAILED tests/test_auth.py::test_login - AssertionError\n"
+            "ERROR tests/test_billing.py - ImportError\n"
+        )
+
+        assert TestImpactAnalyzer.failed_test_files(output) == [
+            "tests/test_auth.py",
+            "tests/test_billing.py",
+        ]
+
+
+class TestRalphIntegration:
+    """Test impact analysis in the Ralph loop test step."""
+
+    @pytest.mark.asyncio
+    async def test_partial_pass_is_confirmed_with_full_run(self, py_project):
+        analyzer = TestImpactAnalyzer(py_project)
+        analyzer.record_result(analyzer.select_tests(TESTS), passed=True)
+        _touch(py_project / "src" / "app" / "billing.py", "X = 1\n")
+
+        run_tests = AsyncMock(return_value={"all_passed": True, "summary": "ok", "output": ""})
+        with patch("orchestrator.langgraph.integrations.ralph_loop._run_tests", run_tests):
+            result = await _run_impacted_tests(py_project, TESTS, RalphLoopConfig(), analyzer)
+
+        assert [call.args[1] for call in run_tests.call_args_list] == [
+            ["tests/test_billing.py"],
+            TESTS,
+        ]
+        assert result["full_run"] is True
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_skips_full_run(self, py_project):
+        analyzer = TestImpactAnalyzer(py_project)
+        analyzer.record_result(analyzer.select_tests(TESTS), passed=True)
+        _touch(py_project / "src" / "app" / "billing.py", "X = 1\n")
+
+        run_tests = AsyncMock(return_value={"all_passed": False, "summary": "1 failed"})
+        with patch("orchestrator.langgraph.integrations.ralph_loop._run_tests", run_tests):
+            result = await _run_impacted_tests(py_project, TESTS, RalphLoopConfig(), analyzer)
+
+        assert run_tests.call_count == 1
+        assert result["tests_run"] == 1
+        assert result["full_run"] is False
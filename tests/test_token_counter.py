@@ -0,0 +1,145 @@
+"""Tests for the shared token counter.
+
+Tests cover:
+1. Heuristic counts compared with BPE-style tokenization
+2. Memoization and LRU bounds
+3. Batch counting of cache misses
+4. Backend selection and integration with chunking and budgeting
+
+Run with: pytest tests/test_token_counter.py -v
+"""
+
+import pytest
+
+from orchestrator.agents.budget import estimate_cost, estimate_prompt_cost
+from orchestrator.utils import token_counter
+from orchestrator.utils.chunking import SemanticChunker
+from orchestrator.utils.token_counter import (
+    HeuristicBackend,
+    TokenCounter,
+    TokenizerBackend,
+    create_backend,
+)
+
+
+class RecordingBackend(TokenizerBackend):
+    """Counts words and records every call."""
+
+    name = "recording"
+
+    def __init__(self):
+        self.calls = []
+
+    def count(self, text):
+        self.calls.append([text])
+        return len(text.split())
+
+    def count_batch(self, texts):
+        self.calls.append(list(texts))
+        return [len(text.split()) for text in texts]
+
+
+@pytest.fixture
+def backend():
+    return RecordingBackend()
+
+
+class TestHeuristicBackend:
+    """Tests for the calibrated heuristic."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Hello world, this is a test.", 8),
+            ("1234567890", 4),
+            ("", 0),
+        ],
+    )
+    def test_known_counts(self, text, expected):
+        assert HeuristicBackend().count(text) == expected
+
+    def test_code_counts_more_than_char_estimate(self):
+        code = "def foo(x):\n    return {'a': x[0] + 1}\n" * 20
+
+        assert HeuristicBackend().count(code) > len(code) // 4
+
+
+class TestTokenCounter:
+    """Tests for memoization and batching."""
+
+    def test_counts_are_memoized(self, backend):
+        counter = TokenCounter(backend)
+        text = "word " * 100
+
+        assert counter.count(text) == 100
+        assert counter.count(text) == 100
+
+        assert len(backend.calls) == 1
+        assert (counter.hits, counter.misses) == (1, 1)
+
+    def test_lru_is_bounded(self, backend):
+        counter = TokenCounter(backend, cache_size=2)
+        for text in ("a", "b", "c"):
+            counter.count(text)
+
+        counter.count("a")
+
+        assert len(counter._cache) == 2
+        assert len(backend.calls) == 4
+
+    def test_count_many_batches_misses(self, backend):
+        counter = TokenCounter(backend)
+        counter.count("cached text")
+
+        counts = counter.count_many(["one two", "cached text", "", "one two", "three"])
+
+        assert counts == [2, 2, 0, 2, 1]
+        assert backend.calls[-1] == ["one two", "three"]
+
+    def test_short_text_never_collides_with_digest(self, backend):
+        counter = TokenCounter(backend)
+        long_text = "x " * 100
+        digest_like = counter._key(long_text).hex()
+
+        counter.count(long_text)
+
+        assert counter.count(digest_like) == 1
+
+
+class TestBackendSelection:
+    """Tests for backend detection."""
+
+    def test_env_selects_heuristic(self, monkeypatch):
+        monkeypatch.setenv("ORCHESTRATOR_TOKENIZER", "heuristic")
+
+        assert isinstance(create_backend(), HeuristicBackend)
+
+    def test_missing_tiktoken_falls_back(self, monkeypatch):
+        def unavailable(*args, **kwargs):
+            raise ImportError("no tiktoken")
+
+        monkeypatch.setattr(token_counter.TiktokenBackend, "__init__", unavailable)
+
+        assert isinstance(create_backend("tiktoken"), HeuristicBackend)
+
+    def test_backend_requires_count(self):
+        with pytest.raises(TypeError):
+            TokenizerBackend()
+
+
+class TestIntegration:
+    """Tests for consumers of the shared counter."""
+
+    def test_chunker_uses_counter(self, backend):
+        chunker = SemanticChunker(token_counter=TokenCounter(backend))
+
+        result = chunker.chunk("alpha beta gamma.\n\ndelta epsilon.")
+
+        assert result.total_tokens == 5
+
+    def test_estimate_prompt_cost(self, monkeypatch, backend):
+        monkeypatch.setattr(token_counter, "_default_counter", TokenCounter(backend))
+
+        cost = estimate_prompt_cost("sonnet", "word " * 1000, 500)
+
+        assert cost == pytest.approx(estimate_cost("sonnet", 1000, 500))
@@ -647,6 +647,25 @@ class TestProjectConfig:
             # Other features should still be True (default)
             assert config.workflow.features.build_verification is True
 
+    def test_review_policy(self):
+        """Test review policy and quorum settings."""
+        from orchestrator.config import load_project_config
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_dir = Path(tmpdir)
+
+            config = load_project_config(project_dir)
+            assert config.review.policy == "all"
+            assert config.review.quorum is None
+
+            config_file = project_dir / ".project-config.json"
+            config_file.write_text(json.dumps({"review": {"policy": "quorum", "quorum": 2}}))
+
+            config = load_project_config(project_dir)
+            assert config.review.policy == "quorum"
+            assert config.review.quorum == 2
+            assert config.to_dict()["review"]["quorum"] == 2
+
     def test_product_md_feature_flags(self):
         """Test PRODUCT.md optional feature flags."""
         from orchestrator.config import load_project_config
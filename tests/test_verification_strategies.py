@@ -4,6 +4,8 @@ Tests the pluggable verification strategies (tests, lint, security)
 used by the unified loop runner.
 """
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -387,6 +389,138 @@ class TestCompositeVerification:
         assert len(composite.strategies) == 1
 
 
+class _SlowStrategy(NoVerification):
+    """Strategy that sleeps, then passes or fails."""
+
+    def __init__(self, project_dir, vtype, delay, passed=True):
+        super().__init__(project_dir)
+        self._vtype = vtype
+        self.delay = delay
+        self.passed = passed
+        self.started = False
+        self.cancelled = False
+
+    @property
+    def verification_type(self):
+        return self._vtype
+
+    async def verify(self, context):
+        self.started = True
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return VerificationResult(
+            passed=self.passed,
+            verification_type=self._vtype,
+            summary="ok" if self.passed else "failed",
+            failures=[] if self.passed else [f"{self._vtype.value} failed"],
+        )
+
+
+class TestCompositeConcurrency:
+    """Tests for concurrent composite execution."""
+
+    @pytest.mark.asyncio
+    async def test_strategies_run_concurrently(self, tmp_path):
+        composite = CompositeVerification(
+            tmp_path,
+            strategies=[
+                _SlowStrategy(tmp_path, VerificationType.TESTS, 0.2),
+                _SlowStrategy(tmp_path, VerificationType.LINT, 0.2),
+                _SlowStrategy(tmp_path, VerificationType.SECURITY, 0.2),
+            ],
+        )
+
+        start = time.monotonic()
+        result = await composite.verify(VerificationContext(project_dir=tmp_path))
+
+        assert time.monotonic() - start < 0.5
+        assert result.passed is True
+        assert set(result.details["timings"]) == {"tests", "lint", "security"}
+        assert all(t >= 0.15 for t in result.details["timings"].values())
+        # Results keep strategy order regardless of completion order
+        assert [r["verification_type"] for r in result.details["individual_results"]] == [
+            "tests",
+            "lint",
+            "security",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_parallelism_cap(self, tmp_path):
+        composite = CompositeVerification(
+            tmp_path,
+            strategies=[
+                _SlowStrategy(tmp_path, VerificationType.TESTS, 0.1),
+                _SlowStrategy(tmp_path, VerificationType.LINT, 0.1),
+            ],
+            max_parallel=1,
+        )
+
+        start = time.monotonic()
+        await composite.verify(VerificationContext(project_dir=tmp_path))
+
+        assert time.monotonic() - start >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_when_require_all(self, tmp_path):
+        slow = _SlowStrategy(tmp_path, VerificationType.TESTS, 10)
+        failing = _SlowStrategy(tmp_path, VerificationType.LINT, 0.01, passed=False)
+        composite = CompositeVerification(tmp_path, strategies=[slow, failing])
+
+        result = await composite.verify(VerificationContext(project_dir=tmp_path))
+
+        assert result.passed is False
+        assert slow.cancelled is True
+        assert result.details["cancelled"] == ["tests"]
+        assert "tests: cancelled" in result.summary
+        assert result.failures == ["lint failed"]
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_cancel_when_require_any(self, tmp_path):
+        slow = _SlowStrategy(tmp_path, VerificationType.TESTS, 0.05)
+        failing = _SlowStrategy(tmp_path, VerificationType.LINT, 0.01, passed=False)
+        composite = CompositeVerification(tmp_path, strategies=[slow, failing], require_all=False)
+
+        result = await composite.verify(VerificationContext(project_dir=tmp_path))
+
+        assert result.passed is True
+        assert slow.cancelled is False
+
+    @pytest.mark.asyncio
+    async def test_strategy_exception_is_a_failure(self, tmp_path):
+        broken = NoVerification(tmp_path)
+        composite = CompositeVerification(tmp_path, strategies=[broken])
+
+        with patch.object(broken, "verify", AsyncMock(side_effect=RuntimeError("boom"))):
+            result = await composite.verify(VerificationContext(project_dir=tmp_path))
+
+        assert result.passed is False
+        assert result.failures == ["boom"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_command_terminates_subprocess(self, tmp_path):
+        verifier = NoVerification(tmp_path)
+        spawned = []
+        real_exec = asyncio.create_subprocess_exec
+
+        async def tracking_exec(*args, **kwargs):
+            process = await real_exec(*args, **kwargs)
+            spawned.append(process)
+            return process
+
+        with patch("asyncio.create_subprocess_exec", side_effect=tracking_exec):
+            task = asyncio.ensure_future(verifier._run_command(["sleep", "30"]))
+            while not spawned:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert spawned[0].returncode is not None
+
+
 class TestNoVerification:
     """Tests for NoVerification strategy."""
 
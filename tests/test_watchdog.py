@@ -0,0 +1,175 @@
+"""Tests for the runtime watchdog.
+
+Tests cover:
+1. Incremental chunked reads that leave partial lines for later
+2. Offset persistence across restarts
+3. Truncation handling
+4. Coalescing of related errors into one fixer dispatch
+5. inotify wake-ups (Linux only)
+
+Run with: pytest tests/test_watchdog.py -v
+"""
+
+import asyncio
+import json
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from orchestrator.observability.watchdog import InotifyWaiter, RuntimeWatchdog
+
+
+def _error(message: str, **extra) -> str:
+    return json.dumps({"level": "ERROR", "message": message, "error_type": "ValueError", **extra})
+
+
+@pytest.fixture
+def make_watchdog(tmp_path):
+    """Create watchdogs with the fixer and logger mocked out."""
+
+    def factory(**kwargs):
+        with (
+            patch("orchestrator.observability.watchdog.FixerAgent"),
+            patch("orchestrator.observability.watchdog.OrchestrationLogger"),
+        ):
+            watchdog = RuntimeWatchdog(tmp_path, use_inotify=False, **kwargs)
+        watchdog.fixer.attempt_fix = AsyncMock(return_value=MagicMock(result=None))
+        return watchdog
+
+    return factory
+
+
+def _dispatched(watchdog) -> list:
+    return [call.args[0] for call in watchdog.fixer.attempt_fix.call_args_list]
+
+
+class TestIncrementalReads:
+    """Test offset-based tailing."""
+
+    async def test_partial_trailing_line_is_left_for_later(self, make_watchdog):
+        watchdog = make_watchdog()
+        log_file = watchdog.errors_dir / "app.jsonl"
+        full = _error("boom") + "\n"
+        log_file.write_text(full + _error("late")[:10])
+
+        await watchdog.check_logs()
+        assert [e.message for e in _dispatched(watchdog)] == ["boom"]
+        assert watchdog.file_offsets[log_file] == len(full)
+
+        log_file.write_text(full + _error("late") + "\n")
+        await watchdog.check_logs()
+
+        assert [e.message for e in _dispatched(watchdog)] == ["boom", "late"]
+
+    async def test_reads_are_bounded_per_check(self, make_watchdog):
+        watchdog = make_watchdog(chunk_size=16, max_chunks_per_check=1)
+        log_file = watchdog.errors_dir / "app.jsonl"
+        log_file.write_text("".join(_error(f"e{i}") + "\n" for i in range(3)))
+
+        await watchdog.check_logs()
+        assert watchdog._backlog is True
+        assert len(_dispatched(watchdog)) == 1
+
+        while watchdog._backlog:
+            await watchdog.check_logs()
+
+        assert [e.message for e in _dispatched(watchdog)] == ["e0", "e1", "e2"]
+
+    async def test_non_error_lines_are_ignored(self, make_watchdog):
+        watchdog = make_watchdog()
+        (watchdog.errors_dir / "app.jsonl").write_text(
+            json.dumps({"level": "INFO", "message": "fine"})
+            + "\n"
+            + _error("fixed", _resolved=True)
+            + "\n"
+        )
+
+        await watchdog.check_logs()
+
+        watchdog.fixer.attempt_fix.assert_not_called()
+
+    async def test_truncated_file_is_read_from_start(self, make_watchdog):
+        watchdog = make_watchdog()
+        log_file = watchdog.errors_dir / "app.jsonl"
+        log_file.write_text(_error("first") + "\n" + _error("second") + "\n")
+        await watchdog.check_logs()
+
+        log_file.write_text(_error("new") + "\n")
+        await watchdog.check_logs()
+
+        assert _dispatched(watchdog)[-1].message == "new"
+
+
+class TestOffsetPersistence:
+    """Test that restarts resume from persisted offsets."""
+
+    async def test_restart_does_not_reprocess(self, make_watchdog):
+        watchdog = make_watchdog()
+        log_file = watchdog.errors_dir / "app.jsonl"
+        log_file.write_text(_error("old") + "\n")
+        await watchdog.check_logs()
+        assert watchdog.offsets_file.exists()
+
+        with log_file.open("a") as f:
+            f.write(_error("new") + "\n")
+        restarted = make_watchdog()
+        await restarted.check_logs()
+
+        assert [e.message for e in _dispatched(restarted)] == ["new"]
+
+    async def test_replaced_file_is_read_from_start(self, make_watchdog):
+        watchdog = make_watchdog()
+        log_file = watchdog.errors_dir / "app.jsonl"
+        log_file.write_text(_error("old") + "\n" + _error("older") + "\n")
+        await watchdog.check_logs()
+
+        replacement = watchdog.errors_dir / "app.jsonl.new"
+        replacement.write_text(_error("rotated") + "\n" + _error("rotated too") + "\n")
+        replacement.replace(log_file)
+        restarted = make_watchdog()
+        await restarted.check_logs()
+
+        assert [e.message for e in _dispatched(restarted)] == ["rotated", "rotated too"]
+
+
+class TestBatching:
+    """Test coalescing of related errors."""
+
+    async def test_duplicate_errors_dispatch_once(self, make_watchdog):
+        watchdog = make_watchdog()
+        (watchdog.errors_dir / "a.jsonl").write_text(
+            "".join(_error("same", file_path="x.py") + "\n" for _ in range(3))
+        )
+        (watchdog.errors_dir / "b.jsonl").write_text(
+            _error("same", file_path="x.py") + "\n" + _error("other") + "\n"
+        )
+
+        await watchdog.check_logs()
+
+        dispatched = _dispatched(watchdog)
+        assert [e.message for e in dispatched] == ["same", "other"]
+        assert dispatched[0].context["occurrences"] == 4
+        assert dispatched[0].context["log_files"] == ["a.jsonl", "b.jsonl"]
+        assert dispatched[0].source == "watchdog"
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+class TestInotifyWaiter:
+    """Test inotify wake-ups."""
+
+    async def test_wakes_on_write(self, tmp_path):
+        waiter = InotifyWaiter.create(tmp_path)
+        if waiter is None:
+            pytest.skip("inotify unavailable")
+        waiter.attach(asyncio.get_running_loop())
+        try:
+            assert await waiter.wait(0.05) is False
+
+            asyncio.get_running_loop().call_later(
+                0.01, lambda: (tmp_path / "app.jsonl").write_text("x\n")
+            )
+
+            assert await waiter.wait(5.0) is True
+        finally:
+            waiter.close()
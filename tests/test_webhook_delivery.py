@@ -0,0 +1,273 @@
+"""Tests for pooled, queued webhook delivery.
+
+Tests cover:
+1. Background outbox delivery without blocking the caller
+2. Connection reuse across events through the per-endpoint session
+3. Batching queued events into one signed POST
+4. Exponential backoff retries and non-retryable errors
+5. Bounded outboxes dropping the oldest events
+6. dispatch/dispatch_sync results and the manager's enqueue path
+
+Run with: pytest tests/test_webhook_delivery.py -v
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp import web
+
+from orchestrator.observability import webhooks as webhooks_module
+from orchestrator.observability.config import WebhooksConfig
+from orchestrator.observability.manager import ObservabilityManager
+from orchestrator.observability.webhooks import WebhookDispatcher, WebhookEventType
+
+
+class StubWebhookServer:
+    """aiohttp server on its own thread that records webhook requests."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.peers: set = set()
+        self.statuses: list[int] = []
+        self.delay = 0.0
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+        self.url = ""
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        body = await request.text()
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.requests.append({"body": body, "headers": dict(request.headers)})
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        status = self.statuses.pop(0) if self.statuses else 200
+        return web.Response(status=status)
+
+    async def _start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/hook", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/hook"
+
+    def start(self) -> None:
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result(5)
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def events(self) -> list[dict]:
+        events = []
+        for request in self.requests:
+            body = json.loads(request["body"])
+            events.extend(body["events"] if "events" in body else [body])
+        return events
+
+
+@pytest.fixture
+def server():
+    server = StubWebhookServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def dispatcher(server, monkeypatch):
+    config = WebhooksConfig(
+        enabled=True,
+        secret="test-secret",
+        timeout_seconds=5,
+        retry_attempts=3,
+        retry_delay_seconds=0.01,
+        endpoints=[server.url],
+    )
+    monkeypatch.setattr(webhooks_module, "get_config", lambda: MagicMock(webhooks=config))
+    dispatcher = WebhookDispatcher()
+    yield dispatcher
+    dispatcher.close(timeout=5)
+
+
+def _signature(body: str) -> str:
+    return "sha256=" + hmac.new(b"test-secret", body.encode(), hashlib.sha256).hexdigest()
+
+
+class TestEnqueue:
+    """Tests for background outbox delivery."""
+
+    def test_enqueue_returns_before_delivery(self, dispatcher, server):
+        server.delay = 0.2
+
+        start = time.monotonic()
+        assert dispatcher.enqueue(WebhookEventType.TASK_STARTED, "project", "wf-1", {"task": "T1"})
+        assert time.monotonic() - start < 0.1
+
+        assert dispatcher.flush(timeout=5)
+        assert server.events()[0]["data"] == {"task": "T1"}
+
+    def test_events_delivered_in_order_over_one_connection(self, dispatcher, server):
+        for i in range(20):
+            dispatcher.enqueue(WebhookEventType.TASK_COMPLETED, "project", "wf-1", {"n": i})
+
+        assert dispatcher.flush(timeout=5)
+
+        assert [e["data"]["n"] for e in server.events()] == list(range(20))
+        assert len(server.peers) == 1
+        assert dispatcher.delivery.stats.delivered == 20
+
+    def test_requests_are_signed(self, dispatcher, server):
+        dispatcher.enqueue(WebhookEventType.WORKFLOW_STARTED, "project", "wf-1")
+        dispatcher.flush(timeout=5)
+
+        request = server.requests[0]
+        assert request["headers"]["X-Webhook-Signature"] == _signature(request["body"])
+
+    def test_disabled_does_not_queue(self, dispatcher, server):
+        dispatcher.config.enabled = False
+
+        assert dispatcher.enqueue(WebhookEventType.WORKFLOW_STARTED, "project", "wf-1") is False
+        assert dispatcher.delivery.stats.enqueued == 0
+
+    def test_enqueue_after_close_is_ignored(self, dispatcher, server):
+        dispatcher.close(timeout=5)
+
+        assert dispatcher.enqueue(WebhookEventType.WORKFLOW_STARTED, "project", "wf-1") is False
+
+
+class TestBatching:
+    """Tests for batching queued events."""
+
+    def test_queued_events_batched(self, dispatcher, server):
+        dispatcher.config.batch_size = 10
+        server.delay = 0.1
+        for i in range(11):
+            dispatcher.enqueue(WebhookEventType.TASK_STARTED, "project", "wf-1", {"n": i})
+
+        assert dispatcher.flush(timeout=5)
+
+        assert [e["data"]["n"] for e in server.events()] == list(range(11))
+        assert len(server.requests) < 11
+        batch = next(r for r in server.requests if "events" in json.loads(r["body"]))
+        assert batch["headers"]["X-Webhook-Signature"] == _signature(batch["body"])
+        assert int(batch["headers"]["X-Webhook-Batch-Size"]) == len(
+            json.loads(batch["body"])["events"]
+        )
+        assert dispatcher.delivery.stats.batches >= 1
+
+    def test_single_event_keeps_plain_payload(self, dispatcher, server):
+        dispatcher.config.batch_size = 10
+        dispatcher.enqueue(WebhookEventType.TASK_STARTED, "project", "wf-1")
+        dispatcher.flush(timeout=5)
+
+        body = json.loads(server.requests[0]["body"])
+        assert body["event_type"] == "task.started"
+        assert "X-Webhook-Batch-Size" not in server.requests[0]["headers"]
+
+
+class TestRetries:
+    """Tests for retry and backoff behaviour."""
+
+    def test_server_errors_retried(self, dispatcher, server):
+        server.statuses = [503, 500]
+
+        dispatcher.enqueue(WebhookEventType.TASK_FAILED, "project", "wf-1")
+        dispatcher.flush(timeout=5)
+
+        assert len(server.requests) == 3
+        assert dispatcher.delivery.stats.retries == 2
+        assert dispatcher.delivery.stats.delivered == 1
+
+    def test_client_errors_not_retried(self, dispatcher, server):
+        server.statuses = [400]
+
+        dispatcher.enqueue(WebhookEventType.TASK_FAILED, "project", "wf-1")
+        dispatcher.flush(timeout=5)
+
+        assert len(server.requests) == 1
+        assert dispatcher.delivery.stats.failed == 1
+
+    def test_backoff_is_exponential_and_capped(self, dispatcher):
+        dispatcher.config.retry_delay_seconds = 1.0
+        dispatcher.config.max_retry_delay_seconds = 5.0
+
+        delays = [dispatcher.delivery._backoff(attempt) for attempt in range(1, 6)]
+
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_unreachable_endpoint_gives_up(self, dispatcher, server):
+        dispatcher.config.endpoints = ["http://127.0.0.1:9/hook"]
+
+        dispatcher.enqueue(WebhookEventType.TASK_FAILED, "project", "wf-1")
+
+        assert dispatcher.flush(timeout=5)
+        assert dispatcher.delivery.stats.failed == 1
+
+
+class TestOutboxBound:
+    """Tests for the bounded outbox."""
+
+    def test_oldest_events_dropped_when_full(self, dispatcher, server):
+        dispatcher.config.queue_size = 5
+        server.delay = 0.2
+        dispatcher.enqueue(WebhookEventType.TASK_STARTED, "project", "wf-1", {"n": 0})
+        time.sleep(0.05)  # First event is in flight
+
+        for i in range(1, 21):
+            dispatcher.enqueue(WebhookEventType.TASK_STARTED, "project", "wf-1", {"n": i})
+        dispatcher.flush(timeout=10)
+
+        assert [e["data"]["n"] for e in server.events()] == [0, 16, 17, 18, 19, 20]
+        assert dispatcher.delivery.stats.dropped == 15
+
+
+class TestDispatch:
+    """Tests for dispatch and dispatch_sync over the pooled sessions."""
+
+    async def test_dispatch_returns_results(self, dispatcher, server):
+        results = await dispatcher.dispatch(WebhookEventType.WORKFLOW_STARTED, "project", "wf-1")
+
+        assert len(results) == 1
+        assert results[0].success is True
+        assert results[0].status_code == 200
+
+    def test_dispatch_sync_posts_concurrently(self, dispatcher, server):
+        dispatcher.config.endpoints = [server.url] * 4
+        server.delay = 0.2
+
+        start = time.monotonic()
+        results = dispatcher.dispatch_sync(WebhookEventType.WORKFLOW_STARTED, "project", "wf-1")
+
+        assert [r.success for r in results] == [True] * 4
+        assert time.monotonic() - start < 0.6
+
+    def test_dispatch_sync_reuses_connection(self, dispatcher, server):
+        for _ in range(5):
+            dispatcher.dispatch_sync(WebhookEventType.WORKFLOW_STARTED, "project", "wf-1")
+
+        assert len(server.requests) == 5
+        assert len(server.peers) == 1
+
+
+class TestManagerEnqueue:
+    """Tests for the observability manager's webhook path."""
+
+    def test_record_without_event_loop(self, dispatcher, server):
+        manager = ObservabilityManager()
+        manager._webhooks = dispatcher
+
+        manager.record_task_started("project", "wf-1", "T1")
+        manager.record_task_completed("project", "wf-1", "T1", duration_seconds=1.0)
+
+        assert dispatcher.flush(timeout=5)
+        assert [e["event_type"] for e in server.events()] == ["task.started", "task.completed"]
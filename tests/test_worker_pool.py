@@ -0,0 +1,290 @@
+"""Tests for warm agent worker processes.
+
+Tests cover:
+1. A worker answering several stream-json messages in one process
+2. Stateless calls using pre-warmed, single-use workers
+3. Session workers reused, recycled after max uses or errors, and resumed
+4. Agent and async call sites running on the pool
+
+Run with: pytest tests/test_worker_pool.py -v
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from orchestrator.agents import worker_pool
+from orchestrator.agents.worker_pool import (
+    AgentWorker,
+    AgentWorkerPool,
+    WorkerError,
+    WorkerRequest,
+    WorkerTimeout,
+)
+
+FAKE_CLI = [sys.executable, str(Path(__file__).parent / "helpers" / "fake_claude_stream.py")]
+
+
+def _command(prompt: str, *extra: str, output_format: str = "json") -> list[str]:
+    return ["claude", "-p", prompt, "--output-format", output_format, "--max-turns", "1", *extra]
+
+
+def _wait_for(condition, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return condition()
+
+
+@pytest.fixture
+def pool():
+    pool = AgentWorkerPool(spares=1, max_uses=3, cli=FAKE_CLI)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def spawn_log(tmp_path, monkeypatch):
+    log = tmp_path / "spawns.jsonl"
+    monkeypatch.setenv("FAKE_CLAUDE_LOG", str(log))
+
+    def read() -> list[dict]:
+        if not log.exists():
+            return []
+        return [json.loads(line) for line in log.read_text().splitlines()]
+
+    return read
+
+
+class TestWorkerRequest:
+    """Tests for splitting one-shot commands."""
+
+    def test_splits_prompt_format_and_session(self):
+        request = WorkerRequest.from_command(
+            _command("hello", "--resume", "S1", "--model", "haiku", output_format="text")
+        )
+
+        assert request.prompt == "hello"
+        assert request.output_format == "text"
+        assert request.session_id == "S1"
+        assert request.args == ("--max-turns", "1", "--model", "haiku")
+
+    def test_requires_prompt(self):
+        with pytest.raises(ValueError):
+            WorkerRequest.from_command(["claude", "--version"])
+
+
+class TestAgentWorker:
+    """Tests for a single long-lived worker."""
+
+    def _worker(self, tmp_path, *args: str) -> AgentWorker:
+        command = [
+            *FAKE_CLI,
+            "-p",
+            "--input-format",
+            "stream-json",
+            "--output-format",
+            "stream-json",
+        ]
+        return AgentWorker([*command, *args], tmp_path)
+
+    def test_answers_several_messages(self, tmp_path):
+        worker = self._worker(tmp_path, "--session-id", "S1")
+        try:
+            first = worker.send("one", timeout=10)
+            second = worker.send("two", timeout=10)
+        finally:
+            worker.close()
+
+        assert first.text == "echo: one"
+        assert second.result["turn"] == 2
+        assert second.result["pid"] == first.result["pid"] == worker.pid
+        assert worker.session_id == "S1"
+        assert worker.uses == 2
+
+    def test_exit_raises_with_stderr(self, tmp_path):
+        worker = self._worker(tmp_path)
+        try:
+            with pytest.raises(WorkerError, match="crashed"):
+                worker.send("CRASH now", timeout=10)
+        finally:
+            worker.close()
+
+        assert not worker.alive
+
+    def test_timeout_stops_worker(self, tmp_path):
+        worker = self._worker(tmp_path)
+
+        with pytest.raises(WorkerTimeout):
+            worker.send("HANG", timeout=0.3)
+
+        assert not worker.alive
+
+
+class TestStatelessCalls:
+    """Tests for pre-warmed single-use workers."""
+
+    def test_spare_is_warmed_for_next_call(self, pool, tmp_path, spawn_log):
+        first = pool.run(_command("one"), cwd=tmp_path, timeout=10)
+        assert _wait_for(lambda: pool.idle_count() == 1)
+
+        second = pool.run(_command("two"), cwd=tmp_path, timeout=10)
+
+        assert pool.stats.cold_starts == 1
+        assert pool.stats.warm_starts == 1
+        assert json.loads(second.stdout)["result"] == "echo: two"
+        # Each call gets a fresh process, so no context carries over
+        assert second.result["pid"] != first.result["pid"]
+        assert second.result["turn"] == 1
+
+    def test_workers_started_in_streaming_mode(self, pool, tmp_path, spawn_log):
+        pool.run(_command("one", "--model", "haiku"), cwd=tmp_path, timeout=10)
+
+        args = spawn_log()[0]["args"]
+        assert args[:5] == ["-p", "--input-format", "stream-json", "--output-format", "stream-json"]
+        assert args.count("-p") == 1
+        assert args[-4:] == ["--max-turns", "1", "--model", "haiku"]
+
+    def test_spares_are_per_command_shape(self, pool, tmp_path):
+        pool.run(_command("one"), cwd=tmp_path, timeout=10)
+        assert _wait_for(lambda: pool.idle_count() == 1)
+
+        pool.run(_command("two", "--model", "haiku"), cwd=tmp_path, timeout=10)
+
+        assert pool.stats.cold_starts == 2
+
+    def test_text_output_format(self, pool, tmp_path):
+        reply = pool.run(_command("hi", output_format="text"), cwd=tmp_path, timeout=10)
+
+        assert reply.stdout == "echo: hi"
+        assert reply.returncode == 0
+
+    def test_error_result_maps_to_failure(self, pool, tmp_path):
+        reply = pool.run(_command("FAIL please"), cwd=tmp_path, timeout=10)
+
+        assert reply.returncode == 1
+        assert reply.stderr == "echo: FAIL please"
+
+    def test_missing_cli_raises(self, tmp_path):
+        pool = AgentWorkerPool(cli=["definitely-not-a-real-cli"])
+
+        with pytest.raises(FileNotFoundError):
+            pool.run(_command("hi"), cwd=tmp_path, timeout=10)
+
+
+class TestSessionWorkers:
+    """Tests for session-bound workers."""
+
+    def test_session_worker_is_reused(self, pool, tmp_path):
+        first = pool.run(_command("one", "--session-id", "S1"), cwd=tmp_path, timeout=10)
+        second = pool.run(_command("two", "--resume", "S1"), cwd=tmp_path, timeout=10)
+
+        assert second.result["pid"] == first.result["pid"]
+        assert second.result["turn"] == 2
+        assert second.session_id == "S1"
+        assert pool.stats.session_reuses == 1
+
+    def test_recycled_after_max_uses_and_resumed(self, pool, tmp_path, spawn_log):
+        pids = [
+            pool.run(_command(f"m{i}", "--session-id", "S1"), cwd=tmp_path, timeout=10).result[
+                "pid"
+            ]
+            for i in range(4)
+        ]
+
+        assert len(set(pids[:3])) == 1
+        assert pids[3] != pids[0]
+        assert pool.stats.recycled == 1
+        assert spawn_log()[-1]["args"][-2:] == ["--resume", "S1"]
+
+    def test_recycled_on_error(self, pool, tmp_path):
+        failed = pool.run(_command("FAIL", "--session-id", "S1"), cwd=tmp_path, timeout=10)
+        retry = pool.run(_command("again", "--resume", "S1"), cwd=tmp_path, timeout=10)
+
+        assert retry.result["pid"] != failed.result["pid"]
+        assert pool.stats.recycled == 1
+
+    def test_crash_recycles_worker(self, pool, tmp_path):
+        with pytest.raises(WorkerError):
+            pool.run(_command("CRASH", "--session-id", "S1"), cwd=tmp_path, timeout=10)
+
+        reply = pool.run(_command("again", "--session-id", "S1"), cwd=tmp_path, timeout=10)
+
+        assert reply.text == "echo: again"
+
+    def test_release_session(self, pool, tmp_path):
+        pool.run(_command("one", "--session-id", "S1"), cwd=tmp_path, timeout=10)
+
+        assert pool.release_session("S1") is True
+        assert pool.release_session("S1") is False
+
+
+class TestIntegration:
+    """Tests for call sites running on the shared pool."""
+
+    @pytest.fixture
+    def shared_pool(self, monkeypatch):
+        monkeypatch.setenv(worker_pool.WARM_WORKERS_ENV, "1")
+        monkeypatch.setenv(worker_pool.WORKER_CLI_ENV, " ".join(FAKE_CLI))
+        worker_pool.set_worker_pool(None)
+        yield worker_pool.get_worker_pool()
+        worker_pool.set_worker_pool(None)
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv(worker_pool.WARM_WORKERS_ENV, raising=False)
+        worker_pool.set_worker_pool(None)
+
+        assert worker_pool.get_worker_pool() is None
+
+    def test_claude_agent_uses_pool(self, shared_pool, tmp_path):
+        from orchestrator.agents.claude_agent import ClaudeAgent
+
+        agent = ClaudeAgent(tmp_path, enable_audit=False, enable_session_continuity=False)
+        result = agent.run("Review this change")
+
+        assert result.success
+        assert result.parsed_output["result"] == "echo: Review this change"
+        assert shared_pool.stats.cold_starts == 1
+
+    async def test_cancellation_stops_worker(self, shared_pool, tmp_path):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                shared_pool.arun(_command("HANG"), cwd=tmp_path, timeout=30), timeout=0.5
+            )
+
+        reply = await shared_pool.arun(_command("after"), cwd=tmp_path, timeout=10)
+        assert reply.text == "echo: after"
+
+    async def test_cancellation_does_not_wait_for_worker_exit(
+        self, shared_pool, tmp_path, monkeypatch
+    ):
+        closes = []
+        original = worker_pool.AgentWorker.close
+
+        def record_close(worker):
+            closes.append(threading.current_thread() is threading.main_thread())
+            original(worker)
+
+        monkeypatch.setattr(worker_pool.AgentWorker, "close", record_close)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                shared_pool.arun(_command("HANG"), cwd=tmp_path, timeout=30), timeout=0.5
+            )
+        deadline = time.monotonic() + 5
+        while not closes and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+        assert closes
+        assert not any(closes)
+
+    async def test_evaluator_uses_pool(self, shared_pool, tmp_path):
+        from orchestrator.evaluation.g_eval import GEvalEvaluator
+
+        evaluator = GEvalEvaluator(project_dir=tmp_path)
+
+        assert await evaluator._call_evaluator("score this") == "echo: score this"